@@ -42,6 +42,8 @@ void BodyCopyAtmEsc(BODY *dest, BODY *src, int foo, int iNumBodies, int iBody) {
   dest[iBody].dAtmXAbsEffH2O       = src[iBody].dAtmXAbsEffH2O;
   dest[iBody].dMinSurfaceWaterMass = src[iBody].dMinSurfaceWaterMass;
   dest[iBody].dMinEnvelopeMass     = src[iBody].dMinEnvelopeMass;
+  dest[iBody].daMagMomTrack        = src[iBody].daMagMomTrack;
+  dest[iBody].iMagMomTrackRows     = src[iBody].iMagMomTrackRows;
   dest[iBody].iWaterLossModel      = src[iBody].iWaterLossModel;
   dest[iBody].iAtmXAbsEffH2OModel  = src[iBody].iAtmXAbsEffH2OModel;
   dest[iBody].dKTide               = src[iBody].dKTide;
@@ -755,6 +757,37 @@ void ReadAtmXAbsEffH2O(BODY *body, CONTROL *control, FILES *files,
   }
 }
 
+/**
+Read the name of the file that holds the magnetic moment history for a replay
+without ThermInt.
+
+@param body A pointer to the current BODY instance
+@param control A pointer to the integration CONTROL instance
+@param files A pointer to the array of input FILES
+@param options A pointer to the OPTIONS instance
+@param system A pointer to the SYSTEM instance
+@param iFile The current file number
+*/
+void ReadFileMagMomTrack(BODY *body, CONTROL *control, FILES *files,
+                         OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary file */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    body[iFile - 1].cFileMagMomTrack = NULL;
+    fvFormattedString(&body[iFile - 1].cFileMagMomTrack, cTmp);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile > 0) {
+    body[iFile - 1].cFileMagMomTrack = NULL;
+    fvFormattedString(&body[iFile - 1].cFileMagMomTrack, options->cDefault);
+  }
+}
+
 // ReadEnvelopeMass is in options.c to avoid memory leaks in verifying envelope.
 
 /**
@@ -1218,6 +1251,26 @@ void InitializeOptionsAtmEsc(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_MINKTIDE].dDefault   = 0.1;
   options[OPT_MINKTIDE].bMultiFile = 1;
   fnRead[OPT_MINKTIDE]             = &ReadMinKTide;
+
+  fvFormattedString(&options[OPT_FILEMAGMOMTRACK].cName, "sFileMagMomTrack");
+  fvFormattedString(&options[OPT_FILEMAGMOMTRACK].cDescr,
+          "Name of file containing a tabulated magnetic moment history");
+  fvFormattedString(&options[OPT_FILEMAGMOMTRACK].cDefault, "magmom.txt");
+  options[OPT_FILEMAGMOMTRACK].iType      = 3;
+  options[OPT_FILEMAGMOMTRACK].bMultiFile = 1;
+  options[OPT_FILEMAGMOMTRACK].iFileType  = 1;
+  options[OPT_FILEMAGMOMTRACK].iModuleBit = ATMESC;
+  fnRead[OPT_FILEMAGMOMTRACK]             = &ReadFileMagMomTrack;
+  fvFormattedString(
+        &options[OPT_FILEMAGMOMTRACK].cLongDescr,
+        "Replay atmospheric escape against the magnetic moment history of an\n"
+        "earlier run instead of evolving the interior. Each row holds the\n"
+        "Age in the units of the body file and MagMom in A m^2, so the\n"
+        "forward file of a ThermInt run with saOutputOrder Age MagMom can be\n"
+        "used directly. The moment sets the magnetic shielding of the escape\n"
+        "flux. Lines starting with # are ignored. Pair it with a star whose\n"
+        "sStellarModel is TRACK, and without ThermInt or RadHeat in this\n"
+        "body, to sweep escape parameters without rerunning the interior.");
 }
 
 /**
@@ -1762,6 +1815,13 @@ void fnPropsAuxAtmEsc(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
   double EARTH_MAGNETIC_MOMENT = 7.94 * pow(10.0, 22); // A m^2 (SI base units). From https://modern-physics.org/earths-dipole-moment/
   double AU_TO_METER = 149597870691.0; // SI base units.
 
+  // A replay takes the magnetic moment from a stored ThermInt run
+  if (body[iBody].iMagMomTrackRows > 0) {
+    body[iBody].dMagMom = fdTableHermite(
+          body[iBody].daMagMomTrack, body[iBody].iMagMomTrackRows,
+          ATMESC_TRACK_NCOL, ATMESC_TRACK_MAGMOM, body[iBody].dAge, 0);
+  }
+
   double semiMajorAxis = body[iBody].dSemi; // SI
   double stellarRadius = body[0].dRadius; // SI
   double planetRadius = body[iBody].dRadius; // SI
@@ -2116,6 +2176,78 @@ void NullAtmEscDerivatives(BODY *body, EVOLVE *evolve, UPDATE *update,
         &fndUpdateFunctionTiny; // NOTE: This points to the VALUE of the radius!
 }
 
+/**
+Read the rows of the body's sFileMagMomTrack into daMagMomTrack, converting the
+ages from the units of the body file to SI. The file may also be held in
+memory by an in-process run.
+
+@param body A pointer to the current BODY instance
+@param control A pointer to the integration CONTROL instance
+@param options A pointer to the OPTIONS instance
+@param iBody The current BODY number
+*/
+void ReadMagMomTrack(BODY *body, CONTROL *control, OPTIONS *options,
+                     int iBody) {
+  int iRow;
+  double dTime;
+
+  body[iBody].iMagMomTrackRows = fiReadTable(
+        control, &options[OPT_FILEMAGMOMTRACK], body[iBody].cFileMagMomTrack,
+        iBody, ATMESC_TRACK_NCOL, "Age MagMom", &body[iBody].daMagMomTrack);
+
+  dTime = fdUnitsTime(control->Units[iBody + 1].iTime);
+  for (iRow = 0; iRow < body[iBody].iMagMomTrackRows; iRow++) {
+    body[iBody].daMagMomTrack[iRow * ATMESC_TRACK_NCOL + ATMESC_TRACK_AGE] *=
+          dTime;
+  }
+
+  iRow = body[iBody].iMagMomTrackRows - 1;
+  if (body[iBody].dAge < body[iBody].daMagMomTrack[ATMESC_TRACK_AGE] ||
+      body[iBody].dAge >
+            body[iBody].daMagMomTrack[iRow * ATMESC_TRACK_NCOL +
+                                      ATMESC_TRACK_AGE]) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: The age of %s is outside %s file %s.\n",
+              body[iBody].cName, options[OPT_FILEMAGMOMTRACK].cName,
+              body[iBody].cFileMagMomTrack);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+}
+
+/**
+Set up a replay against a stored magnetic moment history. ThermInt would
+overwrite the moment, so the two cannot be combined.
+
+@param body A pointer to the current BODY instance
+@param control A pointer to the integration CONTROL instance
+@param files A pointer to the array of input FILES
+@param options A pointer to the OPTIONS instance
+@param iBody The current BODY number
+*/
+void VerifyMagMomTrack(BODY *body, CONTROL *control, FILES *files,
+                       OPTIONS *options, int iBody) {
+  if (options[OPT_FILEMAGMOMTRACK].iLine[iBody + 1] == -1) {
+    body[iBody].iMagMomTrackRows = 0;
+    return;
+  }
+  if (body[iBody].bThermint) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr,
+              "ERROR: %s cannot be set when module ThermInt computes the "
+              "magnetic moment.\n",
+              options[OPT_FILEMAGMOMTRACK].cName);
+    }
+    LineExit(files->Infile[iBody + 1].cIn,
+             options[OPT_FILEMAGMOMTRACK].iLine[iBody + 1]);
+  }
+
+  ReadMagMomTrack(body, control, options, iBody);
+  body[iBody].dMagMom = fdTableHermite(
+        body[iBody].daMagMomTrack, body[iBody].iMagMomTrackRows,
+        ATMESC_TRACK_NCOL, ATMESC_TRACK_MAGMOM, body[iBody].dAge, 0);
+}
+
 /**
 Verify all the inputs for the atmospheric escape module.
 
@@ -2146,6 +2278,8 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
     body[iBody].bCalcFXUV = 1;
   }
 
+  VerifyMagMomTrack(body, control, files, options, iBody);
+
   if (body[iBody].iPlanetRadiusModel == ATMESC_LEHMER17) {
     if (body[0].bStellar) {
       if (body[iBody].dEnvelopeMass > 0.5 * body[iBody].dMass) {
@@ -2176,7 +2310,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
     } else {
       fprintf(stderr,
               "ERROR: The Lehmer & Catling (2017) model requires a star.\n");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   } else {
     int iCol, bError = 0;
@@ -2280,7 +2414,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 body[iBody].bUseBondiLimited);
         fprintf(stderr, "\tbAtmEscAuto = %d\n", body[iBody].bAtmEscAuto);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else if (iRegimeCounter == 0) {
       if (control->Io.iVerbose >= VERBINPUT) {
         fprintf(stderr,
@@ -2323,7 +2457,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               options[OPT_ENVELOPEMASS].cName, options[OPT_MASS].cName,
               files->Infile[iBody + 1].cIn);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   // Initialize rg duration
@@ -2344,7 +2478,7 @@ void VerifyAtmEsc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
             "ERROR: More than one module is trying to set dRadius for body %d!",
             iBody);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   // If envelope mass exists, compute mass of the solid planet
@@ -2630,6 +2764,30 @@ int fbHaltEnvelopeGone(BODY *body, EVOLVE *evolve, HALT *halt, IO *io,
   return 0;
 }
 
+/**
+Event function for surface desiccation, which occurs when it drops to zero.
+
+@param body A pointer to the current BODY instance
+@param iBody The current BODY number
+
+@return Surface water mass above the desiccation threshold
+*/
+double fdEventSurfaceDesiccated(BODY *body, int iBody) {
+  return body[iBody].dSurfaceWaterMass - body[iBody].dMinSurfaceWaterMass;
+}
+
+/**
+Event function for envelope evaporation, which occurs when it drops to zero.
+
+@param body A pointer to the current BODY instance
+@param iBody The current BODY number
+
+@return Envelope mass above the evaporation threshold
+*/
+double fdEventEnvelopeGone(BODY *body, int iBody) {
+  return body[iBody].dEnvelopeMass - body[iBody].dMinEnvelopeMass;
+}
+
 /**
 Count the number of halting conditions.
 
@@ -4551,6 +4709,6 @@ void fvAtmEscRegimeChangeOutput(int iRegimeOld, int iRegimeNew, double dTime) {
   } else {
     fprintf(stderr, "ERROR: unknown initial atmospheric escape regime: %d\n",
             iRegimeOld);
-    exit(1);
+    VplanetExit(1);
   }
 }
@@ -73,6 +73,13 @@
 #define OPT_STOPWATERLOSSINHZ                                                  \
   1235                    /**< Stop water loss once planet reaches HZ? */
 #define OPT_MINKTIDE 1240 /**< Minimum KTide value */
+#define OPT_FILEMAGMOMTRACK                                                    \
+  1241 /**< File with the magnetic moment history of a ThermInt run */
+
+/* Columns of sFileMagMomTrack */
+#define ATMESC_TRACK_AGE 0
+#define ATMESC_TRACK_MAGMOM 1
+#define ATMESC_TRACK_NCOL 2
 
 /* @cond DOXYGEN_OVERRIDE */
 
@@ -82,6 +89,7 @@ void BodyCopyAtmEsc(BODY *, BODY *, int, int, int);
 /* Options Functions */
 void HelpOptionsAtmEsc(OPTIONS *);
 void InitializeOptionsAtmEsc(OPTIONS *, fnReadOption[]);
+void ReadFileMagMomTrack(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *, int);
 void ReadOptionsAtmEsc(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *,
                        fnReadOption[], int);
 
@@ -94,11 +102,15 @@ int fbHaltSurfaceDesiccated(BODY *, EVOLVE *, HALT *, IO *, UPDATE *,
 int fbHaltEnvelopeGone(BODY *, EVOLVE *, HALT *, IO *, UPDATE *,
                        fnUpdateVariable ***, int);
 void CountHaltsAtmEsc(HALT *, int *);
+double fdEventSurfaceDesiccated(BODY *, int);
+double fdEventEnvelopeGone(BODY *, int);
 
 /* Verify Functions */
 void VerifyAtmEsc(BODY *, CONTROL *, FILES *, OPTIONS *, OUTPUT *, SYSTEM *,
                   UPDATE *, int, int);
 void VerifyRotationAtmEsc(BODY *, CONTROL *, OPTIONS *, char[], int);
+void ReadMagMomTrack(BODY *, CONTROL *, OPTIONS *, int);
+void VerifyMagMomTrack(BODY *, CONTROL *, FILES *, OPTIONS *, int);
 void InitializeVplanetAtmEsc(CONTROL *, MODULE *);
 void VerifyHaltAtmEsc(BODY *, CONTROL *, OPTIONS *, int, int *);
 void VerifyRotationAtmEsc(BODY *, CONTROL *, OPTIONS *, char[], int);
@@ -117,6 +117,196 @@ double fdPerToFreq(double dPeriod) {
   return 2 * PI / dPeriod;
 }
 
+/**
+  Find the row of a table that starts the interval containing dX, limited to
+  the first and last intervals. The first column of each row holds the
+  abscissa, which must increase.
+
+  @param daTable The table, stored row by row
+  @param iNumRows The number of rows
+  @param iNumCols The number of columns
+  @param dX The abscissa
+
+  @return Row index
+*/
+int fiTableRow(double *daTable, int iNumRows, int iNumCols, double dX) {
+  int iLo = 0, iHi = iNumRows - 1, iMid;
+
+  while (iHi - iLo > 1) {
+    iMid = (iLo + iHi) / 2;
+    if (daTable[iMid * iNumCols] <= dX) {
+      iLo = iMid;
+    } else {
+      iHi = iMid;
+    }
+  }
+  return iLo;
+}
+
+/**
+  Calculate the slope of column iCol of a table at row iRow from the rows on
+  either side.
+
+  @param daTable The table, stored row by row
+  @param iNumRows The number of rows
+  @param iNumCols The number of columns
+  @param iCol The column
+  @param iRow The row
+
+  @return The slope with respect to the first column
+*/
+double fdTableKnotSlope(double *daTable, int iNumRows, int iNumCols, int iCol,
+                        int iRow) {
+  double *daLo, *daHi;
+  int iLo = iRow > 0 ? iRow - 1 : 0;
+  int iHi = iRow < iNumRows - 1 ? iRow + 1 : iRow;
+
+  daLo = &daTable[iLo * iNumCols];
+  daHi = &daTable[iHi * iNumCols];
+  return (daHi[iCol] - daLo[iCol]) / (daHi[0] - daLo[0]);
+}
+
+/**
+  Interpolate column iCol of a table at dX, or its rate of change if bSlope is
+  set. The rows are joined by cubic Hermite polynomials through the
+  finite-difference slopes at each row, so that the value and its slope are
+  continuous and adaptive steps are not cut at every row. Outside the table
+  the first or last row is used, with a slope of dTINY.
+
+  @param daTable The table, stored row by row, with at least 2 rows
+  @param iNumRows The number of rows
+  @param iNumCols The number of columns
+  @param iCol The column
+  @param dX The abscissa
+  @param bSlope Return the rate of change instead of the value?
+
+  @return Interpolated value, or its rate of change
+*/
+double fdTableHermite(double *daTable, int iNumRows, int iNumCols, int iCol,
+                      double dX, int bSlope) {
+  int iRow = fiTableRow(daTable, iNumRows, iNumCols, dX);
+  double *daLo, *daHi, dStep, dTheta, dSlopeLo, dSlopeHi;
+
+  daLo   = &daTable[iRow * iNumCols];
+  daHi   = daLo + iNumCols;
+  dStep  = daHi[0] - daLo[0];
+  dTheta = (dX - daLo[0]) / dStep;
+  if (dTheta < 0 || dTheta > 1) {
+    if (bSlope) {
+      return dTINY;
+    }
+    return dTheta < 0 ? daLo[iCol] : daHi[iCol];
+  }
+
+  dSlopeLo =
+        fdTableKnotSlope(daTable, iNumRows, iNumCols, iCol, iRow) * dStep;
+  dSlopeHi =
+        fdTableKnotSlope(daTable, iNumRows, iNumCols, iCol, iRow + 1) * dStep;
+  if (bSlope) {
+    return (6 * dTheta * (dTheta - 1) * (daLo[iCol] - daHi[iCol]) +
+            (dTheta * (3 * dTheta - 4) + 1) * dSlopeLo +
+            dTheta * (3 * dTheta - 2) * dSlopeHi) /
+           dStep;
+  }
+  return (1 + 2 * dTheta) * (1 - dTheta) * (1 - dTheta) * daLo[iCol] +
+         dTheta * (1 - dTheta) * (1 - dTheta) * dSlopeLo +
+         dTheta * dTheta * (3 - 2 * dTheta) * daHi[iCol] +
+         dTheta * dTheta * (dTheta - 1) * dSlopeHi;
+}
+
+/**
+  Read a table of numbers for fdTableHermite from the file named by an option
+  of body iBody, which may also be held in memory by an in-process run. Blank
+  lines and lines starting with # are skipped. Every row must hold iNumCols
+  numbers, and the first column must increase. The values are read as they
+  are, in the units of the body file.
+
+  @param control Control struct
+  @param option The option that names the file
+  @param cFile The name of the file
+  @param iBody Index of the body
+  @param iNumCols The number of columns
+  @param cColumns The names of the columns, for error messages
+  @param daTable Set to the table, stored row by row
+
+  @return The number of rows, at least 2
+*/
+int fiReadTable(CONTROL *control, OPTIONS *option, char *cFile, int iBody,
+                int iNumCols, char *cColumns, double **daTable) {
+  int iRow = 0, iMaxRows = 256, iCol, iChars;
+  double *daRow;
+  char cLine[LINE], cFirst[2];
+  char *cText, *cPos;
+  FILE *fp = NULL;
+
+  cText = fsInMemoryFile(cFile);
+  if (cText == NULL) {
+    fp = fopen(cFile, "r");
+    if (fp == NULL) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: Unable to open %s file %s.\n", option->cName,
+                cFile);
+      }
+      LineExit(option->cFile[iBody + 1], option->iLine[iBody + 1]);
+    }
+  }
+
+  *daTable = malloc(iMaxRows * iNumCols * sizeof(double));
+  while (fbReadInputLine(fp, &cText, cLine)) {
+    // Skip blank lines and comments
+    if (sscanf(cLine, " %1s", cFirst) != 1 || cFirst[0] == '#') {
+      continue;
+    }
+    if (iRow == iMaxRows) {
+      iMaxRows *= 2;
+      *daTable = realloc(*daTable, iMaxRows * iNumCols * sizeof(double));
+    }
+    daRow = &(*daTable)[iRow * iNumCols];
+    cPos  = cLine;
+    for (iCol = 0; iCol < iNumCols; iCol++) {
+      if (sscanf(cPos, "%lf%n", &daRow[iCol], &iChars) != 1) {
+        break;
+      }
+      cPos += iChars;
+    }
+    if (iCol < iNumCols) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr,
+                "ERROR: Row %d of %s file %s must have %d columns: %s.\n",
+                iRow + 1, option->cName, cFile, iNumCols, cColumns);
+      }
+      if (fp != NULL) {
+        fclose(fp);
+      }
+      VplanetExit(EXIT_INPUT);
+    }
+    if (iRow > 0 && daRow[0] <= (daRow - iNumCols)[0]) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr,
+                "ERROR: The first column of %s file %s must increase.\n",
+                option->cName, cFile);
+      }
+      if (fp != NULL) {
+        fclose(fp);
+      }
+      VplanetExit(EXIT_INPUT);
+    }
+    iRow++;
+  }
+  if (fp != NULL) {
+    fclose(fp);
+  }
+
+  if (iRow < 2) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: %s file %s must have at least 2 rows.\n",
+              option->cName, cFile);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+  return iRow;
+}
+
 /*
  * Physical Relationships
  */
@@ -408,7 +598,7 @@ double fdMassToRad(double dMass, int iRelation) {
   /* Whoops! */
   fprintf(stderr, "ERROR: Unknown mass-radius relationship.\n");
   fprintf(stderr, "Mass: %.3e, Relationship: %d\n", dMass, iRelation);
-  exit(EXIT_UNITS);
+  VplanetExit(EXIT_UNITS);
 }
 
 // Assign mass from radius and published relationship
@@ -425,7 +615,7 @@ double fdRadToMass(double dMass, int iRelation) {
   } else {
     /* Whoops! */
     fprintf(stderr, "ERROR: Unknown mass-radius relation.\n");
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -442,7 +632,6 @@ void BodyCopy(BODY *dest, BODY *src, EVOLVE *evolve) {
      Module-specific parameters belong in the fnBodyCopy subroutines. */
 
   for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
-    fvFormattedString(&dest[iBody].cName, src[iBody].cName);
     dest[iBody].iBodyType = src[iBody].iBodyType;
     dest[iBody].dMass     = src[iBody].dMass;
     dest[iBody].dRadius   = src[iBody].dRadius;
@@ -1277,15 +1466,9 @@ double fdBaraffeBiLinear(int iMLEN, int iALEN,
 
   What are the arguments?
 */
-double fdBaraffeBiCubic(int iMLEN, int iALEN,
-                        double const data[STELLAR_BAR_MLEN][STELLAR_BAR_ALEN],
-                        int xi, int yi, double dx, double dy) {
-  double dvCoeff[16];
-  int j, k;
-  int ijkn      = 0;
-  double dypow  = 1;
-  double result = 0;
-
+void fvBaraffeBiCubicCoeff(
+      double const data[STELLAR_BAR_MLEN][STELLAR_BAR_ALEN], int xi, int yi,
+      double *dvCoeff) {
   // Linear algebra time!
   // Adapted from http://en.wikipedia.org/wiki/Bicubic_interpolation
   double dvDeriv[16] = {// values of the function at each corner
@@ -1315,7 +1498,23 @@ double fdBaraffeBiCubic(int iMLEN, int iALEN,
                                 data[xi + 2][yi] + data[xi][yi])};
 
   fvMatrixVectorMult(STELLAR_BICUBIC_MATRIX, dvDeriv, dvCoeff);
-  dypow = 1;
+}
+
+/**
+  Helper function for interpolating Baraffe grid
+
+  What are the arguments?
+*/
+double fdBaraffeBiCubic(int iMLEN, int iALEN,
+                        double const data[STELLAR_BAR_MLEN][STELLAR_BAR_ALEN],
+                        int xi, int yi, double dx, double dy) {
+  double dvCoeff[16];
+  int j, k;
+  int ijkn      = 0;
+  double dypow  = 1;
+  double result = 0;
+
+  fvBaraffeBiCubicCoeff(data, xi, yi, dvCoeff);
   for (j = 0; j < 4; ++j) {
     result +=
           dypow * (dvCoeff[ijkn] +
@@ -1428,27 +1627,42 @@ fdBaraffeInterpolate(int iMLEN, int iALEN, double const xarr[STELLAR_BAR_MLEN],
   What are the arguments?
 */
 double fdBaraffe(int iParam, double A, double M, int iOrder, int *iError) {
+  return fdBaraffeGrid(iParam, A / (1.e9 * YEARSEC), M / MSUN, iOrder, iError);
+}
+
+/**
+  Same as fdBaraffe, but with the age and mass in the units of the grid.
+
+  @param iParam Which parameter: STELLAR_T, STELLAR_L, STELLAR_R or STELLAR_RG
+  @param A Age in Gyr
+  @param M Mass in solar masses
+  @param iOrder Interpolation order, 1 or 3
+  @param iError Set to one of the STELLAR_ERR codes
+  @return The parameter in SI units
+*/
+double fdBaraffeGrid(int iParam, double A, double M, int iOrder,
+                     int *iError) {
   double res;
 
   if (iParam == STELLAR_T) {
     res = fdBaraffeInterpolate(STELLAR_BAR_MLEN, STELLAR_BAR_ALEN,
-                               STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_LOGT,
-                               M / MSUN, A / (1.e9 * YEARSEC), iOrder, iError);
+                               STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_LOGT, M,
+                               A, iOrder, iError);
     return pow(10., res);
   } else if (iParam == STELLAR_L) {
     res = fdBaraffeInterpolate(STELLAR_BAR_MLEN, STELLAR_BAR_ALEN,
-                               STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_LOGL,
-                               M / MSUN, A / (1.e9 * YEARSEC), iOrder, iError);
+                               STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_LOGL, M,
+                               A, iOrder, iError);
     return LSUN * pow(10., res);
   } else if (iParam == STELLAR_R) {
     res = fdBaraffeInterpolate(STELLAR_BAR_MLEN, STELLAR_BAR_ALEN,
                                STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_RADIUS,
-                               M / MSUN, A / (1.e9 * YEARSEC), iOrder, iError);
+                               M, A, iOrder, iError);
     return RSUN * res;
   } else if (iParam == STELLAR_RG) {
     res = fdBaraffeInterpolate(STELLAR_BAR_MLEN, STELLAR_BAR_ALEN,
-                               STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_RG,
-                               M / MSUN, A / (1.e9 * YEARSEC), iOrder, iError);
+                               STELLAR_BAR_MARR, STELLAR_BAR_AARR, DATA_RG, M,
+                               A, iOrder, iError);
     return res;
   } else {
     *iError = STELLAR_ERR_FILE;
@@ -1456,6 +1670,192 @@ double fdBaraffe(int iParam, double A, double M, int iOrder, int *iError) {
   }
 }
 
+/**
+  Collapse the Baraffe grid onto a body's mass, which is assumed constant. At
+  fixed mass the bicubic interpolant of each age cell is a cubic polynomial in
+  the normalized age, so only its 4 coefficients per parameter are stored.
+  Cells for which fiGetLowerBound fails are left as NaN.
+
+  @param body Body struct
+  @param iBody Index of body
+*/
+void fvBaraffeTrack(BODY *body, int iBody) {
+  double const(*daData[STELLAR_BAR_NPARAM])[STELLAR_BAR_ALEN] = {
+        DATA_LOGT, DATA_LOGL, DATA_RADIUS, DATA_RG};
+  double dvCoeff[16];
+  double dM, dx;
+  int xi, yi, iParam, j;
+  double *dTrack;
+
+  dM = body[iBody].dMass / MSUN;
+  xi = fiGetLowerBound(dM, STELLAR_BAR_MARR, STELLAR_BAR_MLEN);
+
+  body[iBody].dBaraffeMass = body[iBody].dMass;
+  body[iBody].dBaraffeAge  = NAN;
+  body[iBody].iBaraffeAge  = 1;
+  if (xi < 0) {
+    // Let fdBaraffe report the error
+    body[iBody].daBaraffeTrack = NULL;
+    return;
+  }
+
+  body[iBody].daBaraffeTrack =
+        malloc(STELLAR_BAR_ALEN * STELLAR_BAR_NPARAM * 4 * sizeof(double));
+  dx = (dM - STELLAR_BAR_MARR[xi]) /
+       (STELLAR_BAR_MARR[xi + 1] - STELLAR_BAR_MARR[xi]);
+
+  for (yi = 0; yi < STELLAR_BAR_ALEN; yi++) {
+    for (iParam = 0; iParam < STELLAR_BAR_NPARAM; iParam++) {
+      dTrack = &body[iBody].daBaraffeTrack[(yi * STELLAR_BAR_NPARAM + iParam) * 4];
+      if (yi == 0 || yi >= STELLAR_BAR_ALEN - 2) {
+        for (j = 0; j < 4; j++) {
+          dTrack[j] = NAN;
+        }
+        continue;
+      }
+      // Same operations as fdBaraffeBiCubic, so results are identical
+      fvBaraffeBiCubicCoeff(daData[iParam], xi, yi, dvCoeff);
+      for (j = 0; j < 4; j++) {
+        dTrack[j] =
+              dvCoeff[4 * j] +
+              dx * (dvCoeff[4 * j + 1] +
+                    dx * (dvCoeff[4 * j + 2] + dx * dvCoeff[4 * j + 3]));
+      }
+    }
+  }
+}
+
+/**
+  Free the tracks built by fvBaraffeTrack. Bodies without the Baraffe stellar
+  model never set daBaraffeTrack, so they are skipped.
+
+  @param body Body struct
+  @param iNumBodies Number of bodies
+*/
+void FreeBaraffeTrack(BODY *body, int iNumBodies) {
+  int iBody;
+
+  for (iBody = 0; iBody < iNumBodies; iBody++) {
+    if (body[iBody].bStellar &&
+        body[iBody].iStellarModel == STELLAR_MODEL_BARAFFE) {
+      free(body[iBody].daBaraffeTrack);
+      body[iBody].daBaraffeTrack = NULL;
+    }
+  }
+}
+
+/**
+  Find the age cell of the Baraffe grid with the same result as
+  fiGetLowerBound, starting from the cell of the previous call.
+
+  @param body Body struct
+  @param iBody Index of body
+  @param A Age in Gyr
+
+  @return Lower index of the cell, or a STELLAR_ERR_OUTOFBOUNDS code
+*/
+int fiBaraffeTrackCell(BODY *body, int iBody, double A) {
+  int iLo = 1, iHi = STELLAR_BAR_ALEN - 3, iMid;
+  int yi  = body[iBody].iBaraffeAge;
+
+  if (A < STELLAR_BAR_AARR[1]) {
+    return STELLAR_ERR_OUTOFBOUNDS_LO;
+  } else if (!(A < STELLAR_BAR_AARR[STELLAR_BAR_ALEN - 2])) {
+    return STELLAR_ERR_OUTOFBOUNDS_HI;
+  }
+
+  if (A >= STELLAR_BAR_AARR[yi] && A < STELLAR_BAR_AARR[yi + 1]) {
+    return yi;
+  }
+  if (yi < iHi && A >= STELLAR_BAR_AARR[yi + 1] &&
+      A < STELLAR_BAR_AARR[yi + 2]) {
+    body[iBody].iBaraffeAge = yi + 1;
+    return yi + 1;
+  }
+
+  // Bisection: AARR[iLo] <= A < AARR[iHi + 1]
+  while (iLo < iHi) {
+    iMid = (iLo + iHi + 1) / 2;
+    if (A < STELLAR_BAR_AARR[iMid]) {
+      iHi = iMid - 1;
+    } else {
+      iLo = iMid;
+    }
+  }
+  body[iBody].iBaraffeAge = iLo;
+  return iLo;
+}
+
+/**
+  Returns the stellar T, L, R or RG from the tracks built by fvBaraffeTrack.
+  All four parameters are evaluated together and kept until the age changes.
+  Any failure (no tracks, a changed mass, an age outside the tracks, or a NaN
+  cell) is returned in iError so the caller can fall back to fdBaraffe.
+
+  @param body Body struct
+  @param iBody Index of body
+  @param iParam STELLAR_T, STELLAR_L, STELLAR_R or STELLAR_RG
+  @param dAge Age of the body
+  @param iError Error code
+
+  @return Interpolated parameter
+*/
+double fdBaraffeTrack(BODY *body, int iBody, int iParam, double dAge,
+                      int *iError) {
+  double A, dy, dypow, dValue;
+  double *dTrack;
+  int yi, iPar, j;
+
+  if (body[iBody].daBaraffeTrack == NULL ||
+      body[iBody].dMass != body[iBody].dBaraffeMass) {
+    *iError = STELLAR_ERR_FILE;
+    return 0;
+  }
+
+  if (dAge != body[iBody].dBaraffeAge) {
+    A = dAge / (1.e9 * YEARSEC);
+    // Same minimum age as fdBaraffeInterpolate
+    if (A < 0.001) {
+      A = 0.001;
+    }
+    yi = fiBaraffeTrackCell(body, iBody, A);
+    if (yi < 0) {
+      *iError = yi;
+      return 0;
+    }
+    dy = (A - STELLAR_BAR_AARR[yi]) /
+         (STELLAR_BAR_AARR[yi + 1] - STELLAR_BAR_AARR[yi]);
+
+    for (iPar = 0; iPar < STELLAR_BAR_NPARAM; iPar++) {
+      dTrack = &body[iBody].daBaraffeTrack[(yi * STELLAR_BAR_NPARAM + iPar) * 4];
+      dValue = 0;
+      dypow  = 1;
+      for (j = 0; j < 4; j++) {
+        dValue += dypow * dTrack[j];
+        dypow *= dy;
+      }
+      body[iBody].daBaraffeValue[iPar] = dValue;
+    }
+    body[iBody].daBaraffeValue[STELLAR_T - 1] =
+          pow(10., body[iBody].daBaraffeValue[STELLAR_T - 1]);
+    body[iBody].daBaraffeValue[STELLAR_L - 1] =
+          LSUN * pow(10., body[iBody].daBaraffeValue[STELLAR_L - 1]);
+    body[iBody].daBaraffeValue[STELLAR_R - 1] *= RSUN;
+    body[iBody].dBaraffeAge = dAge;
+  }
+
+  if (iParam < STELLAR_T || iParam > STELLAR_RG) {
+    *iError = STELLAR_ERR_FILE;
+    return 0;
+  }
+  if (isnan(body[iBody].daBaraffeValue[iParam - 1])) {
+    *iError = STELLAR_ERR_ISNAN;
+    return 0;
+  }
+  *iError = STELLAR_ERR_NONE;
+  return body[iBody].daBaraffeValue[iParam - 1];
+}
+
 /** Compute habitable zone limits from Kopparapu et al. (2013). Works with
     any number of stars.
 
@@ -1467,13 +1867,29 @@ double fdBaraffe(int iParam, double A, double M, int iOrder, int *iError) {
 
 void fdHabitableZoneKopparapu2013(BODY *body, int iNumBodies,
                                   double *daHZLimit) {
+  // Assume central body's effective temperature? Is there a Better way?
+  fvHabitableZoneKopparapu2013Limits(fdLuminosityTotal(body, iNumBodies),
+                                     body[0].dTemperature, daHZLimit);
+}
+
+/** Compute the habitable zone limits of Kopparapu et al. (2013) for a given
+    luminosity and effective temperature, e.g. of a star at an age other than
+    the current one.
+
+@param dLuminosity The luminosity in W
+@param dTemperature The effective temperature in K
+@param daHZLimit A pointer to the array of the HZ_NUMLIMITS limits, indexed by
+  HZ_RECENTVENUS to HZ_TWOAUCLOUD
+
+*/
+void fvHabitableZoneKopparapu2013Limits(double dLuminosity,
+                                        double dTemperature,
+                                        double *daHZLimit) {
 
   int iLimit;
-  double dT_star, dLuminosity, dSeff[6];
+  double dT_star, dSeff[6];
   double dSeffSun[6], dCoeffA[6], dCoeffB[6], dCoeffC[6], dCoeffD[6];
 
-  // Caculate total system luminosity
-  dLuminosity = fdLuminosityTotal(body, iNumBodies);
   // Luminosity must be expressed in solar units
   dLuminosity /= LSUN;
 
@@ -1512,8 +1928,7 @@ void fdHabitableZoneKopparapu2013(BODY *body, int iNumBodies,
   dCoeffD[4] = -4.3896e-16;
   dCoeffD[5] = -3.8282e-16;
 
-  // Assume central body's effective temperature? Is there a Better way?
-  dT_star = body[0].dTemperature - 5700;
+  dT_star = dTemperature - 5700;
 
   for (iLimit = 0; iLimit < 6; iLimit++) {
     dSeff[iLimit] = dSeffSun[iLimit] + dCoeffA[iLimit] * dT_star +
@@ -55,6 +55,16 @@
 #define STELLAR_ERR_BADORDER -7
 #define STELLAR_BAR_MLEN 25
 #define STELLAR_BAR_ALEN 502
+#define STELLAR_BAR_NPARAM 4 // T, L, R and RG
+
+/* Indices of the six Kopparapu et al. (2013) habitable zone limits */
+#define HZ_RECENTVENUS 0
+#define HZ_RUNAWAYGREENHOUSE 1
+#define HZ_MOISTGREENHOUSE 2
+#define HZ_MAXGREENHOUSE 3
+#define HZ_EARLYMARS 4
+#define HZ_TWOAUCLOUD 5 // The 2 AU cloud limit
+#define HZ_NUMLIMITS 6
 
 /* @cond DOXYGEN_OVERRIDE */
 
@@ -65,6 +75,10 @@ double fdTimescaleMulti(double, double *, int);
 double fdPerToFreq(double);
 double fdRotVel(double, double);
 double fdDPerDt(double, double);
+int fiTableRow(double *, int, int, double);
+double fdTableKnotSlope(double *, int, int, int, int);
+double fdTableHermite(double *, int, int, int, double, int);
+int fiReadTable(CONTROL *, OPTIONS *, char *, int, int, char *, double **);
 
 double fdBodyPotEnergy(double, double);
 double fdRotAngMom(double, double, double, double);
@@ -108,6 +122,7 @@ void CalcXYZobl(BODY *, int);
 double CalcDynEllipEq(BODY *, int);
 
 void fdHabitableZoneKopparapu2013(BODY *, int, double *);
+void fvHabitableZoneKopparapu2013Limits(double, double, double *);
 
 double fdEffectiveTemperature(BODY*,int);
 
@@ -3753,6 +3768,13 @@ static double const daLopezRadius[MASSLEN][COMPLEN][FLUXLEN][METLEN][TIMELEN] =
 
 // Baraffe stellar evolution grid
 double fdBaraffe(int, double, double, int, int *);
+double fdBaraffeGrid(int, double, double, int, int *);
+void fvBaraffeBiCubicCoeff(double const[STELLAR_BAR_MLEN][STELLAR_BAR_ALEN],
+                           int, int, double *);
+void fvBaraffeTrack(BODY *, int);
+void FreeBaraffeTrack(BODY *, int);
+int fiBaraffeTrackCell(BODY *, int, double);
+double fdBaraffeTrack(BODY *, int, int, double, int *);
 
 /* @endcond */
 
@@ -0,0 +1,684 @@
+/**
+  @file checkpoint.c
+
+  @brief Snapshots of an integration, so that it can be resumed after it was
+  stopped, or several runs can branch from one state.
+
+  A snapshot holds what the integrator carries from one step to the next:
+  the time, the primary variables, the step size control, the switches and
+  iteration seeds of the modules, the event records, the length of each
+  output file and the reducers. Everything else is recomputed from the input
+  files and the primary variables when the run is resumed, so the input files
+  must describe the same bodies and modules.
+  All numbers are written in little-endian byte order.
+
+  @date Oct 2026
+
+*/
+
+#include "vplanet.h"
+
+/* Set by the SIGTERM handler; the snapshot is written at the end of the
+   step, when the state is consistent. */
+static volatile sig_atomic_t bTermSignal = 0;
+
+static void TermHandler(int iSignal) {
+  bTermSignal = 1;
+}
+
+/* Start writing snapshots, if requested. Only a command-line run catches
+   SIGTERM; an in-memory run belongs to its caller. */
+void InitializeCheckpoint(CONTROL *control, FILES *files) {
+  control->Io.dNextCheckpoint = dHUGE;
+  if (files->cCheckpoint == NULL) {
+    return;
+  }
+  if (control->Io.dCheckpointTime > 0) {
+    control->Io.dNextCheckpoint =
+          control->Evolve.dTime + control->Io.dCheckpointTime;
+  }
+  if (InMemory == NULL && !control->Io.bTermHandlerSet) {
+    bTermSignal                    = 0;
+    control->Io.fnPrevTermHandler = signal(SIGTERM, TermHandler);
+    control->Io.bTermHandlerSet   = 1;
+  }
+}
+
+/* Give SIGTERM back to whoever had it before the run. */
+void FinishCheckpoint(CONTROL *control, FILES *files) {
+  if (control->Io.bTermHandlerSet) {
+    signal(SIGTERM, control->Io.fnPrevTermHandler);
+    control->Io.bTermHandlerSet = 0;
+  }
+  free(control->Io.daCheckpointCarried);
+  control->Io.daCheckpointCarried = NULL;
+}
+
+static void fvWriteCheckpointString(FILE *fp, char *cString) {
+  int iLen = strlen(cString);
+
+  fvWriteLittleEndian(fp, &iLen, sizeof(int), 1);
+  fwrite(cString, 1, iLen, fp);
+}
+
+/* Read iNum values from the snapshot, or exit if it ends first. */
+static void fvReadCheckpoint(FILE *fp, void *pData, int iSize, int iNum,
+                             FILES *files, CONTROL *control) {
+  if (!fbReadLittleEndian(fp, pData, iSize, iNum)) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: %s ends before the snapshot is complete.\n",
+              files->cRestart);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+}
+
+static void fvReadCheckpointString(FILE *fp, char **cString, FILES *files,
+                                   CONTROL *control) {
+  int iLen;
+
+  fvReadCheckpoint(fp, &iLen, sizeof(int), 1, files, control);
+  if (iLen < 0 || iLen > CHECKPOINTMAXSTRING) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: %s is not a valid snapshot.\n", files->cRestart);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+  *cString = realloc(*cString, iLen + 1);
+  fvReadCheckpoint(fp, *cString, 1, iLen, files, control);
+  (*cString)[iLen] = '\0';
+}
+
+static void fvCheckpointMismatch(CONTROL *control, FILES *files,
+                                 char *cWhat) {
+  if (control->Io.iVerbose >= VERBERR) {
+    fprintf(stderr,
+            "ERROR: %s was written for a different system: %s do not match "
+            "the input files.\n",
+            files->cRestart, cWhat);
+  }
+  VplanetExit(EXIT_INPUT);
+}
+
+/* Open the snapshot to resume from and check that it describes the bodies,
+   primary variables and processes of the input files. Returns the file
+   positioned after the header. */
+static FILE *fpOpenRestart(BODY *body, CONTROL *control, FILES *files,
+                           UPDATE *update) {
+  FILE *fp;
+  char cMagic[CHECKPOINTMAGICLEN], *cName = NULL;
+  int iBody, iVar, iNum;
+
+  fp = fopen(files->cRestart, "rb");
+  if (fp == NULL) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: Unable to open %s.\n", files->cRestart);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+  if (fread(cMagic, 1, CHECKPOINTMAGICLEN, fp) != CHECKPOINTMAGICLEN ||
+      memcmp(cMagic, CHECKPOINTMAGIC, CHECKPOINTMAGICLEN) != 0) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: %s is not a snapshot written by this version.\n",
+              files->cRestart);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+
+  fvReadCheckpoint(fp, &iNum, sizeof(int), 1, files, control);
+  if (iNum != control->Evolve.iNumBodies) {
+    fvCheckpointMismatch(control, files, "the number of bodies");
+  }
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    fvReadCheckpointString(fp, &cName, files, control);
+    if (strcmp(cName, body[iBody].cName) != 0) {
+      fvCheckpointMismatch(control, files, "the body names");
+    }
+    fvReadCheckpoint(fp, &iNum, sizeof(int), 1, files, control);
+    if (iNum != update[iBody].iNumVars) {
+      fvCheckpointMismatch(control, files, "the primary variables");
+    }
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      fvReadCheckpoint(fp, &iNum, sizeof(int), 1, files, control);
+      if (iNum != update[iBody].iNumEqns[iVar]) {
+        fvCheckpointMismatch(control, files, "the processes");
+      }
+    }
+  }
+  free(cName);
+
+  return fp;
+}
+
+/* Write the reducers of every body. They are kept by name, so that a run
+   branching from the snapshot may ask for different ones. */
+static void fvWriteCheckpointReduce(FILE *fp, CONTROL *control,
+                                    FILES *files) {
+  int iBody, iReduce;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+    fvWriteLittleEndian(fp, &outfile->iNumReduce, sizeof(int), 1);
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      fvWriteCheckpointString(fp, outfile->saReduceName[iReduce]);
+      fvWriteLittleEndian(fp, &outfile->baReduceDone[iReduce], sizeof(int),
+                          1);
+      fvWriteLittleEndian(fp, &outfile->daReduceInitial[iReduce],
+                          sizeof(double), 1);
+      fvWriteLittleEndian(fp, &outfile->daReduceLast[iReduce], sizeof(double),
+                          1);
+      fvWriteLittleEndian(fp, &outfile->daReduceExtreme[iReduce],
+                          sizeof(double), 1);
+      fvWriteLittleEndian(fp, &outfile->daReduceResult[iReduce],
+                          sizeof(double), 1);
+    }
+  }
+}
+
+/* Read the reducers of every body. If bApply is set, a reducer of the
+   same name takes the saved record; reducers the snapshot does not know
+   start at the snapshot time. */
+static void fvReadCheckpointReduce(FILE *fp, CONTROL *control, FILES *files,
+                                   int bApply) {
+  int iBody, iReduce, iSaved, iNumSaved, bDone;
+  double daRecord[4];
+  char *cName = NULL;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+    fvReadCheckpoint(fp, &iNumSaved, sizeof(int), 1, files, control);
+    for (iSaved = 0; iSaved < iNumSaved; iSaved++) {
+      fvReadCheckpointString(fp, &cName, files, control);
+      fvReadCheckpoint(fp, &bDone, sizeof(int), 1, files, control);
+      fvReadCheckpoint(fp, daRecord, sizeof(double), 4, files, control);
+      if (!bApply) {
+        continue;
+      }
+      for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+        if (strcmp(cName, outfile->saReduceName[iReduce]) == 0) {
+          outfile->baReduceDone[iReduce]    = bDone;
+          outfile->daReduceInitial[iReduce] = daRecord[0];
+          outfile->daReduceLast[iReduce]    = daRecord[1];
+          outfile->daReduceExtreme[iReduce] = daRecord[2];
+          outfile->daReduceResult[iReduce]  = daRecord[3];
+        }
+      }
+    }
+  }
+  free(cName);
+}
+
+static void fvCarryDouble(double *pdValue, double *daCarried, int *iNum,
+                          int bStore) {
+  if (daCarried != NULL) {
+    if (bStore) {
+      daCarried[*iNum] = *pdValue;
+    } else {
+      *pdValue = daCarried[*iNum];
+    }
+  }
+  (*iNum)++;
+}
+
+static void fvCarryInt(int *piValue, double *daCarried, int *iNum,
+                       int bStore) {
+  double dValue = *piValue;
+
+  fvCarryDouble(&dValue, daCarried, iNum, bStore);
+  *piValue = (int)dValue;
+}
+
+/* Copy what the modules carry from one step to the next besides the
+   primary variables, between the bodies and daCarried, or only count it if
+   daCarried is NULL. These are the switches that ForceBehavior sets once a
+   threshold is crossed, and the values that the iterations of auxiliary
+   properties start from. Returns the number of values. */
+static int fiCheckpointCarried(BODY *body, CONTROL *control, SYSTEM *system,
+                               double *daCarried, int bStore) {
+  int iBody, iNum = 0;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    /* AtmEsc */
+    fvCarryInt(&body[iBody].iHEscapeRegime, daCarried, &iNum, bStore);
+
+    /* EqTide */
+    fvCarryInt(&body[iBody].bTideLock, daCarried, &iNum, bStore);
+    fvCarryDouble(&body[iBody].dLockTime, daCarried, &iNum, bStore);
+
+    /* GalHabit */
+    fvCarryInt(&body[iBody].iDisrupt, daCarried, &iNum, bStore);
+
+    /* MagmOc */
+    fvCarryInt(&body[iBody].bManStartSol, daCarried, &iNum, bStore);
+    fvCarryInt(&body[iBody].bLowPressSol, daCarried, &iNum, bStore);
+    fvCarryInt(&body[iBody].bAllFeOOxid, daCarried, &iNum, bStore);
+    fvCarryInt(&body[iBody].bManSolid, daCarried, &iNum, bStore);
+    fvCarryInt(&body[iBody].bPlanetDesiccated, daCarried, &iNum, bStore);
+    fvCarryInt(&body[iBody].bManQuasiSol, daCarried, &iNum, bStore);
+    fvCarryInt(&body[iBody].bEscapeStop, daCarried, &iNum, bStore);
+    fvCarryDouble(&body[iBody].dPrefactorA, daCarried, &iNum, bStore);
+    fvCarryDouble(&body[iBody].dPrefactorB, daCarried, &iNum, bStore);
+
+    /* POISE */
+    fvCarryInt(&body[iBody].bSkipSeas, daCarried, &iNum, bStore);
+
+    /* ThermInt: the melt fraction and viscosity of the mantle, and the
+       inner core and its light elements, iterate from these */
+    fvCarryDouble(&body[iBody].dMeltfactorUMan, daCarried, &iNum, bStore);
+    fvCarryDouble(&body[iBody].dMeltfactorLMan, daCarried, &iNum, bStore);
+    fvCarryDouble(&body[iBody].dRIC, daCarried, &iNum, bStore);
+    fvCarryDouble(&body[iBody].dMassChiIC, daCarried, &iNum, bStore);
+  }
+
+  /* GalHabit */
+  fvCarryInt(&system->bRadialMigr, daCarried, &iNum, bStore);
+  fvCarryDouble(&system->dLastEncTime, daCarried, &iNum, bStore);
+  fvCarryDouble(&system->dCloseEncTime, daCarried, &iNum, bStore);
+
+  /* SpiNBody and DistOrb switch between each other */
+  fvCarryInt(&control->Evolve.bUsingDistOrb, daCarried, &iNum, bStore);
+  fvCarryInt(&control->Evolve.bUsingSpiNBody, daCarried, &iNum, bStore);
+
+  return iNum;
+}
+
+/* Called at the end of every step, before the auxiliary properties are
+   updated. A resumed run repeats that update, so the snapshot needs the
+   iteration seeds it started from. */
+void KeepCheckpointCarried(BODY *body, CONTROL *control, FILES *files,
+                           SYSTEM *system) {
+  if (files->cCheckpoint == NULL) {
+    return;
+  }
+  if (control->Io.daCheckpointCarried == NULL) {
+    control->Io.daCheckpointCarried =
+          malloc(fiCheckpointCarried(body, control, system, NULL, 1) *
+                 sizeof(double));
+  }
+  fiCheckpointCarried(body, control, system, control->Io.daCheckpointCarried,
+                      1);
+}
+
+/* Could the next step start with the last stage of the previous one? The
+   state is compared when the step starts. */
+static int fbCheckpointStateEnd(CONTROL *control, UPDATE *update,
+                                fnUpdateVariable ***fnUpdate) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iEqn, iStateEqn = 0;
+
+  if (!evolve->bStateEndValid || evolve->daStateDeriv == NULL) {
+    return 0;
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        if (fnUpdate[iBody][iVar][iEqn] != evolve->fnStateEnd[iStateEqn++]) {
+          return 0;
+        }
+      }
+    }
+  }
+  return 1;
+}
+
+/* Write the snapshot. It goes to a temporary file first, so that a run
+   stopped while writing leaves the previous snapshot intact. */
+void WriteCheckpoint(BODY *body, CONTROL *control, FILES *files,
+                     SYSTEM *system, UPDATE *update,
+                     fnUpdateVariable ***fnUpdate) {
+  EVOLVE *evolve = &(control->Evolve);
+  FILE *fp;
+  char *cTmp = NULL;
+  int iBody, iVar, iEvent, bScale, bEnd, iNumCarried;
+  long long lSize;
+
+  fvFormattedString(&cTmp, "%s.tmp", files->cCheckpoint);
+  fp = fopen(cTmp, "wb");
+  if (fp == NULL) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: Unable to open %s.\n", cTmp);
+    }
+    VplanetExit(EXIT_WRITE);
+  }
+
+  fwrite(CHECKPOINTMAGIC, 1, CHECKPOINTMAGICLEN, fp);
+  fvWriteLittleEndian(fp, &evolve->iNumBodies, sizeof(int), 1);
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    fvWriteCheckpointString(fp, body[iBody].cName);
+    fvWriteLittleEndian(fp, &update[iBody].iNumVars, sizeof(int), 1);
+    fvWriteLittleEndian(fp, update[iBody].iNumEqns, sizeof(int),
+                        update[iBody].iNumVars);
+  }
+
+  fvWriteCheckpointReduce(fp, control, files);
+
+  fvWriteLittleEndian(fp, &evolve->dTime, sizeof(double), 1);
+  fvWriteLittleEndian(fp, &control->Io.dNextOutput, sizeof(double), 1);
+  fvWriteLittleEndian(fp, &evolve->dNextDt, sizeof(double), 1);
+  fvWriteLittleEndian(fp, &evolve->dCurrentDt, sizeof(double), 1);
+  fvWriteLittleEndian(fp, &evolve->iTotalSteps, sizeof(int), 1);
+  fvWriteLittleEndian(fp, &evolve->iStepsSinceLastOutput, sizeof(int), 1);
+  fvWriteLittleEndian(fp, &evolve->iNumRejectedSteps, sizeof(int), 1);
+  fvWriteLittleEndian(fp, &evolve->bFirstStep, sizeof(int), 1);
+
+  /* Some auxiliary properties, e.g. the latent heat of the mantle, depend
+     on the derivatives of the last step */
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    fvWriteLittleEndian(fp, &body[iBody].dAge, sizeof(double), 1);
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      fvWriteLittleEndian(fp, update[iBody].pdVar[iVar], sizeof(double), 1);
+      fvWriteLittleEndian(fp, &update[iBody].daDeriv[iVar], sizeof(double), 1);
+      fvWriteLittleEndian(fp, update[iBody].daDerivProc[iVar], sizeof(double),
+                          update[iBody].iNumEqns[iVar]);
+    }
+  }
+
+  /* The error control of the adaptive methods scales by the largest
+     magnitude each variable has had */
+  bScale = (evolve->daStateScale != NULL);
+  fvWriteLittleEndian(fp, &bScale, sizeof(int), 1);
+  if (bScale) {
+    fvWriteLittleEndian(fp, evolve->daStateScale, sizeof(double),
+                        evolve->iNumStateVars);
+  }
+
+  /* The adaptive methods start a step with the last stage of the previous
+     one, if it was evaluated at the same state with the same processes */
+  bEnd = fbCheckpointStateEnd(control, update, fnUpdate);
+  fvWriteLittleEndian(fp, &bEnd, sizeof(int), 1);
+  if (bEnd) {
+    fvWriteLittleEndian(fp, &evolve->iOneStep, sizeof(int), 1);
+    fvWriteLittleEndian(fp, &evolve->iNumStages, sizeof(int), 1);
+    fvWriteLittleEndian(fp, evolve->daStateEnd, sizeof(double),
+                        evolve->iNumStateVars);
+    fvWriteLittleEndian(fp, evolve->daStateDeriv, sizeof(double),
+                        evolve->iNumStages * evolve->iNumStateVars);
+    fvWriteLittleEndian(fp, evolve->daStateDerivProc, sizeof(double),
+                        evolve->iNumStages * evolve->iNumStateEqns);
+  }
+
+  if (control->Io.daCheckpointCarried == NULL) {
+    KeepCheckpointCarried(body, control, files, system);
+  }
+  iNumCarried = fiCheckpointCarried(body, control, system, NULL, 1);
+  fvWriteLittleEndian(fp, &iNumCarried, sizeof(int), 1);
+  fvWriteLittleEndian(fp, control->Io.daCheckpointCarried, sizeof(double),
+                      iNumCarried);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iEvent = 0; iEvent < NUMEVENTS; iEvent++) {
+      fvWriteLittleEndian(fp, &control->Halt[iBody].dEventTime[iEvent],
+                          sizeof(double), 1);
+      fvWriteLittleEndian(fp, &control->Halt[iBody].dEventValue[iEvent],
+                          sizeof(double), 1);
+    }
+  }
+
+  /* How much of each output file belongs to the snapshot */
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    lSize = -1;
+    if (files->Outfile[iBody].fp != NULL) {
+      fflush(files->Outfile[iBody].fp);
+      lSize = ftell(files->Outfile[iBody].fp);
+    }
+    fvWriteLittleEndian(fp, &lSize, sizeof(long long), 1);
+  }
+
+  if (fclose(fp) != 0) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: Unable to write %s.\n", cTmp);
+    }
+    VplanetExit(EXIT_WRITE);
+  }
+  /* Windows will not rename over an existing file */
+  if (rename(cTmp, files->cCheckpoint) != 0) {
+    remove(files->cCheckpoint);
+    if (rename(cTmp, files->cCheckpoint) != 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: Unable to write %s.\n", files->cCheckpoint);
+      }
+      VplanetExit(EXIT_WRITE);
+    }
+  }
+  free(cTmp);
+}
+
+/* Cut an output file back to the snapshot and open it for appending. A
+   file that does not exist yet is opened at the next output as usual. */
+static void ResumeOutputFile(CONTROL *control, FILES *files,
+                             OUTFILE *outfile, long long lSize) {
+  FILE *fp;
+  char *cBuffer;
+  long long lRead;
+
+  if (control->Io.iOutputFormat == OUTPUTMEMORY || outfile->iNumCols == 0 ||
+      lSize < 0) {
+    return;
+  }
+  fp = fopen(outfile->cOut, "rb");
+  if (fp == NULL) {
+    return;
+  }
+  cBuffer = malloc(lSize > 0 ? lSize : 1);
+  lRead   = fread(cBuffer, 1, lSize, fp);
+  fclose(fp);
+  if (lRead < lSize) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: %s is shorter than when %s was written.\n",
+              outfile->cOut, files->cRestart);
+    }
+    VplanetExit(EXIT_OUTPUT);
+  }
+
+  fp = fopen(outfile->cOut, "wb");
+  if (fp == NULL || (long long)fwrite(cBuffer, 1, lSize, fp) != lSize) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: Unable to write %s.\n", outfile->cOut);
+    }
+    VplanetExit(EXIT_OUTPUT);
+  }
+  fclose(fp);
+  free(cBuffer);
+
+  if (control->Io.iOutputFormat == OUTPUTBINARY) {
+    outfile->fp = fopen(outfile->cOut, "ab");
+  } else {
+    outfile->fp = fopen(outfile->cOut, "a");
+  }
+  if (outfile->fp == NULL) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: Unable to open %s.\n", outfile->cOut);
+    }
+    VplanetExit(EXIT_OUTPUT);
+  }
+  if (control->Io.iOutputFormat != OUTPUTBINARY) {
+    setvbuf(outfile->fp, NULL, _IOFBF, 1 << 16);
+  }
+}
+
+/* Put the integration back into the state of the snapshot. The input
+   files were read as usual, so options that differ from the run that wrote
+   the snapshot, e.g. dStopTime or a module parameter, take effect from the
+   snapshot time on. */
+void RestoreCheckpoint(BODY *body, CONTROL *control, FILES *files,
+                       MODULE *module, SYSTEM *system, UPDATE *update,
+                       fnUpdateVariable ***fnUpdate) {
+  EVOLVE *evolve = &(control->Evolve);
+  FILE *fp;
+  int iBody, iVar, iEqn, iEvent, iModule, iStateEqn, bScale, bEnd;
+  int iOneStep, iNumStages, iNumEnd, iNumCarried;
+  double *daEnd, *daCarried;
+  long long lSize;
+
+  fp = fpOpenRestart(body, control, files, update);
+  fvReadCheckpointReduce(fp, control, files, 0);
+
+  fvReadCheckpoint(fp, &evolve->dTime, sizeof(double), 1, files, control);
+  fvReadCheckpoint(fp, &control->Io.dNextOutput, sizeof(double), 1, files,
+                   control);
+  fvReadCheckpoint(fp, &evolve->dNextDt, sizeof(double), 1, files, control);
+  fvReadCheckpoint(fp, &evolve->dCurrentDt, sizeof(double), 1, files,
+                   control);
+  fvReadCheckpoint(fp, &evolve->iTotalSteps, sizeof(int), 1, files, control);
+  fvReadCheckpoint(fp, &evolve->iStepsSinceLastOutput, sizeof(int), 1, files,
+                   control);
+  fvReadCheckpoint(fp, &evolve->iNumRejectedSteps, sizeof(int), 1, files,
+                   control);
+  fvReadCheckpoint(fp, &evolve->bFirstStep, sizeof(int), 1, files, control);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    fvReadCheckpoint(fp, &body[iBody].dAge, sizeof(double), 1, files,
+                     control);
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      fvReadCheckpoint(fp, update[iBody].pdVar[iVar], sizeof(double), 1,
+                       files, control);
+      fvReadCheckpoint(fp, &update[iBody].daDeriv[iVar], sizeof(double), 1,
+                       files, control);
+      fvReadCheckpoint(fp, update[iBody].daDerivProc[iVar], sizeof(double),
+                       update[iBody].iNumEqns[iVar], files, control);
+    }
+  }
+
+  if (evolve->daState == NULL && evolve->iOneStep != EULER) {
+    InitializeStateVector(control, update);
+  }
+  fvReadCheckpoint(fp, &bScale, sizeof(int), 1, files, control);
+  if (bScale) {
+    daEnd = malloc(evolve->iNumStateVars * sizeof(double));
+    fvReadCheckpoint(fp, daEnd, sizeof(double), evolve->iNumStateVars, files,
+                     control);
+    if (evolve->daStateScale != NULL) {
+      memcpy(evolve->daStateScale, daEnd,
+             evolve->iNumStateVars * sizeof(double));
+    }
+    free(daEnd);
+  }
+
+  /* The last stage is only reused by the method that evaluated it */
+  evolve->bStateEndValid = 0;
+  fvReadCheckpoint(fp, &bEnd, sizeof(int), 1, files, control);
+  if (bEnd) {
+    fvReadCheckpoint(fp, &iOneStep, sizeof(int), 1, files, control);
+    fvReadCheckpoint(fp, &iNumStages, sizeof(int), 1, files, control);
+    iNumEnd = evolve->iNumStateVars * (1 + iNumStages) +
+              evolve->iNumStateEqns * iNumStages;
+    daEnd = malloc(iNumEnd * sizeof(double));
+    fvReadCheckpoint(fp, daEnd, sizeof(double), iNumEnd, files, control);
+    if (iOneStep == evolve->iOneStep && evolve->daState != NULL &&
+        iNumStages == evolve->iNumStages) {
+      memcpy(evolve->daStateEnd, daEnd,
+             evolve->iNumStateVars * sizeof(double));
+      memcpy(evolve->daStateDeriv, daEnd + evolve->iNumStateVars,
+             iNumStages * evolve->iNumStateVars * sizeof(double));
+      memcpy(evolve->daStateDerivProc,
+             daEnd + evolve->iNumStateVars * (1 + iNumStages),
+             iNumStages * evolve->iNumStateEqns * sizeof(double));
+      evolve->bStateEndValid = 1;
+    }
+    free(daEnd);
+  }
+
+  /* The switches of the modules decide how they behave in the restored
+     state */
+  fvReadCheckpoint(fp, &iNumCarried, sizeof(int), 1, files, control);
+  if (iNumCarried != fiCheckpointCarried(body, control, system, NULL, 0)) {
+    fvCheckpointMismatch(control, files, "the module properties");
+  }
+  daCarried = malloc(iNumCarried * sizeof(double));
+  fvReadCheckpoint(fp, daCarried, sizeof(double), iNumCarried, files,
+                   control);
+  fiCheckpointCarried(body, control, system, daCarried, 0);
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iEvent = 0; iEvent < NUMEVENTS; iEvent++) {
+      fvReadCheckpoint(fp, &control->Halt[iBody].dEventTime[iEvent],
+                       sizeof(double), 1, files, control);
+      fvReadCheckpoint(fp, &control->Halt[iBody].dEventValue[iEvent],
+                       sizeof(double), 1, files, control);
+    }
+  }
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    fvReadCheckpoint(fp, &lSize, sizeof(long long), 1, files, control);
+    ResumeOutputFile(control, files, &files->Outfile[iBody], lSize);
+  }
+  fclose(fp);
+
+  /* Repeat the end of a step, so that the modules switch to the behavior
+     of the restored state. The auxiliary properties are then updated once
+     more from the iteration seeds of the last update before the snapshot,
+     which gives the same properties. */
+  PropertiesAuxiliary(body, control, system, update);
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iModule = 0; iModule < evolve->iNumModules[iBody]; iModule++) {
+      control->fnForceBehavior[iBody][iModule](body, module, evolve,
+                                               &control->Io, system, update,
+                                               fnUpdate, iBody, iModule);
+    }
+    for (iModule = 0; iModule < control->iNumMultiForce[iBody]; iModule++) {
+      control->fnForceBehaviorMulti[iBody][iModule](
+            body, module, evolve, &control->Io, system, update, fnUpdate,
+            iBody, iModule);
+    }
+  }
+  fiCheckpointCarried(body, control, system, daCarried, 0);
+  free(daCarried);
+  PropertiesAuxiliary(body, control, system, update);
+
+  if (evolve->bStateEndValid) {
+    iStateEqn = 0;
+    for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+      for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          evolve->fnStateEnd[iStateEqn++] = fnUpdate[iBody][iVar][iEqn];
+        }
+      }
+    }
+  }
+
+  if (control->Io.iVerbose >= VERBPROG) {
+    printf("Resumed from %s.\n", files->cRestart);
+  }
+}
+
+/* Give the reducers the records of the snapshot. Must follow
+   InitializeReduce, which starts the reducers the snapshot does not know. */
+void RestoreCheckpointReduce(BODY *body, CONTROL *control, FILES *files,
+                             UPDATE *update) {
+  FILE *fp;
+
+  fp = fpOpenRestart(body, control, files, update);
+  fvReadCheckpointReduce(fp, control, files, 1);
+  fclose(fp);
+  SetNextReduce(control, files);
+}
+
+/* Called at the end of every step: write a snapshot when one is due, and
+   stop after writing one if SIGTERM arrived. */
+void CheckpointStep(BODY *body, CONTROL *control, FILES *files,
+                    SYSTEM *system, UPDATE *update,
+                    fnUpdateVariable ***fnUpdate) {
+  if (files->cCheckpoint == NULL) {
+    return;
+  }
+
+  if (bTermSignal) {
+    WriteCheckpoint(body, control, files, system, update, fnUpdate);
+    CloseOutput(control, files);
+    FinishCheckpoint(control, files);
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "INFO: Stopped by SIGTERM; snapshot written to %s.\n",
+              files->cCheckpoint);
+    }
+    VplanetExit(EXIT_TERM);
+  }
+
+  if (control->Evolve.dTime >= control->Io.dNextCheckpoint) {
+    WriteCheckpoint(body, control, files, system, update, fnUpdate);
+    while (control->Io.dNextCheckpoint <= control->Evolve.dTime) {
+      control->Io.dNextCheckpoint += control->Io.dCheckpointTime;
+    }
+  }
+}
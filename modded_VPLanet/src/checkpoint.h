@@ -0,0 +1,30 @@
+/**
+  @file checkpoint.h
+
+  @brief Snapshots of an integration, so that it can be resumed or branched.
+
+  @date Oct 2026
+
+*/
+
+/* First bytes of a snapshot file; the digit is the layout version */
+#define CHECKPOINTMAGIC "VPLCKPT2"
+#define CHECKPOINTMAGICLEN 8
+
+/* Longest name a snapshot may hold; longer means the file is corrupt */
+#define CHECKPOINTMAXSTRING 65536
+
+/* @cond DOXYGEN_OVERRIDE */
+
+void InitializeCheckpoint(CONTROL *, FILES *);
+void FinishCheckpoint(CONTROL *, FILES *);
+void KeepCheckpointCarried(BODY *, CONTROL *, FILES *, SYSTEM *);
+void WriteCheckpoint(BODY *, CONTROL *, FILES *, SYSTEM *, UPDATE *,
+                     fnUpdateVariable ***);
+void RestoreCheckpoint(BODY *, CONTROL *, FILES *, MODULE *, SYSTEM *,
+                       UPDATE *, fnUpdateVariable ***);
+void RestoreCheckpointReduce(BODY *, CONTROL *, FILES *, UPDATE *);
+void CheckpointStep(BODY *, CONTROL *, FILES *, SYSTEM *, UPDATE *,
+                    fnUpdateVariable ***);
+
+/* @endcond */
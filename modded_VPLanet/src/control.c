@@ -111,11 +111,27 @@ void InitializeFilesOptions(FILES *files,OPTIONS *options) {
   }
 }
 
+/* Forget where each option was found, so that the option tables can be
+   reused by another run. */
+void FreeFilesOptions(FILES *files, OPTIONS *options) {
+  int iFile, iOption;
+
+  for (iOption = 0; iOption < MODULEOPTEND; iOption++) {
+    for (iFile = 0; iFile < files->iNumInputs; iFile++) {
+      free(options[iOption].cFile[iFile]);
+    }
+    free(options[iOption].cFile);
+    options[iOption].cFile = NULL;
+  }
+}
+
 void InitializeFiles(FILES *files, OPTIONS *options, char *sPrimaryFile, char **saBodyFiles, int iNumBodies) {
   int iFile;
 
   files->iNumInputs = iNumBodies + 1;
   files->cLog = NULL;
+  files->cCheckpoint = NULL;
+  files->cRestart    = NULL;
   files->cExe = NULL;
   files->Infile            = malloc(files->iNumInputs * sizeof(INFILE));
   files->Outfile             = malloc(iNumBodies * sizeof(OUTFILE));
@@ -131,6 +147,25 @@ void InitializeFiles(FILES *files, OPTIONS *options, char *sPrimaryFile, char **
       fvFormattedString(&files->Infile[iFile].cIn, saBodyFiles[iFile-1]);
 
       files->Outfile[iFile-1].cOut = NULL;
+      files->Outfile[iFile-1].fp = NULL;
+      files->Outfile[iFile-1].iaPlanOut = NULL;
+      files->Outfile[iFile-1].iNumRows = 0;
+      files->Outfile[iFile-1].iMaxRows = 0;
+      files->Outfile[iFile-1].daRows = NULL;
+      files->Outfile[iFile-1].saColName = NULL;
+      files->Outfile[iFile-1].saColUnit = NULL;
+      files->Outfile[iFile-1].iNumReduce = 0;
+      files->Outfile[iFile-1].saReduceName = NULL;
+      files->Outfile[iFile-1].saReduceUnit = NULL;
+      files->Outfile[iFile-1].iaReduceOut = NULL;
+      files->Outfile[iFile-1].iaReduceOp = NULL;
+      files->Outfile[iFile-1].baReduceNeg = NULL;
+      files->Outfile[iFile-1].baReduceDone = NULL;
+      files->Outfile[iFile-1].daReduceTime = NULL;
+      files->Outfile[iFile-1].daReduceInitial = NULL;
+      files->Outfile[iFile-1].daReduceLast = NULL;
+      files->Outfile[iFile-1].daReduceExtreme = NULL;
+      files->Outfile[iFile-1].daReduceResult = NULL;
       // Outfile names assigned after reading in output file names
     }
     RecordCommentsAndWhiteSpace(&files->Infile[iFile]);
@@ -209,6 +244,8 @@ void InitializeIo(CONTROL *control) {
         malloc(control->Evolve.iNumBodies * sizeof(int));
   control->Io.baEnterHZMessage =
         malloc(control->Evolve.iNumBodies * sizeof(int));
+  control->Io.bTermHandlerSet     = 0;
+  control->Io.daCheckpointCarried = NULL;
   for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
     control->Io.baRocheMessage[iBody]      = 0;
     control->Io.baCassiniOneMessage[iBody] = 0;
@@ -257,8 +294,17 @@ void InitializeControlEvolve(BODY *body, CONTROL *control, MODULE *module,
 
   control->Evolve.tmpBody = malloc(control->Evolve.iNumBodies * sizeof(BODY));
   InitializeBodyModules(&control->Evolve.tmpBody, control->Evolve.iNumBodies);
+  control->Evolve.daState        = NULL;
+  control->Evolve.dNextDt        = 0;
+  control->Evolve.bStateEndValid = 0;
+  control->Evolve.iNumRejectedSteps = 0;
 
   for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    /* Names never change, so BodyCopy leaves them alone */
+    control->Evolve.tmpBody[iBody].cName = NULL;
+    fvFormattedString(&control->Evolve.tmpBody[iBody].cName,
+                      body[iBody].cName);
+
     control->Evolve.fnBodyCopy[iBody] =
           malloc(module->iNumModules[iBody] * sizeof(fnBodyCopyModule));
 
@@ -267,9 +313,9 @@ void InitializeControlEvolve(BODY *body, CONTROL *control, MODULE *module,
     }
   }
 
-  /* Currently this only matters for RK4 integration. This should
-     be generalized for any integration method. */
-  if (control->Evolve.iOneStep == RUNGEKUTTA) {
+  /* Every method except Euler evaluates derivatives in tmpBody, so these
+     are needed by all of them. */
+  if (control->Evolve.iOneStep != EULER) {
     control->Evolve.daDeriv     = malloc(4 * sizeof(double **));
     control->Evolve.daDerivProc = malloc(4 * sizeof(double ***));
     for (iSubStep = 0; iSubStep < 4; iSubStep++) {
@@ -498,7 +544,7 @@ void WriteHelpOption(OPTIONS *options, int bLong) {
       } else {
         fprintf(stderr, "ERROR: Unknown value for typestr in "
                         "control.c:WriteHelpOption.\n");
-        exit(EXIT_UNITS);
+        VplanetExit(EXIT_UNITS);
       }
       printf("| Type            || %s", typestr);
       for (typelen = 0; typelen < (iMaxChars - strlen(typestr)); typelen++) {
@@ -768,16 +814,166 @@ void Help(OPTIONS *options, OUTPUT *output, char exe[], int bLong) {
          options[OPT_OUTPUTORDER].cName);
   HelpOutput(output, bLong);
 
-  exit(0);
+  VplanetExit(0);
 }
 
 /*
  * I/O
  */
 
+/* Stop the run. A command-line run exits; an in-memory run returns to the
+   caller, which reports iExitStatus. */
+void VplanetExit(int iExitStatus) {
+  if (InMemory != NULL) {
+    InMemory->iExitStatus = iExitStatus;
+    longjmp(InMemory->jbExit, 1);
+  }
+  exit(iExitStatus);
+}
+
+#ifdef VPLANET_PYTHON_INTERFACE
+/*
+ * Memory of in-memory runs
+ *
+ * The Python extension routes malloc, calloc, realloc, free, fopen and fclose
+ * through these functions. While an in-memory run is active on this thread,
+ * each allocation is linked into its RUNMEMORY, and each open file recorded.
+ * The real functions are called by their names in parentheses, which the
+ * macros of vplanet.h do not replace.
+ */
+
+static void LinkRunBlock(RUNBLOCK *block, RUNMEMORY *memory) {
+  block->memory = memory;
+  block->pPrev  = NULL;
+  block->pNext  = NULL;
+  if (memory != NULL) {
+    block->pNext = memory->pFirst;
+    if (memory->pFirst != NULL) {
+      memory->pFirst->pPrev = block;
+    }
+    memory->pFirst = block;
+  }
+}
+
+static void UnlinkRunBlock(RUNBLOCK *block) {
+  if (block->memory == NULL) {
+    return;
+  }
+  if (block->pPrev != NULL) {
+    block->pPrev->pNext = block->pNext;
+  } else {
+    block->memory->pFirst = block->pNext;
+  }
+  if (block->pNext != NULL) {
+    block->pNext->pPrev = block->pPrev;
+  }
+}
+
+void *RunMalloc(size_t iSize) {
+  RUNBLOCK *block = (malloc)(sizeof(RUNBLOCK) + iSize);
+
+  if (block == NULL) {
+    return NULL;
+  }
+  LinkRunBlock(block, InMemory != NULL ? &InMemory->Memory : NULL);
+  return block + 1;
+}
+
+void *RunCalloc(size_t iNum, size_t iSize) {
+  void *pMem;
+
+  if (iSize != 0 && iNum > ((size_t)-1 - sizeof(RUNBLOCK)) / iSize) {
+    return NULL;
+  }
+  pMem = RunMalloc(iNum * iSize);
+  if (pMem != NULL) {
+    memset(pMem, 0, iNum * iSize);
+  }
+  return pMem;
+}
+
+/* A reallocated block stays with the run that allocated it */
+void *RunRealloc(void *pMem, size_t iSize) {
+  RUNBLOCK *block, *newblock;
+
+  if (pMem == NULL) {
+    return RunMalloc(iSize);
+  }
+  block = (RUNBLOCK *)pMem - 1;
+  UnlinkRunBlock(block);
+  newblock = (realloc)(block, sizeof(RUNBLOCK) + iSize);
+  if (newblock == NULL) {
+    LinkRunBlock(block, block->memory);
+    return NULL;
+  }
+  LinkRunBlock(newblock, newblock->memory);
+  return newblock + 1;
+}
+
+void RunFree(void *pMem) {
+  RUNBLOCK *block;
+
+  if (pMem == NULL) {
+    return;
+  }
+  block = (RUNBLOCK *)pMem - 1;
+  UnlinkRunBlock(block);
+  (free)(block);
+}
+
+FILE *RunFopen(const char *cFile, const char *cMode) {
+  FILE *fp = (fopen)(cFile, cMode);
+  RUNMEMORY *memory;
+
+  if (fp != NULL && InMemory != NULL) {
+    memory = &InMemory->Memory;
+    if (memory->iNumOpen == memory->iMaxOpen) {
+      memory->iMaxOpen = 2 * memory->iMaxOpen + 4;
+      memory->fpaOpen =
+            (realloc)(memory->fpaOpen, memory->iMaxOpen * sizeof(FILE *));
+    }
+    memory->fpaOpen[memory->iNumOpen++] = fp;
+  }
+  return fp;
+}
+
+int RunFclose(FILE *fp) {
+  RUNMEMORY *memory;
+  int iFile;
+
+  if (InMemory != NULL) {
+    memory = &InMemory->Memory;
+    for (iFile = memory->iNumOpen - 1; iFile >= 0; iFile--) {
+      if (memory->fpaOpen[iFile] == fp) {
+        memory->fpaOpen[iFile] = memory->fpaOpen[--memory->iNumOpen];
+        break;
+      }
+    }
+  }
+  return (fclose)(fp);
+}
+
+/* Close the files and free the allocations that the run left behind */
+void FreeRunMemory(RUNMEMORY *memory) {
+  RUNBLOCK *block;
+  int iFile;
+
+  for (iFile = 0; iFile < memory->iNumOpen; iFile++) {
+    (fclose)(memory->fpaOpen[iFile]);
+  }
+  (free)(memory->fpaOpen);
+  while (memory->pFirst != NULL) {
+    block          = memory->pFirst;
+    memory->pFirst = block->pNext;
+    (free)(block);
+  }
+  memset(memory, 0, sizeof(RUNMEMORY));
+}
+#endif
+
 void LineExit(char cFile[], int iLine) {
   fprintf(stderr, "\t%s: Line %d\n", cFile, iLine + 1);
-  exit(EXIT_INPUT);
+  VplanetExit(EXIT_INPUT);
 }
 
 char *sLower(char cString[]) {
@@ -909,7 +1105,7 @@ void AllocateStringMemory(char **sString, int iStringLength) {
 
   if (*sString == NULL) {
     fprintf(stderr, "ERROR: Failure in function AllocateStringMemory.\n");
-    exit(EXIT_EXE);
+    VplanetExit(EXIT_EXE);
   }
 }
 
@@ -950,7 +1146,7 @@ double fdUnitsLength(int iType) {
     return AUM;
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitLength %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -971,7 +1167,7 @@ void fsUnitsLength(int iType, char **cUnit) {
     fvFormattedString(cUnit, "au");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitLength %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -989,7 +1185,7 @@ double fdUnitsTime(int iType) {
     return 1e9 * YEARSEC;
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTime: %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1006,7 +1202,7 @@ void fsUnitsTime(int iType, char **cUnit) {
     fvFormattedString(cUnit, "Gyr");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTime: %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1025,7 +1221,7 @@ double fdUnitsMass(int iType) {
     return MNEP;
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitMass: %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1045,7 +1241,7 @@ void fsUnitsMass(int iType, char **cUnit) {
 
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitMass: %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1056,7 +1252,7 @@ double fdUnitsAngle(int iType) {
     return DEGRAD;
   } else {
     fprintf(stderr, "ERROR: Unknown Angle type %d\n.", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1067,7 +1263,7 @@ void fsUnitsAngle(int iType, char **cUnit) {
     fvFormattedString(cUnit, "deg");
   } else {
     fprintf(stderr, "ERROR: Unknown Angle type %d\n.", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1208,7 +1404,7 @@ double fdUnitsTemp(double dTemp, int iOldType, int iNewType) {
       return dTemp;
     } else {
       fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iNewType);
-      exit(EXIT_UNITS);
+      VplanetExit(EXIT_UNITS);
     }
   } else if (iOldType == U_CELSIUS) {
     if (iNewType == U_KELVIN) {
@@ -1221,7 +1417,7 @@ double fdUnitsTemp(double dTemp, int iOldType, int iNewType) {
       return dTemp;
     } else {
       fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iNewType);
-      exit(EXIT_UNITS);
+      VplanetExit(EXIT_UNITS);
     }
   } else if (iOldType == U_FARENHEIT) {
     if (iNewType == U_KELVIN) {
@@ -1234,11 +1430,11 @@ double fdUnitsTemp(double dTemp, int iOldType, int iNewType) {
       return dTemp;
     } else {
       fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iNewType);
-      exit(EXIT_UNITS);
+      VplanetExit(EXIT_UNITS);
     }
   } else {
     fprintf(stderr, "ERROR: Unknown Temperature type %d.\n", iOldType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1251,7 +1447,7 @@ void fsUnitsTemp(int iType, char **cUnit) {
     fvFormattedString(cUnit, "F");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTemp %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
@@ -1265,7 +1461,7 @@ void fsUnitsTempRate(int iType, char **cUnit) {
     fvFormattedString(cUnit, "F/s");
   } else {
     fprintf(stderr, "ERROR: Unknown iUnitTempRate %d.\n", iType);
-    exit(EXIT_UNITS);
+    VplanetExit(EXIT_UNITS);
   }
 }
 
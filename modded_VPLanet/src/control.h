@@ -18,6 +18,7 @@ void InitializeControlEvolve(BODY *, CONTROL *, MODULE *, UPDATE *);
 void InitializeControlVerifyProperty(CONTROL *);
 
 void InitializeFiles(FILES *, OPTIONS *, char *,char **, int);
+void FreeFilesOptions(FILES *, OPTIONS *);
 
 void WriteHelpOption(OPTIONS *, int);
 void WriteHelpOutput(OUTPUT *, int);
@@ -25,6 +26,10 @@ void HelpOptions(OPTIONS *, int);
 void HelpOutput(OUTPUT *, int);
 void Help(OPTIONS *, OUTPUT *, char[], int);
 
+NORETURN void VplanetExit(int);
+#ifdef VPLANET_PYTHON_INTERFACE
+void FreeRunMemory(RUNMEMORY *);
+#endif
 void LineExit(char[], int);
 char *sLower(char[]);
 void fprintd(FILE *, double, int, int);
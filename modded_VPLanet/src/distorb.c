@@ -494,7 +494,7 @@ void VerifyOrbitModel(CONTROL *control, FILES *files, OPTIONS *options) {
         }
       }
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   if (iFound == 0) {
@@ -543,7 +543,7 @@ void VerifyPericenter(BODY *body, CONTROL *control, OPTIONS *options,
               options[OPT_LONGA].cName, options[OPT_LONGP].cName,
               options[OPT_ARGP].cName, cFile);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   /* At least 2 must be set */
@@ -558,7 +558,7 @@ void VerifyPericenter(BODY *body, CONTROL *control, OPTIONS *options,
               options[OPT_LONGA].cName, options[OPT_LONGP].cName,
               options[OPT_ARGP].cName, cFile);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   /* Were all set? */
@@ -570,7 +570,7 @@ void VerifyPericenter(BODY *body, CONTROL *control, OPTIONS *options,
                      options[OPT_LONGA].iLine[iBody + 1],
                      options[OPT_LONGP].iLine[iBody + 1],
                      options[OPT_ARGP].iLine[iBody + 1], cFile, iVerbose);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   /* Was LONGA set? */
@@ -752,7 +752,7 @@ void VerifyPerturbersDistOrbRD4(BODY *body, int iNumBodies, int iBody) {
     if (j != iBody) {
       if (body[j].bDistOrb == 0) {
         fprintf(stderr, "ERROR: DistOrb must be the called for all planets\n");
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       body[iBody].iaGravPerts[iPert] = j;
       iPert++;
@@ -869,7 +869,7 @@ void VerifyPerturbersDistOrbLL2(BODY *body, int iNumBodies, int iBody) {
   for (j = 1; j < iNumBodies; j++) {
     if (body[j].bDistOrb == 0) {
       fprintf(stderr, "ERROR: DistOrb must be the called for all planets\n");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
     body[iBody].iaGravPerts[iPert] = j;
     iPert++;
@@ -885,7 +885,7 @@ void VerifyGRCorrLL2(BODY *body, int iNumBodies) {
                       "DistOrb LL2 model\n");
       fprintf(stderr,"\t%s: %d\n",body[1].cName,body[1].bGRCorr);
       fprintf(stderr,"\t%s: %d\n",body[iBody].cName,body[iBody].bGRCorr);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 }
@@ -2358,7 +2358,7 @@ double fndABmatrix(BODY *body, int j, int jBody, int kBody) {
     fprintf(stderr,
             "ERROR: Body %s and body %s have the same semi-major axis.\n",
             body[kBody].cName, body[jBody].cName);
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   n = KGAUSS * sqrt((body[0].dMass + body[jBody].dMass) / MSUN /
@@ -2475,7 +2475,7 @@ void HessEigen(double **amat, int origsize, double real[], double imag[]) {
         } else {
           if (iterations == 30) {
             fprintf(stderr, "Too many iterations in HessEigen routine\n");
-            exit(EXIT_INPUT);
+            VplanetExit(EXIT_INPUT);
           }
           if (iterations == 10 || iterations == 20) {
             exshift += lrcorner;
@@ -2713,7 +2713,7 @@ void LUDecomp(double **amat, double **copy, double *scale, int *rowswap,
     }
     if (scale[i] == 0.0) {
       fprintf(stderr, "Singular matrix in routine LUDecomp");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
     for (j = 0; j < size; j++) {
       copy[i][j] = amat[i][j];
@@ -3018,7 +3018,7 @@ void RecalcLaplace(BODY *body, EVOLVE *evolve, SYSTEM *system, int iVerbose) {
         alpha1 = body[jBody].dSemi / body[iBody].dSemi;
       } else {
         fprintf(stderr,"ERROR: Semi-major axes cannot be identical in RecalcLaplace.");
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
 
       for (j = 0; j < 26; j++) {
@@ -3062,7 +3062,7 @@ void RecalcEigenVals(BODY *body, EVOLVE *evolve, SYSTEM *system) {
         alpha1 = body[jBody].dSemi / body[iBody].dSemi;
       } else {
         fprintf(stderr,"ERROR: Semi-major axes cannot be identical in RecalcEigenVals.");
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       for (j = 0; j < 2; j++) {
         dalphaTmp =
@@ -413,17 +413,17 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
       fprintf(stderr, "ERROR: Must set %s if using %s for file %s\n",
               options[OPT_FILEORBITDATA].cName,
               options[OPT_READORBITDATA].cName, body[iBody].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else {
       fileorb = fopen(body[iBody].cFileOrbitData, "r");
       if (fileorb == NULL) {
         printf("ERROR: File %s not found.\n", body[iBody].cFileOrbitData);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       // Check file has exactly 7 columns
       if (fgets(cLine, LINE, fileorb) == NULL) {
         fprintf(stderr, "ERROR: Unable to read line from orbit data file.");
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       GetWords(cLine, cFoo, &iNumColsFound, &bFoo);
       if (iNumCols != iNumColsFound) {
@@ -434,7 +434,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
                   iNumColsFound, options[OPT_READORBITDATA].cName,
                   body[iBody].cFileOrbitData, iNumCols);
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
 
 
@@ -464,7 +464,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
         if (fscanf(fileorb, "%lf %lf %lf %lf %lf %lf %lf\n", &dttmp, &datmp,
                    &detmp, &ditmp, &daptmp, &dlatmp, &dmatmp) != 7) {
           fprintf(stderr, "ERROR: Incorrect number of columns in orbit file.");
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
         body[iBody].daTimeSeries[iLine] =
               dttmp * fdUnitsTime(control->Units[iBody + 1].iTime);
@@ -506,7 +506,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
       fprintf(stderr,
               "ERROR: Cannot use variable time step (%s = 1) if %s = 1\n",
               options[OPT_VARDT].cName, options[OPT_READORBITDATA].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
     if (control->Evolve.bDoForward) {
       if (body[iBody].daTimeSeries[1] != control->Evolve.dTimeStep) {
@@ -516,7 +516,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
                 "(%lf) if %s = 1\n",
                 options[OPT_TIMESTEP].cName, control->Evolve.dTimeStep,
                 body[iBody].daTimeSeries[1], options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     } else if (control->Evolve.bDoBackward) {
       if (body[iBody].daTimeSeries[1] != -1 * control->Evolve.dTimeStep) {
@@ -526,7 +526,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
                 "(%lf) if %s = 1\n",
                 options[OPT_TIMESTEP].cName, control->Evolve.dTimeStep,
                 body[iBody].daTimeSeries[1], options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     }
     if (iNLines < (control->Evolve.dStopTime / control->Evolve.dTimeStep + 1)) {
@@ -534,7 +534,7 @@ void VerifyOrbitData(BODY *body, CONTROL *control, OPTIONS *options,
               "ERROR: Final time in %s is less than %s; simulation cannot be "
               "completed.\n",
               options[OPT_FILEORBITDATA].cName, options[OPT_STOPTIME].cName);
-      exit(EXIT_INPUT); // Should really be a DoubleLineExit
+      VplanetExit(EXIT_INPUT); // Should really be a DoubleLineExit
     }
   }
 }
@@ -1745,7 +1745,7 @@ void PropsAuxDistRot(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
       fprintf(stderr, "\tYobl: %.6e\n", body[iBody].dYobl);
       fprintf(stderr, "\tZobl: %.6e\n", body[iBody].dZobl);
     }
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   body[iBody].dObliquity = atan2(sqrt(body[iBody].dXobl * body[iBody].dXobl +
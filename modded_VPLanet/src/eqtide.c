@@ -1286,7 +1286,7 @@ void VerifyCTL(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 "%s.\n",
                 options[OPT_TIDALQ].cName, files->Infile[iBody + 1].cIn);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 
@@ -1514,7 +1514,7 @@ void VerifyCPL(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                 "%s.\n",
                 options[OPT_TIDALTAU].cName, files->Infile[iBody + 1].cIn);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
 
     /* Verify output contains no CTL-specific parameters */
@@ -1677,7 +1677,7 @@ void VerifyPerturbersEqtide(BODY *body, FILES *files, OPTIONS *options,
       }
 
       if (!ok) {
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     }
   }
@@ -1712,7 +1712,7 @@ void VerifyPerturbersEqtide(BODY *body, FILES *files, OPTIONS *options,
           fprintf(stderr, "\tFile: %s, Line: %d\n",
                   files->Infile[body[iBody].iaTidePerts[iPert] + 1].cIn,
                   options[OPT_TIDEPERTS].iLine[iPert + 1]);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
       }
     }
@@ -1754,7 +1754,7 @@ int fiGetModuleIntEqtide(MODULE *module, int iBody) {
   }
 
   fprintf(stderr, "ERROR: Eqtide not found for body #%d.\n", iBody);
-  exit(1);
+  VplanetExit(1);
 }
 
 void VerifyTideModel(CONTROL *control, FILES *files, OPTIONS *options) {
@@ -1777,7 +1777,7 @@ void VerifyTideModel(CONTROL *control, FILES *files, OPTIONS *options) {
         }
       }
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   if (iFound == 0) {
@@ -1815,7 +1815,7 @@ void AssignEqtideDerivatives(BODY *body, EVOLVE *evolve, UPDATE *update,
           &fndUpdateFunctionTiny;
   } else {
     fprintf(stderr, "ERROR: Must choose CPL, CTL of DB15 tidal model!\n");
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   for (iPert = 0; iPert < body[iBody].iTidePerts; iPert++) {
@@ -2234,7 +2234,7 @@ void VerifyHaltEqtide(BODY *body, CONTROL *control, OPTIONS *options, int iBody,
                      options[OPT_HALTDBLSYNC].cFile[iBody + 1],
                      options[OPT_BODYFILES].iLine[0],
                      options[OPT_HALTDBLSYNC].iLine[iBody + 1]);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else {
       control->fnHalt[iBody][(*iHalt)++] = &HaltDblSync;
     }
@@ -2249,7 +2249,7 @@ void VerifyHaltEqtide(BODY *body, CONTROL *control, OPTIONS *options, int iBody,
                      options[OPT_HALTTIDELOCK].cFile[iBody + 1],
                      options[OPT_BODYFILES].iLine[0],
                      options[OPT_HALTTIDELOCK].iLine[iBody + 1]);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else {
       control->fnHalt[iBody][(*iHalt)++] = &HaltTideLock;
     }
@@ -2264,7 +2264,7 @@ void VerifyHaltEqtide(BODY *body, CONTROL *control, OPTIONS *options, int iBody,
                      options[OPT_HALTSYNCROT].cFile[iBody + 1],
                      options[OPT_BODYFILES].iLine[0],
                      options[OPT_HALTSYNCROT].iLine[iBody + 1]);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else {
       control->fnHalt[iBody][(*iHalt)++] = &HaltSyncRot;
     }
@@ -31,6 +31,7 @@ void PropertiesAuxiliary(BODY *body, CONTROL *control, SYSTEM *system,
    * of interest such as mean motion.
    */
   int iBody, iModule; // Dummy counter variables
+  double dStart = fdProfileStart(control);
 
   PropsAuxGeneral(body, control);
 
@@ -48,6 +49,8 @@ void PropertiesAuxiliary(BODY *body, CONTROL *control, SYSTEM *system,
                                                &control->Io, update, iBody);
     }
   }
+
+  ProfileSection(control, PROFILEPROPSAUX, dStart);
 }
 
 void CalculateDerivatives(BODY *body, SYSTEM *system, UPDATE *update,
@@ -104,10 +107,182 @@ void CheckProgress(BODY *body, CONTROL *control, SYSTEM *system,
   }
 }
 
+/*
+ * Profiling
+ */
+
+/**
+  Wall-clock time, for profiling
+
+  @return Time in seconds since an arbitrary epoch
+*/
+double fdProfileClock() {
+  struct timespec ts;
+
+  timespec_get(&ts, TIME_UTC);
+  return ts.tv_sec + 1e-9 * ts.tv_nsec;
+}
+
+/**
+  Zero the counters of a run, allocating those of each equation if it is
+  profiled. Called once the update matrix is complete, before the first
+  derivatives are evaluated.
+
+  @param control Control struct
+  @param update Update struct
+*/
+void InitializeProfile(CONTROL *control, UPDATE *update) {
+  PROFILE *profile = &control->Profile;
+  int iBody, iVar, iNumVars, iNumEqns;
+
+  memset(profile, 0, sizeof(PROFILE));
+  if (!control->Io.bProfile) {
+    return;
+  }
+
+  profile->laNumDerivs =
+        malloc(control->Evolve.iNumBodies * sizeof(long long **));
+  profile->daDerivTime = malloc(control->Evolve.iNumBodies * sizeof(double **));
+  profile->laNumLimits = malloc(control->Evolve.iNumBodies * sizeof(long long *));
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    iNumVars                    = update[iBody].iNumVars;
+    profile->laNumDerivs[iBody] = malloc(iNumVars * sizeof(long long *));
+    profile->daDerivTime[iBody] = malloc(iNumVars * sizeof(double *));
+    profile->laNumLimits[iBody] = calloc(iNumVars, sizeof(long long));
+    for (iVar = 0; iVar < iNumVars; iVar++) {
+      iNumEqns = update[iBody].iNumEqns[iVar];
+      profile->laNumDerivs[iBody][iVar] = calloc(iNumEqns, sizeof(long long));
+      profile->daDerivTime[iBody][iVar] = calloc(iNumEqns, sizeof(double));
+    }
+  }
+}
+
+void FreeProfile(CONTROL *control, UPDATE *update) {
+  PROFILE *profile = &control->Profile;
+  int iBody, iVar;
+
+  if (profile->laNumDerivs == NULL) {
+    return;
+  }
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      free(profile->laNumDerivs[iBody][iVar]);
+      free(profile->daDerivTime[iBody][iVar]);
+    }
+    free(profile->laNumDerivs[iBody]);
+    free(profile->daDerivTime[iBody]);
+    free(profile->laNumLimits[iBody]);
+  }
+  free(profile->laNumDerivs);
+  free(profile->daDerivTime);
+  free(profile->laNumLimits);
+  profile->laNumDerivs = NULL;
+}
+
+/**
+  When did a profiled section start?
+
+  @param control Control struct
+  @return The clock, or 0 if the run is not profiled
+*/
+double fdProfileStart(CONTROL *control) {
+  if (!control->Io.bProfile) {
+    return 0;
+  }
+  return fdProfileClock();
+}
+
+/**
+  Count a call of a profiled section and the time since it started.
+
+  @param control Control struct
+  @param iSection Section, one of PROFILE*
+  @param dStart Time the call started, from fdProfileStart
+*/
+void ProfileSection(CONTROL *control, int iSection, double dStart) {
+  if (control->Io.bProfile) {
+    control->Profile.laNumSection[iSection]++;
+    control->Profile.daSectionTime[iSection] += fdProfileClock() - dStart;
+  }
+}
+
+/**
+  Count a step in the timestep histogram, by decade of seconds. Steps
+  outside the histogram are counted in its first or last decade.
+
+  @param control Control struct
+  @param dDt Length of the step
+*/
+void ProfileStep(CONTROL *control, double dDt) {
+  int iDecade;
+
+  if (control->Io.bProfile && dDt > 0) {
+    iDecade = (int)floor(log10(dDt)) - PROFILEMINDECADE;
+    if (iDecade < 0) {
+      iDecade = 0;
+    } else if (iDecade >= PROFILENUMDECADES) {
+      iDecade = PROFILENUMDECADES - 1;
+    }
+    control->Profile.laNumSteps[iDecade]++;
+  }
+}
+
+/**
+  Record how long the integration took.
+
+  @param control Control struct
+*/
+void FinishProfile(CONTROL *control) {
+  if (control->Io.bProfile) {
+    control->Profile.dEvolveTime =
+          fdProfileClock() - control->Profile.dEvolveStart;
+  }
+}
+
+/**
+  Evaluate one equation of the update matrix, counting and timing it if the
+  run is profiled.
+
+  @return The derivative, or the new value of an explicit variable
+*/
+double fdEvaluateEquation(BODY *body, CONTROL *control, SYSTEM *system,
+                          UPDATE *update, fnUpdateVariable ***fnUpdate,
+                          int iBody, int iVar, int iEqn) {
+  double dStart, dValue;
+
+  if (!control->Io.bProfile) {
+    return fnUpdate[iBody][iVar][iEqn](body, system,
+                                       update[iBody].iaBody[iVar][iEqn]);
+  }
+  dStart = fdProfileClock();
+  dValue = fnUpdate[iBody][iVar][iEqn](body, system,
+                                       update[iBody].iaBody[iVar][iEqn]);
+  control->Profile.daDerivTime[iBody][iVar][iEqn] += fdProfileClock() - dStart;
+  control->Profile.laNumDerivs[iBody][iVar][iEqn]++;
+  return dValue;
+}
+
 /*
  * Integration Control
  */
 
+/**
+  When must the next step end? At the next output or @ reducer, unless they
+  are interpolated, in which case only at the end of the integration.
+
+  @param control Control struct
+  @return Time at which the next step must end
+*/
+double fdNextStopTime(CONTROL *control) {
+  if (control->Evolve.bDenseOutput) {
+    return control->Evolve.dStopTime;
+  }
+  if (control->Io.dNextReduce < control->Io.dNextOutput) {
+    return control->Io.dNextReduce;
+  }
+  return control->Io.dNextOutput;
+}
+
 double AssignDt(double dMin, double dNextOutput, double dEta) {
   /* Compute the next timestep, dt, making sure it's not larger than the output
    * cadence */
@@ -132,6 +307,7 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
   integr; // Dummy EVOLVE struct so we don't have to dereference control a lot
   double dVarNow, dMinNow, dMin = dHUGE,
                            dVarTotal; // Intermediate storage variables
+  int iLimitBody = -1, iLimitVar = -1; // Variable that set dMin, if any
 
   integr = control->Evolve;
 
@@ -150,11 +326,12 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
         if (update[iBody].iaType[iVar][0] == 0) {
           dVarNow = *update[iBody].pdVar[iVar];
           for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
-            update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                  body, system, update[iBody].iaBody[iVar][iEqn]);
+            update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
           }
           if (control->Evolve.bFirstStep) {
             dMin                       = integr.dTimeStep;
+            iLimitBody                 = -1;
             control->Evolve.bFirstStep = 0;
           } else {
             /* Sum over all equations giving new value of the variable */
@@ -168,6 +345,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
                     fabs(dVarNow / ((dVarNow - dVarTotal) / integr.dTimeStep));
               if (dMinNow < dMin) {
                 dMin = dMinNow;
+                iLimitBody = iBody;
+                iLimitVar  = iVar;
               }
             }
           }
@@ -181,8 +360,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
         } else if (update[iBody].iaType[iVar][0] == 5) {
           // continue;
           for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
-            update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                  body, system, update[iBody].iaBody[iVar][iEqn]);
+            update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
           }
           /* Integration for binary, where parameters can be computed via
          derivatives, or as an explicit function of age */
@@ -193,6 +372,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
           dMinNow = control->Io.dNextOutput;
           if (dMinNow < dMin) {
             dMin = dMinNow;
+            iLimitBody = iBody;
+            iLimitVar  = iVar;
           }
           /* The parameter does not require a derivative, but is calculated
             explicitly as a function of age and is a sinusoidal quantity
@@ -200,11 +381,12 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
         } else if (update[iBody].iaType[iVar][0] == 3) {
           dVarNow = *update[iBody].pdVar[iVar];
           for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
-            update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                  body, system, update[iBody].iaBody[iVar][iEqn]);
+            update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
           }
           if (control->Evolve.bFirstStep) {
             dMin                       = integr.dTimeStep;
+            iLimitBody                 = -1;
             control->Evolve.bFirstStep = 0;
           } else {
             /* Sum over all equations giving new value of the variable */
@@ -217,6 +399,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
               dMinNow = fabs(1.0 / ((dVarNow - dVarTotal) / integr.dTimeStep));
               if (dMinNow < dMin) {
                 dMin = dMinNow;
+                iLimitBody = iBody;
+                iLimitVar  = iVar;
               }
             }
           }
@@ -225,9 +409,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
         } else {
           for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
             if (update[iBody].iaType[iVar][iEqn] == 2) {
-              update[iBody].daDerivProc[iVar][iEqn] =
-                    fnUpdate[iBody][iVar][iEqn](
-                          body, system, update[iBody].iaBody[iVar][iEqn]);
+              update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
               // if (update[iBody].daDerivProc[iVar][iEqn] != 0 &&
               // *(update[iBody].pdVar[iVar]) != 0) {
               if (update[iBody].daDerivProc[iVar][iEqn] != 0) {
@@ -257,14 +440,15 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
                 }
                 if (dMinNow < dMin) {
                   dMin = dMinNow;
+                  iLimitBody = iBody;
+                  iLimitVar  = iVar;
                 }
               }
               // enforce a minimum step size for ice sheets, otherwise dDt -> 0
               // real fast
             } else if (update[iBody].iaType[iVar][iEqn] == 9) {
-              update[iBody].daDerivProc[iVar][iEqn] =
-                    fnUpdate[iBody][iVar][iEqn](
-                          body, system, update[iBody].iaBody[iVar][iEqn]);
+              update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
               if (update[iBody].daDerivProc[iVar][iEqn] != 0 &&
                   *(update[iBody].pdVar[iVar]) != 0) {
                 dMinNow = fabs((*(update[iBody].pdVar[iVar])) /
@@ -276,8 +460,12 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
                     dMin = control->Halt[iBody].iMinIceDt *
                            (2 * PI / body[iBody].dMeanMotion) /
                            control->Evolve.dEta;
+                    iLimitBody = iBody;
+                    iLimitVar  = iVar;
                   } else {
                     dMin = dMinNow;
+                    iLimitBody = iBody;
+                    iLimitVar  = iVar;
                   }
                 }
               }
@@ -288,9 +476,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
             } else if (update[iBody].iaType[iVar][iEqn] == 7) {
               if ((control->Evolve.bSpiNBodyDistOrb == 0) ||
                   (control->Evolve.bUsingSpiNBody == 1)) {
-                update[iBody].daDerivProc[iVar][iEqn] =
-                      fnUpdate[iBody][iVar][iEqn](
-                            body, system, update[iBody].iaBody[iVar][iEqn]);
+                update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
                 dMinNow =
                       sqrt((body[iBody].dPositionX * body[iBody].dPositionX +
                             body[iBody].dPositionY * body[iBody].dPositionY +
@@ -300,13 +487,14 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
                             body[iBody].dVelZ * body[iBody].dVelZ));
                 if (dMinNow < dMin) {
                   dMin = dMinNow;
+                  iLimitBody = iBody;
+                  iLimitVar  = iVar;
                 }
               }
             } else {
               // The parameter is controlled by a time derivative
-              update[iBody].daDerivProc[iVar][iEqn] =
-                    fnUpdate[iBody][iVar][iEqn](
-                          body, system, update[iBody].iaBody[iVar][iEqn]);
+              update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
               if (!fbFloatComparison(update[iBody].daDerivProc[iVar][iEqn],
                                     0.0) &&
                   !fbFloatComparison(*(update[iBody].pdVar[iVar]), 0.0)) {
@@ -314,6 +502,8 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
                                update[iBody].daDerivProc[iVar][iEqn]);
                 if (dMinNow < dMin) {
                   dMin = dMinNow;
+                  iLimitBody = iBody;
+                  iLimitVar  = iVar;
                 }
               }
             }
@@ -323,6 +513,10 @@ double fdGetTimeStep(BODY *body, CONTROL *control, SYSTEM *system,
     }       // if (update[iBody].iNumVars > 0)
   }         // for loop iNumBodies
 
+  if (control->Io.bProfile && iLimitBody >= 0) {
+    control->Profile.laNumLimits[iLimitBody][iLimitVar]++;
+  }
+
   return dMin;
 }
 
@@ -345,8 +539,8 @@ void fdGetUpdateInfo(BODY *body, CONTROL *control, SYSTEM *system,
       for (iVar = 0; iVar < iNumVars; iVar++) {
         iNumEqns = update[iBody].iNumEqns[iVar];
         for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-          update[iBody].daDerivProc[iVar][iEqn] = fnUpdate[iBody][iVar][iEqn](
-                body, system, update[iBody].iaBody[iVar][iEqn]);
+          update[iBody].daDerivProc[iVar][iEqn] = fdEvaluateEquation(
+                  body, control, system, update, fnUpdate, iBody, iVar, iEqn);
         }
       }
     }
@@ -365,9 +559,10 @@ void EulerStep(BODY *body, CONTROL *control, SYSTEM *system, UPDATE *update,
   if (control->Evolve.bVarDt) {
     /* dDt is the dynamical timescale */
     *dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
-    *dDt = AssignDt(*dDt, (control->Io.dNextOutput - control->Evolve.dTime),
+    *dDt = AssignDt(*dDt, (fdNextStopTime(control) - control->Evolve.dTime),
                     control->Evolve.dEta);
   }
+  control->Evolve.dCurrentDt = *dDt;
 
   for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
     for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
@@ -384,19 +579,237 @@ void EulerStep(BODY *body, CONTROL *control, SYSTEM *system, UPDATE *update,
   }
 }
 
+/**
+  Lay out the primary variables of all bodies in one contiguous state vector,
+  with room for the derivatives of every stage of the integration method.
+  Called once, on the first step or, for dense output, before it, so that no
+  step allocates memory.
+
+  @param control Control struct
+  @param update Update struct
+*/
+void InitializeStateVector(CONTROL *control, UPDATE *update) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iState;
+
+  evolve->iNumStateVars = 0;
+  evolve->iNumStateEqns = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->iNumStateVars++;
+      evolve->iNumStateEqns += update[iBody].iNumEqns[iVar];
+    }
+  }
+
+  evolve->daState       = malloc(evolve->iNumStateVars * sizeof(double));
+  evolve->pdStateVar    = malloc(evolve->iNumStateVars * sizeof(double *));
+  evolve->pdStateTmpVar = malloc(evolve->iNumStateVars * sizeof(double *));
+  evolve->bStateValue   = malloc(evolve->iNumStateVars * sizeof(int));
+  evolve->bStateControl = malloc(evolve->iNumStateVars * sizeof(int));
+  evolve->daStateScale  = malloc(evolve->iNumStateVars * sizeof(double));
+  evolve->daStateEnd    = malloc(evolve->iNumStateVars * sizeof(double));
+  evolve->daStateErr    = malloc(evolve->iNumStateVars * sizeof(double));
+  evolve->fnStateEnd =
+        malloc(evolve->iNumStateEqns * sizeof(fnUpdateVariable));
+
+  if (evolve->iOneStep == DORMANDPRINCE) {
+    evolve->iNumStages = 7;
+  } else {
+    evolve->iNumStages = 4;
+  }
+  evolve->daStateDeriv =
+        calloc(evolve->iNumStages * evolve->iNumStateVars, sizeof(double));
+  evolve->daStateDerivProc =
+        calloc(evolve->iNumStages * evolve->iNumStateEqns, sizeof(double));
+
+  if (evolve->iOneStep == ROSENBROCK) {
+    evolve->daJacobian = malloc(evolve->iNumStateVars * sizeof(double *));
+    evolve->daRosenW   = malloc(evolve->iNumStateVars * sizeof(double *));
+    evolve->daRosenLU  = malloc(evolve->iNumStateVars * sizeof(double *));
+    for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+      evolve->daJacobian[iState] =
+            calloc(evolve->iNumStateVars, sizeof(double));
+      evolve->daRosenW[iState]  = malloc(evolve->iNumStateVars * sizeof(double));
+      evolve->daRosenLU[iState] = malloc(evolve->iNumStateVars * sizeof(double));
+    }
+    evolve->daRosenRowScale = malloc(evolve->iNumStateVars * sizeof(double));
+    evolve->iaRosenSwap     = malloc(evolve->iNumStateVars * sizeof(int));
+    evolve->daRosenK    = malloc(3 * evolve->iNumStateVars * sizeof(double));
+    evolve->daTimeDeriv = calloc(evolve->iNumStateVars, sizeof(double));
+  }
+
+  if (evolve->bDenseOutput) {
+    evolve->daDenseState0 = malloc(evolve->iNumStateVars * sizeof(double));
+    evolve->daDenseDeriv0 = malloc(evolve->iNumStateVars * sizeof(double));
+    evolve->daDenseState1 = malloc(evolve->iNumStateVars * sizeof(double));
+    evolve->daDenseDeriv1 = malloc(evolve->iNumStateVars * sizeof(double));
+    evolve->daDenseProc   = malloc(evolve->iNumStateEqns * sizeof(double));
+    evolve->denseBody     = malloc(evolve->iNumBodies * sizeof(BODY));
+  }
+
+  iState = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->pdStateVar[iState]    = update[iBody].pdVar[iVar];
+      // Euler has no tmpBody
+      if (evolve->iOneStep != EULER) {
+        evolve->pdStateTmpVar[iState] = evolve->tmpUpdate[iBody].pdVar[iVar];
+      }
+      // For these types the "derivative" is the new value of the variable
+      evolve->bStateValue[iState] = (update[iBody].iaType[iVar][0] == 0 ||
+                                     update[iBody].iaType[iVar][0] == 3 ||
+                                     update[iBody].iaType[iVar][0] == 10);
+      // Derived quantities must not dictate the timestep
+      evolve->bStateControl[iState] =
+            !evolve->bStateValue[iState] && update[iBody].iaType[iVar][0] != 5;
+      evolve->daStateScale[iState] = fabs(*(update[iBody].pdVar[iVar]));
+      iState++;
+    }
+  }
+}
+
+/**
+  Free the arrays of InitializeStateVector, if the run made them.
+
+  @param control Control struct
+*/
+void FreeStateVector(CONTROL *control) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iState;
+
+  if (evolve->daState == NULL) {
+    return;
+  }
+  free(evolve->daState);
+  free(evolve->pdStateVar);
+  free(evolve->pdStateTmpVar);
+  free(evolve->bStateValue);
+  free(evolve->bStateControl);
+  free(evolve->daStateScale);
+  free(evolve->daStateEnd);
+  free(evolve->daStateErr);
+  free(evolve->fnStateEnd);
+  free(evolve->daStateDeriv);
+  free(evolve->daStateDerivProc);
+
+  if (evolve->iOneStep == ROSENBROCK) {
+    for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+      free(evolve->daJacobian[iState]);
+      free(evolve->daRosenW[iState]);
+      free(evolve->daRosenLU[iState]);
+    }
+    free(evolve->daJacobian);
+    free(evolve->daRosenW);
+    free(evolve->daRosenLU);
+    free(evolve->daRosenRowScale);
+    free(evolve->iaRosenSwap);
+    free(evolve->daRosenK);
+    free(evolve->daTimeDeriv);
+  }
+
+  if (evolve->bDenseOutput) {
+    free(evolve->daDenseState0);
+    free(evolve->daDenseDeriv0);
+    free(evolve->daDenseState1);
+    free(evolve->daDenseDeriv1);
+    free(evolve->daDenseProc);
+    free(evolve->denseBody);
+  }
+  evolve->daState = NULL;
+}
+
+/**
+  Collect the derivatives last evaluated into control->Evolve.tmpUpdate as the
+  derivatives of one Runge-Kutta stage.
+
+  @param control Control struct
+  @param update Update struct
+  @param iStage Stage number, 0-3
+  @param iDir Direction of integration
+*/
+void GetStageDerivatives(CONTROL *control, UPDATE *update, int iStage,
+                         int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iEqn, iState = 0, iStateEqn = 0;
+  double dDerivVar;
+  double *daDeriv     = evolve->daStateDeriv + iStage * evolve->iNumStateVars;
+  double *daDerivProc =
+        evolve->daStateDerivProc + iStage * evolve->iNumStateEqns;
+
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      // The last RK4 stage does not need the new values of these variables
+      if (evolve->iOneStep == RUNGEKUTTA && iStage == 3 &&
+          evolve->bStateValue[iState]) {
+        iStateEqn += update[iBody].iNumEqns[iVar];
+        iState++;
+        continue;
+      }
+      dDerivVar = 0;
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        dDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
+        daDerivProc[iStateEqn++] =
+              evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
+      }
+      daDeriv[iState++] = dDerivVar;
+    }
+  }
+}
+
+/**
+  Move the primary variables of control->Evolve.tmpBody to the start of the
+  step plus dFactor times the derivatives of one stage.
+
+  @param control Control struct
+  @param iStage Stage number, 0-2
+  @param dFactor Fraction of the timestep to advance by
+*/
+void SetStageState(CONTROL *control, int iStage, double dFactor) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iState;
+  double *daDeriv = evolve->daStateDeriv + iStage * evolve->iNumStateVars;
+
+  for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+    if (evolve->bStateValue[iState]) {
+      // LUGER: Note that this is the VALUE of the variable getting passed,
+      // contrary to what the names suggest These values are updated in the
+      // tmpUpdate struct so that equations which are dependent upon them will
+      // be evaluated with higher accuracy
+      *(evolve->pdStateTmpVar[iState]) = daDeriv[iState];
+    } else {
+      *(evolve->pdStateTmpVar[iState]) =
+            evolve->daState[iState] + dFactor * daDeriv[iState];
+    }
+  }
+}
+
 void RungeKutta4Step(BODY *body, CONTROL *control, SYSTEM *system,
                      UPDATE *update, fnUpdateVariable ***fnUpdate, double *dDt,
                      int iDir) {
-  /* Compute and apply a 4th order Runge-Kutta update step a given parameter. */
-  int iBody, iVar, iEqn, iSubStep, iNumBodies, iNumVars, iNumEqns;
-  double dFoo, dDelta;
+  /* Compute and apply a 4th order Runge-Kutta update step a given parameter.
+     The primary variables live in one contiguous state vector, so only that
+     vector moves between the stages. */
+  int iBody, iVar, iEqn, iState, iStateEqn, iNumStateVars, iNumStateEqns;
+  double *daK, *daKProc;
 
   EVOLVE *evolve = &(
         control->Evolve); // Save Evolve as a variable for speed and legibility
 
-  /* Create a copy of BODY array */
+  if (evolve->daState == NULL) {
+    InitializeStateVector(control, update);
+  }
+  iNumStateVars = evolve->iNumStateVars;
+  iNumStateEqns = evolve->iNumStateEqns;
+  daK           = evolve->daStateDeriv;
+  daKProc       = evolve->daStateDerivProc;
+
+  /* Bring the rest of tmpBody up to date, e.g. after ForceBehavior */
   BodyCopy(evolve->tmpBody, body, &control->Evolve);
 
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    evolve->daState[iState] = *(evolve->pdStateVar[iState]);
+  }
+
   /* Derivatives at start */
   *dDt = fdGetTimeStep(body, control, system, control->Evolve.tmpUpdate,
                        fnUpdate);
@@ -404,199 +817,1114 @@ void RungeKutta4Step(BODY *body, CONTROL *control, SYSTEM *system,
   /* Adjust dt? */
   if (evolve->bVarDt) {
     /*  This is minimum dynamical timescale */
-    *dDt = AssignDt(*dDt, (control->Io.dNextOutput - evolve->dTime),
+    *dDt = AssignDt(*dDt, (fdNextStopTime(control) - evolve->dTime),
                     evolve->dEta);
   } else {
     *dDt = evolve->dTimeStep;
   }
 
   evolve->dCurrentDt = *dDt;
-  iNumBodies         = evolve->iNumBodies;
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    // int thread_num = omp_get_thread_num();
-    // int cpu_num = sched_getcpu();
-    // printf("Thread %3d is running on CPU %3d\n", thread_num, cpu_num);
-    double daDerivVar;
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      iNumEqns   = update[iBody].iNumEqns[iVar];
-      for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-        daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        evolve->daDerivProc[0][iBody][iVar][iEqn] =
-              evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
+
+  GetStageDerivatives(control, update, 0, iDir);
+  SetStageState(control, 0, 0.5 * (*dDt));
+
+  /* First midpoint derivative.*/
+  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+
+  fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
+                  fnUpdate);
+
+  GetStageDerivatives(control, update, 1, iDir);
+  SetStageState(control, 1, 0.5 * (*dDt));
+
+  /* Second midpoint derivative */
+  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+
+  fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
+                  fnUpdate);
+
+  GetStageDerivatives(control, update, 2, iDir);
+  SetStageState(control, 2, *dDt);
+
+  /* Full step derivative */
+  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+
+  fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
+                  fnUpdate);
+
+  GetStageDerivatives(control, update, 3, iDir);
+
+  /* Now do the update -- Note the pointer to the home of the actual
+   * variables!!! */
+  iState    = 0;
+  iStateEqn = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      update[iBody].daDeriv[iVar] =
+            1. / 6 *
+            (daK[iState] + 2 * daK[iNumStateVars + iState] +
+             2 * daK[2 * iNumStateVars + iState] +
+             daK[3 * iNumStateVars + iState]);
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        update[iBody].daDerivProc[iVar][iEqn] =
+              1. / 6 *
+              (daKProc[iStateEqn] + 2 * daKProc[iNumStateEqns + iStateEqn] +
+               2 * daKProc[2 * iNumStateEqns + iStateEqn] +
+               daKProc[3 * iNumStateEqns + iStateEqn]);
+        iStateEqn++;
       }
-      evolve->daDeriv[0][iBody][iVar] = daDerivVar;
-    }
-  }
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
+      if (evolve->bStateValue[iState]) {
         // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest These values are updated in the
-        // tmpUpdate struct so that equations which are dependent upon them will
-        // be evaluated with higher accuracy
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              evolve->daDeriv[0][iBody][iVar];
+        // contrary to what the names suggest
+        *(evolve->pdStateVar[iState]) = daK[iState];
       } else {
-        /* While we're in this loop, move each parameter to the midpoint of the
-         * timestep */
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              *(update[iBody].pdVar[iVar]) +
-              0.5 * (*dDt) * evolve->daDeriv[0][iBody][iVar];
+        *(evolve->pdStateVar[iState]) =
+              evolve->daState[iState] + update[iBody].daDeriv[iVar] * (*dDt);
       }
+      iState++;
     }
   }
+}
 
-  /* First midpoint derivative.*/
-  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+/* Dormand-Prince 5(4) coefficients. The 5th order solution is the state of
+   the last stage, so its derivatives start the next step. */
+static const double daDPNode[7] = {0, 1. / 5, 3. / 10, 4. / 5, 8. / 9, 1, 1};
+static const double daDPMatrix[7][6] = {
+      {0, 0, 0, 0, 0, 0},
+      {1. / 5, 0, 0, 0, 0, 0},
+      {3. / 40, 9. / 40, 0, 0, 0, 0},
+      {44. / 45, -56. / 15, 32. / 9, 0, 0, 0},
+      {19372. / 6561, -25360. / 2187, 64448. / 6561, -212. / 729, 0, 0},
+      {9017. / 3168, -355. / 33, 46732. / 5247, 49. / 176, -5103. / 18656, 0},
+      {35. / 384, 0, 500. / 1113, 125. / 192, -2187. / 6784, 11. / 84}};
+/* 5th minus 4th order weights */
+static const double daDPError[7] = {
+      35. / 384 - 5179. / 57600,    0,
+      500. / 1113 - 7571. / 16695,  125. / 192 - 393. / 640,
+      -2187. / 6784 + 92097. / 339200, 11. / 84 - 187. / 2100,
+      -1. / 40};
 
-  fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
-                  fnUpdate);
+/**
+  Move control->Evolve.tmpBody to one stage of a Dormand-Prince step,
+  including its age.
+
+  @param body Body struct
+  @param control Control struct
+  @param iStage Stage number, 1-6
+  @param dDt Timestep
+  @param iDir Direction of integration
+*/
+void SetDormandPrinceStage(BODY *body, CONTROL *control, int iStage,
+                           double dDt, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iState, iPrev, iNumStateVars = evolve->iNumStateVars;
+  double dVar;
+
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    if (evolve->bStateValue[iState]) {
+      // As in RungeKutta4Step, pass the latest VALUE of the variable
+      *(evolve->pdStateTmpVar[iState]) =
+            evolve->daStateDeriv[(iStage - 1) * iNumStateVars + iState];
+    } else {
+      dVar = 0;
+      for (iPrev = 0; iPrev < iStage; iPrev++) {
+        dVar += daDPMatrix[iStage][iPrev] *
+                evolve->daStateDeriv[iPrev * iNumStateVars + iState];
+      }
+      *(evolve->pdStateTmpVar[iState]) = evolve->daState[iState] + dDt * dVar;
+    }
+  }
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    double daDerivVar;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      iNumEqns   = update[iBody].iNumEqns[iVar];
-      for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-        daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        evolve->daDerivProc[1][iBody][iVar][iEqn] =
-              evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->tmpBody[iBody].dAge = body[iBody].dAge + iDir * daDPNode[iStage] * dDt;
+  }
+}
+
+/**
+  Measure the error estimate in control->Evolve.daStateErr against the
+  tolerances. The new state must be in control->Evolve.tmpBody.
+
+  @param control Control struct
+  @return RMS over the variables of the error divided by its tolerance; the
+    step is acceptable if this is at most 1
+*/
+double fdStateErrorNorm(CONTROL *control) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iState, iNumControlled = 0;
+  double dErr, dScale, dSum = 0;
+
+  for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+    /* A variable that has only ever been zero, e.g. oxygen before any water
+       is lost, has no scale yet. Its derivative may also jump as soon as it
+       leaves zero, so it only controls the step once it has become nonzero. */
+    if (!evolve->bStateControl[iState] || evolve->daStateScale[iState] == 0) {
+      continue;
+    }
+    dErr   = evolve->daStateErr[iState];
+    dScale = evolve->dScaleTol * evolve->daStateScale[iState] +
+             evolve->dRelTol * fmax(fabs(evolve->daState[iState]),
+                                    fabs(*(evolve->pdStateTmpVar[iState])));
+    dSum += (dErr / dScale) * (dErr / dScale);
+    iNumControlled++;
+  }
+
+  if (iNumControlled == 0) {
+    return 0;
+  }
+  return sqrt(dSum / iNumControlled);
+}
+
+/**
+  Decide whether a step of an adaptive method is accepted, and choose the
+  next timestep from its error.
+
+  @param control Control struct
+  @param dErr Error of the step relative to the tolerances
+  @param dDt Timestep
+  @param bClamped Was the step cut short by an output?
+  @param dExponent Power of the error by which the step scales, -1/(q+1) for
+    an error estimate of order q
+  @return 1 if the step is accepted, 0 if it must be retried
+*/
+int fbAdaptTimeStep(CONTROL *control, double dErr, double dDt, int bClamped,
+                    double dExponent) {
+  EVOLVE *evolve = &(control->Evolve);
+  double dFactor;
+
+  if (dErr <= 1) {
+    /* Grow the step by at most a factor of 5 */
+    dFactor = 5;
+    if (dErr > 0) {
+      dFactor = fmin(5, 0.9 * pow(dErr, dExponent));
+    }
+    /* A step cut short by an output must not shrink the ones after it */
+    if (!bClamped || dDt * dFactor > evolve->dNextDt) {
+      evolve->dNextDt = dDt * dFactor;
+    }
+    return 1;
+  }
+
+  /* Reject the step and shrink it by at most a factor of 5 */
+  dFactor = 0.2;
+  if (!isnan(dErr)) {
+    dFactor = fmax(0.2, 0.9 * pow(dErr, dExponent));
+  }
+  evolve->dNextDt = dDt * dFactor;
+  evolve->iNumRejectedSteps++;
+  if (evolve->dNextDt < evolve->dStopTime * DBL_EPSILON) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr,
+              "ERROR: Timestep underflow at t = %e years. The tolerances "
+              "dRelTol and dScaleTol cannot be met.\n",
+              evolve->dTime / YEARSEC);
+    }
+    VplanetExit(EXIT_INT);
+  }
+  return 0;
+}
+
+/**
+  Estimate the error of a Dormand-Prince step, relative to the tolerances.
+
+  @param control Control struct
+  @param dDt Timestep
+  @return Error norm of the step, see fdStateErrorNorm
+*/
+double fdDormandPrinceError(CONTROL *control, double dDt) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iState, iStage, iNumStateVars = evolve->iNumStateVars;
+  double dErr;
+
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    dErr = 0;
+    for (iStage = 0; iStage < 7; iStage++) {
+      dErr += daDPError[iStage] *
+              evolve->daStateDeriv[iStage * iNumStateVars + iState];
+    }
+    evolve->daStateErr[iState] = dErr * dDt;
+  }
+  // The state of the last stage is the new value of the variable
+  return fdStateErrorNorm(control);
+}
+
+/**
+  Can the derivatives of the last stage of the previous step start this one?
+  Only if nothing, e.g. ForceBehavior, has changed the state or swapped the
+  equations since they were evaluated.
+
+  @param control Control struct
+  @param update Update struct
+  @param fnUpdate Function pointers to the derivatives
+  @return 1 if the last stage can be reused, 0 if not
+*/
+int fbReuseLastStage(CONTROL *control, UPDATE *update,
+                     fnUpdateVariable ***fnUpdate) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iEqn, iState, iStateEqn = 0;
+
+  if (!evolve->bStateEndValid) {
+    return 0;
+  }
+  for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+    if (evolve->daState[iState] != evolve->daStateEnd[iState]) {
+      return 0;
+    }
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        if (fnUpdate[iBody][iVar][iEqn] != evolve->fnStateEnd[iStateEqn++]) {
+          return 0;
+        }
       }
-      evolve->daDeriv[1][iBody][iVar] = daDerivVar;
     }
   }
+  return 1;
+}
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
+void DormandPrinceStep(BODY *body, CONTROL *control, SYSTEM *system,
+                       UPDATE *update, fnUpdateVariable ***fnUpdate,
+                       double *dDt, int iDir) {
+  /* Take one step with the Dormand-Prince 5(4) embedded pair. The timestep is
+     chosen so that the estimated error of every primary variable stays within
+     dScaleTol and dRelTol; steps that miss are rejected and retried. */
+  int iBody, iVar, iEqn, iStage, iState, iStateEqn, bClamped;
+  int iNumStateVars, iNumStateEqns;
+  double dErr, dDeriv, *daK, *daKProc;
 
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest These values are updated in the
-        // tmpUpdate struct so that equations which are dependent upon them will
-        // be evaluated with higher accuracy
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              evolve->daDeriv[1][iBody][iVar];
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->daState == NULL) {
+    InitializeStateVector(control, update);
+  }
+  iNumStateVars = evolve->iNumStateVars;
+  iNumStateEqns = evolve->iNumStateEqns;
+  daK           = evolve->daStateDeriv;
+  daKProc       = evolve->daStateDerivProc;
+
+  BodyCopy(evolve->tmpBody, body, &control->Evolve);
+
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    evolve->daState[iState] = *(evolve->pdStateVar[iState]);
+  }
+
+  /* Derivatives at start: the last stage of the previous step, if possible */
+  if (fbReuseLastStage(control, update, fnUpdate)) {
+    memcpy(daK, daK + 6 * iNumStateVars, iNumStateVars * sizeof(double));
+    memcpy(daKProc, daKProc + 6 * iNumStateEqns,
+           iNumStateEqns * sizeof(double));
+  } else {
+    if (evolve->dNextDt <= 0) {
+      /* The first timestep comes from the smallest timescale */
+      evolve->dNextDt = evolve->dEta * fdGetTimeStep(body, control, system,
+                                                     evolve->tmpUpdate,
+                                                     fnUpdate);
+    }
+    fdGetUpdateInfo(body, control, system, evolve->tmpUpdate, fnUpdate);
+    GetStageDerivatives(control, update, 0, iDir);
+  }
+
+  if (!evolve->bVarDt) {
+    evolve->dNextDt = evolve->dTimeStep;
+  }
+
+  while (1) {
+    *dDt     = evolve->dNextDt;
+    bClamped = 0;
+    if (evolve->bVarDt && fdNextStopTime(control) - evolve->dTime < *dDt) {
+      /* Don't step past the next output */
+      *dDt     = fdNextStopTime(control) - evolve->dTime;
+      bClamped = 1;
+    }
+
+    for (iStage = 1; iStage < 7; iStage++) {
+      SetDormandPrinceStage(body, control, iStage, *dDt, iDir);
+      PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+      fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
+                      fnUpdate);
+      GetStageDerivatives(control, update, iStage, iDir);
+    }
+
+    if (!evolve->bVarDt) {
+      break;
+    }
+
+    dErr = fdDormandPrinceError(control, *dDt);
+    if (fbAdaptTimeStep(control, dErr, *dDt, bClamped, -0.2)) {
+      break;
+    }
+  }
+
+  evolve->dCurrentDt = *dDt;
+
+  /* The derivatives of the last stage were evaluated here */
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    evolve->daStateEnd[iState] = *(evolve->pdStateTmpVar[iState]);
+  }
+
+  /* Now do the update -- Note the pointer to the home of the actual
+   * variables!!! */
+  iState    = 0;
+  iStateEqn = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      dDeriv = 0;
+      for (iStage = 0; iStage < 6; iStage++) {
+        dDeriv += daDPMatrix[6][iStage] * daK[iStage * iNumStateVars + iState];
+      }
+      update[iBody].daDeriv[iVar] = dDeriv;
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        dDeriv = 0;
+        for (iStage = 0; iStage < 6; iStage++) {
+          dDeriv += daDPMatrix[6][iStage] *
+                    daKProc[iStage * iNumStateEqns + iStateEqn];
+        }
+        update[iBody].daDerivProc[iVar][iEqn] = dDeriv;
+        evolve->fnStateEnd[iStateEqn]         = fnUpdate[iBody][iVar][iEqn];
+        iStateEqn++;
+      }
+
+      if (evolve->bStateValue[iState]) {
+        // The VALUE of the variable at the end of the step
+        *(evolve->pdStateVar[iState]) = daK[6 * iNumStateVars + iState];
       } else {
-        /* While we're in this loop, move each parameter to the midpoint
-        of the timestep based on the midpoint derivative. */
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              *(update[iBody].pdVar[iVar]) +
-              0.5 * (*dDt) * evolve->daDeriv[1][iBody][iVar];
+        *(evolve->pdStateVar[iState]) =
+              evolve->daState[iState] + update[iBody].daDeriv[iVar] * (*dDt);
       }
+      evolve->daStateScale[iState] = fmax(evolve->daStateScale[iState],
+                                          fabs(*(evolve->pdStateVar[iState])));
+      iState++;
     }
   }
+  evolve->bStateEndValid = 1;
+}
 
-  /* Second midpoint derivative */
-  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+/* Rosenbrock 2(3) coefficients of Shampine & Reichelt (1997), as in MATLAB's
+   ode23s. The method is L-stable, so the step is set by accuracy alone, not
+   by the fastest decaying variable. */
+#define ROSENGAMMA (1 / (2 + sqrt(2)))
+#define ROSENE32 (6 + sqrt(2))
 
+/**
+  Evaluate the derivatives at the state of control->Evolve.tmpBody and store
+  them as one stage.
+
+  @param control Control struct
+  @param system System struct
+  @param update Update struct
+  @param fnUpdate Function pointers to the derivatives
+  @param iStage Stage to store the derivatives in
+  @param iDir Direction of integration
+*/
+void EvaluateTmpStage(CONTROL *control, SYSTEM *system, UPDATE *update,
+                      fnUpdateVariable ***fnUpdate, int iStage, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+
+  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
   fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
                   fnUpdate);
+  GetStageDerivatives(control, update, iStage, iDir);
+}
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    double daDerivVar;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      iNumEqns   = update[iBody].iNumEqns[iVar];
-      for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-        daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        evolve->daDerivProc[2][iBody][iVar][iEqn] =
-              evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-      }
-      evolve->daDeriv[2][iBody][iVar] = daDerivVar;
+/**
+  Move control->Evolve.tmpBody to the start of the step plus dStep times an
+  increment of the state, and dAgeStep forward in age.
+
+  @param body Body struct
+  @param control Control struct
+  @param daIncr Increment of the state, NULL for none
+  @param dStep Multiple of the increment to add
+  @param iValueStage Stage whose values set the variables that are updated
+    by value
+  @param dAgeStep Time to advance the ages by
+  @param iDir Direction of integration
+*/
+void SetRosenbrockStage(BODY *body, CONTROL *control, double *daIncr,
+                        double dStep, int iValueStage, double dAgeStep,
+                        int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iState, iNumStateVars = evolve->iNumStateVars;
+
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    if (evolve->bStateValue[iState]) {
+      *(evolve->pdStateTmpVar[iState]) =
+            evolve->daStateDeriv[iValueStage * iNumStateVars + iState];
+    } else if (daIncr == NULL) {
+      *(evolve->pdStateTmpVar[iState]) = evolve->daState[iState];
+    } else {
+      *(evolve->pdStateTmpVar[iState]) =
+            evolve->daState[iState] + dStep * daIncr[iState];
     }
   }
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    evolve->tmpBody[iBody].dAge = body[iBody].dAge + iDir * dAgeStep;
+  }
+}
 
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest These values are updated in the
-        // tmpUpdate struct so that equations which are dependent upon them will
-        // be evaluated with higher accuracy
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              evolve->daDeriv[2][iBody][iVar];
+/**
+  Approximate the Jacobian of the derivatives with respect to the primary
+  variables, and their explicit dependence on time, by forward differences.
+  The differences are taken from the derivatives of control->Evolve.tmpBody
+  at the start of the step, stored in stage 2, rather than from stage 0:
+  auxiliary properties such as the latent heat of the mantle depend on the
+  last derivatives of the body, so the two can differ slightly. Stage 3 is
+  used as scratch space. Variables that are updated by value, or that have
+  only ever been zero, are held fixed.
+
+  @param body Body struct
+  @param control Control struct
+  @param system System struct
+  @param update Update struct
+  @param fnUpdate Function pointers to the derivatives
+  @param dDt Timestep
+  @param iDir Direction of integration
+*/
+void RosenbrockJacobian(BODY *body, CONTROL *control, SYSTEM *system,
+                        UPDATE *update, fnUpdateVariable ***fnUpdate,
+                        double dDt, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iState, jState, iNumStateVars = evolve->iNumStateVars;
+  double dDelta, *daF0, *daFBase, *daF;
+
+  daF0    = evolve->daStateDeriv;
+  daFBase = evolve->daStateDeriv + 2 * iNumStateVars;
+  daF     = evolve->daStateDeriv + 3 * iNumStateVars;
+
+  SetRosenbrockStage(body, control, NULL, 0, 0, 0, iDir);
+  EvaluateTmpStage(control, system, update, fnUpdate, 2, iDir);
+  for (jState = 0; jState < iNumStateVars; jState++) {
+    if (evolve->bStateValue[jState] || evolve->daStateScale[jState] == 0) {
+      for (iState = 0; iState < iNumStateVars; iState++) {
+        evolve->daJacobian[iState][jState] = 0;
+      }
+      continue;
+    }
+    /* A variable that starts near zero may still change quickly */
+    dDelta = sqrt(DBL_EPSILON) *
+             fmax(fmax(fabs(evolve->daState[jState]),
+                       evolve->daStateScale[jState]),
+                  fabs(dDt * daF0[jState]));
+    *(evolve->pdStateTmpVar[jState]) = evolve->daState[jState] + dDelta;
+    EvaluateTmpStage(control, system, update, fnUpdate, 3, iDir);
+    *(evolve->pdStateTmpVar[jState]) = evolve->daState[jState];
+
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      if (evolve->bStateValue[iState]) {
+        evolve->daJacobian[iState][jState] = 0;
       } else {
-        /* While we're in this loop, move each parameter to the end of
-        the timestep based on the second midpoint derivative. */
-        *(evolve->tmpUpdate[iBody].pdVar[iVar]) =
-              *(update[iBody].pdVar[iVar]) +
-              *dDt * evolve->daDeriv[2][iBody][iVar];
+        evolve->daJacobian[iState][jState] =
+              (daF[iState] - daFBase[iState]) / dDelta;
       }
     }
   }
 
-  /* Full step derivative */
-  PropertiesAuxiliary(evolve->tmpBody, control, system, update);
+  /* Stellar tracks, for example, depend on age directly */
+  dDelta = sqrt(DBL_EPSILON) * fmax(fabs(body[0].dAge), dDt);
+  SetRosenbrockStage(body, control, NULL, 0, 0, dDelta, iDir);
+  EvaluateTmpStage(control, system, update, fnUpdate, 3, iDir);
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    if (evolve->bStateValue[iState]) {
+      evolve->daTimeDeriv[iState] = 0;
+    } else {
+      evolve->daTimeDeriv[iState] = (daF[iState] - daFBase[iState]) / dDelta;
+    }
+  }
+}
 
-  fdGetUpdateInfo(evolve->tmpBody, control, system, evolve->tmpUpdate,
-                  fnUpdate);
+void RosenbrockStep(BODY *body, CONTROL *control, SYSTEM *system,
+                    UPDATE *update, fnUpdateVariable ***fnUpdate, double *dDt,
+                    int iDir) {
+  /* Take one step with the linearly implicit Rosenbrock 2(3) pair. Each step
+     solves linear systems with I - gamma*dt*J, where J is a finite-difference
+     Jacobian, so stiff variables such as the interior temperatures do not
+     limit the timestep. The error control is the same as Dormand-Prince's. */
+  int iBody, iVar, iEqn, iState, jState, iStateEqn, bClamped;
+  int iNumStateVars, iNumStateEqns;
+  double dErr, dGammaDt, *daF0, *daF1, *daF2, *daK1, *daK2, *daK3;
+
+  EVOLVE *evolve = &(control->Evolve);
+
+  if (evolve->daState == NULL) {
+    InitializeStateVector(control, update);
+  }
+  iNumStateVars = evolve->iNumStateVars;
+  iNumStateEqns = evolve->iNumStateEqns;
+  daF0          = evolve->daStateDeriv;
+  daF1          = evolve->daStateDeriv + iNumStateVars;
+  daF2          = evolve->daStateDeriv + 2 * iNumStateVars;
+  daK1          = evolve->daRosenK;
+  daK2          = evolve->daRosenK + iNumStateVars;
+  daK3          = evolve->daRosenK + 2 * iNumStateVars;
 
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    double daDerivVar;
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      daDerivVar = 0;
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // NOTHING!
-      } else {
-        evolve->daDeriv[3][iBody][iVar] = 0;
-        iNumEqns                        = update[iBody].iNumEqns[iVar];
-        for (iEqn = 0; iEqn < iNumEqns; iEqn++) {
-          daDerivVar += iDir * evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-          evolve->daDerivProc[3][iBody][iVar][iEqn] =
-                evolve->tmpUpdate[iBody].daDerivProc[iVar][iEqn];
-        }
-        evolve->daDeriv[3][iBody][iVar] = daDerivVar;
+  BodyCopy(evolve->tmpBody, body, &control->Evolve);
+
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    evolve->daState[iState] = *(evolve->pdStateVar[iState]);
+  }
+
+  /* Derivatives at start: those at the end of the previous step, if possible */
+  if (fbReuseLastStage(control, update, fnUpdate)) {
+    memcpy(daF0, daF2, iNumStateVars * sizeof(double));
+    memcpy(evolve->daStateDerivProc,
+           evolve->daStateDerivProc + 2 * iNumStateEqns,
+           iNumStateEqns * sizeof(double));
+  } else {
+    if (evolve->dNextDt <= 0) {
+      /* The first timestep comes from the smallest timescale */
+      evolve->dNextDt = evolve->dEta * fdGetTimeStep(body, control, system,
+                                                     evolve->tmpUpdate,
+                                                     fnUpdate);
+    }
+    fdGetUpdateInfo(body, control, system, evolve->tmpUpdate, fnUpdate);
+    GetStageDerivatives(control, update, 0, iDir);
+  }
+
+  if (!evolve->bVarDt) {
+    evolve->dNextDt = evolve->dTimeStep;
+  }
+
+  /* A rejected step keeps the Jacobian and only changes the timestep */
+  RosenbrockJacobian(body, control, system, update, fnUpdate, evolve->dNextDt,
+                     iDir);
+
+  while (1) {
+    *dDt     = evolve->dNextDt;
+    bClamped = 0;
+    if (evolve->bVarDt && fdNextStopTime(control) - evolve->dTime < *dDt) {
+      /* Don't step past the next output */
+      *dDt     = fdNextStopTime(control) - evolve->dTime;
+      bClamped = 1;
+    }
+    dGammaDt = ROSENGAMMA * (*dDt);
+
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      for (jState = 0; jState < iNumStateVars; jState++) {
+        evolve->daRosenW[iState][jState] =
+              -dGammaDt * evolve->daJacobian[iState][jState];
       }
+      evolve->daRosenW[iState][iState] += 1;
+    }
+    LUDecomp(evolve->daRosenW, evolve->daRosenLU, evolve->daRosenRowScale,
+             evolve->iaRosenSwap, iNumStateVars);
+
+    /* Variables updated by value have no increments */
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      daK1[iState] = 0;
+      if (!evolve->bStateValue[iState]) {
+        daK1[iState] = daF0[iState] + dGammaDt * evolve->daTimeDeriv[iState];
+      }
+    }
+    LUSolve(evolve->daRosenLU, daK1, evolve->iaRosenSwap, iNumStateVars);
+
+    SetRosenbrockStage(body, control, daK1, 0.5 * (*dDt), 0, 0.5 * (*dDt),
+                       iDir);
+    EvaluateTmpStage(control, system, update, fnUpdate, 1, iDir);
+
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      daK2[iState] = 0;
+      if (!evolve->bStateValue[iState]) {
+        daK2[iState] = daF1[iState] - daK1[iState];
+      }
+    }
+    LUSolve(evolve->daRosenLU, daK2, evolve->iaRosenSwap, iNumStateVars);
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      daK2[iState] += daK1[iState];
+    }
+
+    /* The second order solution */
+    SetRosenbrockStage(body, control, daK2, *dDt, 1, *dDt, iDir);
+    EvaluateTmpStage(control, system, update, fnUpdate, 2, iDir);
+
+    if (!evolve->bVarDt) {
+      break;
+    }
+
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      daK3[iState] = 0;
+      if (!evolve->bStateValue[iState]) {
+        daK3[iState] = daF2[iState] - ROSENE32 * (daK2[iState] - daF1[iState]) -
+                       2 * (daK1[iState] - daF0[iState]) +
+                       dGammaDt * evolve->daTimeDeriv[iState];
+      }
+    }
+    LUSolve(evolve->daRosenLU, daK3, evolve->iaRosenSwap, iNumStateVars);
+
+    for (iState = 0; iState < iNumStateVars; iState++) {
+      evolve->daStateErr[iState] =
+            *dDt / 6 * (daK1[iState] - 2 * daK2[iState] + daK3[iState]);
+    }
+    dErr = fdStateErrorNorm(control);
+    if (fbAdaptTimeStep(control, dErr, *dDt, bClamped, -1. / 3)) {
+      break;
     }
   }
-  /* Now do the update -- Note the pointer to the home of the actual
-   * variables!!! */
-  for (iBody = 0; iBody < iNumBodies; iBody++) {
-    iNumVars = update[iBody].iNumVars;
-    for (iVar = 0; iVar < iNumVars; iVar++) {
-      update[iBody].daDeriv[iVar] = 1. / 6 *
-                                    (evolve->daDeriv[0][iBody][iVar] +
-                                     2 * evolve->daDeriv[1][iBody][iVar] +
-                                     2 * evolve->daDeriv[2][iBody][iVar] +
-                                     evolve->daDeriv[3][iBody][iVar]);
+
+  evolve->dCurrentDt = *dDt;
+
+  /* The derivatives of the last stage were evaluated here */
+  for (iState = 0; iState < iNumStateVars; iState++) {
+    evolve->daStateEnd[iState] = *(evolve->pdStateTmpVar[iState]);
+  }
+
+  /* Now do the update. The rates of the individual processes are those at
+     the end of the step. */
+  iState    = 0;
+  iStateEqn = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      update[iBody].daDeriv[iVar] = daK2[iState];
       for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
         update[iBody].daDerivProc[iVar][iEqn] =
-              1. / 6 *
-              (evolve->daDerivProc[0][iBody][iVar][iEqn] +
-               2 * evolve->daDerivProc[1][iBody][iVar][iEqn] +
-               2 * evolve->daDerivProc[2][iBody][iVar][iEqn] +
-               evolve->daDerivProc[3][iBody][iVar][iEqn]);
+              evolve->daStateDerivProc[2 * iNumStateEqns + iStateEqn];
+        evolve->fnStateEnd[iStateEqn] = fnUpdate[iBody][iVar][iEqn];
+        iStateEqn++;
       }
 
-      if (update[iBody].iaType[iVar][0] == 0 ||
-          update[iBody].iaType[iVar][0] == 3 ||
-          update[iBody].iaType[iVar][0] == 10) {
-        // LUGER: Note that this is the VALUE of the variable getting passed,
-        // contrary to what the names suggest
-        *(update[iBody].pdVar[iVar]) = evolve->daDeriv[0][iBody][iVar];
+      if (evolve->bStateValue[iState]) {
+        // The VALUE of the variable at the end of the step
+        update[iBody].daDeriv[iVar]   = daF2[iState];
+        *(evolve->pdStateVar[iState]) = daF2[iState];
       } else {
-        *(update[iBody].pdVar[iVar]) += update[iBody].daDeriv[iVar] * (*dDt);
+        *(evolve->pdStateVar[iState]) =
+              evolve->daState[iState] + daK2[iState] * (*dDt);
       }
+      evolve->daStateScale[iState] = fmax(evolve->daStateScale[iState],
+                                          fabs(*(evolve->pdStateVar[iState])));
+      iState++;
     }
   }
+  evolve->bStateEndValid = 1;
+}
+
+/**
+  Sum the latest derivatives in update into one derivative per state variable.
+
+  @param control Control struct
+  @param update Update struct
+  @param daDeriv Derivatives, filled here
+  @param iDir Direction of integration
+*/
+void GetStateDerivatives(CONTROL *control, UPDATE *update, double *daDeriv,
+                         int iDir) {
+  int iBody, iVar, iEqn, iState = 0;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      daDeriv[iState] = 0;
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        daDeriv[iState] += iDir * update[iBody].daDerivProc[iVar][iEqn];
+      }
+      iState++;
+    }
+  }
+}
+
+/**
+  Remember the start of a step, from which output within it is interpolated.
+
+  @param control Control struct
+  @param update Update struct
+  @param iDir Direction of integration
+*/
+void StartDenseStep(CONTROL *control, UPDATE *update, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iState;
+
+  evolve->dDenseTime0 = evolve->dTime;
+  evolve->bDenseSaved = 0;
+  for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+    evolve->daDenseState0[iState] = *(evolve->pdStateVar[iState]);
+  }
+  GetStateDerivatives(control, update, evolve->daDenseDeriv0, iDir);
+}
+
+/**
+  Return the bodies and their derivatives to the end of the step, as saved by
+  SaveDenseStep. Only the BODY structs themselves are copied, not the arrays
+  that modules hang off them, e.g. the tidal phase lags of eqtide: those keep
+  the values of the last interpolated time until PropertiesAuxiliary
+  recomputes them for the next step.
+
+  @param body Body struct
+  @param control Control struct
+  @param update Update struct
+*/
+void RestoreDenseStep(BODY *body, CONTROL *control, UPDATE *update) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iEqn, iState = 0, iStateEqn = 0;
+
+  memcpy(body, evolve->denseBody, evolve->iNumBodies * sizeof(BODY));
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      *(evolve->pdStateVar[iState]) = evolve->daDenseState1[iState];
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        update[iBody].daDerivProc[iVar][iEqn] = evolve->daDenseProc[iStateEqn++];
+      }
+      iState++;
+    }
+  }
+  evolve->dTime = evolve->dDenseTime1;
+}
+
+/**
+  Keep the end of the step that ends at dTimeEnd, so that the step can be
+  interpolated and then returned to. Only the first call in a step saves. The
+  copy of the bodies is shallow; see RestoreDenseStep.
+
+  @param body Body struct
+  @param control Control struct
+  @param update Update struct
+  @param dTimeEnd Time at the end of the step
+  @param iDir Direction of integration
+*/
+void SaveDenseStep(BODY *body, CONTROL *control, UPDATE *update,
+                   double dTimeEnd, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iEqn, iState = 0, iStateEqn = 0;
+
+  if (evolve->bDenseSaved) {
+    return;
+  }
+  memcpy(evolve->denseBody, body, evolve->iNumBodies * sizeof(BODY));
+  evolve->dDenseTime1 = evolve->dTime;
+  evolve->dDenseStep  = dTimeEnd - evolve->dDenseTime0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      evolve->daDenseState1[iState] = *(evolve->pdStateVar[iState]);
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        evolve->daDenseProc[iStateEqn++] = update[iBody].daDerivProc[iVar][iEqn];
+      }
+      iState++;
+    }
+  }
+  GetStateDerivatives(control, update, evolve->daDenseDeriv1, iDir);
+  evolve->bDenseSaved = 1;
+}
+
+/**
+  Set the bodies to time dTimeOut within the saved step. The primary variables
+  are interpolated with a cubic Hermite polynomial through their values and
+  derivatives at both ends of the step; the auxiliary properties and
+  derivatives are then recomputed. Variables that are set by value, e.g. the
+  stellar luminosity, then take the values computed at dTimeOut, as in the
+  stages of a step, starting from a linear interpolation. Every call
+  starts from the end of the step: some auxiliary properties, e.g. the mantle
+  melt fraction, iterate on their previous values, so the interpolation would
+  otherwise change the integration.
+
+  @param body Body struct
+  @param control Control struct
+  @param system System struct
+  @param update Update struct
+  @param fnUpdate Function pointers to the derivatives
+  @param dTimeOut Time to interpolate to
+  @param iDir Direction of integration
+*/
+void InterpolateDenseStep(BODY *body, CONTROL *control, SYSTEM *system,
+                          UPDATE *update, fnUpdateVariable ***fnUpdate,
+                          double dTimeOut, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  int iBody, iVar, iEqn, iState, bValue = 0;
+  double dStep = evolve->dDenseStep, dTheta, dH00, dH10, dH01, dH11;
+
+  dTheta = (dTimeOut - evolve->dDenseTime0) / dStep;
+  dH00   = (1 + 2 * dTheta) * (1 - dTheta) * (1 - dTheta);
+  dH10   = dTheta * (1 - dTheta) * (1 - dTheta);
+  dH01   = dTheta * dTheta * (3 - 2 * dTheta);
+  dH11   = dTheta * dTheta * (dTheta - 1);
+
+  RestoreDenseStep(body, control, update);
+  for (iState = 0; iState < evolve->iNumStateVars; iState++) {
+    if (evolve->bStateValue[iState]) {
+      *(evolve->pdStateVar[iState]) =
+            evolve->daDenseState0[iState] +
+            dTheta *
+                  (evolve->daDenseState1[iState] - evolve->daDenseState0[iState]);
+    } else {
+      *(evolve->pdStateVar[iState]) =
+            dH00 * evolve->daDenseState0[iState] +
+            dH10 * dStep * evolve->daDenseDeriv0[iState] +
+            dH01 * evolve->daDenseState1[iState] +
+            dH11 * dStep * evolve->daDenseDeriv1[iState];
+    }
+  }
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    body[iBody].dAge = evolve->denseBody[iBody].dAge +
+                       iDir * (dTimeOut - evolve->dDenseTime1);
+  }
+  evolve->dTime = dTimeOut;
+
+  PropertiesAuxiliary(body, control, system, update);
+  fdGetUpdateInfo(body, control, system, update, fnUpdate);
+
+  iState = 0;
+  for (iBody = 0; iBody < evolve->iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      if (evolve->bStateValue[iState]) {
+        *(evolve->pdStateVar[iState]) = 0;
+        for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+          *(evolve->pdStateVar[iState]) +=
+                update[iBody].daDerivProc[iVar][iEqn];
+        }
+        bValue = 1;
+      }
+      iState++;
+    }
+  }
+  if (bValue) {
+    PropertiesAuxiliary(body, control, system, update);
+    fdGetUpdateInfo(body, control, system, update, fnUpdate);
+  }
+}
+
+/**
+  Write every output that falls inside the step that ends at dTimeEnd, from
+  the bodies interpolated by InterpolateDenseStep. Afterwards the bodies are
+  returned exactly to the end of the step. An output at the end of the step
+  itself is left to the caller.
+
+  @param body Body struct
+  @param control Control struct
+  @param files Files struct
+  @param output Output struct
+  @param system System struct
+  @param update Update struct
+  @param fnUpdate Function pointers to the derivatives
+  @param fnWrite Function pointers to the output functions
+  @param dTimeEnd Time at the end of the step
+  @param iDir Direction of integration
+*/
+void WriteDenseOutput(BODY *body, CONTROL *control, FILES *files,
+                      OUTPUT *output, SYSTEM *system, UPDATE *update,
+                      fnUpdateVariable ***fnUpdate, fnWriteOutput *fnWrite,
+                      double dTimeEnd, int iDir) {
+  EVOLVE *evolve = &(control->Evolve);
+  double dSlop   = DENSESLOP * control->Io.dOutputTime;
+
+  if (control->Io.dNextOutput >= dTimeEnd - dSlop) {
+    return;
+  }
+
+  SaveDenseStep(body, control, update, dTimeEnd, iDir);
+  while (control->Io.dNextOutput < dTimeEnd - dSlop) {
+    InterpolateDenseStep(body, control, system, update, fnUpdate,
+                         control->Io.dNextOutput, iDir);
+
+    evolve->iTotalSteps += evolve->iStepsSinceLastOutput;
+    WriteOutput(body, control, files, output, system, update, fnWrite);
+    ReduceDenseOutput(body, control, files, output, system, update, fnWrite,
+                      iDir);
+    evolve->iStepsSinceLastOutput = 0;
+    control->Io.dNextOutput += control->Io.dOutputTime;
+  }
+
+  RestoreDenseStep(body, control, update);
+}
+
+/**
+  The time within the step from dTime0 to dTime1 at which the value of a
+  firstzero reducer, dValue0 at the start and dValue1 at the end, first
+  reaches zero. With dense output the interpolated bodies are searched with
+  the Illinois method; otherwise the value is interpolated linearly.
+
+  @return Time the value reaches zero
+*/
+double fdReduceZeroTime(BODY *body, CONTROL *control, OUTFILE *outfile,
+                        OUTPUT *output, SYSTEM *system, UPDATE *update,
+                        fnUpdateVariable ***fnUpdate, fnWriteOutput *fnWrite,
+                        int iBody, int iReduce, double dTime0, double dTime1,
+                        double dValue0, double dValue1, char **cUnit,
+                        int iDir) {
+  int iIter, iSide = 0;
+  double dTime, dValue;
+
+  if (control->Evolve.bDenseOutput) {
+    SaveDenseStep(body, control, update, dTime1, iDir);
+    for (iIter = 0; iIter < REDUCEMAXITER && dValue1 != 0 &&
+                    dTime1 - dTime0 > REDUCETOL * control->Evolve.dDenseStep;
+         iIter++) {
+      dTime = dTime1 - dValue1 * (dTime1 - dTime0) / (dValue1 - dValue0);
+      InterpolateDenseStep(body, control, system, update, fnUpdate, dTime,
+                           iDir);
+      dValue = fdReduceValue(body, control, outfile, output, system, update,
+                             fnWrite, iBody, iReduce, cUnit);
+      if (dValue * outfile->daReduceLast[iReduce] <= 0) {
+        // Crossed: the zero is no later than dTime
+        dTime1  = dTime;
+        dValue1 = dValue;
+        if (iSide == -1) {
+          dValue0 /= 2;
+        }
+        iSide = -1;
+      } else {
+        dTime0  = dTime;
+        dValue0 = dValue;
+        if (iSide == 1) {
+          dValue1 /= 2;
+        }
+        iSide = 1;
+      }
+    }
+    RestoreDenseStep(body, control, update);
+  }
+
+  return dTime1 - dValue1 * (dTime1 - dTime0) / (dValue1 - dValue0);
+}
+
+/**
+  Keep dValue, the value of min, max, argmin or argmax reducer iReduce at
+  dTime, in the units of the results, if it is the most extreme so far.
+
+  @param outfile Outfile struct of the body
+  @param iReduce Index of the reducer
+  @param dValue Value of the reducer's output
+  @param dTime Time of the value, in the units of the results
+*/
+void UpdateReduceExtreme(OUTFILE *outfile, int iReduce, double dValue,
+                         double dTime) {
+  int iOp = outfile->iaReduceOp[iReduce];
+
+  if (((iOp == REDUCE_MIN || iOp == REDUCE_ARGMIN) &&
+       dValue < outfile->daReduceExtreme[iReduce]) ||
+      ((iOp == REDUCE_MAX || iOp == REDUCE_ARGMAX) &&
+       dValue > outfile->daReduceExtreme[iReduce])) {
+    outfile->daReduceExtreme[iReduce] = dValue;
+    outfile->daReduceResult[iReduce] =
+          (iOp == REDUCE_MIN || iOp == REDUCE_MAX) ? dValue : dTime;
+  }
+}
+
+/**
+  Update the extreme reducers with the bodies interpolated to an output time
+  by WriteDenseOutput. Long dense steps would otherwise leave the extremes
+  coarser than the output.
+
+  @param body Body struct
+  @param control Control struct
+  @param files Files struct
+  @param output Output struct
+  @param system System struct
+  @param update Update struct
+  @param fnWrite Function pointers to the output functions
+  @param iDir Direction of integration
+*/
+void ReduceDenseOutput(BODY *body, CONTROL *control, FILES *files,
+                       OUTPUT *output, SYSTEM *system, UPDATE *update,
+                       fnWriteOutput *fnWrite, int iDir) {
+  int iBody, iReduce, iOp;
+  double dValue, dUnitTime;
+  char *cUnit = NULL;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile   = &files->Outfile[iBody];
+    dUnitTime = fdUnitsTime(control->Units[iBody].iTime);
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      iOp = outfile->iaReduceOp[iReduce];
+      if (iOp == REDUCE_MIN || iOp == REDUCE_ARGMIN || iOp == REDUCE_MAX ||
+          iOp == REDUCE_ARGMAX) {
+        dValue = fdReduceValue(body, control, outfile, output, system, update,
+                               fnWrite, iBody, iReduce, &cUnit);
+        UpdateReduceExtreme(outfile, iReduce, dValue,
+                            iDir * control->Evolve.dTime / dUnitTime);
+      }
+    }
+  }
+  free(cUnit);
+}
+
+/**
+  Update the reducers with the step from dTime0 to dTime1, whose end the
+  bodies hold. @ reducers inside the step are interpolated like dense output,
+  or linearly between the ends of the step if it could not be made to end
+  there. Extremes are taken over the ends of the steps and, with dense output,
+  the output times inside them; see ReduceDenseOutput.
+
+  @param body Body struct
+  @param control Control struct
+  @param files Files struct
+  @param output Output struct
+  @param system System struct
+  @param update Update struct
+  @param fnUpdate Function pointers to the derivatives
+  @param fnWrite Function pointers to the output functions
+  @param dTime0 Time at the start of the step
+  @param dTime1 Time at the end of the step
+  @param iDir Direction of integration
+*/
+void ReduceStep(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
+                SYSTEM *system, UPDATE *update, fnUpdateVariable ***fnUpdate,
+                fnWriteOutput *fnWrite, double dTime0, double dTime1,
+                int iDir) {
+  int iBody, iReduce, iOp;
+  double dValue, dTime, dSlop = DENSESLOP * control->Io.dOutputTime;
+  double dUnitTime;
+  char *cUnit = NULL;
+  OUTFILE *outfile;
+
+  /* Values inside the step come first, while the step end is untouched */
+  if (control->Evolve.bDenseOutput && control->Io.dNextReduce < dTime1 - dSlop) {
+    SaveDenseStep(body, control, update, dTime1, iDir);
+    for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+      outfile = &files->Outfile[iBody];
+      for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+        if (outfile->iaReduceOp[iReduce] == REDUCE_AT &&
+            !outfile->baReduceDone[iReduce] &&
+            outfile->daReduceTime[iReduce] < dTime1 - dSlop) {
+          InterpolateDenseStep(body, control, system, update, fnUpdate,
+                               outfile->daReduceTime[iReduce], iDir);
+          outfile->daReduceResult[iReduce] =
+                fdReduceValue(body, control, outfile, output, system, update,
+                              fnWrite, iBody, iReduce, &cUnit);
+          outfile->baReduceDone[iReduce] = 1;
+        }
+      }
+    }
+    RestoreDenseStep(body, control, update);
+  }
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile   = &files->Outfile[iBody];
+    dUnitTime = fdUnitsTime(control->Units[iBody].iTime);
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      iOp    = outfile->iaReduceOp[iReduce];
+      dValue = fdReduceValue(body, control, outfile, output, system, update,
+                             fnWrite, iBody, iReduce, &cUnit);
+
+      if (iOp == REDUCE_AT && !outfile->baReduceDone[iReduce] &&
+          outfile->daReduceTime[iReduce] < dTime1 + dSlop) {
+        dTime = outfile->daReduceTime[iReduce];
+        if (dTime < dTime1 - dSlop) {
+          // A fixed timestep stepped over it
+          outfile->daReduceResult[iReduce] =
+                outfile->daReduceLast[iReduce] +
+                (dValue - outfile->daReduceLast[iReduce]) * (dTime - dTime0) /
+                      (dTime1 - dTime0);
+        } else {
+          outfile->daReduceResult[iReduce] = dValue;
+        }
+        outfile->baReduceDone[iReduce] = 1;
+      } else if (iOp == REDUCE_MIN || iOp == REDUCE_ARGMIN ||
+                 iOp == REDUCE_MAX || iOp == REDUCE_ARGMAX) {
+        UpdateReduceExtreme(outfile, iReduce, dValue,
+                            iDir * dTime1 / dUnitTime);
+      } else if (iOp == REDUCE_FIRSTZERO && !outfile->baReduceDone[iReduce] &&
+                 dValue * outfile->daReduceLast[iReduce] <= 0) {
+        dTime = fdReduceZeroTime(body, control, outfile, output, system,
+                                 update, fnUpdate, fnWrite, iBody, iReduce,
+                                 dTime0, dTime1, outfile->daReduceLast[iReduce],
+                                 dValue, &cUnit, iDir);
+        outfile->daReduceResult[iReduce] = iDir * dTime / dUnitTime;
+        outfile->baReduceDone[iReduce]   = 1;
+      }
+      outfile->daReduceLast[iReduce] = dValue;
+    }
+  }
+  free(cUnit);
+
+  SetNextReduce(control, files);
 }
 
 /*
@@ -611,6 +1939,12 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
   int iDir, iBody, iModule; // Dummy counting variables
   double dDt, dFoo;         // Next timestep, dummy variable
   double dEqSpinRate;       // Store the equilibrium spin rate
+  double dOutputSlop = 0;   // How early an output may be written
+  double dStart;            // When a profiled section started
+  double dTimeEnd;          // Time at the end of the step
+  int bHalt;                // Did the step meet a halt condition?
+
+  control->Profile.dEvolveStart = fdProfileStart(control);
 
   if (control->Evolve.bDoForward) {
     iDir = 1;
@@ -619,41 +1953,71 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
   }
 
   PropertiesAuxiliary(body, control, system, update);
+  InitializeEvents(body, control);
   control->Io.dNextOutput = control->Evolve.dTime + control->Io.dOutputTime;
+  control->Evolve.iStepsSinceLastOutput = 0;
+  control->Evolve.iTotalSteps           = 0;
 
-  // Get derivatives at start, useful for logging
-  dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
+  if (files->cRestart != NULL) {
+    /* A resumed run keeps the derivatives and timestep of the snapshot */
+    RestoreCheckpoint(body, control, files, module, system, update, fnUpdate);
+    dDt = control->Evolve.dCurrentDt;
+  } else {
+    // Get derivatives at start, useful for logging
+    dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
+  }
 
 
   /* Adjust dt? */
-  if (control->Evolve.bVarDt) {
+  if (!control->Evolve.bVarDt) {
+    dDt = control->Evolve.dTimeStep;
+  } else if (files->cRestart == NULL) {
     /* Now choose the correct timestep */
-    dDt = AssignDt(dDt, (control->Io.dNextOutput - control->Evolve.dTime),
+    dDt = AssignDt(dDt, (fdNextStopTime(control) - control->Evolve.dTime),
                    control->Evolve.dEta);
-  } else {
-    dDt = control->Evolve.dTimeStep;
   }
 
-  /* Write out initial conditions */
-  WriteOutput(body, control, files, output, system, update, fnWrite);
+  /* Write out initial conditions, unless the run resumes from a snapshot
+     whose output files already have them */
+  InitializeOutputPlan(control, files, output);
+  if (files->cRestart == NULL) {
+    WriteOutput(body, control, files, output, system, update, fnWrite);
+  }
+  InitializeReduce(body, control, files, output, system, update, fnWrite);
+  if (files->cRestart != NULL) {
+    RestoreCheckpointReduce(body, control, files, update);
+  }
+  InitializeCheckpoint(control, files);
 
   /* If Runge-Kutta need to copy actual update to that in
      control->Evolve. This transfer all the meta-data about the
      struct. */
   UpdateCopy(control->Evolve.tmpUpdate, update, control->Evolve.iNumBodies);
 
+  if (control->Evolve.bDenseOutput) {
+    if (control->Evolve.daState == NULL) {
+      InitializeStateVector(control, update);
+    }
+    /* Accumulating dNextOutput can leave the last output a rounding error
+       after the end of the integration */
+    dOutputSlop = DENSESLOP * control->Io.dOutputTime;
+  }
+
   /*
    *
    * Main loop begins here
    *
    */
 
-  control->Evolve.iStepsSinceLastOutput = 0;
-  control->Evolve.iTotalSteps           = 0;
   while (control->Evolve.dTime < control->Evolve.dStopTime) {
+    if (control->Evolve.bDenseOutput) {
+      StartDenseStep(control, update, iDir);
+    }
+
     /* Take one step */
     fnOneStep(body, control, system, update, fnUpdate, &dDt, iDir);
 
+    dStart = fdProfileStart(control);
     for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
       for (iModule = 0; iModule < control->Evolve.iNumModules[iBody];
            iModule++) {
@@ -668,11 +2032,36 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
               fnUpdate, iBody, iModule);
       }
     }
+    ProfileSection(control, PROFILEFORCE, dStart);
 
     fdGetUpdateInfo(body, control, system, update, fnUpdate);
 
     /* Halt? */
-    if (fbCheckHalt(body, control, update, fnUpdate)) {
+    dStart = fdProfileStart(control);
+    bHalt  = fbCheckHalt(body, control, update, fnUpdate);
+    ProfileSection(control, PROFILEHALT, dStart);
+    if (bHalt) {
+      dTimeEnd = control->Evolve.dTime + dDt;
+      if (control->Evolve.bDenseOutput) {
+        WriteDenseOutput(body, control, files, output, system, update,
+                         fnUpdate, fnWrite, dTimeEnd, iDir);
+      }
+      ReduceStep(body, control, files, output, system, update, fnUpdate,
+                 fnWrite, control->Evolve.dTime, dTimeEnd, iDir);
+      /* The interpolated rows reach the end of the step, so the last row must
+         too. Without dense output it keeps the time of the start of the
+         step, as it always has. */
+      if (control->Evolve.bDenseOutput) {
+        for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+          body[iBody].dAge += iDir * dDt;
+        }
+        control->Evolve.dTime = dTimeEnd;
+        control->Evolve.iStepsSinceLastOutput++;
+      }
+      /* The event functions use auxiliary properties, such as the inner core
+         radius, which must match the state at the end of the step */
+      PropertiesAuxiliary(body, control, system, update);
+      fbCheckEvents(body, control, dTimeEnd, dDt);
       fdGetUpdateInfo(body, control, system, update, fnUpdate);
       WriteOutput(body, control, files, output, system, update, fnWrite);
       return;
@@ -684,9 +2073,16 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
 
     control->Evolve.dTime += dDt;
     control->Evolve.iStepsSinceLastOutput++;
+    ProfileStep(control, dDt);
 
     /* Time for Output? */
-    if (control->Evolve.dTime >= control->Io.dNextOutput) {
+    if (control->Evolve.bDenseOutput) {
+      WriteDenseOutput(body, control, files, output, system, update, fnUpdate,
+                       fnWrite, control->Evolve.dTime, iDir);
+    }
+    ReduceStep(body, control, files, output, system, update, fnUpdate, fnWrite,
+               control->Evolve.dTime - dDt, control->Evolve.dTime, iDir);
+    if (control->Evolve.dTime >= control->Io.dNextOutput - dOutputSlop) {
       control->Evolve.iTotalSteps += control->Evolve.iStepsSinceLastOutput;
       WriteOutput(body, control, files, output, system, update, fnWrite);
       // Timesteps are synchronized with the output time, so this statement is
@@ -698,10 +2094,23 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
       }
     }
 
+    /* A snapshot keeps what the update below starts from */
+    KeepCheckpointCarried(body, control, files, system);
+
     /* Get auxiliary properties for next step -- first call
        was prior to loop. */
     PropertiesAuxiliary(body, control, system, update);
 
+    /* Have all the events we are waiting for occurred? */
+    if (fbCheckEvents(body, control, control->Evolve.dTime, dDt)) {
+      if (control->Evolve.iStepsSinceLastOutput > 0 &&
+          control->Evolve.dTime < control->Evolve.dStopTime) {
+        control->Evolve.iTotalSteps += control->Evolve.iStepsSinceLastOutput;
+        WriteOutput(body, control, files, output, system, update, fnWrite);
+      }
+      return;
+    }
+
     // If control->Evolve.bFirstStep hasn't been switched off by now, do so.
     if (control->Evolve.bFirstStep) {
       control->Evolve.bFirstStep = 0;
@@ -709,10 +2118,16 @@ void Evolve(BODY *body, CONTROL *control, FILES *files, MODULE *module,
 
     // Any variables reached an interesting value?
     CheckProgress(body, control, system, update);
+
+    CheckpointStep(body, control, files, system, update, fnUpdate);
   }
 
   if (control->Io.iVerbose >= VERBPROG) {
     printf("Evolution completed.\n");
+    if (control->Evolve.iOneStep == DORMANDPRINCE ||
+        control->Evolve.iOneStep == ROSENBROCK) {
+      printf("%d steps were rejected.\n", control->Evolve.iNumRejectedSteps);
+    }
   }
   //     printf("%d\n",body[1].iBadImpulse);
 }
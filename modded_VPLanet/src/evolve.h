@@ -13,6 +13,17 @@
 /* 0 => Not input by user, verify assigns default */
 #define EULER 1
 #define RUNGEKUTTA 2
+#define DORMANDPRINCE 3
+#define ROSENBROCK 4
+
+/* With dense output, an output this fraction of dOutputTime before the end
+   of a step is written at the end of the step instead */
+#define DENSESLOP 1e-10
+
+/* The time a firstzero reducer reaches zero is searched for until it is
+   known to this fraction of the step, or for this many iterations */
+#define REDUCETOL 1e-10
+#define REDUCEMAXITER 100
 
 /* @cond DOXYGEN_OVERRIDE */
 
@@ -21,6 +32,17 @@ void fdGetUpdateInfo(BODY *, CONTROL *, SYSTEM *, UPDATE *,
                      fnUpdateVariable ***);
 double fdGetTimeStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
                      fnUpdateVariable ***);
+double fdNextStopTime(CONTROL *);
+
+double fdProfileClock();
+void InitializeProfile(CONTROL *, UPDATE *);
+void FreeProfile(CONTROL *, UPDATE *);
+double fdProfileStart(CONTROL *);
+void ProfileSection(CONTROL *, int, double);
+void ProfileStep(CONTROL *, double);
+void FinishProfile(CONTROL *);
+double fdEvaluateEquation(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                          fnUpdateVariable ***, int, int, int);
 void CalculateDerivatives(BODY *, SYSTEM *, UPDATE *, fnUpdateVariable ***,
                           int);
 
@@ -30,7 +52,44 @@ void Evolve(BODY *, CONTROL *, FILES *, MODULE *, OUTPUT *, SYSTEM *, UPDATE *,
 void EulerStep(BODY *, CONTROL *, SYSTEM *, UPDATE *, fnUpdateVariable ***,
                double *, int);
 
+void InitializeStateVector(CONTROL *, UPDATE *);
+void FreeStateVector(CONTROL *);
+void GetStageDerivatives(CONTROL *, UPDATE *, int, int);
+void SetStageState(CONTROL *, int, double);
 void RungeKutta4Step(BODY *, CONTROL *, SYSTEM *, UPDATE *,
                      fnUpdateVariable ***, double *, int);
 
+void SetDormandPrinceStage(BODY *, CONTROL *, int, double, int);
+double fdStateErrorNorm(CONTROL *);
+int fbAdaptTimeStep(CONTROL *, double, double, int, double);
+double fdDormandPrinceError(CONTROL *, double);
+int fbReuseLastStage(CONTROL *, UPDATE *, fnUpdateVariable ***);
+void DormandPrinceStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                       fnUpdateVariable ***, double *, int);
+
+void EvaluateTmpStage(CONTROL *, SYSTEM *, UPDATE *, fnUpdateVariable ***, int,
+                      int);
+void SetRosenbrockStage(BODY *, CONTROL *, double *, double, int, double, int);
+void RosenbrockJacobian(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                        fnUpdateVariable ***, double, int);
+void RosenbrockStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                    fnUpdateVariable ***, double *, int);
+
+void GetStateDerivatives(CONTROL *, UPDATE *, double *, int);
+void StartDenseStep(CONTROL *, UPDATE *, int);
+void RestoreDenseStep(BODY *, CONTROL *, UPDATE *);
+void SaveDenseStep(BODY *, CONTROL *, UPDATE *, double, int);
+void InterpolateDenseStep(BODY *, CONTROL *, SYSTEM *, UPDATE *,
+                          fnUpdateVariable ***, double, int);
+void WriteDenseOutput(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *, UPDATE *,
+                      fnUpdateVariable ***, fnWriteOutput *, double, int);
+double fdReduceZeroTime(BODY *, CONTROL *, OUTFILE *, OUTPUT *, SYSTEM *,
+                        UPDATE *, fnUpdateVariable ***, fnWriteOutput *, int,
+                        int, double, double, double, double, char **, int);
+void UpdateReduceExtreme(OUTFILE *, int, double, double);
+void ReduceDenseOutput(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *, UPDATE *,
+                       fnWriteOutput *, int);
+void ReduceStep(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *, UPDATE *,
+                fnUpdateVariable ***, fnWriteOutput *, double, double, int);
+
 /* @endcond */
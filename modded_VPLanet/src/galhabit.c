@@ -960,7 +960,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
               options[OPT_GALACTIDES].cName, options[OPT_HOSTBINARY].cName,
               cFile);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
   if (body[iBody].bHostBinary) {
     if (control->Evolve.iNumBodies != 3) {
@@ -970,7 +970,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
               "ERROR: %s can only be used with exactly 3 bodies in GalHabit\n",
               options[OPT_HOSTBINARY].cName);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
     if (body[1].bHostBinary == 1 && body[2].bHostBinary == 0) {
       if (iVerbose >= VERBERR) {
@@ -979,7 +979,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
                 "GalHabit\n",
                 options[OPT_HOSTBINARY].cName);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else if (body[1].bHostBinary == 0 && body[2].bHostBinary == 1) {
       if (iVerbose >= VERBERR) {
         fprintf(stderr,
@@ -987,7 +987,7 @@ void VerifyTidesBinary(BODY *body, CONTROL *control, OPTIONS *options,
                 "GalHabit\n",
                 options[OPT_HOSTBINARY].cName);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
   if (body[iBody].bGalacTides) {
@@ -2399,7 +2399,7 @@ double fndMag2mass(double dMagV) {
     dlogMass = log10(4.0); // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:fndMag2mass.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   return pow(10.0, dlogMass);
@@ -2496,7 +2496,7 @@ void VelocityDisp(SYSTEM *system) {
     dSigma = 41.0; // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:VelocityDisp.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   system->dPassingStarSigma = system->dScalingFVelDisp * dSigma;
@@ -2535,7 +2535,7 @@ void VelocityApex(SYSTEM *system) {
     dVel = 21.0; // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:VelocityApex.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   dVel *= 1000.0;
@@ -2612,7 +2612,7 @@ double fndNearbyStarDist(double dMagV) {
     dNs = 0.43; // giants
   } else {
     fprintf(stderr, "ERROR: Unknown object in galhabit.c:fndNearbyStarDist.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
 
@@ -2651,7 +2651,7 @@ double fndNearbyStarFrEnc(SYSTEM *system, double dMagV) {
   } else {
     fprintf(stderr,
             "ERROR: Unknown object in galhabit.c:fndNearbyStarFrEnc.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   return dFs;
@@ -282,7 +282,7 @@ void VerifyHalts(BODY *body, CONTROL *control, MODULE *module,
               "maximum value for the eccentricity of all non-primary body will "
               "be MAXECCDISTORB\n.",
               options[OPT_HALTMAXECC].cName, iNumMaxEcc);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
 
     // Now add 1 to each iNumHalts
@@ -298,7 +298,7 @@ void VerifyHalts(BODY *body, CONTROL *control, MODULE *module,
       fprintf(stderr,
               "ERROR: %s set, but only 1 body present.\n",
               options[OPT_HALTMAXMUTUALINC].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 
@@ -354,7 +354,117 @@ void VerifyHalts(BODY *body, CONTROL *control, MODULE *module,
         control->fnHalt[iBody][iHaltNow++] = &fniHaltMaxEcc;
       }
     }
+
+    VerifyEvents(body, control, options, iBody);
+  }
+}
+
+/******************* Events *************************/
+
+void VerifyEvents(BODY *body, CONTROL *control, OPTIONS *options, int iBody) {
+  /* Each event is tracked by one module, which the body must have */
+  int iEvent, iNumEvents = 0;
+
+  for (iEvent = 0; iEvent < NUMEVENTS; iEvent++) {
+    control->Halt[iBody].dEventTime[iEvent] = -1;
+    if (control->Halt[iBody].bEvent[iEvent]) {
+      if ((iEvent == EVENT_SURFACEDESICCATED ||
+           iEvent == EVENT_ENVELOPEGONE) &&
+          !body[iBody].bAtmEsc) {
+        fprintf(stderr,
+                "ERROR: %s of %s includes SurfaceDesiccated or EnvelopeGone, "
+                "which require module AtmEsc.\n",
+                options[OPT_EVENTS].cName, body[iBody].cName);
+        VplanetExit(EXIT_INPUT);
+      }
+      if ((iEvent == EVENT_INNERCORENUCLEATED ||
+           iEvent == EVENT_DYNAMOSHUTDOWN) &&
+          !body[iBody].bThermint) {
+        fprintf(stderr,
+                "ERROR: %s of %s includes InnerCoreNucleated or "
+                "DynamoShutdown, which require module ThermInt.\n",
+                options[OPT_EVENTS].cName, body[iBody].cName);
+        VplanetExit(EXIT_INPUT);
+      }
+      iNumEvents++;
+    }
+  }
+
+  if (control->Halt[iBody].bHaltEvents && iNumEvents == 0) {
+    fprintf(stderr, "ERROR: %s set for %s, but %s is not.\n",
+            options[OPT_HALTEVENTS].cName, body[iBody].cName,
+            options[OPT_EVENTS].cName);
+    VplanetExit(EXIT_INPUT);
+  }
+}
+
+/* The event functions change sign when the event occurs: positive before,
+   zero or negative after. */
+double fdEventFunction(BODY *body, int iBody, int iEvent) {
+  if (iEvent == EVENT_SURFACEDESICCATED) {
+    return fdEventSurfaceDesiccated(body, iBody);
+  } else if (iEvent == EVENT_ENVELOPEGONE) {
+    return fdEventEnvelopeGone(body, iBody);
+  } else if (iEvent == EVENT_INNERCORENUCLEATED) {
+    return fdEventInnerCoreNucleated(body, iBody);
+  } else {
+    return fdEventDynamoShutdown(body, iBody);
+  }
+}
+
+void InitializeEvents(BODY *body, CONTROL *control) {
+  /* Record the events that have already occurred at the start */
+  int iBody, iEvent;
+  HALT *halt;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    halt = &control->Halt[iBody];
+    for (iEvent = 0; iEvent < NUMEVENTS; iEvent++) {
+      if (halt->bEvent[iEvent]) {
+        halt->dEventValue[iEvent] = fdEventFunction(body, iBody, iEvent);
+        if (halt->dEventValue[iEvent] <= 0) {
+          halt->dEventTime[iEvent] = control->Evolve.dTime;
+        }
+      }
+    }
+  }
+}
+
+int fbCheckEvents(BODY *body, CONTROL *control, double dTime, double dDt) {
+  /* Record the events that occurred during the last step, of length dDt and
+     ending at dTime. The time of each is interpolated linearly in its event
+     function. Returns 1 if the integration should halt. */
+  int iBody, iEvent, bHalt = 0, bAllDone;
+  double dValue;
+  HALT *halt;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    halt     = &control->Halt[iBody];
+    bAllDone = 1;
+    for (iEvent = 0; iEvent < NUMEVENTS; iEvent++) {
+      if (!halt->bEvent[iEvent]) {
+        continue;
+      }
+      if (halt->dEventTime[iEvent] < 0) {
+        dValue = fdEventFunction(body, iBody, iEvent);
+        if (dValue <= 0) {
+          halt->dEventTime[iEvent] =
+                dTime - dDt * dValue / (dValue - halt->dEventValue[iEvent]);
+        } else {
+          bAllDone = 0;
+        }
+        halt->dEventValue[iEvent] = dValue;
+      }
+    }
+    if (halt->bHaltEvents && bAllDone) {
+      if (control->Io.iVerbose >= VERBPROG) {
+        printf("HALT: All events of %s have occurred.\n", body[iBody].cName);
+      }
+      bHalt = 1;
+    }
   }
+
+  return bHalt;
 }
 
 /************** Check for Halts *********************/
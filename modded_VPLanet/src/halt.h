@@ -28,5 +28,9 @@ void InitializeHalts(CONTROL *, MODULE *);
 void VerifyHalts(BODY *, CONTROL *, MODULE *, OPTIONS *);
 int fniHaltMaxEcc(BODY *, EVOLVE *, HALT *, IO *, UPDATE *,
                   fnUpdateVariable ***, int);
+void VerifyEvents(BODY *, CONTROL *, OPTIONS *, int);
+double fdEventFunction(BODY *, int, int);
+void InitializeEvents(BODY *, CONTROL *);
+int fbCheckEvents(BODY *, CONTROL *, double, double);
 
 /* @endcond */
@@ -867,7 +867,7 @@ double fndBisection(double (*f)(BODY *, double, int), BODY *body, double dXl,
     return dXm;
   } else {
     fprintf(stderr,"ERROR: Tolerance factor <= 0 in fndBisection.");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }  
 }
 
@@ -961,7 +961,7 @@ void VerifyModuleMultiDistOrbDistRot(BODY *body, UPDATE *update,
                 "ERROR: Module DISTROT selected for %s, but DISTORB not "
                 "selected and bReadOrbitData = 0.\n",
                 body[iBody].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     } else {
       if (body[iBody].bReadOrbitData) {
@@ -969,7 +969,7 @@ void VerifyModuleMultiDistOrbDistRot(BODY *body, UPDATE *update,
                 "ERROR: Cannot set both DISTORB and bReadOrbitData for body "
                 "%s.\n",
                 body[iBody].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     }
   }
@@ -984,7 +984,7 @@ void VerifyModuleMultiEqtideDistRot(BODY *body, UPDATE *update,
       fprintf(stderr,
               "ERROR: Cannot set both EQTIDE and bReadOrbitData for body %s.\n",
               body[iBody].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
 
     control->fnPropsAuxMulti[iBody][(*iModuleProps)++] = &PropsAuxEqtideDistRot;
@@ -1023,7 +1023,7 @@ void VerifyModuleMultiEqtideThermint(BODY *body, UPDATE *update,
   if (body[iBody].bEqtide && body[iBody].bThermint) {
     if (control->Evolve.iEqtideModel == CTL) {
       fprintf(stderr,"ERROR: The CTL EqTide model cannot be coupled to ThermInt.\n");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 
@@ -1101,7 +1101,7 @@ void VerifyModuleMultiEqtideStellar(BODY *body, UPDATE *update,
                   "and 1 for a binary system!\n",
                   iBody);
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
 
       // If you're using stellar and eqtide and this isn't the primary body, it
@@ -1111,7 +1111,7 @@ void VerifyModuleMultiEqtideStellar(BODY *body, UPDATE *update,
           fprintf(stderr, "ERROR: If both stellar AND eqtide are set and iBody "
                           "> 0, MUST set iBodyType == 1 for stars\n");
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
 
       // Can't have any ocean, envelope tidal parameters set
@@ -1130,28 +1130,28 @@ void VerifyModuleMultiEqtideStellar(BODY *body, UPDATE *update,
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_TIDALQOCEAN].cName);
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       if (options[OPT_K2OCEAN].iLine[iBody + 1] > -1) {
         if (control->Io.iVerbose >= VERBINPUT) {
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_K2OCEAN].cName);
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       if (options[OPT_TIDALQENV].iLine[iBody + 1] > -1) {
         if (control->Io.iVerbose >= VERBINPUT) {
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_TIDALQENV].cName);
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       if (options[OPT_K2ENV].iLine[iBody + 1] > -1) {
         if (control->Io.iVerbose >= VERBINPUT) {
           fprintf(stderr, "ERROR: %s set, but this body is a star!.\n",
                   options[OPT_K2ENV].cName);
         }
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
 
       // ALl the options are ok! Add in the necessary AuxProps
@@ -1225,19 +1225,19 @@ void VerifyModuleMultiAtmescEqtide(BODY *body, UPDATE *update, CONTROL *control,
         if (!(options[OPT_TIDALQENV].iLine[iBody + 1] > -1)) {
           fprintf(stderr, "ERROR: if bEnvTides == 1, must specify %s.\n",
                   options[OPT_TIDALQENV].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
         // k2env not set
         else if (!(options[OPT_K2ENV].iLine[iBody + 1] > -1)) {
           fprintf(stderr, "ERROR: if bEnvTides == 1, must specify %s.\n",
                   options[OPT_K2ENV].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
         // envmass not set
         else if (!(options[OPT_ENVELOPEMASS].iLine[iBody + 1] > -1)) {
           fprintf(stderr, "ERROR: if bEnvTides == 1, must specify %s.\n",
                   options[OPT_ENVELOPEMASS].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
       }
 
@@ -1248,16 +1248,16 @@ void VerifyModuleMultiAtmescEqtide(BODY *body, UPDATE *update, CONTROL *control,
           fprintf(stderr, "ERROR: if %s == 1, must specify %s.\n",
                   options[OPT_OCEANTIDES].cName,
                   options[OPT_TIDALQOCEAN].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         } else if (options[OPT_SURFACEWATERMASS].iLine[iBody + 1] == -1) {
           fprintf(stderr, "ERROR: if %s == 1, must specify %s.\n",
                   options[OPT_OCEANTIDES].cName,
                   options[OPT_SURFACEWATERMASS].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         } else if (options[OPT_K2OCEAN].iLine[iBody + 1] == -1) {
           fprintf(stderr, "ERROR: if %s == 1, must specify %s.\n",
                   options[OPT_OCEANTIDES].cName, options[OPT_K2OCEAN].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
       }
       // now lets check there's actually an envelope
@@ -1343,7 +1343,7 @@ body[iBody].dTidalQOcean;
               (options[OPT_TIDALRADIUS].iLine[iBody + 1] > -1))) {
           fprintf(stderr, "ERROR: if bTidalRadius == 1, must set %s.\n",
                   options[OPT_TIDALRADIUS].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
       }
 
@@ -1360,7 +1360,7 @@ body[iBody].dTidalQOcean;
                   "not set!\n",
                   options[OPT_RADIUS].cName,
                   options[OPT_PLANETRADIUSMODEL].cName);
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
 
         // If dTidalRadius set, warn user since it's not considered
@@ -1398,7 +1398,7 @@ body[iBody].dTidalQOcean;
           !(options[OPT_MASSRAD].iLine[iBody + 1] > -1)) {
         fprintf(stderr, "ERROR: Using EQTIDE but neither %s or %s is set!\n",
                 options[OPT_RADIUS].cName, options[OPT_MASSRAD].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
 
       // If dTidalRadius or bUseTidalRadius set, ignore and warn user as they do
@@ -1446,7 +1446,7 @@ void VerifyModuleMultiAtmescEqtideThermint(BODY *body, UPDATE *update,
                       options[OPT_TIDALQENV].cName, options[OPT_K2ENV].cName);
               fprintf(stderr, "Must both be set when using EQTIDE, THERMINT "
                               "and ATMESC with bEnvTides == True.\n");
-              exit(EXIT_INPUT);
+              VplanetExit(EXIT_INPUT);
             }
 
             // Otherwise, we're good! set ImK2 for the envelope component
@@ -1460,7 +1460,7 @@ void VerifyModuleMultiAtmescEqtideThermint(BODY *body, UPDATE *update,
               if (control->Io.iVerbose >= VERBINPUT) {
                 fprintf(stderr, "ERROR: %s or %s set, but bEnvTides == 0.\n",
                         options[OPT_TIDALQENV].cName, options[OPT_K2ENV].cName);
-                exit(EXIT_INPUT);
+                VplanetExit(EXIT_INPUT);
               }
             }
 
@@ -1490,7 +1490,7 @@ void VerifyModuleMultiAtmescEqtideThermint(BODY *body, UPDATE *update,
             if (control->Io.iVerbose >= VERBINPUT) {
               fprintf(stderr, "ERROR: %s or %s set, but bOceanTides == 0.\n",
                       options[OPT_TIDALQENV].cName, options[OPT_K2ENV].cName);
-              exit(EXIT_INPUT);
+              VplanetExit(EXIT_INPUT);
             }
           }
 
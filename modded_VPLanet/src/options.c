@@ -44,96 +44,250 @@ int fbCommentedLine(char cLine[], int iLen) {
   return 0;
 }
 
-void GetLine(char *cFile, char *cOption, char **cLine, int *iLine,
-             int iVerbose) {
-  int iLen, bDone = 0, iLineTmp = 0;
-  char cWord[LINE], cTmp[LINE];
-  FILE *fp;
+/* Input files that have been read into memory during this run. Each file is
+   read and indexed once, the first time an option is looked up in it. The
+   index belongs to the thread, so in-process runs on different threads do
+   not share it. */
 
-  *cLine = NULL;
+static THREADLOCAL INPUTINDEX *InputIndex = NULL;
+static THREADLOCAL int iNumInputIndex     = 0;
 
-  iLen = strlen(cOption);
+unsigned int fiHashOptionName(char *cName) {
+  unsigned int iHash = 5381;
 
-  fp = fopen(cFile, "r");
-  memset(cTmp, '\0', LINE);
-  memset(cWord, '\0', OPTLEN);
-
-  while (fgets(cTmp, LINE, fp) != NULL) {
-    if (!fbCommentedLine(cTmp, LINE)) {
-      sscanf(cTmp, "%s", cWord);
-      if (memcmp(cWord, cOption, iLen + 1) == 0) {
-        /* Parameter Found! */
-        if (bDone) {
-          if (iVerbose > VERBINPUT) {
-            fprintf(stderr, "Multiple occurences of parameter %s found.\n",
-                    cOption);
-          }
-          fprintf(stderr, "\t%s, lines: %d and %d\n", cFile, (*iLine + 1),
-                  iLineTmp + 1);
-          exit(1);
-        }
-        fvFormattedString(cLine, cTmp);
-        *iLine = iLineTmp;
-        bDone  = 1;
+  while (*cName) {
+    iHash = 33 * iHash + (unsigned char)*cName++;
+  }
+
+  return iHash;
+}
+
+/* Would GetNextValidLine stop at this line? Blank lines, comments and lines
+   starting with a $ are skipped. */
+int fbValidLine(char *cLine) {
+  int iPos;
+
+  for (iPos = 0; iPos <= strlen(cLine); iPos++) {
+    if (cLine[iPos] == 36 || cLine[iPos] == 35 || cLine[iPos] == 10) {
+      return 0;
+    }
+    if (!isspace(cLine[iPos])) {
+      return 1;
+    }
+  }
+
+  return 0;
+}
+
+int fiInputIndexSlot(INPUTINDEX *index, char *cWord) {
+  int iSlot = fiHashOptionName(cWord) & (index->iNumSlots - 1);
+
+  while (index->saKey[iSlot] != NULL && strcmp(index->saKey[iSlot], cWord)) {
+    iSlot = (iSlot + 1) & (index->iNumSlots - 1);
+  }
+
+  return iSlot;
+}
+
+/* The contents of cFile if an in-memory run holds it, else NULL */
+char *fsInMemoryFile(char *cFile) {
+  int iFile;
+
+  if (InMemory != NULL) {
+    for (iFile = 0; iFile < InMemory->iNumFiles; iFile++) {
+      if (strcmp(InMemory->saFileName[iFile], cFile) == 0) {
+        return InMemory->saFileText[iFile];
       }
     }
-    iLineTmp++;
-    memset(cTmp, '\0', LINE);
-    memset(cWord, '\0', OPTLEN);
   }
-  fclose(fp);
+
+  return NULL;
 }
 
-/* If the previous line ended in $, must find the next valid line
-   (the next lines could be a # or blank). The search is made
-   recursively, and cLine and *iLine are the line and line number,
-   respectively. */
+/* Read the next line into cLine as fgets(cLine, LINE, fp) would, from fp or,
+   if fp is NULL, from the in-memory text at *cText. */
+int fbReadInputLine(FILE *fp, char **cText, char cLine[]) {
+  int iChar = 0;
 
-void GetNextValidLine(char cFile[], int iStart, char **cLine, int *iLine) {
-  FILE *fp;
-  int iPos, iLineTmp, ok = 1;
-  char cTmp[LINE];
+  if (fp != NULL) {
+    return fgets(cLine, LINE, fp) != NULL;
+  }
 
-  fp     = fopen(cFile, "r");
-  *iLine = 0;
-  *cLine = NULL;
+  if (**cText == '\0') {
+    return 0;
+  }
+  while (iChar < LINE - 1 && **cText != '\0') {
+    cLine[iChar] = *(*cText)++;
+    if (cLine[iChar++] == '\n') {
+      break;
+    }
+  }
+  cLine[iChar] = '\0';
 
-  for (iLineTmp = 0; iLineTmp < iStart; iLineTmp++) {
-    if (fgets(cTmp, LINE, fp) == NULL) {
-      fprintf(stderr, "ERROR: Unable to read next valid line.");
-      LineExit(cFile, iStart);
+  return 1;
+}
+
+void ReadInputIndex(INPUTINDEX *index, char *cFile) {
+  int iLine, iSlot, iMaxLines = 64;
+  char cTmp[LINE], cWord[LINE];
+  char *cText;
+  FILE *fp = NULL;
+
+  cText = fsInMemoryFile(cFile);
+  if (cText == NULL) {
+    fp = fopen(cFile, "r");
+    if (fp == NULL) {
+      fprintf(stderr, "ERROR: Unable to open %s.\n", cFile);
+      VplanetExit(EXIT_INPUT);
     }
-    fvFormattedString(cLine, cTmp);
-    (*iLine)++;
   }
 
-  /* If EOF, return */
-  if (fgets(cTmp, LINE, fp) == NULL) {
-    fvFormattedString(cLine, "null");
+  index->cFile = NULL;
+  fvFormattedString(&index->cFile, "%s", cFile);
+  index->iNumLines = 0;
+  index->saLine    = malloc(iMaxLines * sizeof(char *));
+
+  memset(cTmp, '\0', LINE);
+  while (fbReadInputLine(fp, &cText, cTmp)) {
+    if (index->iNumLines == iMaxLines) {
+      iMaxLines *= 2;
+      index->saLine = realloc(index->saLine, iMaxLines * sizeof(char *));
+    }
+    index->saLine[index->iNumLines] = NULL;
+    fvFormattedString(&index->saLine[index->iNumLines], "%s", cTmp);
+    index->iNumLines++;
+    memset(cTmp, '\0', LINE);
+  }
+  if (fp != NULL) {
     fclose(fp);
-    return;
   }
 
-  /* Now check for blank line, comment (# = 35), continue ($ = 36)
-     or blank line (line feed = 10). */
+  index->iaNextValid = malloc((index->iNumLines + 1) * sizeof(int));
+  index->iaNextValid[index->iNumLines] = index->iNumLines;
+  for (iLine = index->iNumLines - 1; iLine >= 0; iLine--) {
+    if (fbValidLine(index->saLine[iLine])) {
+      index->iaNextValid[iLine] = iLine;
+    } else {
+      index->iaNextValid[iLine] = index->iaNextValid[iLine + 1];
+    }
+  }
+
+  /* Hash table at most half full */
+  index->iNumSlots = 16;
+  while (index->iNumSlots < 2 * index->iNumLines) {
+    index->iNumSlots *= 2;
+  }
+  index->saKey        = malloc(index->iNumSlots * sizeof(char *));
+  index->iaKeyLine    = malloc(index->iNumSlots * sizeof(int));
+  index->iaKeyDupLine = malloc(index->iNumSlots * sizeof(int));
+  for (iSlot = 0; iSlot < index->iNumSlots; iSlot++) {
+    index->saKey[iSlot] = NULL;
+  }
 
-  for (iPos = 0; iPos < LINE; iPos++) {
-    if (cTmp[iPos] == 36 || cTmp[iPos] == 35 || cTmp[iPos] == 10) {
-      /* First character is a $, # or \n: continue */
-      GetNextValidLine(cFile, iStart + 1, cLine, iLine);
-      fclose(fp);
-      return;
+  for (iLine = 0; iLine < index->iNumLines; iLine++) {
+    if (fbCommentedLine(index->saLine[iLine],
+                        strlen(index->saLine[iLine]) + 1) ||
+        sscanf(index->saLine[iLine], "%s", cWord) != 1) {
+      continue;
     }
-    if (!isspace(cTmp[iPos])) {
-      /* Found next valid line */
-      fclose(fp);
-      fvFormattedString(cLine, cTmp);
-      return;
+    iSlot = fiInputIndexSlot(index, cWord);
+    if (index->saKey[iSlot] == NULL) {
+      fvFormattedString(&index->saKey[iSlot], "%s", cWord);
+      index->iaKeyLine[iSlot]    = iLine;
+      index->iaKeyDupLine[iSlot] = -1;
+    } else if (index->iaKeyDupLine[iSlot] == -1) {
+      index->iaKeyDupLine[iSlot] = iLine;
     }
   }
-  /* If made it here, line was blank */
-  GetNextValidLine(cFile, iStart + 1, cLine, iLine);
-  fclose(fp);
+}
+
+INPUTINDEX *GetInputIndex(char *cFile) {
+  int iIndex;
+
+  for (iIndex = 0; iIndex < iNumInputIndex; iIndex++) {
+    if (strcmp(InputIndex[iIndex].cFile, cFile) == 0) {
+      return &InputIndex[iIndex];
+    }
+  }
+
+  InputIndex = realloc(InputIndex, (iNumInputIndex + 1) * sizeof(INPUTINDEX));
+  ReadInputIndex(&InputIndex[iNumInputIndex], cFile);
+
+  return &InputIndex[iNumInputIndex++];
+}
+
+/* Forget all input files, so that the next run reads them again. */
+void FreeInputIndex() {
+  int iIndex, iLine, iSlot;
+
+  for (iIndex = 0; iIndex < iNumInputIndex; iIndex++) {
+    for (iLine = 0; iLine < InputIndex[iIndex].iNumLines; iLine++) {
+      free(InputIndex[iIndex].saLine[iLine]);
+    }
+    for (iSlot = 0; iSlot < InputIndex[iIndex].iNumSlots; iSlot++) {
+      free(InputIndex[iIndex].saKey[iSlot]);
+    }
+    free(InputIndex[iIndex].cFile);
+    free(InputIndex[iIndex].saLine);
+    free(InputIndex[iIndex].iaNextValid);
+    free(InputIndex[iIndex].saKey);
+    free(InputIndex[iIndex].iaKeyLine);
+    free(InputIndex[iIndex].iaKeyDupLine);
+  }
+  free(InputIndex);
+  InputIndex     = NULL;
+  iNumInputIndex = 0;
+}
+
+/* Find the line that starts with cOption. cLine and *iLine are the line and
+   its number; *iLine is unchanged if the option is not in the file. */
+
+void GetLine(char *cFile, char *cOption, char **cLine, int *iLine,
+             int iVerbose) {
+  int iSlot;
+  INPUTINDEX *index;
+
+  *cLine = NULL;
+
+  index = GetInputIndex(cFile);
+  iSlot = fiInputIndexSlot(index, cOption);
+
+  if (index->saKey[iSlot] != NULL) {
+    if (index->iaKeyDupLine[iSlot] >= 0) {
+      if (iVerbose > VERBINPUT) {
+        fprintf(stderr, "Multiple occurences of parameter %s found.\n",
+                cOption);
+      }
+      fprintf(stderr, "\t%s, lines: %d and %d\n", cFile,
+              index->iaKeyLine[iSlot] + 1, index->iaKeyDupLine[iSlot] + 1);
+      VplanetExit(1);
+    }
+    fvFormattedString(cLine, "%s", index->saLine[index->iaKeyLine[iSlot]]);
+    *iLine = index->iaKeyLine[iSlot];
+  }
+}
+
+/* If the previous line ended in $, must find the next valid line
+   (the next lines could be a # or blank). cLine and *iLine are the line
+   and line number, respectively; cLine is "null" at the end of the file. */
+
+void GetNextValidLine(char cFile[], int iStart, char **cLine, int *iLine) {
+  INPUTINDEX *index;
+
+  *cLine = NULL;
+
+  index = GetInputIndex(cFile);
+  if (iStart > index->iNumLines) {
+    fprintf(stderr, "ERROR: Unable to read next valid line.");
+    LineExit(cFile, iStart);
+  }
+
+  *iLine = index->iaNextValid[iStart];
+  if (*iLine == index->iNumLines) {
+    fvFormattedString(cLine, "null");
+  } else {
+    fvFormattedString(cLine, "%s", index->saLine[*iLine]);
+  }
 }
 
 /* Where is the first non-white-space character in a line? */
@@ -347,7 +501,7 @@ void AddOptionDouble(char *cFile, char *cOption, double *dInput, int *iLine,
     if (iNumOptionsRead != 2) {                                                     
       printf("ERROR: %d arguments read for option %s.\n",iNumOptionsRead,cOption);
       printf("\tcLine=%s, cTmp=%s, dInput=%lf\n", cLine, cTmp, *dInput );
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
   free(cLine);
@@ -363,7 +517,7 @@ void AddOptionInt(char *cFile, char *cOption, int *iInput, int *iLine,
     if (iNumOptionsRead != 2) {                                                     
       printf("ERROR: %d arguments read for option %s.\n",iNumOptionsRead,cOption);
       printf("\tcLine=%s, cTmp=%s, dInput=%d\n", cLine, cTmp, *iInput );
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } 
   }
   free(cLine);
@@ -398,27 +552,22 @@ void AddOptionString(char *cFile, char *cOption, char cInput[], int *iLine,
     if (iNumOptionsRead != 2) {                                                     
       printf("ERROR: %d arguments read for option %s.\n",iNumOptionsRead,cOption);
       printf("\tcLine=%s, cTmp=%s, dInput=%s\n", cLine, cTmp, cInput );
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } 
   }
   free(cLine);
 }
 
 int iGetNumLines(char *cFile) {
-  int iNumLines = 0, iChar, bFileOK = 1;
+  int iLine, iChar, bFileOK = 1;
   int bComment, bReturn;
-  FILE *fp;
-  char cLine[LINE];
+  char *cLine;
+  INPUTINDEX *index;
 
-  fp = fopen(cFile, "r");
-  if (fp == NULL) {
-    fprintf(stderr, "Unable to open %s.\n", cFile);
-    exit(EXIT_INPUT);
-  }
+  index = GetInputIndex(cFile);
 
-  memset(cLine, '\0', LINE);
-  while (fgets(cLine, LINE, fp) != NULL) {
-    iNumLines++;
+  for (iLine = 0; iLine < index->iNumLines; iLine++) {
+    cLine = index->saLine[iLine];
 
     /* Check to see if line is too long. The maximum length of a line is set
        by LINE. If a carriage return is not found in the first LINE
@@ -440,27 +589,30 @@ int iGetNumLines(char *cFile) {
       if (iChar >= LINE) {
         fprintf(stderr,
                 "ERROR: Line %s:%d is longer than allowed (%d characters).\n",
-                cFile, iNumLines, LINE);
+                cFile, iLine + 1, LINE);
         bFileOK = 0;
       }
     }
-    memset(cLine, '\0', LINE);
   }
 
   if (!bFileOK) {
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
-  return iNumLines;
+  return index->iNumLines;
 }
 
 void CheckFileExists(char *cFile) {
   FILE *fp;
 
+  if (fsInMemoryFile(cFile) != NULL) {
+    return;
+  }
+
   fp = fopen(cFile, "r");
   if (fp == NULL) {
     fprintf(stderr, "ERROR: Unable to open %s for reading.\n", cFile);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
   fclose(fp);
 }
@@ -476,22 +628,18 @@ int fbBlankLine(char *cLine,int iLineLength) {
 }
 
 void RecordCommentsAndWhiteSpace(INFILE *infile) {
-  int iLine, iPos, bBlank;
+  int iLine;
   char cLine[LINE];
-  FILE *fp;
+  INPUTINDEX *index;
 
-  fp = fopen(infile->cIn, "r");
+  index = GetInputIndex(infile->cIn);
   infile->bLineOK   = malloc(infile->iNumLines * sizeof(int));
 
   for (iLine = 0; iLine < infile->iNumLines; iLine++) {
     infile->bLineOK[iLine] = 0;
     memset(cLine, '\0', LINE);
+    strcpy(cLine, index->saLine[iLine]);
 
-    // XXX Isn't this the same as CheckFileExists?
-    if (fgets(cLine, LINE, fp) == NULL) {
-      fprintf(stderr, "ERROR: Unable to open %s.\n", infile->cIn);
-      exit(EXIT_INPUT);
-    }
     if (fbCommentedLine(cLine, LINE) || fbBlankLine(cLine,LINE)) {
       infile->bLineOK[iLine] = 1;
     }
@@ -499,28 +647,25 @@ void RecordCommentsAndWhiteSpace(INFILE *infile) {
 }
 
 void Unrecognized(FILES files) {
-  FILE *fp;
-  char cLine[LINE], cWord[NAMELEN];
+  char cWord[NAMELEN];
   int iFile, iLine, bExit = 0; /* Assume don't exit */
+  INPUTINDEX *index;
 
   for (iFile = 0; iFile < files.iNumInputs; iFile++) {
-    fp = fopen(files.Infile[iFile].cIn, "r");
+    index = GetInputIndex(files.Infile[iFile].cIn);
 
-    iLine = 0;
-    while (fgets(cLine, LINE, fp) != NULL) {
+    for (iLine = 0; iLine < index->iNumLines; iLine++) {
       if (!files.Infile[iFile].bLineOK[iLine]) {
         /* Bad line */
-        sscanf(cLine, "%s", cWord);
+        sscanf(index->saLine[iLine], "%s", cWord);
         fprintf(stderr, "ERROR: Unrecognized option \"%s\" in %s, line %d.\n",
                 cWord, files.Infile[iFile].cIn, iLine + 1);
         bExit = 1;
       }
-      memset(cLine, '\0', LINE);
-      iLine++;
     }
   }
   if (bExit) {
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 }
 
@@ -554,7 +699,7 @@ void CheckDuplication(FILES *files, OPTIONS *options, char cFile[], int iLine,
     fprintf(stderr,
             "ERROR: CheckDuplication called, but options.bMultiFile = %d\n",
             options->bMultiFile);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   for (iFile = 0; iFile < files->iNumInputs; iFile++) {
@@ -568,7 +713,7 @@ void CheckDuplication(FILES *files, OPTIONS *options, char cFile[], int iLine,
       fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn,
               options->iLine[iFile]);
       fprintf(stderr, "\t%s, Line: %d\n", cFile, iLine);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 }
@@ -682,7 +827,7 @@ void ReadUnitMass(CONTROL *control, FILES *files, OPTIONS *options, int iFile) {
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[0].cIn,
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iMass =
@@ -774,7 +919,7 @@ void ReadUnitTime(CONTROL *control, FILES *files, OPTIONS *options, int iFile) {
         fprintf(stderr, "\t%s, Line: %d\n", options->cFile[0],
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iTime =
@@ -860,7 +1005,7 @@ void ReadUnitAngle(CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "\t%s, Line: %d\n", options->cFile[0],
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iAngle =
@@ -957,7 +1102,7 @@ void ReadUnitLength(CONTROL *control, FILES *files, OPTIONS *options,
         fprintf(stderr, "\t%s, Line: %d\n", options->cFile[0],
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iLength =
@@ -1046,7 +1191,7 @@ void ReadUnitTemp(CONTROL *control, FILES *files, OPTIONS *options, int iFile) {
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[0].cIn,
                 options->iLine[0]);
         fprintf(stderr, "\t%s, Line: %d\n", files->Infile[iFile].cIn, lTmp);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       } else {
         /* Wasn't assigned in primary */
         control->Units[iFile].iTemp =
@@ -1116,7 +1261,7 @@ void ReadBodyFileNames(BODY **body,CONTROL *control, FILES *files, OPTIONS *opti
   } else {
     fprintf(stderr, "ERROR: Option %s is required in file %s.\n",
             options->cName, cFile);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   control->Evolve.iNumBodies = iNumIndices;
@@ -1538,6 +1683,52 @@ void ReadBodyName(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Snapshot file name */
+
+void ReadCheckpointFile(BODY *body, CONTROL *control, FILES *files,
+                        OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    fvFormattedString(&files->cCheckpoint, cTmp);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  }
+}
+
+/* Interval between snapshots */
+
+void ReadCheckpointTime(BODY *body, CONTROL *control, FILES *files,
+                        OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp < 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be greater than 0.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    control->Io.dCheckpointTime =
+          dTmp * fdUnitsTime(control->Units[iFile].iTime);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, &control->Io.dCheckpointTime,
+                        files->iNumInputs);
+  }
+}
+
 /* Body color (for plotting) */
 void ReadColor(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                SYSTEM *system, int iFile) {
@@ -1565,6 +1756,28 @@ void ReadColor(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
  *
  */
 
+/* Interpolate output between steps? */
+
+void ReadDenseOutput(BODY *body, CONTROL *control, FILES *files,
+                     OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  int bTmp;
+
+  AddOptionBool(files->Infile[iFile].cIn, options->cName, &bTmp, &lTmp,
+                control->Io.iVerbose);
+  if (lTmp >= 0) {
+    /* Option was found */
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    control->Evolve.bDenseOutput = bTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultInt(options, &control->Evolve.bDenseOutput,
+                     files->iNumInputs);
+  }
+}
+
 /* Digits */
 
 void ReadDigits(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
@@ -1669,6 +1882,54 @@ void ReadEnvelopeMass(BODY *body, CONTROL *control, FILES *files,
   }
 }
 
+/* Events to record */
+
+void ReadEvents(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+                SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary file */
+  int iEvent, iIndex, iNumIndices = 0, iNumLines = 0;
+  int *lTmp;
+  char **saTmp;
+
+  lTmp = malloc(MAXLINES * sizeof(int));
+
+  AddOptionStringArray(files->Infile[iFile].cIn, options->cName, &saTmp,
+                       &iNumIndices, &iNumLines, lTmp, control->Io.iVerbose);
+  if (iFile > 0) {
+    for (iEvent = 0; iEvent < NUMEVENTS; iEvent++) {
+      control->Halt[iFile - 1].bEvent[iEvent] = 0;
+    }
+  }
+  if (lTmp[0] >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp[0],
+                    control->Io.iVerbose);
+    for (iIndex = 0; iIndex < iNumIndices; iIndex++) {
+      if (strcmp(sLower(saTmp[iIndex]), "surfacedesiccated") == 0) {
+        iEvent = EVENT_SURFACEDESICCATED;
+      } else if (strcmp(sLower(saTmp[iIndex]), "envelopegone") == 0) {
+        iEvent = EVENT_ENVELOPEGONE;
+      } else if (strcmp(sLower(saTmp[iIndex]), "innercorenucleated") == 0) {
+        iEvent = EVENT_INNERCORENUCLEATED;
+      } else if (strcmp(sLower(saTmp[iIndex]), "dynamoshutdown") == 0) {
+        iEvent = EVENT_DYNAMOSHUTDOWN;
+      } else {
+        if (control->Io.iVerbose >= VERBERR) {
+          fprintf(stderr,
+                  "ERROR: Unknown argument to %s: %s. Options are: "
+                  "SurfaceDesiccated, EnvelopeGone, InnerCoreNucleated, "
+                  "DynamoShutdown.\n",
+                  options->cName, saTmp[iIndex]);
+        }
+        LineExit(files->Infile[iFile].cIn, lTmp[0]);
+      }
+      control->Halt[iFile - 1].bEvent[iEvent] = 1;
+    }
+    UpdateFoundOptionMulti(&files->Infile[iFile], options, lTmp, iNumLines,
+                           iFile);
+  }
+  free(lTmp);
+}
+
 
 /*
  *
@@ -1724,6 +1985,29 @@ void ReadGRCorr(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
  */
 
 
+/* Halt once all events have occurred */
+
+void ReadHaltEvents(BODY *body, CONTROL *control, FILES *files,
+                    OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary file */
+  int lTmp = -1;
+  int bTmp;
+
+  AddOptionBool(files->Infile[iFile].cIn, options->cName, &bTmp, &lTmp,
+                control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    control->Halt[iFile - 1].bHaltEvents = bTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    if (iFile > 0) {
+      AssignDefaultInt(options, &control->Halt[iFile - 1].bHaltEvents,
+                       files->iNumInputs);
+    }
+  }
+}
+
 /* Maximum Eccentricity */
 
 void ReadHaltMaxEcc(BODY *body, CONTROL *control, FILES *files,
@@ -1985,12 +2269,39 @@ void ReadHecc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dHecc = options->dDefault;
   }
 }
 
+/* Stellar age at which dSemiFromHZFlux or sSemiHZLimit is evaluated */
+
+void ReadHZAge(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+               SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary input file */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    if (dTmp < 0) {
+      body[iFile - 1].dHZAge =
+            dTmp * dNegativeDouble(*options, files->Infile[iFile].cIn,
+                                   control->Io.iVerbose);
+    } else {
+      body[iFile - 1].dHZAge = dTmp * fdUnitsTime(control->Units[iFile].iTime);
+    }
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile > 0) {
+    /* VerifySemiHZ uses the age of the system */
+    body[iFile - 1].dHZAge = options->dDefault;
+  }
+}
+
 /*
  *
  * I
@@ -2011,13 +2322,19 @@ void ReadIntegrationMethod(BODY *body, CONTROL *control, FILES *files,
                      control->Io.iVerbose);
     if (memcmp(sLower(cTmp), "e", 1) == 0) {
       control->Evolve.iOneStep = EULER;
+    } else if (memcmp(sLower(cTmp), "ro", 2) == 0) {
+      control->Evolve.iOneStep = ROSENBROCK;
     } else if (memcmp(sLower(cTmp), "r", 1) == 0) {
       control->Evolve.iOneStep = RUNGEKUTTA;
+    } else if (memcmp(sLower(cTmp), "d", 1) == 0) {
+      control->Evolve.iOneStep = DORMANDPRINCE;
     } else {
       if (control->Io.iVerbose >= VERBERR) {
         fprintf(stderr, "ERROR: Unknown argument to %s: %s.\n", options->cName,
                 cTmp);
-        fprintf(stderr, "Options are Euler.\n");
+        fprintf(stderr,
+                "Options are Euler, Runge-Kutta4, DormandPrince and "
+                "Rosenbrock.\n");
       }
       LineExit(files->Infile[iFile].cIn, lTmp);
     }
@@ -2044,7 +2361,7 @@ void ReadKecc(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dKecc = options->dDefault;
   }
@@ -2310,7 +2627,7 @@ void ReadLXUV(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   } else {
     if (iFile > 0) {
       body[iFile - 1].dLXUV = options->dDefault;
@@ -2626,7 +2943,7 @@ void ReadOutputOrder(FILES *files, MODULE *module, OPTIONS *options,
                 "increase MAXARRAY in vplanet.h.\n",
                 files->Infile[iFile].cIn);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
 
     /* First remove and record negative signs */
@@ -2956,6 +3273,223 @@ void ReadGridOutput(FILES *files, OPTIONS *options, OUTPUT *output, int iFile,
   free(cOption);
 }
 
+/*
+ * Reducers -- Also special, as each one names an output
+ */
+
+/* Return the output whose name is cName or starts with it, -1 if there is
+   none, or -2 if there are several. */
+int fiFindOutput(OUTPUT *output, char *cName) {
+  int iOut, iFound = -1;
+  char *cTmp = NULL, *cOut = NULL;
+
+  fvFormattedString(&cTmp, cName);
+  sLower(cTmp);
+  for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
+    fvFormattedString(&cOut, output[iOut].cName);
+    sLower(cOut);
+    if (strcmp(cTmp, cOut) == 0) {
+      iFound = iOut;
+      break;
+    }
+    if (strlen(cOut) > strlen(cTmp) &&
+        memcmp(cTmp, cOut, strlen(cTmp)) == 0) {
+      iFound = (iFound == -1) ? iOut : -2;
+    }
+  }
+  free(cTmp);
+  free(cOut);
+  return iFound;
+}
+
+void ReadReduce(FILES *files, MODULE *module, OPTIONS *options,
+                OUTPUT *output, int iFile, int iVerbose) {
+  int iReduce, jReduce, iNumIndices = 0, iOut, iOp, *lTmp;
+  char **saTmp, *cName = NULL, *cOp, *cEnd;
+  const char *saOp[] = {"initial", "final",  "delta",  "loss",     "min",
+                        "max",     "argmin", "argmax", "firstzero"};
+  OUTFILE *outfile = &files->Outfile[iFile - 1];
+
+  lTmp = malloc(MAXLINES * sizeof(int));
+  AddOptionStringArray(files->Infile[iFile].cIn, options[OPT_REDUCE].cName,
+                       &saTmp, &iNumIndices, &files->Infile[iFile].iNumLines,
+                       lTmp, iVerbose);
+
+  outfile->iNumReduce = 0;
+  if (lTmp[0] < 0) {
+    free(lTmp);
+    return;
+  }
+  NotPrimaryInput(iFile, options[OPT_REDUCE].cName, files->Infile[iFile].cIn,
+                  lTmp[0], iVerbose);
+
+  outfile->saReduceName    = malloc(iNumIndices * sizeof(char *));
+  outfile->saReduceUnit    = malloc(iNumIndices * sizeof(char *));
+  outfile->iaReduceOut     = malloc(iNumIndices * sizeof(int));
+  outfile->iaReduceOp      = malloc(iNumIndices * sizeof(int));
+  outfile->baReduceNeg     = malloc(iNumIndices * sizeof(int));
+  outfile->baReduceDone    = malloc(iNumIndices * sizeof(int));
+  outfile->daReduceTime    = malloc(iNumIndices * sizeof(double));
+  outfile->daReduceInitial = malloc(iNumIndices * sizeof(double));
+  outfile->daReduceLast    = malloc(iNumIndices * sizeof(double));
+  outfile->daReduceExtreme = malloc(iNumIndices * sizeof(double));
+  outfile->daReduceResult  = malloc(iNumIndices * sizeof(double));
+  outfile->iNumReduce      = iNumIndices;
+
+  for (iReduce = 0; iReduce < iNumIndices; iReduce++) {
+    outfile->saReduceName[iReduce] = NULL;
+    outfile->saReduceUnit[iReduce] = NULL;
+    outfile->baReduceDone[iReduce] = 0;
+    outfile->daReduceTime[iReduce] = 0;
+    outfile->daReduceResult[iReduce] = NAN;
+
+    /* Split the entry into [-]Name and either @Time or :Operation */
+    outfile->baReduceNeg[iReduce] = (saTmp[iReduce][0] == '-');
+    fvFormattedString(&cName, "%s", saTmp[iReduce] + outfile->baReduceNeg[iReduce]);
+    cOp = strpbrk(cName, "@:");
+    if (cOp == NULL) {
+      if (iVerbose >= VERBERR) {
+        fprintf(stderr,
+                "ERROR: Reducer \"%s\" must be Name@Time or Name:Operation.\n",
+                saTmp[iReduce]);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp[0]);
+    }
+
+    if (*cOp == '@') {
+      iOp = REDUCE_AT;
+      outfile->daReduceTime[iReduce] = strtod(cOp + 1, &cEnd);
+      if (cEnd == cOp + 1 || *cEnd != '\0') {
+        if (iVerbose >= VERBERR) {
+          fprintf(stderr, "ERROR: Time of reducer \"%s\" is not a number.\n",
+                  saTmp[iReduce]);
+        }
+        LineExit(files->Infile[iFile].cIn, lTmp[0]);
+      }
+    } else {
+      sLower(cOp + 1);
+      for (iOp = REDUCE_INITIAL; iOp <= REDUCE_FIRSTZERO; iOp++) {
+        if (strcmp(cOp + 1, saOp[iOp - REDUCE_INITIAL]) == 0) {
+          break;
+        }
+      }
+      if (iOp > REDUCE_FIRSTZERO) {
+        if (iVerbose >= VERBERR) {
+          fprintf(stderr,
+                  "ERROR: Unknown operation in reducer \"%s\". Options are "
+                  "initial, final, delta, loss, min, max, argmin, argmax and "
+                  "firstzero.\n",
+                  saTmp[iReduce]);
+        }
+        LineExit(files->Infile[iFile].cIn, lTmp[0]);
+      }
+    }
+    outfile->iaReduceOp[iReduce] = iOp;
+
+    /* Now the output it reduces */
+    *cOp = '\0';
+    iOut = fiFindOutput(output, cName);
+    if (iOut < 0) {
+      if (iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s output option \"%s\" in reducer \"%s\".\n",
+                iOut == -1 ? "Unknown" : "Ambiguous", cName, saTmp[iReduce]);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp[0]);
+    }
+    if (output[iOut].iNum != 1 || output[iOut].bGrid == 1) {
+      if (iVerbose >= VERBERR) {
+        fprintf(stderr,
+                "ERROR: Output %s cannot be reduced, as it is not a single "
+                "value.\n",
+                output[iOut].cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp[0]);
+    }
+    if (outfile->baReduceNeg[iReduce] && !output[iOut].bNeg) {
+      if (iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: Output option %s cannot be negative.\n",
+                output[iOut].cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp[0]);
+    }
+    if (!(module->iBitSum[iFile - 1] & output[iOut].iModuleBit)) {
+      if (iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: Output parameter %s requires module(s): ",
+                output[iOut].cName);
+        PrintModuleList(stderr, output[iOut].iModuleBit, 0);
+        fprintf(stderr, "\n");
+      }
+      DoubleLineExit(files->Infile[iFile].cIn, files->Infile[iFile].cIn,
+                     lTmp[0], options[OPT_MODULES].iLine[iFile]);
+    }
+    outfile->iaReduceOut[iReduce] = iOut;
+
+    /* Name the result after the full output name */
+    if (iOp == REDUCE_AT) {
+      fvFormattedString(&outfile->saReduceName[iReduce], "%s%s@%s",
+                        outfile->baReduceNeg[iReduce] ? "-" : "",
+                        output[iOut].cName, cOp + 1);
+    } else {
+      fvFormattedString(&outfile->saReduceName[iReduce], "%s%s:%s",
+                        outfile->baReduceNeg[iReduce] ? "-" : "",
+                        output[iOut].cName, saOp[iOp - REDUCE_INITIAL]);
+    }
+    for (jReduce = 0; jReduce < iReduce; jReduce++) {
+      if (strcmp(outfile->saReduceName[iReduce],
+                 outfile->saReduceName[jReduce]) == 0) {
+        if (iVerbose >= VERBERR) {
+          fprintf(stderr, "ERROR: Reducer %s selected twice.\n",
+                  outfile->saReduceName[iReduce]);
+        }
+        LineExit(files->Infile[iFile].cIn, lTmp[0]);
+      }
+    }
+  }
+
+  UpdateFoundOptionMulti(&files->Infile[iFile], &options[OPT_REDUCE], lTmp,
+                         files->Infile[iFile].iNumLines, iFile);
+
+  free(lTmp);
+  free(cName);
+  free(saTmp);
+}
+
+/* Output file format */
+
+void ReadOutputFormat(BODY *body, CONTROL *control, FILES *files,
+                      OPTIONS *options, SYSTEM *system, int iFile) {
+  /* Like the other output settings, this parameter is registered with
+     iFileType 2: it can exist in any file, but only once, and the format
+     applies to the output files of every body. */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (!memcmp(sLower(cTmp), "t", 1)) {
+      control->Io.iOutputFormat = OUTPUTTEXT;
+    } else if (!memcmp(sLower(cTmp), "b", 1)) {
+      control->Io.iOutputFormat = OUTPUTBINARY;
+    } else {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr,
+                "ERROR: Unknown argument to %s: %s. Options are text or "
+                "binary.\n",
+                options->cName, cTmp);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile == 0) {
+    /* The primary file is read first, so this cannot overwrite a value set
+       in a body file. */
+    control->Io.iOutputFormat = OUTPUTTEXT;
+  }
+}
+
 void ReadOverwrite(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
                    SYSTEM *system, int iFile) {
   /* This parameter can exist in any file, but only once */
@@ -3104,6 +3638,25 @@ void ReadCalcDynEllip(BODY *body, CONTROL *control, FILES *files,
   //     AssignDefaultInt(options,&body[iFile-1].bCalcDynEllip,files->iNumInputs);
 }
 
+/* Profile the integration */
+
+void ReadProfile(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+                 SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  int bTmp;
+
+  AddOptionBool(files->Infile[iFile].cIn, options->cName, &bTmp, &lTmp,
+                control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    control->Io.bProfile = bTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultInt(options, &control->Io.bProfile, files->iNumInputs);
+  }
+}
 
 /*
  *
@@ -3166,6 +3719,50 @@ void ReadRadiusGyration(BODY *body, CONTROL *control, FILES *files,
   }
 }
 
+/* Relative error tolerance of adaptive integration */
+
+void ReadRelTol(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+                SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp <= 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be greater than 0.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    control->Evolve.dRelTol = dTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, &control->Evolve.dRelTol, files->iNumInputs);
+  }
+}
+
+/* Snapshot to resume from */
+
+void ReadRestartFile(BODY *body, CONTROL *control, FILES *files,
+                     OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    fvFormattedString(&files->cRestart, cTmp);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  }
+}
+
 /* Rotation Period */
 
 void ReadRotPeriod(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
@@ -3252,6 +3849,32 @@ void ReadRotVel(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
  *
  */
 
+/* Error tolerance of adaptive integration, relative to each variable's scale */
+
+void ReadScaleTol(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
+                  SYSTEM *system, int iFile) {
+  /* This parameter can exist in any file, but only once */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    CheckDuplication(files, options, files->Infile[iFile].cIn, lTmp,
+                     control->Io.iVerbose);
+    if (dTmp <= 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be greater than 0.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    control->Evolve.dScaleTol = dTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else {
+    AssignDefaultDouble(options, &control->Evolve.dScaleTol, files->iNumInputs);
+  }
+}
+
 /* Scientific Notation */
 
 void ReadSciNot(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
@@ -3284,6 +3907,63 @@ void ReadSciNot(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   }
 }
 
+/* Semi-Major Axis from an instellation */
+
+void ReadSemiFromHZFlux(BODY *body, CONTROL *control, FILES *files,
+                        OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary input file */
+  int lTmp = -1;
+  double dTmp;
+
+  AddOptionDouble(files->Infile[iFile].cIn, options->cName, &dTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    if (dTmp <= 0) {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: %s must be greater than 0.\n", options->cName);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    body[iFile - 1].dSemiHZFlux = dTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile > 0) {
+    body[iFile - 1].dSemiHZFlux = options->dDefault;
+  }
+}
+
+/* Semi-Major Axis from a habitable zone limit */
+
+void ReadSemiHZLimit(BODY *body, CONTROL *control, FILES *files,
+                     OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary input file */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    if (memcmp(sLower(cTmp), "i", 1) == 0) {
+      body[iFile - 1].iSemiHZLimit = HZ_RUNAWAYGREENHOUSE;
+    } else if (memcmp(sLower(cTmp), "o", 1) == 0) {
+      body[iFile - 1].iSemiHZLimit = HZ_MAXGREENHOUSE;
+    } else {
+      if (control->Io.iVerbose >= VERBERR) {
+        fprintf(stderr, "ERROR: Unknown argument to %s: %s. Options are INNER "
+                        "or OUTER.\n",
+                options->cName, cTmp);
+      }
+      LineExit(files->Infile[iFile].cIn, lTmp);
+    }
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile > 0) {
+    body[iFile - 1].iSemiHZLimit = -1;
+  }
+}
+
 /* Semi-Major Axis */
 
 void ReadSemiMajorAxis(BODY *body, CONTROL *control, FILES *files,
@@ -3433,7 +4113,7 @@ void ReadOptionsGeneral(BODY *body, CONTROL *control, FILES *files,
     for (iOpt = 100; iOpt < NUMOPT; iOpt++) {
       /* OutputOrder is special */
       if (options[iOpt].iType != -1 && iOpt != OPT_OUTPUTORDER &&
-          iOpt != OPT_GRIDOUTPUT) {
+          iOpt != OPT_GRIDOUTPUT && iOpt != OPT_REDUCE) {
         // printf("%d\n",iOpt);
         // fflush(stdout);
         fnRead[iOpt](body, control, files, &options[iOpt], system, iFile);
@@ -3445,6 +4125,7 @@ void ReadOptionsGeneral(BODY *body, CONTROL *control, FILES *files,
   for (iFile = 1; iFile < files->iNumInputs; iFile++) {
     ReadOutputOrder(files, module, options, output, iFile,
                     control->Io.iVerbose);
+    ReadReduce(files, module, options, output, iFile, control->Io.iVerbose);
     if (body[iFile - 1].bPoise) {
       ReadGridOutput(files, options, output, iFile, control->Io.iVerbose);
     } else {
@@ -3516,7 +4197,7 @@ void ReadXobl(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dXobl = options->dDefault;
   }
@@ -3540,7 +4221,7 @@ void ReadYobl(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dYobl = options->dDefault;
   }
@@ -3564,7 +4245,7 @@ void ReadZobl(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
   if (lTmp >= 0) {
     fprintf(stderr, "ERROR: Option %s is not currently supported.\n",
             options->cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   } else if (iFile > 0) {
     body[iFile - 1].dZobl = options->dDefault;
   }
@@ -3582,6 +4263,9 @@ void ReadOptions(BODY **body, CONTROL *control, FILES *files, MODULE *module,
                  UPDATE **update, fnReadOption fnRead[], char infile[]) {
   int iBody;
 
+  /* Input files are read again for every run */
+  FreeInputIndex();
+
   /* Read options for files, units, verbosity, and system name. */
   ReadInitialOptions(body, control, files, module, options, output, system,
                      infile);
@@ -3606,6 +4290,8 @@ void ReadOptions(BODY **body, CONTROL *control, FILES *files, MODULE *module,
 
   /* Any unrecognized options? */
   Unrecognized(*files);
+
+  FreeInputIndex();
 }
 
 /*
@@ -3774,6 +4460,41 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
    *
    */
 
+  fvFormattedString(&options[OPT_CHECKPOINTFILE].cName, "sCheckpointFile");
+  fvFormattedString(&options[OPT_CHECKPOINTFILE].cDescr,
+                    "Name of the Snapshot File");
+  fvFormattedString(&options[OPT_CHECKPOINTFILE].cDefault,
+                    "<system>.checkpoint if dCheckpointTime is set");
+  options[OPT_CHECKPOINTFILE].iType      = 3;
+  options[OPT_CHECKPOINTFILE].iModuleBit = 0;
+  options[OPT_CHECKPOINTFILE].bNeg       = 0;
+  options[OPT_CHECKPOINTFILE].iFileType  = 2;
+  fnRead[OPT_CHECKPOINTFILE]             = &ReadCheckpointFile;
+  fvFormattedString(
+        &options[OPT_CHECKPOINTFILE].cLongDescr,
+        "Write a snapshot of the integration to this file every "
+        "dCheckpointTime,\n"
+        "and when the process receives SIGTERM. The snapshot replaces the "
+        "previous\n"
+        "one, so the file always holds the latest state. Setting this option "
+        "alone\n"
+        "writes a snapshot only at SIGTERM. See sRestartFile to resume from "
+        "it.");
+
+  fvFormattedString(&options[OPT_CHECKPOINTTIME].cName, "dCheckpointTime");
+  fvFormattedString(&options[OPT_CHECKPOINTTIME].cDescr,
+                    "Interval Between Snapshots");
+  fvFormattedString(&options[OPT_CHECKPOINTTIME].cDefault, "0, i.e. none");
+  fvFormattedString(&options[OPT_CHECKPOINTTIME].cNeg, "Years");
+  fvFormattedString(&options[OPT_CHECKPOINTTIME].cDimension, "time");
+  options[OPT_CHECKPOINTTIME].dDefault   = 0;
+  options[OPT_CHECKPOINTTIME].iType      = 2;
+  options[OPT_CHECKPOINTTIME].iModuleBit = 0;
+  options[OPT_CHECKPOINTTIME].bNeg       = 1;
+  options[OPT_CHECKPOINTTIME].dNeg       = YEARSEC;
+  options[OPT_CHECKPOINTTIME].iFileType  = 2;
+  fnRead[OPT_CHECKPOINTTIME]             = &ReadCheckpointTime;
+
   fvFormattedString(&options[OPT_COLOR].cName, "sColor");
   fvFormattedString(&options[OPT_COLOR].cDescr,
                     "Hexadecimal color code for the body to be used in vplot");
@@ -3784,12 +4505,65 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_COLOR].iFileType  = 1;
   fnRead[OPT_COLOR]             = &ReadColor;
 
+  /*
+   *
+   *   D
+   *
+   */
+
+  fvFormattedString(&options[OPT_DENSEOUTPUT].cName, "bDenseOutput");
+  fvFormattedString(&options[OPT_DENSEOUTPUT].cDescr,
+                    "Interpolate output between timesteps?");
+  fvFormattedString(&options[OPT_DENSEOUTPUT].cDefault, "0");
+  options[OPT_DENSEOUTPUT].iType      = 0;
+  options[OPT_DENSEOUTPUT].iModuleBit = 0;
+  options[OPT_DENSEOUTPUT].bNeg       = 0;
+  options[OPT_DENSEOUTPUT].iFileType  = 2;
+  fnRead[OPT_DENSEOUTPUT]             = &ReadDenseOutput;
+  fvFormattedString(
+        &options[OPT_DENSEOUTPUT].cLongDescr,
+        "Normally every step ends on the next output time, so a small %s "
+        "forces small steps. With %s set, steps only stop at %s and each "
+        "output is interpolated within the step that contains it: cubic "
+        "Hermite interpolation from the values and derivatives at both ends of "
+        "the step. Auxiliary properties, and variables that are set rather "
+        "than integrated, such as the stellar luminosity, are then recomputed "
+        "at the output time. The integration is the same whatever %s is, but "
+        "at the end of a step arrays that modules keep per body, such as the "
+        "tidal phase lags, may hold the values of the last interpolated output "
+        "until the next step recomputes them. DeltaTime reports the step in "
+        "progress.",
+        "dOutputTime", options[OPT_DENSEOUTPUT].cName, "dStopTime",
+        "dOutputTime");
+
   /*
    *
    *   E
    *
    */
 
+  fvFormattedString(&options[OPT_EVENTS].cName, "saEvents");
+  fvFormattedString(&options[OPT_EVENTS].cDescr,
+                    "Events whose times are recorded in the log file");
+  fvFormattedString(&options[OPT_EVENTS].cDefault, "none");
+  fvFormattedString(
+        &options[OPT_EVENTS].cLongDescr,
+        "The time at which each of these events first occurs is found by "
+        "interpolating\n"
+        "across the step in which it occurs and written to the log file. Options "
+        "are:\n"
+        "SurfaceDesiccated (surface water mass reaches dMinSurfWaterMass),\n"
+        "EnvelopeGone (envelope mass reaches dMinEnvelopeMass),\n"
+        "InnerCoreNucleated (inner core radius becomes positive) and\n"
+        "DynamoShutdown (magnetic moment reaches zero). Set bHaltEvents to stop "
+        "the\n"
+        "integration once all of them have occurred.");
+  options[OPT_EVENTS].iType      = 13;
+  options[OPT_EVENTS].iModuleBit = ATMESC + THERMINT;
+  options[OPT_EVENTS].bNeg       = 0;
+  options[OPT_EVENTS].iFileType  = 1;
+  fnRead[OPT_EVENTS]             = &ReadEvents;
+
   /*
    *   FORWARD
    *
@@ -3822,6 +4596,16 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
    *
    */
 
+  fvFormattedString(&options[OPT_HALTEVENTS].cName, "bHaltEvents");
+  fvFormattedString(&options[OPT_HALTEVENTS].cDescr,
+                    "Halt once all events listed in saEvents have occurred?");
+  fvFormattedString(&options[OPT_HALTEVENTS].cDefault, "0");
+  options[OPT_HALTEVENTS].iType      = 0;
+  options[OPT_HALTEVENTS].iModuleBit = ATMESC + THERMINT;
+  options[OPT_HALTEVENTS].bNeg       = 0;
+  options[OPT_HALTEVENTS].iFileType  = 1;
+  fnRead[OPT_HALTEVENTS]             = &ReadHaltEvents;
+
   fvFormattedString(&options[OPT_HALTMAXECC].cName, "dHaltMaxEcc");
   fvFormattedString(&options[OPT_HALTMAXECC].cDescr,
                     "Maximum eccentricity value that halts ntegration");
@@ -3950,7 +4734,8 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
                     "sIntegrationMethod");
   fvFormattedString(
         &options[OPT_INTEGRATIONMETHOD].cDescr,
-        "Integration Method: Euler, Runge-Kutta4 (Default = Runge-Kutta4)");
+        "Integration Method: Euler, Runge-Kutta4, DormandPrince, Rosenbrock "
+        "(Default = Runge-Kutta4)");
   fvFormattedString(&options[OPT_INTEGRATIONMETHOD].cDefault, "Runge-Kutta4");
   options[OPT_INTEGRATIONMETHOD].iType      = 3;
   options[OPT_INTEGRATIONMETHOD].iModuleBit = 0;
@@ -4114,6 +4899,49 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_GRIDOUTPUT].bMultiFile = 1;
   options[OPT_GRIDOUTPUT].iFileType  = 1;
 
+  fvFormattedString(&options[OPT_REDUCE].cName, "saReduce");
+  fvFormattedString(&options[OPT_REDUCE].cDescr,
+                    "Output Parameter(s) Reduced to One Number per Run");
+  fvFormattedString(&options[OPT_REDUCE].cDefault, "None");
+  options[OPT_REDUCE].iType      = 13;
+  options[OPT_REDUCE].iModuleBit = 0;
+  options[OPT_REDUCE].bNeg       = 0;
+  options[OPT_REDUCE].iFileType  = 1;
+  options[OPT_REDUCE].bMultiFile = 1;
+  fvFormattedString(
+        &options[OPT_REDUCE].cLongDescr,
+        "Each entry condenses one output of this body into a single number,\n"
+        "evaluated during the integration and written to\n"
+        "<system>.reduce. Name@Time is the value at that simulation time,\n"
+        "in sUnitTime; steps end there, or the value is interpolated with\n"
+        "bDenseOutput. Name:Operation is one of initial, final, delta\n"
+        "(final - initial), loss (initial - final), min, max, argmin or\n"
+        "argmax (the time of the extreme), and firstzero, the time the value\n"
+        "first reaches zero, interpolated within the step. Extremes are\n"
+        "taken over the ends of the steps, and with bDenseOutput the output\n"
+        "times too, so they are never coarser than the output; an extreme\n"
+        "between those times is not searched for. Prefix\n"
+        "the name with - for its negative units. Results that never occur\n"
+        "are nan. saOutputOrder may be omitted, so that no forward file is\n"
+        "written.");
+
+  fvFormattedString(&options[OPT_OUTPUTFORMAT].cName, "sOutputFormat");
+  fvFormattedString(&options[OPT_OUTPUTFORMAT].cDescr,
+                    "Output File Format: text, binary (Default = text)");
+  fvFormattedString(&options[OPT_OUTPUTFORMAT].cDefault, "text");
+  options[OPT_OUTPUTFORMAT].iType      = 3;
+  options[OPT_OUTPUTFORMAT].iModuleBit = 0;
+  options[OPT_OUTPUTFORMAT].bNeg       = 0;
+  options[OPT_OUTPUTFORMAT].iFileType  = 2;
+  fnRead[OPT_OUTPUTFORMAT]             = &ReadOutputFormat;
+  fvFormattedString(
+        &options[OPT_OUTPUTFORMAT].cLongDescr,
+        "With binary, the forward and backward files are written as a header\n"
+        "listing each column's name and unit, followed by rows of\n"
+        "little-endian 64-bit doubles. The file is kept open and buffered for\n"
+        "the whole integration. iDigits and iSciNot do not apply, and grid\n"
+        "output (saGridOutput) is always written as text.");
+
   fvFormattedString(&options[OPT_OUTSCINOT].cName, "iSciNot");
   fvFormattedString(&options[OPT_OUTSCINOT].cDescr,
                     "Logarithm to Change from Standard to Scientific Notation");
@@ -4190,6 +5018,58 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_ORBSEMI].iFileType  = 1;
   fnRead[OPT_ORBSEMI]             = &ReadSemiMajorAxis;
 
+  fvFormattedString(&options[OPT_HZAGE].cName, "dHZAge");
+  fvFormattedString(&options[OPT_HZAGE].cDescr,
+                    "Stellar age at which the orbit is placed in the HZ");
+  fvFormattedString(&options[OPT_HZAGE].cDefault, "System age");
+  fvFormattedString(&options[OPT_HZAGE].cNeg, "Gyr");
+  fvFormattedString(&options[OPT_HZAGE].cDimension, "time");
+  options[OPT_HZAGE].dDefault   = 0;
+  options[OPT_HZAGE].iType      = 2;
+  options[OPT_HZAGE].bMultiFile = 1;
+  options[OPT_HZAGE].iModuleBit = 0;
+  options[OPT_HZAGE].bNeg       = 1;
+  options[OPT_HZAGE].dNeg       = 1e9 * YEARSEC;
+  options[OPT_HZAGE].iFileType  = 1;
+  fnRead[OPT_HZAGE]             = &ReadHZAge;
+
+  fvFormattedString(&options[OPT_SEMIHZFLUX].cName, "dSemiFromHZFlux");
+  fvFormattedString(&options[OPT_SEMIHZFLUX].cDescr,
+                    "Place the orbit where it receives this instellation");
+  fvFormattedString(&options[OPT_SEMIHZFLUX].cDefault, "1");
+  fvFormattedString(&options[OPT_SEMIHZFLUX].cDimension, "nd");
+  options[OPT_SEMIHZFLUX].dDefault   = 1;
+  options[OPT_SEMIHZFLUX].iType      = 2;
+  options[OPT_SEMIHZFLUX].bMultiFile = 1;
+  options[OPT_SEMIHZFLUX].iModuleBit = 0;
+  options[OPT_SEMIHZFLUX].iFileType  = 1;
+  fnRead[OPT_SEMIHZFLUX]             = &ReadSemiFromHZFlux;
+  fvFormattedString(
+        &options[OPT_SEMIHZFLUX].cLongDescr,
+        "Set the semi-major axis so that the body receives this instellation,\n"
+        "in units of Earth's, from the central star's Baraffe luminosity at\n"
+        "age %s. Replaces %s, so a sweep over stellar masses needs no\n"
+        "separate run of the star to find its habitable zone.",
+        options[OPT_HZAGE].cName, options[OPT_ORBSEMI].cName);
+
+  fvFormattedString(&options[OPT_SEMIHZLIMIT].cName, "sSemiHZLimit");
+  fvFormattedString(&options[OPT_SEMIHZLIMIT].cDescr,
+                    "Place the orbit at this habitable zone limit");
+  fvFormattedString(&options[OPT_SEMIHZLIMIT].cDefault, "Inner");
+  fvFormattedString(&options[OPT_SEMIHZLIMIT].cValues, "Inner Outer");
+  options[OPT_SEMIHZLIMIT].iType      = 3;
+  options[OPT_SEMIHZLIMIT].bMultiFile = 1;
+  options[OPT_SEMIHZLIMIT].iModuleBit = 0;
+  options[OPT_SEMIHZLIMIT].iFileType  = 1;
+  fnRead[OPT_SEMIHZLIMIT]             = &ReadSemiHZLimit;
+  fvFormattedString(
+        &options[OPT_SEMIHZLIMIT].cLongDescr,
+        "Set the semi-major axis to the runaway greenhouse (Inner) or maximum\n"
+        "greenhouse (Outer) limit of Kopparapu et al. (2013), from the\n"
+        "central star's Baraffe luminosity and effective temperature at age\n"
+        "%s. Replaces %s.",
+        options[OPT_HZAGE].cName, options[OPT_ORBSEMI].cName);
+
   fvFormattedString(&options[OPT_INC].cName, "dInc");
   fvFormattedString(&options[OPT_INC].cDescr,
                     "Inclination of planet's orbital plane");
@@ -4238,6 +5118,25 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_PRECA].iFileType  = 1;
   fnRead[OPT_PRECA]             = &ReadPrecA;
 
+  fvFormattedString(&options[OPT_PROFILE].cName, "bProfile");
+  fvFormattedString(&options[OPT_PROFILE].cDescr,
+                    "Count and time the work of the integration?");
+  fvFormattedString(&options[OPT_PROFILE].cDefault, "0");
+  fvFormattedString(
+        &options[OPT_PROFILE].cLongDescr,
+        "If set, the log file ends with a PROFILE section that counts and "
+        "times the evaluations of each equation, totalled per module, and the "
+        "calls of PropertiesAuxiliary, the ForceBehavior functions, the halt "
+        "checks and WriteOutput. It also counts how often each primary "
+        "variable set the shortest timescale, and the steps taken in each "
+        "decade of timestep. Times are wall-clock seconds and include the cost "
+        "of the timing itself. Requires bDoLog.");
+  options[OPT_PROFILE].iType      = 0;
+  options[OPT_PROFILE].iModuleBit = 0;
+  options[OPT_PROFILE].bNeg       = 0;
+  options[OPT_PROFILE].iFileType  = 2;
+  fnRead[OPT_PROFILE]             = &ReadProfile;
+
   fvFormattedString(&options[OPT_LONGA].cName, "dLongA");
   fvFormattedString(&options[OPT_LONGA].cDescr,
                     "Longitude of ascending node of planet's orbital plane");
@@ -4431,6 +5330,74 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_RG].iFileType  = 1;
   fnRead[OPT_RG]             = &ReadRadiusGyration;
 
+  fvFormattedString(&options[OPT_RELTOL].cName, "dRelTol");
+  fvFormattedString(&options[OPT_RELTOL].cDescr,
+                    "Relative Error Tolerance of Adaptive Steps");
+  fvFormattedString(&options[OPT_RELTOL].cDefault, "1e-6");
+  fvFormattedString(&options[OPT_RELTOL].cDimension, "nd");
+  options[OPT_RELTOL].dDefault   = 1e-6;
+  options[OPT_RELTOL].iType      = 2;
+  options[OPT_RELTOL].iModuleBit = 0;
+  options[OPT_RELTOL].bNeg       = 0;
+  options[OPT_RELTOL].iFileType  = 2;
+  fnRead[OPT_RELTOL]             = &ReadRelTol;
+  fvFormattedString(
+        &options[OPT_RELTOL].cLongDescr,
+        "With sIntegrationMethod DormandPrince or Rosenbrock, the error allowed "
+        "in one step includes %s times the current magnitude of the variable. "
+        "See %s for the rest.",
+        options[OPT_RELTOL].cName, "dScaleTol");
+
+  fvFormattedString(&options[OPT_SCALETOL].cName, "dScaleTol");
+  fvFormattedString(&options[OPT_SCALETOL].cDescr,
+                    "Scaled Error Tolerance of Adaptive Steps");
+  fvFormattedString(&options[OPT_SCALETOL].cDefault, "1e-9");
+  fvFormattedString(&options[OPT_SCALETOL].cDimension, "nd");
+  options[OPT_SCALETOL].dDefault   = 1e-9;
+  options[OPT_SCALETOL].iType      = 2;
+  options[OPT_SCALETOL].iModuleBit = 0;
+  options[OPT_SCALETOL].bNeg       = 0;
+  options[OPT_SCALETOL].iFileType  = 2;
+  fnRead[OPT_SCALETOL]             = &ReadScaleTol;
+  fvFormattedString(
+        &options[OPT_SCALETOL].cLongDescr,
+        "With sIntegrationMethod DormandPrince or Rosenbrock, the error allowed "
+        "in one step is %s times the largest magnitude the variable has had so "
+        "far, plus %s times its current magnitude. This is not an absolute "
+        "tolerance: scaling by each variable's own magnitude makes one value "
+        "work for variables in very different units. Variables that have only "
+        "ever been zero do not limit the step.",
+        options[OPT_SCALETOL].cName, "dRelTol");
+
+  fvFormattedString(&options[OPT_RESTARTFILE].cName, "sRestartFile");
+  fvFormattedString(&options[OPT_RESTARTFILE].cDescr,
+                    "Snapshot File to Resume From");
+  options[OPT_RESTARTFILE].iType      = 3;
+  options[OPT_RESTARTFILE].iModuleBit = 0;
+  options[OPT_RESTARTFILE].bNeg       = 0;
+  options[OPT_RESTARTFILE].iFileType  = 2;
+  fnRead[OPT_RESTARTFILE]             = &ReadRestartFile;
+  fvFormattedString(
+        &options[OPT_RESTARTFILE].cLongDescr,
+        "Continue the integration from a snapshot written by %s. The input "
+        "files\n"
+        "must describe the same bodies and modules as the run that wrote it; "
+        "other\n"
+        "options, such as dStopTime, dOutputTime or module parameters, may "
+        "differ,\n"
+        "so several runs can branch from one snapshot. Output files that "
+        "exist are\n"
+        "cut back to the snapshot and appended to, otherwise they start at "
+        "the\n"
+        "snapshot time. The snapshot keeps the primary variables and the "
+        "switches\n"
+        "and iteration seeds of the modules; the rest is recomputed, so a "
+        "resumed\n"
+        "run with the same options repeats the uninterrupted one exactly. "
+        "Only\n"
+        "the random encounters of galhabit start a new sequence.",
+        options[OPT_CHECKPOINTFILE].cName);
+
   fvFormattedString(&options[OPT_ROTPER].cName, "dRotPeriod");
   fvFormattedString(&options[OPT_ROTPER].cDescr, "Rotation Period");
   fvFormattedString(&options[OPT_ROTPER].cDefault, "1 Day");
@@ -4640,6 +5607,25 @@ void InitializeOptionsGeneral(OPTIONS *options, fnReadOption fnRead[]) {
 */
 }
 
+/*
+ * Free the strings and arrays allocated by InitializeOptions
+ */
+
+void FreeOptions(OPTIONS *options) {
+  int iOpt;
+
+  for (iOpt = 0; iOpt < MODULEOPTEND; iOpt++) {
+    free(options[iOpt].cName);
+    free(options[iOpt].cDescr);
+    free(options[iOpt].cLongDescr);
+    free(options[iOpt].cDefault);
+    free(options[iOpt].cValues);
+    free(options[iOpt].cNeg);
+    free(options[iOpt].cDimension);
+    free(options[iOpt].iLine);
+  }
+}
+
 void InitializeOptions(OPTIONS *options, fnReadOption *fnRead) {
   int iBody, iOpt, iFile, iModule;
 
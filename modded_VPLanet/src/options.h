@@ -40,13 +40,19 @@
 #define OPT_TIMESTEP 160
 #define OPT_VARDT 170
 #define OPT_BODYNAME 180
+#define OPT_CHECKPOINTFILE 182
+#define OPT_CHECKPOINTTIME 183
 
 #define OPT_COLOR 185
 
+#define OPT_DENSEOUTPUT 188
 #define OPT_DENSITY 190
 
+#define OPT_EVENTS 195
+
 #define OPT_FORW 200
 
+#define OPT_HALTEVENTS 315
 #define OPT_HALTMAXECC 320
 #define OPT_HALTMAXMUTUALINC 322
 #define OPT_HALTMERGE 325
@@ -79,6 +85,9 @@
 #define OPT_ARGP 562
 #define OPT_LONGA 563
 #define OPT_GRCORR 564
+#define OPT_SEMIHZFLUX 565 /**< Place orbit at this instellation */
+#define OPT_SEMIHZLIMIT 566 /**< Place orbit at this HZ limit */
+#define OPT_HZAGE 567 /**< Stellar age for the HZ placement */
 #define OPT_LUMINOSITY 575 /**< (Initial) luminosity */
 #define OPT_TIDALQ 577
 #define OPT_USEOUTERTIDALQ 579
@@ -86,6 +95,8 @@
 #define OPT_OUTDIGITS 570
 #define OPT_OUTPUTORDER 580
 #define OPT_GRIDOUTPUT 585
+#define OPT_REDUCE 586
+#define OPT_OUTPUTFORMAT 587
 #define OPT_OUTSCINOT 590
 #define OPT_OVERWRITE 595
 
@@ -93,6 +104,7 @@
 #define OPT_DYNELLIP 611
 #define OPT_CALCDYNELLIP 612
 #define OPT_PRILUM 615
+#define OPT_PROFILE 620
 
 #define OPT_VISCUMAN 630 // Viscosity UMTBL
 #define OPT_OBL 640
@@ -102,6 +114,9 @@
 
 #define OPT_ROTPER 660
 #define OPT_ROTRATE 665
+#define OPT_RELTOL 667
+#define OPT_RESTARTFILE 668
+#define OPT_SCALETOL 669
 #define OPT_ROTVEL 680
 
 #define OPT_TEMPERATURE 690 /**< Effective temperature (initial) */
@@ -119,11 +134,16 @@
 
 /* @cond DOXYGEN_OVERRIDE */
 
+INPUTINDEX *GetInputIndex(char *);
+void FreeInputIndex();
 void GetWords(char cLine[], char[MAXARRAY][OPTLEN], int *, int *);
 int iGetNumLines(char *);
+char *fsInMemoryFile(char *);
+int fbReadInputLine(FILE *, char **, char[]);
 void CheckFileExists(char *);
 void RecordCommentsAndWhiteSpace(INFILE *);
 void InitializeOptions(OPTIONS *, fnReadOption *);
+void FreeOptions(OPTIONS *);
 void ReadOptions(BODY **, CONTROL *, FILES *, MODULE *, OPTIONS *, OUTPUT *,
                  SYSTEM *, UPDATE **, fnReadOption *, char[]);
 
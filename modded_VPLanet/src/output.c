@@ -91,7 +91,10 @@ void WriteDeltaTime(BODY *body, CONTROL *control, OUTPUT *output,
                     double *dTmp, char **cUnit) {
 
   if (control->Evolve.bVarDt) {
-    if (control->Evolve.dTime > 0) {
+    if (control->Evolve.dTime > 0 && control->Evolve.bDenseOutput) {
+      // Several outputs can fall within one step
+      *dTmp = control->Evolve.dCurrentDt;
+    } else if (control->Evolve.dTime > 0) {
       *dTmp = control->Io.dOutputTime / control->Evolve.iStepsSinceLastOutput;
     } else {
       if (control->Io.iVerbose >= VERBINPUT && !control->Io.bDeltaTimeMessage) {
@@ -128,6 +131,56 @@ void WriteDensity(BODY *body, CONTROL *control, OUTPUT *output, SYSTEM *system,
   }
 }
 
+/*
+ * E
+ */
+
+/* Time of an event, or -1 if it has not occurred or is not recorded */
+void WriteEventTime(BODY *body, CONTROL *control, OUTPUT *output,
+                    UNITS *units, int iBody, int iEvent, double *dTmp,
+                    char **cUnit) {
+  *dTmp = control->Halt[iBody].dEventTime[iEvent];
+
+  if (output->bDoNeg[iBody]) {
+    if (*dTmp >= 0) {
+      *dTmp *= output->dNeg;
+    }
+    fvFormattedString(cUnit, output->cNeg);
+  } else {
+    if (*dTmp >= 0) {
+      *dTmp /= fdUnitsTime(units->iTime);
+    }
+    fsUnitsTime(units->iTime, cUnit);
+  }
+}
+
+void WriteDesiccatedTime(BODY *body, CONTROL *control, OUTPUT *output,
+                         SYSTEM *system, UNITS *units, UPDATE *update,
+                         int iBody, double *dTmp, char **cUnit) {
+  WriteEventTime(body, control, output, units, iBody, EVENT_SURFACEDESICCATED,
+                 dTmp, cUnit);
+}
+
+void WriteEnvelopeGoneTime(BODY *body, CONTROL *control, OUTPUT *output,
+                           SYSTEM *system, UNITS *units, UPDATE *update,
+                           int iBody, double *dTmp, char **cUnit) {
+  WriteEventTime(body, control, output, units, iBody, EVENT_ENVELOPEGONE, dTmp,
+                 cUnit);
+}
+
+void WriteInnerCoreTime(BODY *body, CONTROL *control, OUTPUT *output,
+                        SYSTEM *system, UNITS *units, UPDATE *update,
+                        int iBody, double *dTmp, char **cUnit) {
+  WriteEventTime(body, control, output, units, iBody, EVENT_INNERCORENUCLEATED,
+                 dTmp, cUnit);
+}
+
+void WriteDynamoShutdownTime(BODY *body, CONTROL *control, OUTPUT *output,
+                             SYSTEM *system, UNITS *units, UPDATE *update,
+                             int iBody, double *dTmp, char **cUnit) {
+  WriteEventTime(body, control, output, units, iBody, EVENT_DYNAMOSHUTDOWN,
+                 dTmp, cUnit);
+}
 
 /*
  * H
@@ -1300,6 +1353,51 @@ void InitializeOutputGeneral(OUTPUT *output, fnWriteOutput fnWrite[]) {
   output[OUT_DENSITY].iModuleBit = 1;
   fnWrite[OUT_DENSITY]           = &WriteDensity;
 
+  /*
+   * E
+   */
+
+  fvFormattedString(&output[OUT_DESICCATEDTIME].cName, "DesiccatedTime");
+  fvFormattedString(&output[OUT_DESICCATEDTIME].cDescr,
+                    "Time When Surface Desiccated (-1 = Never)");
+  fvFormattedString(&output[OUT_DESICCATEDTIME].cNeg, "Gyr");
+  output[OUT_DESICCATEDTIME].bNeg       = 1;
+  output[OUT_DESICCATEDTIME].dNeg       = 1. / (YEARSEC * 1e9);
+  output[OUT_DESICCATEDTIME].iNum       = 1;
+  output[OUT_DESICCATEDTIME].iModuleBit = ATMESC;
+  fnWrite[OUT_DESICCATEDTIME]           = &WriteDesiccatedTime;
+
+  fvFormattedString(&output[OUT_ENVELOPEGONETIME].cName, "EnvelopeGoneTime");
+  fvFormattedString(&output[OUT_ENVELOPEGONETIME].cDescr,
+                    "Time When Envelope Evaporated (-1 = Never)");
+  fvFormattedString(&output[OUT_ENVELOPEGONETIME].cNeg, "Gyr");
+  output[OUT_ENVELOPEGONETIME].bNeg       = 1;
+  output[OUT_ENVELOPEGONETIME].dNeg       = 1. / (YEARSEC * 1e9);
+  output[OUT_ENVELOPEGONETIME].iNum       = 1;
+  output[OUT_ENVELOPEGONETIME].iModuleBit = ATMESC;
+  fnWrite[OUT_ENVELOPEGONETIME]           = &WriteEnvelopeGoneTime;
+
+  fvFormattedString(&output[OUT_INNERCORETIME].cName, "InnerCoreTime");
+  fvFormattedString(&output[OUT_INNERCORETIME].cDescr,
+                    "Time When Inner Core Nucleated (-1 = Never)");
+  fvFormattedString(&output[OUT_INNERCORETIME].cNeg, "Gyr");
+  output[OUT_INNERCORETIME].bNeg       = 1;
+  output[OUT_INNERCORETIME].dNeg       = 1. / (YEARSEC * 1e9);
+  output[OUT_INNERCORETIME].iNum       = 1;
+  output[OUT_INNERCORETIME].iModuleBit = THERMINT;
+  fnWrite[OUT_INNERCORETIME]           = &WriteInnerCoreTime;
+
+  fvFormattedString(&output[OUT_DYNAMOSHUTDOWNTIME].cName,
+                    "DynamoShutdownTime");
+  fvFormattedString(&output[OUT_DYNAMOSHUTDOWNTIME].cDescr,
+                    "Time When Magnetic Moment Vanished (-1 = Never)");
+  fvFormattedString(&output[OUT_DYNAMOSHUTDOWNTIME].cNeg, "Gyr");
+  output[OUT_DYNAMOSHUTDOWNTIME].bNeg       = 1;
+  output[OUT_DYNAMOSHUTDOWNTIME].dNeg       = 1. / (YEARSEC * 1e9);
+  output[OUT_DYNAMOSHUTDOWNTIME].iNum       = 1;
+  output[OUT_DYNAMOSHUTDOWNTIME].iModuleBit = THERMINT;
+  fnWrite[OUT_DYNAMOSHUTDOWNTIME]           = &WriteDynamoShutdownTime;
+
   /*
    * H
    */
@@ -1938,9 +2036,24 @@ void LogIntegration(CONTROL *control, FILE *fp) {
     fprintf(fp, "Euler");
   } else if (control->Evolve.iOneStep == RUNGEKUTTA) {
     fprintf(fp, "Runge-Kutta4");
+  } else if (control->Evolve.iOneStep == DORMANDPRINCE) {
+    fprintf(fp, "Dormand-Prince5(4)");
+  } else if (control->Evolve.iOneStep == ROSENBROCK) {
+    fprintf(fp, "Rosenbrock2(3)");
   }
   fprintf(fp, "\n");
 
+  if (control->Evolve.iOneStep == DORMANDPRINCE ||
+      control->Evolve.iOneStep == ROSENBROCK) {
+    fprintf(fp, "Relative Tolerance: ");
+    fprintd(fp, control->Evolve.dRelTol, control->Io.iSciNot,
+            control->Io.iDigits);
+    fprintf(fp, "\nScaled Tolerance: ");
+    fprintd(fp, control->Evolve.dScaleTol, control->Io.iSciNot,
+            control->Io.iDigits);
+    fprintf(fp, "\n");
+  }
+
   fprintf(fp, "Direction: ");
   if (control->Evolve.bDoBackward) {
     fprintf(fp, "Backward\n");
@@ -1962,6 +2075,9 @@ void LogIntegration(CONTROL *control, FILE *fp) {
   fprintd(fp, control->Io.dOutputTime, control->Io.iSciNot,
           control->Io.iDigits);
   fprintf(fp, "\n");
+  if (control->Evolve.bDenseOutput) {
+    fprintf(fp, "Interpolate Output: Yes\n");
+  }
 
   fprintf(fp, "Use Variable Timestep: ");
   if (control->Evolve.bVarDt == 0) {
@@ -1999,7 +2115,7 @@ void LogBodyRelations(CONTROL *control, FILE *fp, int iBody) {
     } else {
       fprintf(fp, "Unknown!\n");
       fprintf(stderr, "Unknown Mass-Radius Relationship!\n");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 }
@@ -2173,6 +2289,119 @@ void LogBody(BODY *body, CONTROL *control, FILES *files, MODULE *module,
   }
 }
 
+/* The modules of an equation, joined by + so the name has no spaces */
+static void LogProfileModule(FILE *fp, int iModuleBits) {
+  int iModule, bFirst = 1;
+
+  for (iModule = EQTIDE; iModule <= MAGMOC; iModule *= 2) {
+    if (iModuleBits & iModule) {
+      if (!bFirst) {
+        fprintf(fp, "+");
+      }
+      PrintModuleList(fp, iModule, 0);
+      bFirst = 0;
+    }
+  }
+}
+
+/* The counters of a profiled run, as whitespace-separated tables, each
+   introduced by a line naming it and its columns. Times are in seconds. */
+void LogProfile(BODY *body, CONTROL *control, UPDATE *update, FILE *fp) {
+  PROFILE *profile = &control->Profile;
+  char *saSection[PROFILENUMSECTIONS] = {"PropertiesAuxiliary",
+                                         "ForceBehavior", "CheckHalt",
+                                         "WriteOutput"};
+  int iBody, iVar, iEqn, jVar, jEqn, iSection, iDecade, bSeen;
+  long long iNumSteps = 0, iNumDerivs;
+  double dTime;
+
+  for (iDecade = 0; iDecade < PROFILENUMDECADES; iDecade++) {
+    iNumSteps += profile->laNumSteps[iDecade];
+  }
+
+  fprintf(fp, "\n\n\n---- PROFILE ----\n");
+  fprintf(fp, "(Steps) Steps: %lld\n", iNumSteps);
+  fprintf(fp, "(RejectedSteps) Rejected Steps: %d\n",
+          control->Evolve.iNumRejectedSteps);
+  fprintf(fp, "(EvolveTime) Evolve Time [sec]: %.6e\n", profile->dEvolveTime);
+
+  fprintf(fp, "\nSections: Section Calls Time\n");
+  for (iSection = 0; iSection < PROFILENUMSECTIONS; iSection++) {
+    fprintf(fp, "%s %lld %.6e\n", saSection[iSection],
+            profile->laNumSection[iSection], profile->daSectionTime[iSection]);
+  }
+
+  /* One row for each module, or combination of modules, with equations.
+     The equations of a module are totalled at its first equation. */
+  fprintf(fp, "\nModules: Body Module Calls Time\n");
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        bSeen      = 0;
+        iNumDerivs = 0;
+        dTime      = 0;
+        for (jVar = 0; jVar < update[iBody].iNumVars && !bSeen; jVar++) {
+          for (jEqn = 0; jEqn < update[iBody].iNumEqns[jVar]; jEqn++) {
+            if (update[iBody].iaModule[jVar][jEqn] !=
+                update[iBody].iaModule[iVar][iEqn]) {
+              continue;
+            }
+            if (jVar < iVar || (jVar == iVar && jEqn < iEqn)) {
+              bSeen = 1;
+              break;
+            }
+            iNumDerivs += profile->laNumDerivs[iBody][jVar][jEqn];
+            dTime += profile->daDerivTime[iBody][jVar][jEqn];
+          }
+        }
+        if (!bSeen) {
+          fprintf(fp, "%s ", body[iBody].cName);
+          LogProfileModule(fp, update[iBody].iaModule[iVar][iEqn]);
+          fprintf(fp, " %lld %.6e\n", iNumDerivs, dTime);
+        }
+      }
+    }
+  }
+
+  /* Limits counts how often the variable set the shortest timescale */
+  fprintf(fp, "\nVariables: Body Variable Calls Time Limits\n");
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      iNumDerivs = 0;
+      dTime      = 0;
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        iNumDerivs += profile->laNumDerivs[iBody][iVar][iEqn];
+        dTime += profile->daDerivTime[iBody][iVar][iEqn];
+      }
+      fprintf(fp, "%s %s %lld %.6e %lld\n", body[iBody].cName,
+              fsPrimaryVariableName(update[iBody].iaVar[iVar]), iNumDerivs,
+              dTime, profile->laNumLimits[iBody][iVar]);
+    }
+  }
+
+  fprintf(fp, "\nEquations: Body Variable Equation Module Calls Time\n");
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    for (iVar = 0; iVar < update[iBody].iNumVars; iVar++) {
+      for (iEqn = 0; iEqn < update[iBody].iNumEqns[iVar]; iEqn++) {
+        fprintf(fp, "%s %s %d ", body[iBody].cName,
+                fsPrimaryVariableName(update[iBody].iaVar[iVar]), iEqn);
+        LogProfileModule(fp, update[iBody].iaModule[iVar][iEqn]);
+        fprintf(fp, " %lld %.6e\n", profile->laNumDerivs[iBody][iVar][iEqn],
+                profile->daDerivTime[iBody][iVar][iEqn]);
+      }
+    }
+  }
+
+  /* Decade d counts the steps from 10^d to 10^(d+1) seconds long */
+  fprintf(fp, "\nTimeSteps: Decade Steps\n");
+  for (iDecade = 0; iDecade < PROFILENUMDECADES; iDecade++) {
+    if (profile->laNumSteps[iDecade] > 0) {
+      fprintf(fp, "%d %lld\n", iDecade + PROFILEMINDECADE,
+              profile->laNumSteps[iDecade]);
+    }
+  }
+}
+
 void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
               OPTIONS *options, OUTPUT *output, SYSTEM *system, UPDATE *update,
               fnUpdateVariable ***fnUpdate, fnWriteOutput fnWrite[], int iEnd) {
@@ -2186,6 +2415,12 @@ void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
      one function, and then the timestep calculated in another. */
   double dDt = fdGetTimeStep(body, control, system, update, fnUpdate);
 
+  /* An in-memory run only has a log file if its caller named one, but the
+     updates above still change the state, so they are made for it too. */
+  if (control->Io.iOutputFormat == OUTPUTMEMORY && InMemory->sLogFile == NULL) {
+    return;
+  }
+
   if (iEnd == 0) {
     fp = fopen(files->cLog, "w");
   } else if (iEnd == 1) {
@@ -2194,7 +2429,11 @@ void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
     fp = fopen(files->cLog, "w");
   } else {
     fprintf(stderr, "ERROR: Unknown cTime in output.c:WriteLog.\n");
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
+  }
+  if (fp == NULL) {
+    fprintf(stderr, "ERROR: Unable to open %s.\n", files->cLog);
+    VplanetExit(EXIT_OUTPUT);
   }
 
   if (!iEnd) {
@@ -2210,62 +2449,461 @@ void WriteLog(BODY *body, CONTROL *control, FILES *files, MODULE *module,
 
   /* Bodies' Properties */
   LogBody(body, control, files, module, output, system, fnWrite, fp, update);
+
+  if (iEnd && control->Io.bProfile) {
+    LogProfile(body, control, update, fp);
+  }
   fclose(fp);
 }
 
+/*
+ * Binary output
+ *
+ * With sOutputFormat = binary, each forward/backward file begins with the
+ * 8-byte string OUTPUTBINARYMAGIC, followed by the number of columns and the
+ * size of the header in bytes, both as little-endian 32-bit unsigned integers.
+ * Next come each column's name and unit as NUL-terminated strings, padded with
+ * zeros so that the header size is a multiple of 8. Every subsequent row holds
+ * one little-endian 64-bit double per column.
+ */
+
+int bHostLittleEndian() {
+  unsigned int iOne = 1;
+
+  return *(unsigned char *)&iOne == 1;
+}
+
+/* Write iNum values of iSize bytes each in little-endian byte order. */
+void fvWriteLittleEndian(FILE *fp, void *pData, int iSize, int iNum) {
+  int iNumber, iByte;
+  unsigned char *cBytes = (unsigned char *)pData;
+
+  if (bHostLittleEndian()) {
+    fwrite(cBytes, iSize, iNum, fp);
+  } else {
+    for (iNumber = 0; iNumber < iNum; iNumber++) {
+      for (iByte = iSize - 1; iByte >= 0; iByte--) {
+        fputc(cBytes[iNumber * iSize + iByte], fp);
+      }
+    }
+  }
+}
+
+/* Read iNum values of iSize bytes each that were written in little-endian
+   byte order. Returns 0 if the file ended first. */
+int fbReadLittleEndian(FILE *fp, void *pData, int iSize, int iNum) {
+  int iNumber, iByte;
+  unsigned char cSwap, *cBytes = (unsigned char *)pData;
+
+  if ((int)fread(cBytes, iSize, iNum, fp) != iNum) {
+    return 0;
+  }
+  if (!bHostLittleEndian()) {
+    for (iNumber = 0; iNumber < iNum; iNumber++) {
+      for (iByte = 0; iByte < iSize / 2; iByte++) {
+        cSwap = cBytes[iNumber * iSize + iByte];
+        cBytes[iNumber * iSize + iByte] =
+              cBytes[iNumber * iSize + iSize - 1 - iByte];
+        cBytes[iNumber * iSize + iSize - 1 - iByte] = cSwap;
+      }
+    }
+  }
+  return 1;
+}
+
+FILE *fpOpenBinaryOutput(char *cFile, char **saName, char **saUnit,
+                         int iNumCols) {
+  FILE *fp;
+  int iCol;
+  unsigned int iHeader[2];
+
+  fp = fopen(cFile, "wb");
+  if (fp == NULL) {
+    fprintf(stderr, "ERROR: Unable to open %s.\n", cFile);
+    VplanetExit(EXIT_OUTPUT);
+  }
+  /* Rows are only flushed when this buffer fills or the file is closed */
+  setvbuf(fp, NULL, _IOFBF, 1 << 16);
+
+  iHeader[0] = iNumCols;
+  iHeader[1] = strlen(OUTPUTBINARYMAGIC) + sizeof(iHeader);
+  for (iCol = 0; iCol < iNumCols; iCol++) {
+    iHeader[1] += strlen(saName[iCol]) + strlen(saUnit[iCol]) + 2;
+  }
+  iHeader[1] = 8 * ((iHeader[1] + 7) / 8);
+
+  fwrite(OUTPUTBINARYMAGIC, 1, strlen(OUTPUTBINARYMAGIC), fp);
+  fvWriteLittleEndian(fp, iHeader, sizeof(unsigned int), 2);
+  for (iCol = 0; iCol < iNumCols; iCol++) {
+    fwrite(saName[iCol], 1, strlen(saName[iCol]) + 1, fp);
+    fwrite(saUnit[iCol], 1, strlen(saUnit[iCol]) + 1, fp);
+  }
+  while (ftell(fp) < iHeader[1]) {
+    fputc(0, fp);
+  }
+
+  return fp;
+}
+
+/* Match every requested column and grid output to its entry in output[] once,
+   so that WriteOutput only has to call the write functions. */
+void InitializeOutputPlan(CONTROL *control, FILES *files, OUTPUT *output) {
+  int iBody, iCol, iGrid, iOut, iPlan;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+
+    outfile->iaPlanOut  = malloc(MODULEOUTEND * sizeof(int));
+    outfile->iNumPlan   = 0;
+    outfile->iNumRowCols = 0;
+    for (iCol = 0; iCol < outfile->iNumCols; iCol++) {
+      for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
+        if (output[iOut].bGrid == 0 || output[iOut].bGrid == 2) {
+          if (strcmp(outfile->caCol[iCol], output[iOut].cName) == 0) {
+            outfile->iaPlanOut[outfile->iNumPlan++] = iOut;
+            outfile->iNumRowCols += output[iOut].iNum;
+          }
+        }
+      }
+    }
+
+    outfile->saPlanUnit = malloc(outfile->iNumPlan * sizeof(char *));
+    for (iPlan = 0; iPlan < outfile->iNumPlan; iPlan++) {
+      outfile->saPlanUnit[iPlan] = NULL;
+    }
+    outfile->daRow = malloc(outfile->iNumRowCols * sizeof(double));
+
+    outfile->iaGridOut = malloc(outfile->iNumGrid * sizeof(int));
+    for (iGrid = 0; iGrid < outfile->iNumGrid; iGrid++) {
+      outfile->iaGridOut[iGrid] = -1;
+      for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
+        if (output[iOut].bGrid == 1 || output[iOut].bGrid == 2) {
+          if (strcmp(outfile->caGrid[iGrid], output[iOut].cName) == 0) {
+            outfile->iaGridOut[iGrid] = iOut;
+          }
+        }
+      }
+    }
+  }
+}
+
+/* Flush and close any output files that are held open for the whole run, and
+   free the output plan. */
+void CloseOutput(CONTROL *control, FILES *files) {
+  int iBody, iPlan;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    if (files->Outfile[iBody].fp != NULL) {
+      fclose(files->Outfile[iBody].fp);
+      files->Outfile[iBody].fp = NULL;
+    }
+    if (files->Outfile[iBody].iaPlanOut != NULL) {
+      for (iPlan = 0; iPlan < files->Outfile[iBody].iNumPlan; iPlan++) {
+        free(files->Outfile[iBody].saPlanUnit[iPlan]);
+      }
+      free(files->Outfile[iBody].saPlanUnit);
+      free(files->Outfile[iBody].iaPlanOut);
+      free(files->Outfile[iBody].daRow);
+      free(files->Outfile[iBody].iaGridOut);
+      files->Outfile[iBody].iaPlanOut = NULL;
+    }
+  }
+}
+
+/* Append the current row of body iBody to the rows kept in memory, or hand
+   it to the stream of a streamed run. The column names and the units of the
+   first row are kept with them. */
+void KeepOutputRow(OUTFILE *outfile, OUTPUT *output, int iBody, char *cBody) {
+  int iPlan, iSubOut, iCol = 0;
+
+  if (outfile->saColName == NULL) {
+    outfile->saColName = malloc(outfile->iNumRowCols * sizeof(char *));
+    outfile->saColUnit = malloc(outfile->iNumRowCols * sizeof(char *));
+    for (iPlan = 0; iPlan < outfile->iNumPlan; iPlan++) {
+      for (iSubOut = 0; iSubOut < output[outfile->iaPlanOut[iPlan]].iNum;
+           iSubOut++) {
+        outfile->saColName[iCol] = NULL;
+        outfile->saColUnit[iCol] = NULL;
+        fvFormattedString(&outfile->saColName[iCol], "%s",
+                          output[outfile->iaPlanOut[iPlan]].cName);
+        fvFormattedString(&outfile->saColUnit[iCol], "%s",
+                          outfile->saPlanUnit[iPlan] ? outfile->saPlanUnit[iPlan]
+                                                     : "");
+        iCol++;
+      }
+    }
+  }
+
+  /* A streamed run hands the row on instead of keeping it */
+  if (InMemory->fnStream != NULL) {
+    if (!InMemory->fnStream(InMemory->pStream, iBody, cBody, outfile)) {
+      VplanetExit(EXIT_TERM);
+    }
+    return;
+  }
+
+  if (outfile->iNumRows == outfile->iMaxRows) {
+    outfile->iMaxRows = outfile->iMaxRows ? 2 * outfile->iMaxRows : 64;
+    outfile->daRows   = realloc(outfile->daRows, (size_t)outfile->iMaxRows *
+                                                   outfile->iNumRowCols *
+                                                   sizeof(double));
+  }
+  memcpy(outfile->daRows + (size_t)outfile->iNumRows * outfile->iNumRowCols,
+         outfile->daRow, outfile->iNumRowCols * sizeof(double));
+  outfile->iNumRows++;
+}
+
+/* The current value of reducer iReduce of body iBody, in the units of its
+   output, which are returned in cUnit. */
+double fdReduceValue(BODY *body, CONTROL *control, OUTFILE *outfile,
+                     OUTPUT *output, SYSTEM *system, UPDATE *update,
+                     fnWriteOutput *fnWrite, int iBody, int iReduce,
+                     char **cUnit) {
+  int iOut = outfile->iaReduceOut[iReduce], bDoNeg;
+  double dValue;
+
+  // A reducer picks its own units, whatever the output order asked for
+  bDoNeg                     = output[iOut].bDoNeg[iBody];
+  output[iOut].bDoNeg[iBody] = outfile->baReduceNeg[iReduce];
+  fnWrite[iOut](body, control, &output[iOut], system, &control->Units[iBody],
+                update, iBody, &dValue, cUnit);
+  output[iOut].bDoNeg[iBody] = bDoNeg;
+
+  return dValue;
+}
+
+/* Find the next time at which an @ reducer must be evaluated. */
+void SetNextReduce(CONTROL *control, FILES *files) {
+  int iBody, iReduce;
+  OUTFILE *outfile;
+
+  control->Io.dNextReduce = dHUGE;
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      if (outfile->iaReduceOp[iReduce] == REDUCE_AT &&
+          !outfile->baReduceDone[iReduce] &&
+          outfile->daReduceTime[iReduce] < control->Io.dNextReduce) {
+        control->Io.dNextReduce = outfile->daReduceTime[iReduce];
+      }
+    }
+  }
+}
+
+/* Evaluate every reducer at the start of the integration. Times of @
+   reducers are converted to seconds here, as the time units are known. */
+void InitializeReduce(BODY *body, CONTROL *control, FILES *files,
+                      OUTPUT *output, SYSTEM *system, UPDATE *update,
+                      fnWriteOutput *fnWrite) {
+  int iBody, iReduce, iOp;
+  double dValue;
+  char *cUnit = NULL;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      iOp    = outfile->iaReduceOp[iReduce];
+      dValue = fdReduceValue(body, control, outfile, output, system, update,
+                             fnWrite, iBody, iReduce, &cUnit);
+      if (iOp == REDUCE_ARGMIN || iOp == REDUCE_ARGMAX ||
+          iOp == REDUCE_FIRSTZERO) {
+        fsUnitsTime(control->Units[iBody].iTime,
+                    &outfile->saReduceUnit[iReduce]);
+      } else {
+        fvFormattedString(&outfile->saReduceUnit[iReduce], "%s",
+                          cUnit ? cUnit : "");
+      }
+
+      outfile->daReduceInitial[iReduce] = dValue;
+      outfile->daReduceLast[iReduce]    = dValue;
+      outfile->daReduceExtreme[iReduce] = dValue;
+      if (iOp == REDUCE_AT) {
+        outfile->daReduceTime[iReduce] =
+              fabs(outfile->daReduceTime[iReduce]) *
+              fdUnitsTime(control->Units[iBody].iTime);
+        if (outfile->daReduceTime[iReduce] == 0) {
+          outfile->daReduceResult[iReduce] = dValue;
+          outfile->baReduceDone[iReduce]   = 1;
+        }
+      } else if (iOp == REDUCE_INITIAL || iOp == REDUCE_MIN ||
+                 iOp == REDUCE_MAX) {
+        outfile->daReduceResult[iReduce] = dValue;
+      } else if (iOp == REDUCE_ARGMIN || iOp == REDUCE_ARGMAX) {
+        outfile->daReduceResult[iReduce] = 0;
+      } else if (iOp == REDUCE_FIRSTZERO && dValue == 0) {
+        outfile->daReduceResult[iReduce] = 0;
+        outfile->baReduceDone[iReduce]   = 1;
+      }
+    }
+  }
+  free(cUnit);
+
+  SetNextReduce(control, files);
+}
+
+/* Complete the reducers that depend on the final values. */
+void FinishReduce(CONTROL *control, FILES *files) {
+  int iBody, iReduce;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      if (outfile->iaReduceOp[iReduce] == REDUCE_FINAL) {
+        outfile->daReduceResult[iReduce] = outfile->daReduceLast[iReduce];
+      } else if (outfile->iaReduceOp[iReduce] == REDUCE_DELTA) {
+        outfile->daReduceResult[iReduce] =
+              outfile->daReduceLast[iReduce] - outfile->daReduceInitial[iReduce];
+      } else if (outfile->iaReduceOp[iReduce] == REDUCE_LOSS) {
+        outfile->daReduceResult[iReduce] =
+              outfile->daReduceInitial[iReduce] - outfile->daReduceLast[iReduce];
+      }
+    }
+  }
+}
+
+/* Write every body's reducers to <system>.reduce, one line of name, value
+   and unit each. */
+void WriteReduce(CONTROL *control, FILES *files, SYSTEM *system, BODY *body) {
+  int iBody, iReduce, bReduce = 0;
+  char *cFile = NULL;
+  FILE *fp;
+  OUTFILE *outfile;
+
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    bReduce = bReduce || files->Outfile[iBody].iNumReduce > 0;
+  }
+  if (!bReduce || control->Io.iOutputFormat == OUTPUTMEMORY) {
+    return;
+  }
+
+  fvFormattedString(&cFile, "%s.reduce", system->cName);
+  fp = fopen(cFile, "w");
+  if (fp == NULL) {
+    fprintf(stderr, "ERROR: Unable to open %s.\n", cFile);
+    VplanetExit(EXIT_OUTPUT);
+  }
+  for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      fprintf(fp, "%s.%s ", body[iBody].cName, outfile->saReduceName[iReduce]);
+      fprintd(fp, outfile->daReduceResult[iReduce], control->Io.iSciNot,
+              control->Io.iDigits);
+      fprintf(fp, " %s\n", outfile->saReduceUnit[iReduce]);
+    }
+  }
+  fclose(fp);
+  free(cFile);
+}
+
+/* Release the reducers of one body. */
+void FreeReduce(OUTFILE *outfile) {
+  int iReduce;
+
+  if (outfile->saReduceName != NULL) {
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      free(outfile->saReduceName[iReduce]);
+      free(outfile->saReduceUnit[iReduce]);
+    }
+  }
+  free(outfile->saReduceName);
+  free(outfile->saReduceUnit);
+  free(outfile->iaReduceOut);
+  free(outfile->iaReduceOp);
+  free(outfile->baReduceNeg);
+  free(outfile->baReduceDone);
+  free(outfile->daReduceTime);
+  free(outfile->daReduceInitial);
+  free(outfile->daReduceLast);
+  free(outfile->daReduceExtreme);
+  free(outfile->daReduceResult);
+  outfile->saReduceName = NULL;
+  outfile->iNumReduce   = 0;
+}
+
+/* Open a forward/backward file on its first row. Binary files start with a
+   header of the column names and the units of the first row. */
+void OpenOutputFile(CONTROL *control, OUTFILE *outfile, OUTPUT *output) {
+  int iPlan, iSubOut, iCol = 0;
+  char **saName, **saUnit;
+
+  if (control->Io.iOutputFormat == OUTPUTBINARY) {
+    saName = malloc(outfile->iNumRowCols * sizeof(char *));
+    saUnit = malloc(outfile->iNumRowCols * sizeof(char *));
+    for (iPlan = 0; iPlan < outfile->iNumPlan; iPlan++) {
+      for (iSubOut = 0; iSubOut < output[outfile->iaPlanOut[iPlan]].iNum;
+           iSubOut++) {
+        saName[iCol] = output[outfile->iaPlanOut[iPlan]].cName;
+        saUnit[iCol] =
+              outfile->saPlanUnit[iPlan] ? outfile->saPlanUnit[iPlan] : "";
+        iCol++;
+      }
+    }
+    outfile->fp =
+          fpOpenBinaryOutput(outfile->cOut, saName, saUnit, outfile->iNumRowCols);
+    free(saName);
+    free(saUnit);
+  } else {
+    outfile->fp = fopen(outfile->cOut, "a");
+    if (outfile->fp == NULL) {
+      fprintf(stderr, "ERROR: Unable to open %s.\n", outfile->cOut);
+      VplanetExit(EXIT_OUTPUT);
+    }
+    setvbuf(outfile->fp, NULL, _IOFBF, 1 << 16);
+  }
+}
+
 void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
                  SYSTEM *system, UPDATE *update, fnWriteOutput *fnWrite) {
-  int iBody, iCol, iOut, iSubOut, iExtra = 0, iGrid, iLat, jBody, j;
-  double dCol[NUMOPT], *dTmp, dGrid[NUMOPT];
+  int iBody, iCol, iOut, iPlan, iGrid, iLat, jBody, j;
+  double *dTmp, dGrid[NUMOPT];
   FILE *fp;
-  char *cUnit, *cPoiseGrid=NULL, *cLaplaceFunc=NULL;
+  char *cUnit = NULL, *cPoiseGrid = NULL, *cLaplaceFunc = NULL;
+  OUTFILE *outfile;
+  double dStart = fdProfileStart(control);
 
-  /* Write out all data columns for each body. As some data may span more than
-     1 column, we search the input list sequentially, adding iExtra to the
-     total number of columns as we go. The calls to fnWrite return the column
-     value in the correct units, and output.iNum already contains the
-     number of columns. */
+  /* Write out all data columns for each body. The outputs were matched to
+     the requested columns by InitializeOutputPlan. Some outputs span more
+     than 1 column; each call to fnWrite fills output.iNum columns of the
+     row, in the correct units. */
 
   for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+    outfile = &files->Outfile[iBody];
 
     // Need to get orbital elements for SpiNBody in case they're being output
     if (body[iBody].bSpiNBody) {
       Bary2OrbElems(body, iBody);
     }
 
-    for (iCol = 0; iCol < files->Outfile[iBody].iNumCols; iCol++) {
-      for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
-        if (output[iOut].bGrid == 0 || output[iOut].bGrid == 2) {
-          // if (memcmp(files->Outfile[iBody].caCol[iCol], output[iOut].cName,
-          //            strlen(output[iOut].cName)) == 0) {
-            if (strcmp(files->Outfile[iBody].caCol[iCol], output[iOut].cName) == 0) {
-            /* Match! */
-            dTmp = malloc(output[iOut].iNum * sizeof(double));
-            cUnit=NULL;
-            fnWrite[iOut](body, control, &output[iOut], system,
-                          &control->Units[iBody], update, iBody, dTmp, &cUnit);
-            for (iSubOut = 0; iSubOut < output[iOut].iNum; iSubOut++) {
-              dCol[iCol + iSubOut + iExtra] = dTmp[iSubOut];
-            }
-            iExtra += (output[iOut].iNum - 1);
-            free(dTmp);
-            dTmp = NULL;
-          }
-        }
-      }
+    dTmp = outfile->daRow;
+    for (iPlan = 0; iPlan < outfile->iNumPlan; iPlan++) {
+      iOut = outfile->iaPlanOut[iPlan];
+      fnWrite[iOut](body, control, &output[iOut], system,
+                    &control->Units[iBody], update, iBody, dTmp,
+                    &outfile->saPlanUnit[iPlan]);
+      dTmp += output[iOut].iNum;
     }
 
     /* Now write the columns */
-    if (files->Outfile[iBody].iNumCols > 0) {
-      fp = fopen(files->Outfile[iBody].cOut, "a");
-      for (iCol = 0; iCol < files->Outfile[iBody].iNumCols + iExtra; iCol++) {
-        // printf("%d %d\n",iBody,iCol);
-        // fflush(stdout);
-        fprintd(fp, dCol[iCol], control->Io.iSciNot, control->Io.iDigits);
-        fprintf(fp, " ");
+    if (outfile->iNumCols > 0) {
+      if (control->Io.iOutputFormat != OUTPUTMEMORY && outfile->fp == NULL) {
+        OpenOutputFile(control, outfile, output);
+      }
+      if (control->Io.iOutputFormat == OUTPUTMEMORY) {
+        KeepOutputRow(outfile, output, iBody, body[iBody].cName);
+      } else if (control->Io.iOutputFormat == OUTPUTBINARY) {
+        fvWriteLittleEndian(outfile->fp, outfile->daRow, sizeof(double),
+                            outfile->iNumRowCols);
+      } else {
+        for (iCol = 0; iCol < outfile->iNumRowCols; iCol++) {
+          fprintd(outfile->fp, outfile->daRow[iCol], control->Io.iSciNot,
+                  control->Io.iDigits);
+          fprintf(outfile->fp, " ");
+        }
+        fprintf(outfile->fp, "\n");
       }
-      fprintf(fp, "\n");
-      fclose(fp);
     }
 
     /* Grid outputs, currently only set up for POISE */
@@ -2273,19 +2911,14 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
       dTmp = malloc(1 * sizeof(double));
       for (iLat = 0; iLat < body[iBody].iNumLats; iLat++) {
         for (iGrid = 0; iGrid < files->Outfile[iBody].iNumGrid; iGrid++) {
-          for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
-            if (output[iOut].bGrid == 1 || output[iOut].bGrid == 2) {
-              // if (memcmp(files->Outfile[iBody].caGrid[iGrid],
-              //            output[iOut].cName, strlen(output[iOut].cName)) == 0) {
-              if (strcmp(files->Outfile[iBody].caGrid[iGrid],output[iOut].cName) == 0) {
-                body[iBody].iWriteLat = iLat;
-                cUnit=NULL;
-                fnWrite[iOut](body, control, &output[iOut], system,
-                              &control->Units[iBody], update, iBody, dTmp,
-                              &cUnit);
-                dGrid[iGrid] = *dTmp;
-              }
-            }
+          iOut = outfile->iaGridOut[iGrid];
+          if (iOut >= 0) {
+            body[iBody].iWriteLat = iLat;
+            cUnit=NULL;
+            fnWrite[iOut](body, control, &output[iOut], system,
+                          &control->Units[iBody], update, iBody, dTmp,
+                          &cUnit);
+            dGrid[iGrid] = *dTmp;
           }
         }
         /* Now write the columns */
@@ -2294,18 +2927,18 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
 
         if (control->Evolve.dTime == 0 && iLat == 0) {
           if (body[iBody].iClimateModel == SEA) {
-            WriteDailyInsol(body, control, &output[iOut], system,
+            WriteDailyInsol(body, control, output, system,
                             &control->Units[iBody], update, iBody, dTmp, &cUnit);
-            WriteSeasonalTemp(body, control, &output[iOut], system,
+            WriteSeasonalTemp(body, control, output, system,
                               &control->Units[iBody], update, iBody, dTmp,
                               &cUnit);
-            WriteSeasonalIceBalance(body, control, &output[iOut], system,
+            WriteSeasonalIceBalance(body, control, output, system,
                                     &control->Units[iBody], update, iBody, dTmp,
                                     &cUnit);
-            WriteSeasonalFluxes(body, control, &output[iOut], system,
+            WriteSeasonalFluxes(body, control, output, system,
                                 &control->Units[iBody], update, iBody, dTmp,
                                 &cUnit);
-            WritePlanckB(body, control, &output[iOut], system,
+            WritePlanckB(body, control, output, system,
                          &control->Units[iBody], update, iBody, dTmp, &cUnit);
 
             if (body[iBody].dSeasOutputTime != 0) {
@@ -2320,18 +2953,18 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
         if (body[iBody].dSeasOutputTime != 0) {
           if (control->Evolve.dTime >= body[iBody].dSeasNextOutput &&
               iLat == 0) {
-            WriteDailyInsol(body, control, &output[iOut], system,
+            WriteDailyInsol(body, control, output, system,
                             &control->Units[iBody], update, iBody, dTmp, &cUnit);
-            WriteSeasonalTemp(body, control, &output[iOut], system,
+            WriteSeasonalTemp(body, control, output, system,
                               &control->Units[iBody], update, iBody, dTmp,
                               &cUnit);
-            WriteSeasonalIceBalance(body, control, &output[iOut], system,
+            WriteSeasonalIceBalance(body, control, output, system,
                                     &control->Units[iBody], update, iBody, dTmp,
                                     &cUnit);
-            WriteSeasonalFluxes(body, control, &output[iOut], system,
+            WriteSeasonalFluxes(body, control, output, system,
                                 &control->Units[iBody], update, iBody, dTmp,
                                 &cUnit);
-            WritePlanckB(body, control, &output[iOut], system,
+            WritePlanckB(body, control, output, system,
                          &control->Units[iBody], update, iBody, dTmp, &cUnit);
 
             body[iBody].dSeasNextOutput =
@@ -2339,8 +2972,7 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
           }
         }
 
-        for (iGrid = 0; iGrid < files->Outfile[iBody].iNumGrid + iExtra;
-             iGrid++) {
+        for (iGrid = 0; iGrid < files->Outfile[iBody].iNumGrid; iGrid++) {
           fprintd(fp, dGrid[iGrid], control->Io.iSciNot, control->Io.iDigits);
           fprintf(fp, " ");
         }
@@ -2461,6 +3093,21 @@ void WriteOutput(BODY *body, CONTROL *control, FILES *files, OUTPUT *output,
   free(cUnit);
   free(cPoiseGrid);
   free(cLaplaceFunc);
+
+  ProfileSection(control, PROFILEOUTPUT, dStart);
+}
+
+/* Release the tables built by InitializeOutput */
+void FreeOutput(OUTPUT *output) {
+  int iOut;
+
+  for (iOut = 0; iOut < MODULEOUTEND; iOut++) {
+    free(output[iOut].cName);
+    free(output[iOut].cDescr);
+    free(output[iOut].cLongDescr);
+    free(output[iOut].cNeg);
+    free(output[iOut].bDoNeg);
+  }
 }
 
 void InitializeOutput(FILES *files, OUTPUT *output, fnWriteOutput fnWrite[]) {
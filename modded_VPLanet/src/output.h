@@ -20,6 +20,7 @@
 #define EXIT_WRITE 4
 #define EXIT_INT 5
 #define EXIT_OUTPUT 6
+#define EXIT_TERM 7
 
 /* Verbosity Level */
 
@@ -29,6 +30,27 @@
 #define VERBUNITS 4
 #define VERBALL 5
 
+/* Output File Format */
+
+#define OUTPUTTEXT 0
+#define OUTPUTBINARY 1
+#define OUTPUTMEMORY 2
+
+/* Reducer operations */
+#define REDUCE_AT 0        /**< Value at a given time */
+#define REDUCE_INITIAL 1   /**< Value at the start */
+#define REDUCE_FINAL 2     /**< Value at the end */
+#define REDUCE_DELTA 3     /**< Final minus initial value */
+#define REDUCE_LOSS 4      /**< Initial minus final value */
+#define REDUCE_MIN 5       /**< Smallest value */
+#define REDUCE_MAX 6       /**< Largest value */
+#define REDUCE_ARGMIN 7    /**< Time of the smallest value */
+#define REDUCE_ARGMAX 8    /**< Time of the largest value */
+#define REDUCE_FIRSTZERO 9 /**< Time the value first reaches zero */
+
+/* Binary output files start with this 8-byte string */
+#define OUTPUTBINARYMAGIC "VPLBIN01"
+
 /* General Outuput 0-999 */
 /* System properties 0-499, body properties 500-999 */
 #define OUTSTART 0
@@ -108,6 +130,11 @@
 #define OUT_LOSTENG 691
 #define OUT_LOSTANGMOM 692
 
+#define OUT_DESICCATEDTIME 693     /**< Time of surface desiccation */
+#define OUT_ENVELOPEGONETIME 694   /**< Time of envelope evaporation */
+#define OUT_INNERCORETIME 695      /**< Time of inner core nucleation */
+#define OUT_DYNAMOSHUTDOWNTIME 696 /**< Time of dynamo shutdown */
+
 /* @cond DOXYGEN_OVERRIDE */
 
 
@@ -118,9 +145,27 @@ void WriteLogEntry(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
 void InitializeOutputFunctions(MODULE *, OUTPUT *, int);
 void WriteOutput(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *, UPDATE *,
                  fnWriteOutput *);
+void InitializeOutputPlan(CONTROL *, FILES *, OUTPUT *);
+void CloseOutput(CONTROL *, FILES *);
+void KeepOutputRow(OUTFILE *, OUTPUT *, int, char *);
+double fdReduceValue(BODY *, CONTROL *, OUTFILE *, OUTPUT *, SYSTEM *,
+                     UPDATE *, fnWriteOutput *, int, int, char **);
+void InitializeReduce(BODY *, CONTROL *, FILES *, OUTPUT *, SYSTEM *,
+                      UPDATE *, fnWriteOutput *);
+void SetNextReduce(CONTROL *, FILES *);
+void FinishReduce(CONTROL *, FILES *);
+void WriteReduce(CONTROL *, FILES *, SYSTEM *, BODY *);
+void FreeReduce(OUTFILE *);
+void OpenOutputFile(CONTROL *, OUTFILE *, OUTPUT *);
+int bHostLittleEndian();
+void fvWriteLittleEndian(FILE *, void *, int, int);
+int fbReadLittleEndian(FILE *, void *, int, int);
+FILE *fpOpenBinaryOutput(char *, char **, char **, int);
+void LogProfile(BODY *, CONTROL *, UPDATE *, FILE *);
 void WriteLog(BODY *, CONTROL *, FILES *, MODULE *, OPTIONS *, OUTPUT *,
               SYSTEM *, UPDATE *, fnUpdateVariable ***, fnWriteOutput *, int);
 void InitializeOutput(FILES*,OUTPUT *, fnWriteOutput *);
+void FreeOutput(OUTPUT *);
 
 void WriteTime(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UNITS *, UPDATE *, int,
                double *, char**);
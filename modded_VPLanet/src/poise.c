@@ -1664,7 +1664,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_COLDSTART].cName, options[OPT_FIXICELAT].cName,
                 options[OPT_ALBEDOZA].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1680,7 +1680,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_COLDSTART].cName, options[OPT_FIXICELAT].cName,
                 cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1695,7 +1695,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_COLDSTART].cName, options[OPT_ALBEDOZA].cName,
                 cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1710,7 +1710,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_FIXICELAT].cName, options[OPT_ALBEDOZA].cName,
                 cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1724,7 +1724,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_ALBEDOLAND].cName, options[OPT_ALBEDOWATER].cName,
                 cFile, options[OPT_SURFALBEDO].cName);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1737,7 +1737,7 @@ void VerifyAlbedo(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 options[OPT_SURFALBEDO].cName, cFile,
                 options[OPT_ALBEDOLAND].cName, options[OPT_ALBEDOWATER].cName);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -1751,7 +1751,7 @@ void VerifyIceSheets(BODY *body, OPTIONS *options, char cFile[], int iBody,
       fprintf(stderr, "ERROR: Cannot set %s in annual model in File:%s\n",
               options[OPT_ICESHEETS].cName, cFile);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
     // LCOV_EXCL_STOP
   }
 }
@@ -1767,7 +1767,7 @@ void VerifyOLR(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 in File:%s\n",
                 options[OPT_PLANCKA].cName, options[OPT_PLANCKB].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
 
@@ -1779,7 +1779,7 @@ void VerifyOLR(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 in File:%s\n",
                 options[OPT_PCO2].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -1796,12 +1796,12 @@ void VerifyOrbitOblData(BODY *body, CONTROL *control, OPTIONS *options,
       fprintf(stderr, "ERROR: Must set %s if using %s for file %s\n",
               options[OPT_FILEORBITOBLDATA].cName,
               options[OPT_READORBITOBLDATA].cName, body[iBody].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     } else {
       fileorb = fopen(body[iBody].sFileOrbitOblData, "r");
       if (fileorb == NULL) {
         printf("ERROR: File %s not found.\n", body[iBody].sFileOrbitOblData);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
       iNLines = 0;
       while ((c = getc(fileorb)) != EOF) {
@@ -1829,7 +1829,7 @@ void VerifyOrbitOblData(BODY *body, CONTROL *control, OPTIONS *options,
         if (fscanf(fileorb, "%lf %lf %lf %lf %lf %lf %lf", &dttmp, &datmp, &detmp,
               &daptmp, &dlatmp, &dobltmp, &dprecatmp) != 7) {
                 fprintf(stderr,"ERROR: Incorrect number of columns in orbit-obliquity file.");
-                exit(EXIT_INPUT);
+                VplanetExit(EXIT_INPUT);
         }
 
         body[iBody].daTimeSeries[iLine] =
@@ -1865,7 +1865,7 @@ void VerifyOrbitOblData(BODY *body, CONTROL *control, OPTIONS *options,
       fprintf(stderr,
               "ERROR: Cannot use variable time step (%s = 1) if %s = 1\n",
               options[OPT_VARDT].cName, options[OPT_READORBITDATA].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
     if (control->Evolve.bDoForward) {
       if (body[iBody].daTimeSeries[1] != control->Evolve.dTimeStep) {
@@ -1873,7 +1873,7 @@ void VerifyOrbitOblData(BODY *body, CONTROL *control, OPTIONS *options,
                 "ERROR: Time step size (%s = 1) must match orbital data if %s "
                 "= 1\n",
                 options[OPT_TIMESTEP].cName, options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     } else if (control->Evolve.bDoBackward) {
       if (body[iBody].daTimeSeries[1] != -1 * control->Evolve.dTimeStep) {
@@ -1881,7 +1881,7 @@ void VerifyOrbitOblData(BODY *body, CONTROL *control, OPTIONS *options,
                 "ERROR: Time step size (%s = 1) must match orbital data if %s "
                 "= 1\n",
                 options[OPT_TIMESTEP].cName, options[OPT_READORBITDATA].cName);
-        exit(EXIT_INPUT);
+        VplanetExit(EXIT_INPUT);
       }
     }
     if (iNLines < (control->Evolve.dStopTime / control->Evolve.dTimeStep + 1)) {
@@ -1889,7 +1889,7 @@ void VerifyOrbitOblData(BODY *body, CONTROL *control, OPTIONS *options,
               "ERROR: Input orbit data must at least as long as vplanet "
               "integration (%f years)\n",
               control->Evolve.dStopTime / YEARSEC);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
     }
   }
 }
@@ -2496,7 +2496,7 @@ void InitializeClimateParams(BODY *body, int iBody, int iVerbose) {
             fprintf(stderr,"ERROR: Initial climate state failed to
         converge.\n");
           }
-          exit(EXIT_INPUT);
+          VplanetExit(EXIT_INPUT);
         }
         */
       }
@@ -2526,7 +2526,7 @@ void VerifyAstro(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 %s\n",
                 options[OPT_FORCEOBLIQ].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     } else {
       body[iBody].dObliq0 = body[iBody].dObliquity;
@@ -2546,7 +2546,7 @@ void VerifyAstro(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 %s\n",
                 options[OPT_FORCEECC].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     } else {
       body[iBody].dEcc0 = body[iBody].dEcc;
@@ -2579,7 +2579,7 @@ void VerifyDiffusion(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 "File:%s\n",
                 options[OPT_DIFFUSION].cName, cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
     if (body[iBody].bHadley) {
@@ -2590,7 +2590,7 @@ void VerifyDiffusion(BODY *body, OPTIONS *options, char cFile[], int iBody,
                 "in File:%s\n",
                 cFile);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -2608,7 +2608,7 @@ void VerifySeasOutputTime(BODY *body, CONTROL *control, OPTIONS *options,
                 options[OPT_SEASOUTPUTTIME].cName, cFile,
                 options[OPT_OUTPUTTIME].cName);
       }
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
   }
@@ -4825,7 +4825,7 @@ void fvNorthIceCapLand(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvNorthIceCapLand.\n");
-  exit(EXIT_INT);
+  VplanetExit(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -4870,7 +4870,7 @@ void fvNorthIceCapSea(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvNorthIceCapSea.\n");
-  exit(EXIT_INT);
+  VplanetExit(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -4916,7 +4916,7 @@ void fvSouthIceCapLand(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvSouthIceCapLand.\n");
-  exit(EXIT_INT);
+  VplanetExit(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -4961,7 +4961,7 @@ void fvSouthIceCapSea(BODY *body, int iBody, double *dLatIceEdge,
   }
   // LCOV_EXCL_START
   fprintf(stderr, "ERROR: Failure in fvSouthIceCapSea.\n");
-  exit(EXIT_INT);
+  VplanetExit(EXIT_INT);
   // LCOV_EXCL_STOP
 }
 
@@ -5915,7 +5915,7 @@ void PoiseAnnual(BODY *body, int iBody) {
     if (iIter >= iIterMax) {
       fprintf(stderr,
               "POISE solution not converged before max iterations reached.\n");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
     if (body[iBody].bCalcAB == 1) {
@@ -7440,7 +7440,7 @@ void IceSheetTriDiag(BODY *body, int iBody) {
     // LCOV_EXCL_START
     if (bTmp == 0) {
       fprintf(stderr, "Ice sheet tri-diagonal solution failed\n");
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
       // LCOV_EXCL_STOP
     }
     body[iBody].daIceHeight[iLat] = (body[iBody].daIcePropsTmp[iLat] -
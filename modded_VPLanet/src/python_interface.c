@@ -7,9 +7,11 @@
 
 #ifdef VPLANET_PYTHON_INTERFACE
 
-#include "vplanet.h"
+// Python.h comes first, so that the allocation macros of vplanet.h do not
+// reach its inline functions
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
+#include "vplanet.h"
 
 // Get the code version, passed in as a macro
 #ifndef VPLANET_VERSION
@@ -25,6 +27,8 @@
 #endif
 
 int main_impl(int, const char *(*)[9]);
+void RunVplanet(CONTROL *, FILES *, OPTIONS *, OUTPUT *, fnReadOption[],
+                fnWriteOutput[], char *);
 
 static PyObject *vplanet_core_version(PyObject *self, PyObject *args) {
   const char *version = VPLANET_VERSION_STRING;
@@ -52,9 +56,537 @@ static PyObject *vplanet_core_run(PyObject *self, PyObject *args) {
   return Py_None;
 }
 
+static PyObject *vplanet_core_baraffe(PyObject *self, PyObject *args) {
+
+  // Contiguous float64 masses [MSUN] and ages [Gyr] of equal length, the
+  // parameter and order, and the float64 and C int arrays to fill
+  Py_buffer mass, age, value, error;
+  int iParam, iOrder;
+  if (!PyArg_ParseTuple(args, "y*y*iiw*w*", &mass, &age, &iParam, &iOrder,
+                        &value, &error)) {
+    return NULL;
+  }
+
+  Py_ssize_t iNum = mass.len / sizeof(double);
+  if (age.len != mass.len || value.len != mass.len ||
+      error.len != iNum * (Py_ssize_t)sizeof(int)) {
+    PyBuffer_Release(&mass);
+    PyBuffer_Release(&age);
+    PyBuffer_Release(&value);
+    PyBuffer_Release(&error);
+    PyErr_SetString(PyExc_ValueError, "Array sizes do not match.");
+    return NULL;
+  }
+
+  const double *dMass = mass.buf;
+  const double *dAge  = age.buf;
+  double *dValue      = value.buf;
+  int *iError         = error.buf;
+
+  // The grid is read-only, so other threads may run meanwhile
+  Py_BEGIN_ALLOW_THREADS
+  for (Py_ssize_t i = 0; i < iNum; i++) {
+    dValue[i] = fdBaraffeGrid(iParam, dAge[i], dMass[i], iOrder, &iError[i]);
+  }
+  Py_END_ALLOW_THREADS
+
+  PyBuffer_Release(&mass);
+  PyBuffer_Release(&age);
+  PyBuffer_Release(&value);
+  PyBuffer_Release(&error);
+
+  // Return None
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+
+static PyObject *VplanetError;
+
+/* An option value as it would be written in an input file: booleans as 0 or
+   1, lists and tuples as space-separated words, anything else as str(). */
+static PyObject *pyOptionValue(PyObject *pValue) {
+  PyObject *pWords, *pWord, *pSep, *pText;
+  Py_ssize_t iWord;
+
+  if (PyBool_Check(pValue)) {
+    return PyUnicode_FromString(pValue == Py_True ? "1" : "0");
+  }
+  if (!PyList_Check(pValue) && !PyTuple_Check(pValue)) {
+    return PyObject_Str(pValue);
+  }
+
+  pWords = PyList_New(PySequence_Size(pValue));
+  if (pWords == NULL) {
+    return NULL;
+  }
+  for (iWord = 0; iWord < PyList_GET_SIZE(pWords); iWord++) {
+    pWord = pyOptionValue(PySequence_Fast_GET_ITEM(pValue, iWord));
+    if (pWord == NULL) {
+      Py_DECREF(pWords);
+      return NULL;
+    }
+    PyList_SET_ITEM(pWords, iWord, pWord);
+  }
+  pSep  = PyUnicode_FromString(" ");
+  pText = PyUnicode_Join(pSep, pWords);
+  Py_DECREF(pSep);
+  Py_DECREF(pWords);
+  return pText;
+}
+
+/* The text of an input file given either as a string or as a dict of
+   option names and values, one option per line. */
+static PyObject *pyInputFileText(PyObject *pFile) {
+  PyObject *pName, *pValue, *pText, *pLines, *pLine;
+  Py_ssize_t iPos = 0;
+
+  if (PyUnicode_Check(pFile)) {
+    Py_INCREF(pFile);
+    return pFile;
+  }
+  if (!PyDict_Check(pFile)) {
+    PyErr_SetString(PyExc_TypeError,
+                    "Each input file must be a str or a dict of options.");
+    return NULL;
+  }
+
+  pLines = PyList_New(0);
+  if (pLines == NULL) {
+    return NULL;
+  }
+  while (PyDict_Next(pFile, &iPos, &pName, &pValue)) {
+    pText = pyOptionValue(pValue);
+    if (pText == NULL) {
+      Py_DECREF(pLines);
+      return NULL;
+    }
+    pLine = PyUnicode_FromFormat("%S %U\n", pName, pText);
+    Py_DECREF(pText);
+    if (pLine == NULL || PyList_Append(pLines, pLine) < 0) {
+      Py_XDECREF(pLine);
+      Py_DECREF(pLines);
+      return NULL;
+    }
+    Py_DECREF(pLine);
+  }
+  pText = PyUnicode_Join(NULL, pLines);
+  Py_DECREF(pLines);
+  return pText;
+}
+
+static char *sCopyString(const char *cString) {
+  char *cCopy = malloc(strlen(cString) + 1);
+  strcpy(cCopy, cString);
+  return cCopy;
+}
+
+/* The option and output tables of a run. ReadOptions records in them where
+   each option was found, so each run builds its own. */
+typedef struct {
+  OPTIONS options[MODULEOPTEND];
+  OUTPUT output[MODULEOUTEND];
+  fnReadOption fnRead[MODULEOPTEND];
+  fnWriteOutput fnWrite[MODULEOUTEND];
+} RUNTABLES;
+
+static RUNTABLES *InitializeRunTables() {
+  RUNTABLES *tables = malloc(sizeof(RUNTABLES));
+  FILES files;
+
+  InitializeOptions(tables->options, tables->fnRead);
+  InitializeOutput(&files, tables->output, tables->fnWrite);
+  return tables;
+}
+
+/* Run vplanet on the input files of inmemory. Returns 1 if the run finished
+   and 0 if it stopped with an error. Everything the run allocates or opens,
+   including its tables and output rows, belongs to inmemory->Memory until
+   FreeInMemory. No Python objects are touched, so the caller may release the
+   GIL. */
+static int fbRunInMemory(INMEMORY *inmemory) {
+  CONTROL control;
+  FILES files;
+  RUNTABLES *tables;
+  volatile int bFinished = 0;
+
+  InMemory = inmemory;
+  tables   = InitializeRunTables();
+
+  control.Io.iVerbose   = -1;
+  control.Io.bOverwrite = -1;
+  files.cExe            = NULL;
+  fvFormattedString(&files.cExe, "vplanet");
+
+  if (setjmp(inmemory->jbExit) == 0) {
+    RunVplanet(&control, &files, tables->options, tables->output,
+               tables->fnRead, tables->fnWrite, inmemory->saFileName[0]);
+    bFinished = 1;
+  }
+  // A run that stopped early may still hold the index of its input files
+  FreeInputIndex();
+  InMemory = NULL;
+
+  return bFinished;
+}
+
+static void FreeInMemory(INMEMORY *inmemory) {
+  int iFile;
+
+  for (iFile = 0; iFile < inmemory->iNumFiles; iFile++) {
+    free(inmemory->saFileName[iFile]);
+    free(inmemory->saFileText[iFile]);
+  }
+  free(inmemory->saFileName);
+  free(inmemory->saFileText);
+  free(inmemory->sLogFile);
+  FreeRunMemory(&inmemory->Memory);
+}
+
+/* The rows of each body as a dict of column names, units and a 2-D float64
+   numpy array, with its reducers as dicts of results and units. */
+static PyObject *pyInMemoryOutput(INMEMORY *inmemory) {
+  PyObject *pNumpy, *pOutput, *pBody, *pBytes, *pFlat, *pRows, *pNames,
+        *pUnits, *pReduce, *pReduceUnits, *pValue;
+  OUTFILE *outfile;
+  int iBody, iCol, iNumCols, iReduce;
+
+  pNumpy = PyImport_ImportModule("numpy");
+  if (pNumpy == NULL) {
+    return NULL;
+  }
+  pOutput = PyDict_New();
+
+  for (iBody = 0; iBody < inmemory->iNumBodies; iBody++) {
+    outfile = &inmemory->Outfile[iBody];
+
+    // Columns are only known once a row has been kept
+    iNumCols = outfile->saColName != NULL ? outfile->iNumRowCols : 0;
+    pNames   = PyList_New(iNumCols);
+    pUnits   = PyList_New(iNumCols);
+    for (iCol = 0; iCol < iNumCols; iCol++) {
+      PyList_SET_ITEM(pNames, iCol,
+                      PyUnicode_FromString(outfile->saColName[iCol]));
+      PyList_SET_ITEM(pUnits, iCol,
+                      PyUnicode_FromString(outfile->saColUnit[iCol]));
+    }
+
+    pBytes = PyByteArray_FromStringAndSize(
+          (char *)outfile->daRows,
+          (Py_ssize_t)outfile->iNumRows * iNumCols * sizeof(double));
+    pFlat = PyObject_CallMethod(pNumpy, "frombuffer", "Os", pBytes, "=f8");
+    Py_DECREF(pBytes);
+    pRows = NULL;
+    if (pFlat != NULL) {
+      pRows = PyObject_CallMethod(pFlat, "reshape", "ii", outfile->iNumRows,
+                                  iNumCols);
+      Py_DECREF(pFlat);
+    }
+    if (pRows == NULL) {
+      Py_DECREF(pNames);
+      Py_DECREF(pUnits);
+      Py_DECREF(pOutput);
+      Py_DECREF(pNumpy);
+      return NULL;
+    }
+
+    pReduce      = PyDict_New();
+    pReduceUnits = PyDict_New();
+    for (iReduce = 0; iReduce < outfile->iNumReduce; iReduce++) {
+      pValue = PyFloat_FromDouble(outfile->daReduceResult[iReduce]);
+      PyDict_SetItemString(pReduce, outfile->saReduceName[iReduce], pValue);
+      Py_DECREF(pValue);
+      pValue = PyUnicode_FromString(outfile->saReduceUnit[iReduce]
+                                          ? outfile->saReduceUnit[iReduce]
+                                          : "");
+      PyDict_SetItemString(pReduceUnits, outfile->saReduceName[iReduce],
+                           pValue);
+      Py_DECREF(pValue);
+    }
+
+    pBody = Py_BuildValue("{sNsNsNsNsN}", "columns", pNames, "units", pUnits,
+                          "rows", pRows, "reduce", pReduce, "reduce_units",
+                          pReduceUnits);
+    PyDict_SetItemString(pOutput, inmemory->saBodyName[iBody], pBody);
+    Py_DECREF(pBody);
+  }
+
+  Py_DECREF(pNumpy);
+  return pOutput;
+}
+
+/* Copy the input files of pConfig, a dict of file names and contents, into
+   inmemory. The first file is the primary file. Returns 0 with an exception
+   set if an entry is invalid. */
+static int fbInMemoryInput(INMEMORY *inmemory, PyObject *pConfig) {
+  PyObject *pName, *pFile, *pText;
+  Py_ssize_t iPos = 0;
+
+  memset(inmemory, 0, sizeof(INMEMORY));
+  if (PyDict_Size(pConfig) == 0) {
+    PyErr_SetString(PyExc_ValueError, "No input files given.");
+    return 0;
+  }
+
+  inmemory->saFileName = malloc(PyDict_Size(pConfig) * sizeof(char *));
+  inmemory->saFileText = malloc(PyDict_Size(pConfig) * sizeof(char *));
+  while (PyDict_Next(pConfig, &iPos, &pName, &pFile)) {
+    if (!PyUnicode_Check(pName)) {
+      PyErr_SetString(PyExc_TypeError, "Input file names must be str.");
+      return 0;
+    }
+    pText = pyInputFileText(pFile);
+    if (pText == NULL) {
+      return 0;
+    }
+    inmemory->saFileName[inmemory->iNumFiles] =
+          sCopyString(PyUnicode_AsUTF8(pName));
+    inmemory->saFileText[inmemory->iNumFiles] =
+          sCopyString(PyUnicode_AsUTF8(pText));
+    inmemory->iNumFiles++;
+    Py_DECREF(pText);
+  }
+  return 1;
+}
+
+/* The VPLANETError for a run that stopped early */
+static PyObject *pyInMemoryError(INMEMORY *inmemory) {
+  return PyObject_CallFunction(
+        VplanetError, "Ni",
+        PyUnicode_FromFormat("vplanet stopped with exit status %d; see stderr "
+                             "for details.",
+                             inmemory->iExitStatus),
+        inmemory->iExitStatus);
+}
+
+static PyObject *vplanet_core_simulate(PyObject *self, PyObject *args) {
+
+  // A dict of input file names and their contents; the first is the primary
+  // file. Body files that are not in the dict are read from disk. If a log
+  // file is named, a run with bDoLog writes its log there.
+  PyObject *pConfig, *pOutput, *pError;
+  INMEMORY inmemory;
+  const char *sLogFile = NULL;
+  int bFinished;
+
+  if (!PyArg_ParseTuple(args, "O!|z", &PyDict_Type, &pConfig, &sLogFile)) {
+    return NULL;
+  }
+  if (!fbInMemoryInput(&inmemory, pConfig)) {
+    FreeInMemory(&inmemory);
+    return NULL;
+  }
+  if (sLogFile != NULL) {
+    inmemory.sLogFile = sCopyString(sLogFile);
+  }
+
+  // Each run has its own state, so other threads may run meanwhile
+  Py_BEGIN_ALLOW_THREADS
+  bFinished = fbRunInMemory(&inmemory);
+  Py_END_ALLOW_THREADS
+
+  if (!bFinished) {
+    pError = pyInMemoryError(&inmemory);
+    if (pError != NULL) {
+      PyErr_SetObject(VplanetError, pError);
+      Py_DECREF(pError);
+    }
+    FreeInMemory(&inmemory);
+    return NULL;
+  }
+
+  pOutput = pyInMemoryOutput(&inmemory);
+  FreeInMemory(&inmemory);
+  return pOutput;
+}
+
+/* A streamed run. The rows of each body are gathered into a block of iBlock
+   rows, and each full block is handed to pCallback while the run goes on. */
+typedef struct {
+  PyObject *pName;    /**< Name of the body */
+  PyObject *pColumns; /**< Column names */
+  PyObject *pUnits;   /**< Column units */
+  int iNumCols;       /**< Number of columns in each row */
+  int iNumRows;       /**< Number of rows in the block */
+  double *daBlock;    /**< Block, iNumCols doubles per row */
+} STREAMBODY;
+
+typedef struct {
+  PyObject *pCallback;    /**< Called with each block; falsy stops the run */
+  int iBlock;             /**< Rows per block */
+  int iNumBodies;         /**< Number of bodies with a block */
+  STREAMBODY *Body;       /**< Block of each body */
+  int bStop;              /**< Did the consumer stop the run? */
+  PyObject *pErrType, *pErrValue, *pErrTraceback; /**< Raised by pCallback */
+} STREAM;
+
+/* Hand the rows of a body's block to the callback as a dict of its name,
+   columns, units and a 2-D float64 numpy array, and empty the block. Returns
+   0 if the run should stop. The GIL must be held. */
+static int fbStreamBlock(STREAM *stream, STREAMBODY *sbody) {
+  PyObject *pNumpy, *pBytes, *pFlat, *pRows = NULL, *pItem, *pResult;
+  int bContinue;
+
+  if (sbody->iNumRows == 0) {
+    return 1;
+  }
+  pNumpy = PyImport_ImportModule("numpy");
+  if (pNumpy != NULL && sbody->pColumns != NULL && sbody->pUnits != NULL &&
+      sbody->pName != NULL) {
+    pBytes = PyByteArray_FromStringAndSize(
+          (char *)sbody->daBlock,
+          (Py_ssize_t)sbody->iNumRows * sbody->iNumCols * sizeof(double));
+    pFlat = PyObject_CallMethod(pNumpy, "frombuffer", "Os", pBytes, "=f8");
+    Py_DECREF(pBytes);
+    if (pFlat != NULL) {
+      pRows = PyObject_CallMethod(pFlat, "reshape", "ii", sbody->iNumRows,
+                                  sbody->iNumCols);
+      Py_DECREF(pFlat);
+    }
+  }
+  Py_XDECREF(pNumpy);
+  sbody->iNumRows = 0;
+
+  pResult = NULL;
+  if (pRows != NULL) {
+    pItem = Py_BuildValue("{sOsNsNsN}", "body", sbody->pName, "columns",
+                          PySequence_List(sbody->pColumns), "units",
+                          PySequence_List(sbody->pUnits), "rows", pRows);
+    if (pItem != NULL) {
+      pResult = PyObject_CallFunctionObjArgs(stream->pCallback, pItem, NULL);
+      Py_DECREF(pItem);
+    }
+  }
+  bContinue = pResult != NULL ? PyObject_IsTrue(pResult) : -1;
+  Py_XDECREF(pResult);
+
+  if (bContinue < 0) {
+    PyErr_Fetch(&stream->pErrType, &stream->pErrValue, &stream->pErrTraceback);
+    return 0;
+  }
+  if (!bContinue) {
+    stream->bStop = 1;
+  }
+  return bContinue;
+}
+
+/* The fnStream of a streamed run, called without the GIL */
+static int fbStreamRow(void *pStream, int iBody, char *cBody,
+                       OUTFILE *outfile) {
+  STREAM *stream = pStream;
+  STREAMBODY *sbody;
+  PyGILState_STATE gil;
+  int iCol, bContinue = 1;
+
+  if (iBody >= stream->iNumBodies) {
+    stream->Body = realloc(stream->Body, (iBody + 1) * sizeof(STREAMBODY));
+    memset(stream->Body + stream->iNumBodies, 0,
+           (iBody + 1 - stream->iNumBodies) * sizeof(STREAMBODY));
+    stream->iNumBodies = iBody + 1;
+  }
+  sbody = &stream->Body[iBody];
+
+  // The names and units are fixed by the first row
+  if (sbody->daBlock == NULL) {
+    sbody->iNumCols = outfile->iNumRowCols;
+    sbody->daBlock =
+          malloc((size_t)stream->iBlock * sbody->iNumCols * sizeof(double));
+    gil             = PyGILState_Ensure();
+    sbody->pName    = PyUnicode_FromString(cBody);
+    sbody->pColumns = PyTuple_New(sbody->iNumCols);
+    sbody->pUnits   = PyTuple_New(sbody->iNumCols);
+    for (iCol = 0; iCol < sbody->iNumCols; iCol++) {
+      PyTuple_SET_ITEM(sbody->pColumns, iCol,
+                       PyUnicode_FromString(outfile->saColName[iCol]));
+      PyTuple_SET_ITEM(sbody->pUnits, iCol,
+                       PyUnicode_FromString(outfile->saColUnit[iCol]));
+    }
+    PyGILState_Release(gil);
+  }
+
+  memcpy(sbody->daBlock + (size_t)sbody->iNumRows * sbody->iNumCols,
+         outfile->daRow, sbody->iNumCols * sizeof(double));
+  sbody->iNumRows++;
+  if (sbody->iNumRows == stream->iBlock) {
+    gil       = PyGILState_Ensure();
+    bContinue = fbStreamBlock(stream, sbody);
+    PyGILState_Release(gil);
+  }
+  return bContinue;
+}
+
+static PyObject *vplanet_core_stream(PyObject *self, PyObject *args) {
+
+  // A config as for simulate, a callable and the number of rows per block.
+  // The callable is called with each block as the run writes it, and stops
+  // the run by returning a falsy value. Returns None once the run is over.
+  PyObject *pConfig, *pError;
+  INMEMORY inmemory;
+  STREAM stream;
+  int iBody, bFinished;
+
+  memset(&stream, 0, sizeof(STREAM));
+  if (!PyArg_ParseTuple(args, "O!Oi", &PyDict_Type, &pConfig,
+                        &stream.pCallback, &stream.iBlock)) {
+    return NULL;
+  }
+  if (!PyCallable_Check(stream.pCallback)) {
+    PyErr_SetString(PyExc_TypeError, "The callback must be callable.");
+    return NULL;
+  }
+  if (stream.iBlock < 1) {
+    PyErr_SetString(PyExc_ValueError, "Blocks must hold at least one row.");
+    return NULL;
+  }
+  if (!fbInMemoryInput(&inmemory, pConfig)) {
+    FreeInMemory(&inmemory);
+    return NULL;
+  }
+  inmemory.fnStream = fbStreamRow;
+  inmemory.pStream  = &stream;
+
+  // The callback takes the GIL for each block it is handed
+  Py_BEGIN_ALLOW_THREADS
+  bFinished = fbRunInMemory(&inmemory);
+  Py_END_ALLOW_THREADS
+
+  // The rows written before the run ended, even by an error, are handed on
+  for (iBody = 0; iBody < stream.iNumBodies; iBody++) {
+    if (!stream.bStop && stream.pErrType == NULL) {
+      fbStreamBlock(&stream, &stream.Body[iBody]);
+    }
+    Py_XDECREF(stream.Body[iBody].pName);
+    Py_XDECREF(stream.Body[iBody].pColumns);
+    Py_XDECREF(stream.Body[iBody].pUnits);
+    free(stream.Body[iBody].daBlock);
+  }
+  free(stream.Body);
+
+  if (stream.pErrType != NULL) {
+    PyErr_Restore(stream.pErrType, stream.pErrValue, stream.pErrTraceback);
+    FreeInMemory(&inmemory);
+    return NULL;
+  }
+  if (!bFinished && !stream.bStop) {
+    pError = pyInMemoryError(&inmemory);
+    if (pError != NULL) {
+      PyErr_SetObject(VplanetError, pError);
+      Py_DECREF(pError);
+    }
+    FreeInMemory(&inmemory);
+    return NULL;
+  }
+
+  FreeInMemory(&inmemory);
+  Py_INCREF(Py_None);
+  return Py_None;
+}
+
 static PyMethodDef VplanetCoreMethods[] = {
       {"run", vplanet_core_run, METH_VARARGS, NULL},
+      {"simulate", vplanet_core_simulate, METH_VARARGS, NULL},
+      {"stream", vplanet_core_stream, METH_VARARGS, NULL},
       {"version", vplanet_core_version, METH_VARARGS, NULL},
+      {"baraffe", vplanet_core_baraffe, METH_VARARGS, NULL},
       {NULL, NULL, 0, NULL}};
 
 static struct PyModuleDef vplanet_core_module = {
@@ -65,6 +597,17 @@ PyMODINIT_FUNC PyInit_vplanet_core(void) {
   if (m == NULL) {
     return NULL;
   }
+
+  // Raised by simulate; args are the message and the exit status
+  VplanetError = PyErr_NewExceptionWithDoc(
+        "vplanet.VPLANETError", "Catch-all runtime error class for VPLANET.",
+        PyExc_RuntimeError, NULL);
+  if (VplanetError == NULL) {
+    Py_DECREF(m);
+    return NULL;
+  }
+  Py_INCREF(VplanetError);
+  PyModule_AddObject(m, "VPLANETError", VplanetError);
   return m;
 }
 
@@ -62,7 +62,8 @@ void fvBodyCopyRadheat(BODY *dest, BODY *src, int foo, int iNumBodies,
   dest[iBody].d235UNumCrust   = src[iBody].d235UNumCrust;
   dest[iBody].d235UConstCrust = src[iBody].d235UConstCrust;
 
-  dest[iBody].dRadPowerTotal = src[iBody].dRadPowerTotal;
+  dest[iBody].bExplicitRadheat = src[iBody].bExplicitRadheat;
+  dest[iBody].dRadPowerTotal   = src[iBody].dRadPowerTotal;
   dest[iBody].dRadPowerMan   = src[iBody].dRadPowerMan;
   dest[iBody].dRadPowerCore  = src[iBody].dRadPowerCore;
   dest[iBody].dRadPowerCrust = src[iBody].dRadPowerCrust;
@@ -1759,6 +1760,34 @@ void fvReadHaltRadPower(BODY *body, CONTROL *control, FILES *files,
   }
 }
 
+/**
+   Read whether radiogenic species are explicit functions of age
+
+   @param body Body struct
+   @param control Control struct
+   @param files Files struct
+   @param options Options struct
+   @param system System struct
+   @param iFile Index of file
+*/
+void fvReadExplicitRadheat(BODY *body, CONTROL *control, FILES *files,
+                           OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary file */
+  int lTmp = -1;
+  int bTmp;
+
+  AddOptionBool(files->Infile[iFile].cIn, options->cName, &bTmp, &lTmp,
+                control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    body[iFile - 1].bExplicitRadheat = bTmp;
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile > 0) {
+    body[iFile - 1].bExplicitRadheat = 0; // Default to integrating the decay
+  }
+}
+
 /* Initiatlize Input Options */
 /**
    Initialize input options to default values
@@ -2317,6 +2346,22 @@ void fvInitializeOptionsRadheat(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_HALTRADPOWER].dDefault   = 0;
   fvFormattedString(&options[OPT_HALTRADPOWER].cNeg, "TW");
   fnRead[OPT_HALTRADPOWER] = &fvReadHaltRadPower;
+
+  fvFormattedString(&options[OPT_EXPLICITRADHEAT].cName, "bExplicitRadheat");
+  fvFormattedString(&options[OPT_EXPLICITRADHEAT].cDescr,
+          "Compute radiogenic species as explicit functions of age?");
+  fvFormattedString(&options[OPT_EXPLICITRADHEAT].cDefault, "0");
+  options[OPT_EXPLICITRADHEAT].iType      = 0;
+  options[OPT_EXPLICITRADHEAT].bMultiFile = 1;
+  fnRead[OPT_EXPLICITRADHEAT]             = &fvReadExplicitRadheat;
+  fvFormattedString(&options[OPT_EXPLICITRADHEAT].cLongDescr,
+          "Radiogenic decay obeys N = N0 exp(-t/tau), so the number of atoms "
+          "and the\n"
+          "power of each species are known exactly at any age. If set, they "
+          "are computed\n"
+          "from the body's age instead of being integrated, and they no "
+          "longer take part\n"
+          "in the timestep selection.");
 }
 /**
    Read input option
@@ -2874,6 +2919,64 @@ void fvVerify235U(BODY *body, OPTIONS *options, SYSTEM *system, UPDATE *update,
     update[iBody].pdD235UNumCrustDt = &update[iBody].dZero;
   }
 }
+/**
+   Set the number of atoms of every radiogenic species, and its time
+   derivative, as explicit functions of age.
+
+   @param body Body struct
+   @param update Update struct
+   @param dAge Age at which to evaluate the species
+   @param iBody Index of body
+*/
+void fvAssignExplicitRadheat(BODY *body, UPDATE *update, double dAge,
+                             int iBody) {
+  body[iBody].d26AlNumMan =
+        fdRadheatNum(body[iBody].d26AlConstMan, HALFLIFE26AL, dAge);
+  update[iBody].dD26AlNumManDt = -body[iBody].d26AlNumMan / (HALFLIFE26AL);
+  body[iBody].d26AlNumCore =
+        fdRadheatNum(body[iBody].d26AlConstCore, HALFLIFE26AL, dAge);
+  update[iBody].dD26AlNumCoreDt = -body[iBody].d26AlNumCore / (HALFLIFE26AL);
+
+  body[iBody].d40KNumMan =
+        fdRadheatNum(body[iBody].d40KConstMan, HALFLIFE40K, dAge);
+  update[iBody].dD40KNumManDt = -body[iBody].d40KNumMan / (HALFLIFE40K);
+  body[iBody].d40KNumCore =
+        fdRadheatNum(body[iBody].d40KConstCore, HALFLIFE40K, dAge);
+  update[iBody].dD40KNumCoreDt = -body[iBody].d40KNumCore / (HALFLIFE40K);
+  body[iBody].d40KNumCrust =
+        fdRadheatNum(body[iBody].d40KConstCrust, HALFLIFE40K, dAge);
+  update[iBody].dD40KNumCrustDt = -body[iBody].d40KNumCrust / (HALFLIFE40K);
+
+  body[iBody].d232ThNumMan =
+        fdRadheatNum(body[iBody].d232ThConstMan, HALFLIFE232TH, dAge);
+  update[iBody].dD232ThNumManDt = -body[iBody].d232ThNumMan / (HALFLIFE232TH);
+  body[iBody].d232ThNumCore =
+        fdRadheatNum(body[iBody].d232ThConstCore, HALFLIFE232TH, dAge);
+  update[iBody].dD232ThNumCoreDt = -body[iBody].d232ThNumCore / (HALFLIFE232TH);
+  body[iBody].d232ThNumCrust =
+        fdRadheatNum(body[iBody].d232ThConstCrust, HALFLIFE232TH, dAge);
+  update[iBody].dD232ThNumCrustDt = -body[iBody].d232ThNumCrust / (HALFLIFE232TH);
+
+  body[iBody].d238UNumMan =
+        fdRadheatNum(body[iBody].d238UConstMan, HALFLIFE238U, dAge);
+  update[iBody].dD238UNumManDt = -body[iBody].d238UNumMan / (HALFLIFE238U);
+  body[iBody].d238UNumCore =
+        fdRadheatNum(body[iBody].d238UConstCore, HALFLIFE238U, dAge);
+  update[iBody].dD238UNumCoreDt = -body[iBody].d238UNumCore / (HALFLIFE238U);
+  body[iBody].d238UNumCrust =
+        fdRadheatNum(body[iBody].d238UConstCrust, HALFLIFE238U, dAge);
+  update[iBody].dD238UNumCrustDt = -body[iBody].d238UNumCrust / (HALFLIFE238U);
+
+  body[iBody].d235UNumMan =
+        fdRadheatNum(body[iBody].d235UConstMan, HALFLIFE235U, dAge);
+  update[iBody].dD235UNumManDt = -body[iBody].d235UNumMan / (HALFLIFE235U);
+  body[iBody].d235UNumCore =
+        fdRadheatNum(body[iBody].d235UConstCore, HALFLIFE235U, dAge);
+  update[iBody].dD235UNumCoreDt = -body[iBody].d235UNumCore / (HALFLIFE235U);
+  body[iBody].d235UNumCrust =
+        fdRadheatNum(body[iBody].d235UConstCrust, HALFLIFE235U, dAge);
+  update[iBody].dD235UNumCrustDt = -body[iBody].d235UNumCrust / (HALFLIFE235U);
+}
 /**
    Define auxiliary radheat body properties.
 
@@ -2885,6 +2988,9 @@ void fvVerify235U(BODY *body, OPTIONS *options, SYSTEM *system, UPDATE *update,
 /* Auxs Props */
 void fvPropsAuxRadheat(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
                        int iBody) {
+  if (body[iBody].bExplicitRadheat) {
+    fvAssignExplicitRadheat(body, update, body[iBody].dAge, iBody);
+  }
   body[iBody].dRadPowerMan   = fdRadPowerMan(update, iBody);
   body[iBody].dRadPowerCore  = fdRadPowerCore(update, iBody);
   body[iBody].dRadPowerCrust = fdRadPowerCrust(update, iBody);
@@ -2905,6 +3011,23 @@ void fvForceBehaviorRadheat(BODY *body, MODULE *module, EVOLVE *evolve, IO *io,
                             SYSTEM *system, UPDATE *update,
                             fnUpdateVariable ***fnUpdate, int iBody,
                             int iModule) {
+  double dAge;
+
+  if (body[iBody].bExplicitRadheat) {
+    /* The age has not been advanced yet, so evaluate the species at the end
+       of the step that was just taken. */
+    if (evolve->bDoForward) {
+      dAge = body[iBody].dAge + evolve->dCurrentDt;
+    } else {
+      dAge = body[iBody].dAge - evolve->dCurrentDt;
+    }
+    fvAssignExplicitRadheat(body, update, dAge, iBody);
+    body[iBody].dRadPowerMan   = fdRadPowerMan(update, iBody);
+    body[iBody].dRadPowerCore  = fdRadPowerCore(update, iBody);
+    body[iBody].dRadPowerCrust = fdRadPowerCrust(update, iBody);
+    body[iBody].dRadPowerTotal = fdRadPowerTotal(body, iBody);
+  }
+
   if (body[iBody].d26AlNumMan < 0.5) {
     body[iBody].d26AlNumMan = 0;
   }
@@ -3092,6 +3215,34 @@ void fvNullRadheatDerivatives(BODY *body, EVOLVE *evolve, UPDATE *update,
 }
 
 
+/**
+   Point the radiogenic derivatives at the fields of the update struct that
+   fvAssignExplicitRadheat fills, so the powers are known without any
+   radiogenic variables in the update matrix.
+
+   @param body Body struct
+   @param update Update struct
+   @param iBody Index of body
+*/
+void fvVerifyExplicitRadheat(BODY *body, UPDATE *update, int iBody) {
+  update[iBody].pdD26AlNumManDt = &update[iBody].dD26AlNumManDt;
+  update[iBody].pdD26AlNumCoreDt = &update[iBody].dD26AlNumCoreDt;
+  update[iBody].pdD40KNumManDt = &update[iBody].dD40KNumManDt;
+  update[iBody].pdD40KNumCoreDt = &update[iBody].dD40KNumCoreDt;
+  update[iBody].pdD40KNumCrustDt = &update[iBody].dD40KNumCrustDt;
+  update[iBody].pdD232ThNumManDt = &update[iBody].dD232ThNumManDt;
+  update[iBody].pdD232ThNumCoreDt = &update[iBody].dD232ThNumCoreDt;
+  update[iBody].pdD232ThNumCrustDt = &update[iBody].dD232ThNumCrustDt;
+  update[iBody].pdD238UNumManDt = &update[iBody].dD238UNumManDt;
+  update[iBody].pdD238UNumCoreDt = &update[iBody].dD238UNumCoreDt;
+  update[iBody].pdD238UNumCrustDt = &update[iBody].dD238UNumCrustDt;
+  update[iBody].pdD235UNumManDt = &update[iBody].dD235UNumManDt;
+  update[iBody].pdD235UNumCoreDt = &update[iBody].dD235UNumCoreDt;
+  update[iBody].pdD235UNumCrustDt = &update[iBody].dD235UNumCrustDt;
+
+  fvAssignExplicitRadheat(body, update, body[iBody].dAge, iBody);
+}
+
 /**
    Verify radheat is initialized: that both man and core initialize and not both
    mass and number specified.
@@ -3138,6 +3289,10 @@ void fvVerifyRadheat(BODY *body, CONTROL *control, FILES *files,
   // 235U set correctly
   fvVerify235U(body, options, system, update, body[iBody].dAge, iBody);
 
+  if (body[iBody].bExplicitRadheat) {
+    fvVerifyExplicitRadheat(body, update, iBody);
+  }
+
   control->fnForceBehavior[iBody][iModule]   = &fvForceBehaviorRadheat;
   control->fnPropsAux[iBody][iModule]        = &fvPropsAuxRadheat;
   control->Evolve.fnBodyCopy[iBody][iModule] = &fvBodyCopyRadheat;
@@ -3158,6 +3313,11 @@ void fvInitializeUpdateRadheat(BODY *body, UPDATE *update, int iBody) {
      ForceBehavior.
   */
 
+  if (body[iBody].bExplicitRadheat) {
+    // Species are explicit functions of age and are not integrated
+    return;
+  }
+
   // Mantle
   if (body[iBody].d26AlNumMan > 0 || body[iBody].d26AlMassMan > 0 ||
       body[iBody].d26AlPowerMan > 0) {
@@ -6324,6 +6484,18 @@ fdDNumRadDt(double dConst, double dHalfLife,
             double dAge) { // dN/dt, can be used by any radioactive system?
   return -dConst / dHalfLife * exp(-dAge / dHalfLife);
 }
+/**
+   Number of radiogenic species at a given age.
+
+   @param dConst Constant coefficient
+   @param dHalflife Decay halflife
+   @param dAge Age
+
+   @return Number of radiogenic species
+*/
+double fdRadheatNum(double dConst, double dHalfLife, double dAge) {
+  return dConst * exp(-dAge / dHalfLife);
+}
 
 /**
    Radiogenic heat production coefficient for 26Al.
@@ -227,6 +227,8 @@ void fvBodyCopyRadheat(BODY *, BODY *, int, int, int);
 #define OPT_HALT235UPOWER 1194
 #define OPT_HALTRADPOWER 1195
 
+#define OPT_EXPLICITRADHEAT 1196
+
 /* Options Functions */
 void fvHelpOptionsRadheat(OPTIONS *);
 void fvRead40KPowerMan(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *, int);
@@ -274,6 +276,8 @@ void fvRead238UNumCrust(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *, int);
 void fvRead235UPowerCrust(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *, int);
 void fvRead235UMassCrust(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *, int);
 void fvRead235UNumCrust(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *, int);
+void fvReadExplicitRadheat(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *,
+                           int);
 
 void fvInitializeOptionsRadheat(OPTIONS *, fnReadOption[]);
 void fvReadOptionsRadheat(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *,
@@ -299,7 +303,9 @@ void fvVerify40K(BODY *, OPTIONS *, SYSTEM *, UPDATE *, double, int);
 void fvVerify232Th(BODY *, OPTIONS *, SYSTEM *, UPDATE *, double, int);
 void fvVerify238U(BODY *, OPTIONS *, SYSTEM *, UPDATE *, double, int);
 void fvVerify235U(BODY *, OPTIONS *, SYSTEM *, UPDATE *, double, int);
+void fvVerifyExplicitRadheat(BODY *, UPDATE *, int);
 
+void fvAssignExplicitRadheat(BODY *, UPDATE *, double, int);
 void fvPropsAuxRadheat(BODY *, EVOLVE *, IO *, UPDATE *, int);
 void fvForceBehaviorRadheat(BODY *, MODULE *, EVOLVE *, IO *, SYSTEM *,
                             UPDATE *, fnUpdateVariable ***, int, int);
@@ -581,6 +587,7 @@ void fvLogBodyRadheat(BODY *, CONTROL *, OUTPUT *, SYSTEM *, UPDATE *,
                       fnWriteOutput[], FILE *, int);
 
 /* RadHeat functions */
+double fdRadheatNum(double, double, double);
 double fd26AlConstant(double, double);
 double fd40KConstant(double, double);
 double fd232ThConstant(double, double);
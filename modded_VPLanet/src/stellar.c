@@ -36,12 +36,21 @@ void BodyCopyStellar(BODY *dest, BODY *src, int foo, int iNumBodies,
   dest[iBody].iXUVModel            = src[iBody].iXUVModel;
   dest[iBody].iMagBrakingModel     = src[iBody].iMagBrakingModel;
   dest[iBody].dLXUV                = src[iBody].dLXUV;
+  dest[iBody].dSurfMagField        = src[iBody].dSurfMagField;
   dest[iBody].bRossbyCut           = src[iBody].bRossbyCut;
   dest[iBody].bEvolveRG            = src[iBody].bEvolveRG;
   dest[iBody].dLuminosityInitial = src[iBody].dLuminosityInitial;
   dest[iBody].dLuminosityAmplitude = src[iBody].dLuminosityAmplitude;
   dest[iBody].dLuminosityFrequency = src[iBody].dLuminosityFrequency;
   dest[iBody].dLuminosityPhase     = src[iBody].dLuminosityPhase;
+  dest[iBody].daBaraffeTrack       = src[iBody].daBaraffeTrack;
+  dest[iBody].dBaraffeMass         = src[iBody].dBaraffeMass;
+  dest[iBody].dBaraffeAge          = src[iBody].dBaraffeAge;
+  dest[iBody].iBaraffeAge          = src[iBody].iBaraffeAge;
+  memcpy(dest[iBody].daBaraffeValue, src[iBody].daBaraffeValue,
+         sizeof(src[iBody].daBaraffeValue));
+  dest[iBody].daStellarTrack       = src[iBody].daStellarTrack;
+  dest[iBody].iStellarTrackRows    = src[iBody].iStellarTrackRows;
 }
 
 /**************** STELLAR options ********************/
@@ -138,11 +147,13 @@ void ReadStellarModel(BODY *body, CONTROL *control, FILES *files,
       body[iFile - 1].iStellarModel = STELLAR_MODEL_PROXIMACEN;
     } else if (!memcmp(sLower(cTmp), "si", 2)) {
       body[iFile - 1].iStellarModel = STELLAR_MODEL_SINEWAVE;
+    } else if (!memcmp(sLower(cTmp), "tr", 2)) {
+      body[iFile - 1].iStellarModel = STELLAR_MODEL_TRACK;
     } else {
       if (control->Io.iVerbose >= VERBERR) {
         fprintf(stderr,
                 "ERROR: Unknown argument to %s: %s. Options are BARAFFE, "
-                "PROXIMACEN, or NONE.\n",
+                "PROXIMACEN, SINEWAVE, TRACK, or NONE.\n",
                 options->cName, cTmp);
       }
       LineExit(files->Infile[iFile].cIn, lTmp);
@@ -455,6 +466,26 @@ void ReadSurfMagField(BODY *body, CONTROL *control, FILES *files, OPTIONS *optio
   }
 }
 
+void ReadFileStellarTrack(BODY *body, CONTROL *control, FILES *files,
+                          OPTIONS *options, SYSTEM *system, int iFile) {
+  /* This parameter cannot exist in primary file */
+  int lTmp = -1;
+  char cTmp[OPTLEN];
+
+  AddOptionString(files->Infile[iFile].cIn, options->cName, cTmp, &lTmp,
+                  control->Io.iVerbose);
+  if (lTmp >= 0) {
+    NotPrimaryInput(iFile, options->cName, files->Infile[iFile].cIn, lTmp,
+                    control->Io.iVerbose);
+    body[iFile - 1].cFileStellarTrack = NULL;
+    fvFormattedString(&body[iFile - 1].cFileStellarTrack, cTmp);
+    UpdateFoundOption(&files->Infile[iFile], options, lTmp, iFile);
+  } else if (iFile > 0) {
+    body[iFile - 1].cFileStellarTrack = NULL;
+    fvFormattedString(&body[iFile - 1].cFileStellarTrack, options->cDefault);
+  }
+}
+
 void InitializeOptionsStellar(OPTIONS *options, fnReadOption fnRead[]) {
   int iOpt, iFile;
 
@@ -504,7 +535,8 @@ void InitializeOptionsStellar(OPTIONS *options, fnReadOption fnRead[]) {
   fvFormattedString(&options[OPT_STELLARMODEL].cName, "sStellarModel");
   fvFormattedString(&options[OPT_STELLARMODEL].cDescr, "Stellar evolution model");
   fvFormattedString(&options[OPT_STELLARMODEL].cDefault, "BARAFFE");
-  fvFormattedString(&options[OPT_STELLARMODEL].cValues, "BARAFFE PROXIMA SINEWAVE NONE");
+  fvFormattedString(&options[OPT_STELLARMODEL].cValues,
+          "BARAFFE PROXIMA SINEWAVE TRACK NONE");
   options[OPT_STELLARMODEL].iType      = 3;
   options[OPT_STELLARMODEL].bMultiFile = 1;
   fnRead[OPT_STELLARMODEL]             = &ReadStellarModel;
@@ -516,6 +548,7 @@ void InitializeOptionsStellar(OPTIONS *options, fnReadOption fnRead[]) {
         "(2015, A&A, 577, 42). PROXIMA will employ the model from Barnes, R. "
         "et al.\n"
         "(2016, arXiv:1608.06919). SINEWAVE produces oscillatory luminosity.\n"
+        "TRACK interpolates them from the table in sFileStellarTrack.\n"
         "NONE will leave them constant.\n");
 
   fvFormattedString(&options[OPT_MAGBRAKINGMODEL].cName, "sMagBrakingModel");
@@ -588,7 +621,9 @@ void InitializeOptionsStellar(OPTIONS *options, fnReadOption fnRead[]) {
           "end of\n"
           "the main sequence. Setting this flag to 1 will halt the code if the "
           "end\n"
-          "of the model grid is reached.");
+          "of the model grid is reached. For the TRACK model it halts the "
+          "code\n"
+          "once the age leaves the table in sFileStellarTrack.");
 
   fvFormattedString(&options[OPT_ROSSBYCUT].cName, "bRossbyCut");
   fvFormattedString(&options[OPT_ROSSBYCUT].cDescr,
@@ -630,6 +665,31 @@ void InitializeOptionsStellar(OPTIONS *options, fnReadOption fnRead[]) {
   options[OPT_SURFMAGFIELD].iModuleBit = STELLAR;
   fnRead[OPT_SURFMAGFIELD] = &ReadSurfMagField;
 
+  fvFormattedString(&options[OPT_FILESTELLARTRACK].cName, "sFileStellarTrack");
+  fvFormattedString(&options[OPT_FILESTELLARTRACK].cDescr,
+          "Name of file containing a tabulated stellar track");
+  fvFormattedString(&options[OPT_FILESTELLARTRACK].cDefault, "track.txt");
+  options[OPT_FILESTELLARTRACK].iType      = 3;
+  options[OPT_FILESTELLARTRACK].bMultiFile = 1;
+  options[OPT_FILESTELLARTRACK].iFileType  = 1;
+  options[OPT_FILESTELLARTRACK].iModuleBit = STELLAR;
+  fnRead[OPT_FILESTELLARTRACK]             = &ReadFileStellarTrack;
+  fvFormattedString(
+        &options[OPT_FILESTELLARTRACK].cLongDescr,
+        "Table read when %s is TRACK. Each row holds the Age, Luminosity,\n"
+        "LXUVStellar, Radius and RotPer of the star, in the units of the\n"
+        "body file, so the forward file of a run of the star alone with\n"
+        "saOutputOrder Age Luminosity LXUVStellar Radius RotPer can be used\n"
+        "directly. Values are joined by cubic Hermite polynomials in age,\n"
+        "the rotation rate follows their slope, and the effective\n"
+        "temperature is derived from the luminosity and radius. Lines\n"
+        "starting with # are ignored. The age must start inside the table.\n"
+        "Runs halt when it leaves the table unless %s is 0, in which\n"
+        "case the star keeps the first or last row, with a warning. Reusing\n"
+        "one track for many planets avoids evolving the same star in each\n"
+        "run.",
+        options[OPT_STELLARMODEL].cName, "bHaltEndBaraffeGrid");
+
   fvFormattedString(&options[OPT_LUMAMPLITUDE].cName, "dLuminosityAmplitude");
   fvFormattedString(&options[OPT_LUMAMPLITUDE].cDescr,
           "Amplitude of luminosity oscillation for SINEWAVE stellar model");
@@ -684,7 +744,12 @@ void ReadOptionsStellar(BODY *body, CONTROL *control, FILES *files,
 
 void VerifyRotRate(BODY *body, CONTROL *control, OPTIONS *options,
                    UPDATE *update, double dAge, int iBody) {
-  update[iBody].iaType[update[iBody].iRot][update[iBody].iRotStellar]     = 1;
+  if (body[iBody].iStellarModel == STELLAR_MODEL_TRACK) {
+    // Follows the track, so it must not dictate the timestep
+    update[iBody].iaType[update[iBody].iRot][update[iBody].iRotStellar] = 5;
+  } else {
+    update[iBody].iaType[update[iBody].iRot][update[iBody].iRotStellar] = 1;
+  }
   update[iBody].iNumBodies[update[iBody].iRot][update[iBody].iRotStellar] = 1;
   update[iBody].iaBody[update[iBody].iRot][update[iBody].iRotStellar] = malloc(
         update[iBody]
@@ -787,6 +852,9 @@ void VerifyStellarBaraffe(BODY *body, CONTROL *control, OPTIONS *options,
   }
   NoSineWaveOptions(body, control, options, iBody);
 
+  // Stellar mass is constant, so collapse the grid onto it once
+  fvBaraffeTrack(body, iBody);
+
   body[iBody].dLuminosity =
         fdLuminosityFunctionBaraffe(body[iBody].dAge, body[iBody].dMass);
 }
@@ -829,10 +897,94 @@ void VerifyStellarNone(BODY *body, CONTROL *control, OPTIONS *options,
             stderr,
             "ERROR: If STELLAR model NONE is selected, then %s must be set.\n",
             options[OPT_LUMINOSITY].cName);
-      exit(EXIT_INPUT);
+      VplanetExit(EXIT_INPUT);
+    }
+  }
+  NoSineWaveOptions(body, control, options, iBody);
+}
+
+/* Read the rows of the body's sFileStellarTrack into daStellarTrack, converting
+   from the units of the body file to SI. The file may also be held in memory
+   by an in-process run. */
+void ReadStellarTrack(BODY *body, CONTROL *control, OPTIONS *options,
+                      int iBody) {
+  int iRow;
+  double dTime, dPower, dLength, *daRow;
+
+  body[iBody].iStellarTrackRows = fiReadTable(
+        control, &options[OPT_FILESTELLARTRACK], body[iBody].cFileStellarTrack,
+        iBody, STELLAR_TRACK_NCOL, "Age Luminosity LXUVStellar Radius RotPer",
+        &body[iBody].daStellarTrack);
+
+  dTime   = fdUnitsTime(control->Units[iBody + 1].iTime);
+  dLength = fdUnitsLength(control->Units[iBody + 1].iLength);
+  dPower  = fdUnitsPower(control->Units[iBody + 1].iTime,
+                         control->Units[iBody + 1].iMass,
+                         control->Units[iBody + 1].iLength);
+
+  for (iRow = 0; iRow < body[iBody].iStellarTrackRows; iRow++) {
+    daRow = &body[iBody].daStellarTrack[iRow * STELLAR_TRACK_NCOL];
+    daRow[STELLAR_TRACK_AGE] *= dTime;
+    daRow[STELLAR_TRACK_L] *= dPower;
+    daRow[STELLAR_TRACK_LXUV] *= dPower;
+    daRow[STELLAR_TRACK_R] *= dLength;
+    daRow[STELLAR_TRACK_ROT] = fdPerToFreq(daRow[STELLAR_TRACK_ROT] * dTime);
+  }
+
+  if (!fbInStellarTrack(body, iBody, body[iBody].dAge)) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: The age of %s is outside %s file %s.\n",
+              body[iBody].cName, options[OPT_FILESTELLARTRACK].cName,
+              body[iBody].cFileStellarTrack);
+    }
+    VplanetExit(EXIT_INPUT);
+  }
+}
+
+void VerifyStellarTrack(BODY *body, CONTROL *control, OPTIONS *options,
+                        int iBody) {
+  double dEndAge;
+
+  if (options[OPT_FILESTELLARTRACK].iLine[iBody + 1] == -1) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: Must set %s when option %s is set to TRACK.\n",
+              options[OPT_FILESTELLARTRACK].cName,
+              options[OPT_STELLARMODEL].cName);
     }
+    LineExit(options[OPT_STELLARMODEL].cFile[iBody + 1],
+             options[OPT_STELLARMODEL].iLine[iBody + 1]);
   }
   NoSineWaveOptions(body, control, options, iBody);
+
+  ReadStellarTrack(body, control, options, iBody);
+
+  /* Past the track the star keeps its last row, so say so unless the run
+     halts there */
+  dEndAge = body[iBody].dAge + control->Evolve.dStopTime;
+  if (control->Evolve.bDoBackward) {
+    dEndAge = body[iBody].dAge - control->Evolve.dStopTime;
+  }
+  if (!control->Halt[iBody].bEndBaraffeGrid &&
+      !fbInStellarTrack(body, iBody, dEndAge) &&
+      control->Io.iVerbose >= VERBINPUT) {
+    fprintf(stderr,
+            "WARNING: %s runs outside %s file %s, where the star keeps the "
+            "nearest row. Set %s to halt there instead.\n",
+            body[iBody].cName, options[OPT_FILESTELLARTRACK].cName,
+            body[iBody].cFileStellarTrack,
+            options[OPT_HALTENDBARAFFEFGRID].cName);
+  }
+
+  // The track sets the star's state; its own inputs only matter at the start
+  body[iBody].dLuminosity = fdStellarTrack(body, iBody, STELLAR_TRACK_L,
+                                           body[iBody].dAge);
+  body[iBody].dLXUV    = fdStellarTrack(body, iBody, STELLAR_TRACK_LXUV,
+                                        body[iBody].dAge);
+  body[iBody].dRadius  = fdStellarTrack(body, iBody, STELLAR_TRACK_R,
+                                        body[iBody].dAge);
+  body[iBody].dRotRate = fdStellarTrack(body, iBody, STELLAR_TRACK_ROT,
+                                        body[iBody].dAge);
+  body[iBody].dTemperature = fdEffectiveTemperature(body, iBody);
 }
 
 void InitializeUpdateLuminosity(UPDATE *update, int iBody) {
@@ -855,6 +1007,8 @@ void VerifyLuminosity(BODY *body, CONTROL *control, OPTIONS *options,
     VerifyStellarProximaCen(body, control, options, iBody);
   } else if (body[iBody].iStellarModel == STELLAR_MODEL_SINEWAVE) {
     VerifyStellarSineWave(body, control, options, iBody);
+  } else if (body[iBody].iStellarModel == STELLAR_MODEL_TRACK) {
+    VerifyStellarTrack(body, control, options, iBody);
   } else if (body[iBody].iStellarModel == STELLAR_MODEL_NONE) {
     VerifyStellarNone(body, control, options, iBody);
   }
@@ -927,7 +1081,7 @@ void VerifyRadGyra(BODY *body, CONTROL *control, OPTIONS *options,
                  "Proxima Cen stellar model.\n",
                  iBody);
         }
-        exit(1);
+        VplanetExit(1);
       }
     }
 
@@ -951,7 +1105,7 @@ void VerifyRadGyra(BODY *body, CONTROL *control, OPTIONS *options,
                "bEvolveRG = 0.\n",
                iBody);
       }
-      exit(1);
+      VplanetExit(1);
     }
   }
 }
@@ -999,11 +1153,24 @@ void VerifyTemperature(BODY *body, CONTROL *control, OPTIONS *options,
 void fnPropsAuxStellar(BODY *body, EVOLVE *evolve, IO *io, UPDATE *update,
                        int iBody) {
 
+  // A tabulated star spins as its track did; its rotation rate does not
+  // control the timestep, so it is reset rather than left to drift
+  if (body[iBody].iStellarModel == STELLAR_MODEL_TRACK) {
+    body[iBody].dRotRate = fdStellarTrack(body, iBody, STELLAR_TRACK_ROT,
+                                          body[iBody].dAge);
+  }
+
   // Set rotation period for rossby number calculations
   body[iBody].dRotPer = fdFreqToPer(body[iBody].dRotRate);
 
   // Update LXUV
-  if (body[iBody].iXUVModel == STELLAR_MODEL_REINERS) {
+  if (body[iBody].iStellarModel == STELLAR_MODEL_TRACK) {
+
+    // Tabulated with the rest of the star
+    body[iBody].dLXUV = fdStellarTrack(body, iBody, STELLAR_TRACK_LXUV,
+                                       body[iBody].dAge);
+
+  } else if (body[iBody].iXUVModel == STELLAR_MODEL_REINERS) {
 
     // REINERS wind model
     double dPer, dLXRay, dLXRaySat;
@@ -1061,10 +1228,18 @@ void AssignStellarDerivatives(BODY *body, EVOLVE *evolve, UPDATE *update,
                               fnUpdateVariable ***fnUpdate, int iBody) {
   fnUpdate[iBody][update[iBody].iRot][update[iBody].iRotStellar] =
         &fdDRotRateDt;
-  fnUpdate[iBody][update[iBody].iLostAngMom][update[iBody].iLostAngMomStellar] =
-        &fdDJDtMagBrakingStellar;
-  fnUpdate[iBody][update[iBody].iLostEng][update[iBody].iLostEngStellar] =
-        &fdDEDtStellar;
+  if (body[iBody].iStellarModel == STELLAR_MODEL_TRACK) {
+    // The track already contains the losses
+    fnUpdate[iBody][update[iBody].iLostAngMom]
+            [update[iBody].iLostAngMomStellar] = &fndUpdateFunctionTiny;
+    fnUpdate[iBody][update[iBody].iLostEng][update[iBody].iLostEngStellar] =
+          &fndUpdateFunctionTiny;
+  } else {
+    fnUpdate[iBody][update[iBody].iLostAngMom]
+            [update[iBody].iLostAngMomStellar] = &fdDJDtMagBrakingStellar;
+    fnUpdate[iBody][update[iBody].iLostEng][update[iBody].iLostEngStellar] =
+          &fdDEDtStellar;
+  }
   fnUpdate[iBody][update[iBody].iLuminosity][0] =
         &fdLuminosity; // NOTE: This points to the value of the Luminosity!
   fnUpdate[iBody][update[iBody].iRadius][0] =
@@ -1113,7 +1288,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dLuminosity for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
   VerifyLuminosity(body, control, options, update, body[iBody].dAge, iBody);
 
@@ -1124,7 +1299,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dRadius for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   if (update[iBody].iNumRadGyra > 1) {
@@ -1134,7 +1309,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dRadGyra for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   VerifyRadius(body, control, options, update, body[iBody].dAge, iBody);
@@ -1148,7 +1323,7 @@ void VerifyStellar(BODY *body, CONTROL *control, FILES *files, OPTIONS *options,
               "dTemperature for body %d!",
               iBody);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
   VerifyTemperature(body, control, options, update, body[iBody].dAge, iBody);
   VerifyLostAngMomStellar(body, control, options, update, body[iBody].dAge,
@@ -1292,6 +1467,27 @@ int fbHaltEndBaraffeGrid(BODY *body, EVOLVE *evolve, HALT *halt, IO *io,
   return 0;
 }
 
+int fbHaltEndStellarTrack(BODY *body, EVOLVE *evolve, HALT *halt, IO *io,
+                          UPDATE *update, fnUpdateVariable ***fnUpdate,
+                          int iBody) {
+  // The age is not advanced until after the halts are checked
+  double dAge = body[iBody].dAge + evolve->dCurrentDt;
+
+  if (evolve->bDoBackward) {
+    dAge = body[iBody].dAge - evolve->dCurrentDt;
+  }
+  if (!fbInStellarTrack(body, iBody, dAge)) {
+    if (io->iVerbose >= VERBPROG) {
+      printf("HALT: %s reached the end of its stellar track at ",
+             body[iBody].cName);
+      fprintd(stdout, dAge / YEARSEC, io->iSciNot, io->iDigits);
+      printf(" years.\n");
+    }
+    return 1;
+  }
+  return 0;
+}
+
 void CountHaltsStellar(HALT *halt, int *iHalt) {
   if (halt->bEndBaraffeGrid) {
     (*iHalt)++;
@@ -1301,7 +1497,11 @@ void CountHaltsStellar(HALT *halt, int *iHalt) {
 void VerifyHaltStellar(BODY *body, CONTROL *control, OPTIONS *options,
                        int iBody, int *iHalt) {
   if (control->Halt[iBody].bEndBaraffeGrid) {
-    control->fnHalt[iBody][(*iHalt)++] = &fbHaltEndBaraffeGrid;
+    if (body[iBody].iStellarModel == STELLAR_MODEL_TRACK) {
+      control->fnHalt[iBody][(*iHalt)++] = &fbHaltEndStellarTrack;
+    } else {
+      control->fnHalt[iBody][(*iHalt)++] = &fbHaltEndBaraffeGrid;
+    }
   }
 }
 
@@ -1537,8 +1737,8 @@ void AddModuleStellar(CONTROL *control, MODULE *module, int iBody,
 double fdLuminosity(BODY *body, SYSTEM *system, int *iaBody) {
   double dLuminosity;
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_BARAFFE) {
-    dLuminosity = fdLuminosityFunctionBaraffe(body[iaBody[0]].dAge,
-                                              body[iaBody[0]].dMass);
+    dLuminosity = fdBaraffeFunction(body, iaBody[0], STELLAR_L,
+                                    body[iaBody[0]].dAge);
     if (!isnan(dLuminosity)) {
       return dLuminosity;
     } else {
@@ -1555,6 +1755,9 @@ double fdLuminosity(BODY *body, SYSTEM *system, int *iaBody) {
   } else if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_SINEWAVE) {
     dLuminosity = fdLuminosityFunctionSineWave(body, iaBody[0]);
     return dLuminosity;
+  } else if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_TRACK) {
+    return fdStellarTrack(body, iaBody[0], STELLAR_TRACK_L,
+                          body[iaBody[0]].dAge);
   }
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_NONE ||
       body[iaBody[0]].iStellarModel == STELLAR_MODEL_CONST) {
@@ -1567,7 +1770,7 @@ double fdLuminosity(BODY *body, SYSTEM *system, int *iaBody) {
 double fdRadius(BODY *body, SYSTEM *system, int *iaBody) {
   double foo;
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_BARAFFE) {
-    foo = fdRadiusFunctionBaraffe(body[iaBody[0]].dAge, body[iaBody[0]].dMass);
+    foo = fdBaraffeFunction(body, iaBody[0], STELLAR_R, body[iaBody[0]].dAge);
     if (!isnan(foo)) {
       return foo;
     } else {
@@ -1581,6 +1784,9 @@ double fdRadius(BODY *body, SYSTEM *system, int *iaBody) {
     } else {
       body[iaBody[0]].iStellarModel = STELLAR_MODEL_CONST;
     }
+  } else if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_TRACK) {
+    return fdStellarTrack(body, iaBody[0], STELLAR_TRACK_R,
+                          body[iaBody[0]].dAge);
   }
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_NONE ||
       body[iaBody[0]].iStellarModel == STELLAR_MODEL_CONST ||
@@ -1594,8 +1800,7 @@ double fdRadius(BODY *body, SYSTEM *system, int *iaBody) {
 double fdTemperature(BODY *body, SYSTEM *system, int *iaBody) {
   double foo;
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_BARAFFE) {
-    foo = fdTemperatureFunctionBaraffe(body[iaBody[0]].dAge,
-                                       body[iaBody[0]].dMass);
+    foo = fdBaraffeFunction(body, iaBody[0], STELLAR_T, body[iaBody[0]].dAge);
     if (!isnan(foo)) {
       return foo;
     } else {
@@ -1614,6 +1819,15 @@ double fdTemperature(BODY *body, SYSTEM *system, int *iaBody) {
     foo = fdEffectiveTemperature(body,iaBody[0]);
     return foo;
   }
+  if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_TRACK) {
+    // Stefan-Boltzmann with the tabulated luminosity and radius
+    foo = fdStellarTrack(body, iaBody[0], STELLAR_TRACK_R,
+                         body[iaBody[0]].dAge);
+    return pow(fdStellarTrack(body, iaBody[0], STELLAR_TRACK_L,
+                              body[iaBody[0]].dAge) /
+                     (4 * PI * SIGMA * foo * foo),
+               0.25);
+  }
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_NONE ||
       body[iaBody[0]].iStellarModel == STELLAR_MODEL_CONST) {
     return body[iaBody[0]].dTemperature;
@@ -1631,7 +1845,7 @@ double fdRadGyra(BODY *body, SYSTEM *system, int *iaBody) {
 
   double foo;
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_BARAFFE) {
-    foo = fdRadGyraFunctionBaraffe(body[iaBody[0]].dAge, body[iaBody[0]].dMass);
+    foo = fdBaraffeFunction(body, iaBody[0], STELLAR_RG, body[iaBody[0]].dAge);
     if (!isnan(foo)) {
       return foo;
     } else {
@@ -1647,7 +1861,8 @@ double fdRadGyra(BODY *body, SYSTEM *system, int *iaBody) {
   }
   if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_NONE ||
       body[iaBody[0]].iStellarModel == STELLAR_MODEL_CONST||
-      body[iaBody[0]].iStellarModel == STELLAR_MODEL_SINEWAVE) {
+      body[iaBody[0]].iStellarModel == STELLAR_MODEL_SINEWAVE ||
+      body[iaBody[0]].iStellarModel == STELLAR_MODEL_TRACK) {
     return body[iaBody[0]].dRadGyra;
   } else {
     return 0;
@@ -1671,10 +1886,10 @@ double fdDRadiusDtStellar(BODY *body, SYSTEM *system, int *iaBody) {
   double eps = 10.0 * YEARDAY * DAYSEC;
   double dRadMinus, dRadPlus;
 
-  dRadMinus = fdRadiusFunctionBaraffe(body[iaBody[0]].dAge - eps,
-                                      body[iaBody[0]].dMass);
-  dRadPlus  = fdRadiusFunctionBaraffe(body[iaBody[0]].dAge + eps,
-                                      body[iaBody[0]].dMass);
+  dRadMinus = fdBaraffeFunction(body, iaBody[0], STELLAR_R,
+                                body[iaBody[0]].dAge - eps);
+  dRadPlus  = fdBaraffeFunction(body, iaBody[0], STELLAR_R,
+                                body[iaBody[0]].dAge + eps);
 
   return (dRadPlus - dRadMinus) / (2. * eps);
 }
@@ -1698,10 +1913,10 @@ double fdDRadGyraDtStellar(BODY *body, SYSTEM *system, int *iaBody) {
   double eps = 10.0 * YEARDAY * DAYSEC;
   double dRGMinus, dRGPlus;
 
-  dRGMinus = fdRadGyraFunctionBaraffe(body[iaBody[0]].dAge - eps,
-                                      body[iaBody[0]].dMass);
-  dRGPlus  = fdRadGyraFunctionBaraffe(body[iaBody[0]].dAge + eps,
-                                      body[iaBody[0]].dMass);
+  dRGMinus = fdBaraffeFunction(body, iaBody[0], STELLAR_RG,
+                               body[iaBody[0]].dAge - eps);
+  dRGPlus  = fdBaraffeFunction(body, iaBody[0], STELLAR_RG,
+                               body[iaBody[0]].dAge + eps);
 
   return (dRGPlus - dRGMinus) / (2. * eps);
 }
@@ -1834,7 +2049,7 @@ double fdDJDtMagBrakingStellar(BODY *body, SYSTEM *system, int *iaBody) {
     } else {
       fprintf(stderr, "ERROR! Must set iWindModel to REINERS if using REINERTS "
                       "magnetic braking model!\n");
-      exit(1);
+      VplanetExit(1);
     }
 
     return -dDJDt; // Return positive amount of lost angular momentum
@@ -1992,6 +2207,12 @@ double fdDRotRateDtMagBrake(BODY *body, SYSTEM *system, int *iaBody) {
  */
 double fdDRotRateDt(BODY *body, SYSTEM *system, int *iaBody) {
 
+  // A tabulated star spins as its track did
+  if (body[iaBody[0]].iStellarModel == STELLAR_MODEL_TRACK) {
+    return fdStellarTrackSlope(body, iaBody[0], STELLAR_TRACK_ROT,
+                               body[iaBody[0]].dAge);
+  }
+
   // Contributions due to contraction, r_g changes, and magnetic braking via
   // chain rule dw_net/dt = dw_contraction/dt + dw_mag_braking/dt +
   // dw_rg_changes/dt
@@ -2022,7 +2243,7 @@ double fdLuminosityFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined Luminosity error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 }
 
@@ -2047,7 +2268,7 @@ double fdRadiusFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined radius error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 }
 
@@ -2075,7 +2296,7 @@ double fdRadGyraFunctionBaraffe(double dAge, double dMass) {
       fprintf(stderr,
               "ERROR: Undefined radius of gyration error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 }
 
@@ -2101,10 +2322,72 @@ double fdTemperatureFunctionBaraffe(double dAge, double dMass) {
     } else {
       fprintf(stderr, "ERROR: Undefined temperature error in fdBaraffe().\n");
     }
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
+  }
+}
+
+/**
+  Stellar T, L, R or RG from the body's Baraffe tracks, falling back on the
+  full grid interpolation at the edges of the grid, in NaN cells, or if the
+  mass has changed since the tracks were built.
+
+  @param body Body struct
+  @param iBody Index of body
+  @param iParam STELLAR_T, STELLAR_L, STELLAR_R or STELLAR_RG
+  @param dAge Age of the body
+
+  @return Interpolated parameter
+*/
+double fdBaraffeFunction(BODY *body, int iBody, int iParam, double dAge) {
+  int iError;
+  double dValue = fdBaraffeTrack(body, iBody, iParam, dAge, &iError);
+
+  if (iError == STELLAR_ERR_NONE) {
+    return dValue;
+  }
+  if (iParam == STELLAR_L) {
+    return fdLuminosityFunctionBaraffe(dAge, body[iBody].dMass);
+  } else if (iParam == STELLAR_R) {
+    return fdRadiusFunctionBaraffe(dAge, body[iBody].dMass);
+  } else if (iParam == STELLAR_RG) {
+    return fdRadGyraFunctionBaraffe(dAge, body[iBody].dMass);
+  } else {
+    return fdTemperatureFunctionBaraffe(dAge, body[iBody].dMass);
   }
 }
 
+/**
+  Column iCol of the body's stellar track at dAge.
+
+  @param body Body struct
+  @param iBody Index of body
+  @param iCol STELLAR_TRACK_L, STELLAR_TRACK_LXUV, STELLAR_TRACK_R or
+    STELLAR_TRACK_ROT
+  @param dAge Age of the body
+
+  @return Interpolated value
+*/
+double fdStellarTrack(BODY *body, int iBody, int iCol, double dAge) {
+  return fdTableHermite(body[iBody].daStellarTrack,
+                        body[iBody].iStellarTrackRows, STELLAR_TRACK_NCOL,
+                        iCol, dAge, 0);
+}
+
+/* Rate of change per second of column iCol of the body's stellar track */
+double fdStellarTrackSlope(BODY *body, int iBody, int iCol, double dAge) {
+  return fdTableHermite(body[iBody].daStellarTrack,
+                        body[iBody].iStellarTrackRows, STELLAR_TRACK_NCOL,
+                        iCol, dAge, 1);
+}
+
+/* Does the body's stellar track cover dAge? */
+int fbInStellarTrack(BODY *body, int iBody, double dAge) {
+  return dAge >= body[iBody].daStellarTrack[STELLAR_TRACK_AGE] &&
+         dAge <= body[iBody].daStellarTrack[(body[iBody].iStellarTrackRows -
+                                             1) * STELLAR_TRACK_NCOL +
+                                            STELLAR_TRACK_AGE];
+}
+
 double fdLuminosityFunctionProximaCen(double dAge, double dMass) {
   int iError;
   double L = fdProximaCenStellar(PROXIMACEN_L, dAge, dMass, &iError);
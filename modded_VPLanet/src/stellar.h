@@ -49,6 +49,15 @@
 #define STELLAR_MODEL_RIBAS 4
 #define STELLAR_MODEL_PROXIMACEN 5
 #define STELLAR_MODEL_SINEWAVE 6
+#define STELLAR_MODEL_TRACK 7
+
+/* Columns of a tabulated stellar track */
+#define STELLAR_TRACK_AGE 0
+#define STELLAR_TRACK_L 1
+#define STELLAR_TRACK_LXUV 2
+#define STELLAR_TRACK_R 3
+#define STELLAR_TRACK_ROT 4
+#define STELLAR_TRACK_NCOL 5
 
 #define STELLAR_DJDT_NONE                                                      \
   0 /**< No stellar angular momentum loss via magnetic braking */
@@ -87,6 +96,8 @@
 // Go to vplanet.h near line 1897 to find length of option chunk.
 #define OPT_SURFMAGFIELD 1523
 
+#define OPT_FILESTELLARTRACK 1524 /**< File with a tabulated stellar track */
+
 #define OPT_LUMAMPLITUDE 1550
 #define OPT_LUMPERIOD 1555
 #define OPT_LUMPHASE 1560
@@ -127,6 +138,8 @@ void ReadOptionsStellar(BODY *, CONTROL *, FILES *, OPTIONS *, SYSTEM *,
 
 int fbHaltEndBaraffeGrid(BODY *, EVOLVE *, HALT *, IO *, UPDATE *,
                          fnUpdateVariable ***, int);
+int fbHaltEndStellarTrack(BODY *, EVOLVE *, HALT *, IO *, UPDATE *,
+                          fnUpdateVariable ***, int);
 void CountHaltsStellar(HALT *, int *);
 
 /* Verify Functions */
@@ -193,6 +206,7 @@ double fdDRotRateDtRadGyra(BODY *, SYSTEM *, int *);
 double fdDRotRateDtMagBrake(BODY *, SYSTEM *, int *);
 double fdTemperature(BODY *, SYSTEM *, int *);
 double fdTemperatureFunctionBaraffe(double, double);
+double fdBaraffeFunction(BODY *, int, int, double);
 double fdTemperatureFunctionProximaCen(double, double);
 double fdDJDtMagBrakingStellar(BODY *, SYSTEM *, int *);
 double fdDRadiusDtStellar(BODY *, SYSTEM *, int *);
@@ -203,6 +217,10 @@ double fdDEDtRotRadGyraStellar(BODY *, SYSTEM *, int *);
 double fdDEDtRotBrakeStellar(BODY *, SYSTEM *, int *);
 double fdDEDtStellar(BODY *, SYSTEM *, int *);
 double fdCranmerSaar2011TauCZ(double);
+void ReadStellarTrack(BODY *, CONTROL *, OPTIONS *, int);
+double fdStellarTrack(BODY *, int, int, double);
+double fdStellarTrackSlope(BODY *, int, int, double);
+int fbInStellarTrack(BODY *, int, double);
 
 /* Dummy functions */
 double fdSurfEnFluxStellar(BODY *, SYSTEM *, UPDATE *, int, int);
@@ -523,7 +523,7 @@ void angularmom(BODY *body, double *AngMom, int iNumBodies) {
   if (body[0].bSpiNBody) {
     fprintf(stderr, "ERROR: Function angularmom called with module SpiNBody. \n"
                     "This function has only been verified for DistOrb.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   osc2cart(body, iNumBodies);
@@ -791,7 +791,7 @@ int fbCheckMaxMutualInc(BODY *body, EVOLVE *evolve, HALT *halt, IO *io,
   } else {
     fprintf(stderr, "ERROR: Unknown value for iReason in "
                     "system.c:fbCheckMaxMutualInc.\n");
-    exit(EXIT_INT);
+    VplanetExit(EXIT_INT);
   }
 
   dMutualInc = fdMutualInclination(body, iBody, jBody);
@@ -2064,6 +2064,31 @@ int fbHaltMinTCore(BODY *body, EVOLVE *evolve, HALT *halt, IO *io,
   return 0;
 }
 
+/**
+  Event function for inner core nucleation, which occurs when it drops to zero.
+
+  @param body Body struct
+  @param iBody Index of body
+
+  @return Minus the square of the inner core radius in units of the core radius
+*/
+double fdEventInnerCoreNucleated(BODY *body, int iBody) {
+  return -fdRICRatio(body, iBody);
+}
+
+/**
+  Event function for the shutdown of the core dynamo, which occurs when it
+  drops to zero, i.e. when the magnetic moment vanishes.
+
+  @param body Body struct
+  @param iBody Index of body
+
+  @return Outer core buoyancy flux times the outer core thickness
+*/
+double fdEventDynamoShutdown(BODY *body, int iBody) {
+  return body[iBody].dCoreBuoyTotal * ((ERCORE)-body[iBody].dRIC);
+}
+
 // XXX Should change these to bHaltTMan as there is no real need to check
 
 /**
@@ -4904,15 +4929,15 @@ double fdDTChi(BODY *body, int iBody) {
   return body[iBody].dDTChiRef * body[iBody].dChiOC / (CHI_OC_E);
 }
 /**
-  Function compute inner core radius RIC
+  Function compute (RIC/ERCORE)^2 from the core adiabat and liquidus. An inner
+  core exists where this is positive.
 
   @param body Body struct
   @param iBody Index of body
 
-  @return Inner core radius
+  @return Square of the inner core radius in units of the core radius
 */
-double fdRIC(BODY *body, int iBody) {
-  double dRIC;
+double fdRICRatio(BODY *body, int iBody) {
   /* NEW VERSION with light element liquidus depression  */
   double T_fe_cen = body[iBody].dTrefLind -
                     (body[iBody].dDTChi); // Liquidus at center of core.
@@ -4927,10 +4952,21 @@ double fdRIC(BODY *body, int iBody) {
   }
   double denom = 1. + pow((body[iBody].dDAdCore) / (ERCORE), 2.0) *
                             log(T_fe_cmb / T_fe_cen);
-  double denom2 = 1. - 2. * (1 - 1. / (3. * (GRUNEISEN))) *
-                             pow(body[iBody].dDAdCore / body[iBody].dDLind, 2);
-  if ((numerator / denom) > 0.) { // IC exists
-    dRIC = (ERCORE)*sqrt(numerator / denom);
+  return numerator / denom;
+}
+/**
+  Function compute inner core radius RIC
+
+  @param body Body struct
+  @param iBody Index of body
+
+  @return Inner core radius
+*/
+double fdRIC(BODY *body, int iBody) {
+  double dRIC;
+  double dRatio = fdRICRatio(body, iBody);
+  if (dRatio > 0.) { // IC exists
+    dRIC = (ERCORE)*sqrt(dRatio);
   } else {
     dRIC = 0; // no IC.
   }
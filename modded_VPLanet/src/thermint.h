@@ -432,6 +432,8 @@ int fbHaltMinTMan(
 int fbHaltMinTCore(BODY *, EVOLVE *, HALT *, IO *, UPDATE *,
                    fnUpdateVariable ***, int);
 void fvCountHaltsThermint(HALT *, int *);
+double fdEventInnerCoreNucleated(BODY *, int);
+double fdEventDynamoShutdown(BODY *, int);
 
 /* Verify Functions */
 void fvVerifyThermint(BODY *, CONTROL *, FILES *, OPTIONS *, OUTPUT *, SYSTEM *,
@@ -784,6 +786,7 @@ double fdTidalPowMan(BODY *, int);
 double fdHflowSurf(BODY *, int);
 double fdHfluxSurf(BODY *, int);
 double fdHflowSecManThermint(BODY *, int);
+double fdRICRatio(BODY *, int);
 double fdRIC(BODY *, int);
 double fdDRICDTCMB(BODY *, int);
 double fdChiOC(BODY *, int);
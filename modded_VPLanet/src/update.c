@@ -90,7 +90,7 @@ void AddPrimaryVariable(BODY *body,CONTROL *control,MODULE *module,UPDATE *updat
       update[iBody].iaModule[*iVar] =
             malloc(iNumPrimaryVariable * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[*iVar] =
               dTmpPrimaryVariable;
         control->Evolve.tmpUpdate[iBody].iNumBodies[*iVar] =
@@ -237,7 +237,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     update[iBody].iaBody     = malloc(update[iBody].iNumVars * sizeof(int **));
 
     // May also have to allocate space for the temp UPDATE
-    if (control->Evolve.iOneStep == RUNGEKUTTA) {
+    if (control->Evolve.iOneStep != EULER) {
       control->Evolve.tmpUpdate[iBody].iaVar =
             malloc(update[iBody].iNumVars * sizeof(int));
       control->Evolve.tmpUpdate[iBody].iNumEqns =
@@ -284,7 +284,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumVelX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dVelX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -328,7 +328,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumVelY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dVelY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -372,7 +372,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumVelZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dVelZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -417,7 +417,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPositionX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPositionX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -462,7 +462,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPositionY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPositionY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -507,7 +507,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPositionZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPositionZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -554,7 +554,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumWaterMassMOAtm * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dWaterMassMOAtm;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -599,7 +599,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumWaterMassSol * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dWaterMassSol;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -644,7 +644,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSurfTemp * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSurfTemp;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -689,7 +689,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSolidRadius * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSolidRadius;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -734,7 +734,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPotTemp * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPotTemp;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -779,7 +779,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMassMOAtm * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMassMOAtm;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -824,7 +824,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMassSol * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMassSol;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -869,7 +869,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumHydrogenMassSpace * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dHydrogenMassSpace;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -914,7 +914,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMassSpace * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMassSpace;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -959,7 +959,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCO2MassMOAtm * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCO2MassMOAtm;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1004,7 +1004,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCO2MassSol * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCO2MassSol;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1053,7 +1053,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum26AlCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d26AlNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1099,7 +1099,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum26AlMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d26AlNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1145,7 +1145,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum40KCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d40KNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1191,7 +1191,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum40KMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d40KNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1225,7 +1225,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     update[iBody].i40KCrust = -1;
     if (update[iBody].iNum40KCrust) {
       update[iBody].i40KCrust      = iVar;
-      update[iBody].iaVar[iVar]    = VNUM40KCORE;
+      update[iBody].iaVar[iVar]    = VNUM40KCRUST;
       update[iBody].iNumEqns[iVar] = update[iBody].iNum40KCrust;
       update[iBody].pdVar[iVar]    = &body[iBody].d40KNumCrust;
       update[iBody].iNumBodies[iVar] =
@@ -1237,7 +1237,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum40KCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d40KNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1283,7 +1283,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum232ThCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d232ThNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1329,7 +1329,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum232ThMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d232ThNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1363,7 +1363,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     update[iBody].i232ThCrust = -1;
     if (update[iBody].iNum232ThCrust) {
       update[iBody].i232ThCrust    = iVar;
-      update[iBody].iaVar[iVar]    = VNUM232THCORE;
+      update[iBody].iaVar[iVar]    = VNUM232THCRUST;
       update[iBody].iNumEqns[iVar] = update[iBody].iNum232ThCrust;
       update[iBody].pdVar[iVar]    = &body[iBody].d232ThNumCrust;
       update[iBody].iNumBodies[iVar] =
@@ -1375,7 +1375,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum232ThCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d232ThNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1421,7 +1421,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum235UCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d235UNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1467,7 +1467,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum235UMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d235UNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1501,7 +1501,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     update[iBody].i235UCrust = -1;
     if (update[iBody].iNum235UCrust) {
       update[iBody].i235UCrust     = iVar;
-      update[iBody].iaVar[iVar]    = VNUM235UCORE;
+      update[iBody].iaVar[iVar]    = VNUM235UCRUST;
       update[iBody].iNumEqns[iVar] = update[iBody].iNum235UCrust;
       update[iBody].pdVar[iVar]    = &body[iBody].d235UNumCrust;
       update[iBody].iNumBodies[iVar] =
@@ -1513,7 +1513,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum235UCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d235UNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1559,7 +1559,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum238UCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d238UNumCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1605,7 +1605,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum238UMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d238UNumMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1639,7 +1639,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     update[iBody].i238UCrust = -1;
     if (update[iBody].iNum238UCrust) {
       update[iBody].i238UCrust     = iVar;
-      update[iBody].iaVar[iVar]    = VNUM238UCORE;
+      update[iBody].iaVar[iVar]    = VNUM238UCRUST;
       update[iBody].iNumEqns[iVar] = update[iBody].iNum238UCrust;
       update[iBody].pdVar[iVar]    = &body[iBody].d238UNumCrust;
       update[iBody].iNumBodies[iVar] =
@@ -1651,7 +1651,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNum238UCrust * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].d238UNumCrust;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1697,7 +1697,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEnvelopeMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEnvelopeMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1749,7 +1749,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumDynEllip * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dDynEllip;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1795,7 +1795,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumHecc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dHecc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1841,7 +1841,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumKecc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dKecc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1893,7 +1893,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLuminosity * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLuminosity;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1937,7 +1937,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     malloc(update[iBody].iNumObl*sizeof(int)); update[iBody].iaModule[iVar] =
     malloc(update[iBody].iNumObl*sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
     &control->Evolve.tmpBody[iBody].dObliquity;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -1977,7 +1977,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumPinc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dPinc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2022,7 +2022,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumQinc * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dQinc;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2068,7 +2068,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumRadius * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dRadius;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2113,7 +2113,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2158,7 +2158,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumRot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dRotRate;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2203,7 +2203,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSemi * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSemi;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2253,7 +2253,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumSurfaceWaterMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dSurfaceWaterMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2299,7 +2299,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2345,7 +2345,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumOxygenMantleMass * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dOxygenMantleMass;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2391,7 +2391,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumTemperature * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dTemperature;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2437,7 +2437,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumRadGyra * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dRadGyra;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2483,7 +2483,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumTCore * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dTCore;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2528,7 +2528,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumTMan * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dTMan;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2573,7 +2573,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumXobl * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dXobl;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2619,7 +2619,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumYobl * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dYobl;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2665,7 +2665,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumZobl * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dZobl;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2713,7 +2713,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPR * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPR;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2759,7 +2759,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2806,7 +2806,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPPhi * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPPhi;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2853,7 +2853,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPRDot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPRDot;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2900,7 +2900,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPZDot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPZDot;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -2947,7 +2947,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumCBPPhiDot * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dCBPPhiDot;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3001,7 +3001,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
     //         update[iBody].iaModule[iVar] =
     //         malloc(update[iBody].iNumIceMass*sizeof(int));
     //
-    //         if (control->Evolve.iOneStep == RUNGEKUTTA) {
+    //         if (control->Evolve.iOneStep != EULER) {
     //
     //           control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
     //           &control->Evolve.tmpBody[iBody].daIceMass[iLat];
@@ -3043,7 +3043,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEccX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEccX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3088,7 +3088,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEccY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEccY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3133,7 +3133,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumEccZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dEccZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3179,7 +3179,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumAngMX * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dAngMX;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3225,7 +3225,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumAngMY * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dAngMY;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3271,7 +3271,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumAngMZ * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dAngMZ;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3323,7 +3323,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLXUV * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLXUV;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3369,7 +3369,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLostAngMom * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLostAngMom;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3415,7 +3415,7 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
       update[iBody].iaModule[iVar] =
             malloc(update[iBody].iNumLostEng * sizeof(int));
 
-      if (control->Evolve.iOneStep == RUNGEKUTTA) {
+      if (control->Evolve.iOneStep != EULER) {
         control->Evolve.tmpUpdate[iBody].pdVar[iVar] =
               &control->Evolve.tmpBody[iBody].dLostEng;
         control->Evolve.tmpUpdate[iBody].iNumBodies[iVar] =
@@ -3450,3 +3450,153 @@ void InitializeUpdate(BODY *body, CONTROL *control, MODULE *module,
                         iFoo);
   }
 }
+
+/* The name of a primary variable, from its identifier in iaVar */
+char *fsPrimaryVariableName(int iID) {
+  switch (iID) {
+    case VSEMI:
+      return "SemiMajorAxis";
+    case VECC:
+      return "Eccentricity";
+    case VROT:
+      return "RotRate";
+    case VOBL:
+      return "Obliquity";
+    case VRADIUS:
+      return "Radius";
+    case VMASS:
+      return "Mass";
+    case VRADGYRA:
+      return "RadGyra";
+    case VNUM26ALMAN:
+      return "26AlNumMan";
+    case VNUM26ALCORE:
+      return "26AlNumCore";
+    case VNUM40KMAN:
+      return "40KNumMan";
+    case VNUM40KCORE:
+      return "40KNumCore";
+    case VNUM40KCRUST:
+      return "40KNumCrust";
+    case VNUM232THMAN:
+      return "232ThNumMan";
+    case VNUM232THCORE:
+      return "232ThNumCore";
+    case VNUM232THCRUST:
+      return "232ThNumCrust";
+    case VNUM235UMAN:
+      return "235UNumMan";
+    case VNUM235UCORE:
+      return "235UNumCore";
+    case VNUM235UCRUST:
+      return "235UNumCrust";
+    case VNUM238UMAN:
+      return "238UNumMan";
+    case VNUM238UCORE:
+      return "238UNumCore";
+    case VNUM238UCRUST:
+      return "238UNumCrust";
+    case VTMAN:
+      return "TMan";
+    case VTCORE:
+      return "TCore";
+    case VHECC:
+      return "HEcc";
+    case VKECC:
+      return "KEcc";
+    case VPINC:
+      return "PInc";
+    case VQINC:
+      return "QInc";
+    case VXOBL:
+      return "XObl";
+    case VYOBL:
+      return "YObl";
+    case VZOBL:
+      return "ZObl";
+    case VDYNELLIP:
+      return "DynEllip";
+    case VVELX:
+      return "VelX";
+    case VVELY:
+      return "VelY";
+    case VVELZ:
+      return "VelZ";
+    case VPOSITIONX:
+      return "PositionX";
+    case VPOSITIONY:
+      return "PositionY";
+    case VPOSITIONZ:
+      return "PositionZ";
+    case VSURFACEWATERMASS:
+      return "SurfWaterMass";
+    case VENVELOPEMASS:
+      return "EnvelopeMass";
+    case VOXYGENMASS:
+      return "OxygenMass";
+    case VOXYGENMANTLEMASS:
+      return "OxygenMantleMass";
+    case VLUMINOSITY:
+      return "Luminosity";
+    case VTEMPERATURE:
+      return "Temperature";
+    case VLOSTANGMOM:
+      return "LostAngMom";
+    case VLOSTENG:
+      return "LostEnergy";
+    case VICEMASS:
+      return "IceMass";
+    case VCBPR:
+      return "CBPR";
+    case VCBPPHI:
+      return "CBPPhi";
+    case VCBPZ:
+      return "CBPZ";
+    case VCBPRDOT:
+      return "CBPRDot";
+    case VCBPPHIDOT:
+      return "CBPPhiDot";
+    case VCBPZDOT:
+      return "CBPZDot";
+    case VLXUV:
+      return "LXUVFlare";
+    case VECCX:
+      return "EccX";
+    case VECCY:
+      return "EccY";
+    case VECCZ:
+      return "EccZ";
+    case VANGMX:
+      return "AngMX";
+    case VANGMY:
+      return "AngMY";
+    case VANGMZ:
+      return "AngMZ";
+    case VMEANL:
+      return "MeanL";
+    case VWATERMASSMOATM:
+      return "WaterMassMOAtm";
+    case VWATERMASSSOL:
+      return "WaterMassSol";
+    case VSURFTEMP:
+      return "SurfTemp";
+    case VPOTTEMP:
+      return "PotTemp";
+    case VSOLIDRADIUS:
+      return "SolidRadius";
+    case VOXYGENMASSMOATM:
+      return "OxygenMassMOAtm";
+    case VOXYGENMASSSOL:
+      return "OxygenMassSol";
+    case VHYDROGENMASSSPACE:
+      return "HydrogenMassSpace";
+    case VOXYGENMASSSPACE:
+      return "OxygenMassSpace";
+    case VCO2MASSMOATM:
+      return "CO2MassMOAtm";
+    case VCO2MASSSOL:
+      return "CO2MassSol";
+    default:
+      return "Unknown";
+  }
+}
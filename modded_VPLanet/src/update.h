@@ -28,6 +28,10 @@
 #define VNUM235UCORE 1135  // 235U in Core
 #define VNUM238UMAN 1140   // 238U in Mantle
 #define VNUM238UCORE 1145  // 238U in Core
+#define VNUM40KCRUST 1150   // 40K in Crust
+#define VNUM232THCRUST 1155 // 232Th in Crust
+#define VNUM235UCRUST 1160  // 235U in Crust
+#define VNUM238UCRUST 1165  // 238U in Crust
 
 // THERMINT
 #define VTMAN 1201  // Mantle Temperature
@@ -54,10 +58,10 @@
 #define VPOSITIONZ 1606 // Cartesian Z Position
 
 // ATMESC
-#define VSURFACEWATERMASS 1202 // Surface Water Mass
-#define VENVELOPEMASS 1203     // Envelope Mass
-#define VOXYGENMASS 1204       // Atmospheric Oxygen Mass
-#define VOXYGENMANTLEMASS 1205 // Mantle Oxygen Mass
+#define VSURFACEWATERMASS 1701 // Surface Water Mass
+#define VENVELOPEMASS 1702     // Envelope Mass
+#define VOXYGENMASS 1703       // Atmospheric Oxygen Mass
+#define VOXYGENMANTLEMASS 1704 // Mantle Oxygen Mass
 
 // STELLAR
 #define VLUMINOSITY 1502  // Luminosity
@@ -107,6 +111,7 @@
 void InitializeUpdateBodyPerts(CONTROL *, UPDATE *, int);
 void InitializeUpdateTmpBody(BODY *, CONTROL *, MODULE *, UPDATE *, int);
 void UpdateCopy(UPDATE *, UPDATE *, int);
+char *fsPrimaryVariableName(int);
 void InitializeUpdate(BODY *, CONTROL *, MODULE *, UPDATE *,
                       fnUpdateVariable ****);
 
@@ -53,14 +53,14 @@ int bFileExists(const char *filename) {
 void OverwriteExit(char cName[], char cFile[]) {
   fprintf(stderr, "ERROR: %s is false and %s exists.\n", cName, cFile);
   fprintf(stderr, "\tOveride with \"-f\" on the command line.\n");
-  exit(EXIT_INPUT);
+  VplanetExit(EXIT_INPUT);
 }
 
 /* XXX Should these be iLine+1? */
 void DoubleLineExit(char cFile1[], char cFile2[], int iLine1, int iLine2) {
   fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile1, iLine1 + 1);
   fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile2, iLine2 + 1);
-  exit(EXIT_INPUT);
+  VplanetExit(EXIT_INPUT);
 }
 
 void VerifyOrbitExit(char cName1[], char cName2[], char cFile1[], char cFile2[],
@@ -70,7 +70,7 @@ void VerifyOrbitExit(char cName1[], char cName2[], char cFile1[], char cFile2[],
     fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile1, iLine1);
     fprintf(stderr, "\tFile: %s, Line: %d.\n", cFile2, iLine2);
   }
-  exit(EXIT_INPUT);
+  VplanetExit(EXIT_INPUT);
 }
 
 void VerifyBodyExit(char cName1[], char cName2[], char cFile[], int iLine1,
@@ -81,7 +81,7 @@ void VerifyBodyExit(char cName1[], char cName2[], char cFile[], int iLine1,
             cName2);
     fprintf(stderr, "\tFile: %s, Lines: %d and %d\n", cFile, iLine1, iLine2);
   }
-  exit(EXIT_INPUT);
+  VplanetExit(EXIT_INPUT);
 }
 
 /** Print three lines that are in conflict
@@ -91,7 +91,7 @@ void VerifyBodyExit(char cName1[], char cName2[], char cFile[], int iLine1,
 void TripleLineExit(char cFile[], int iLine1, int iLine2, int iLine3) {
   fprintf(stderr, "\tFile: %s, Lines: %d, %d and %d.\n", cFile, iLine1, iLine2,
           iLine3);
-  exit(EXIT_INPUT);
+  VplanetExit(EXIT_INPUT);
 }
 
 /* Do we need both these? */
@@ -167,6 +167,81 @@ void VerifyNames(BODY *body, CONTROL *control, OPTIONS *options) {
  *
  */
 
+/**
+  Place body iBody where it receives the instellation of dSemiFromHZFlux, or
+  at the habitable zone limit of sSemiHZLimit, from the Baraffe luminosity and
+  effective temperature of the central star at dHZAge.
+ */
+void VerifySemiHZ(BODY *body, CONTROL *control, FILES files, OPTIONS *options,
+                  int iBody) {
+  int iFile = iBody + 1, iOpt, iOrbit;
+  int iaOrbit[3] = {OPT_ORBSEMI, OPT_ORBMEANMOTION, OPT_ORBPER};
+  double dAge, dLuminosity, dTemperature, daHZLimit[HZ_NUMLIMITS];
+
+  if (options[OPT_SEMIHZFLUX].iLine[iFile] > -1 &&
+      options[OPT_SEMIHZLIMIT].iLine[iFile] > -1) {
+    VerifyOrbitExit(options[OPT_SEMIHZFLUX].cName,
+                    options[OPT_SEMIHZLIMIT].cName, files.Infile[iFile].cIn,
+                    files.Infile[iFile].cIn,
+                    options[OPT_SEMIHZFLUX].iLine[iFile],
+                    options[OPT_SEMIHZLIMIT].iLine[iFile], control->Io.iVerbose);
+  }
+  if (options[OPT_SEMIHZFLUX].iLine[iFile] > -1) {
+    iOpt = OPT_SEMIHZFLUX;
+  } else {
+    iOpt = OPT_SEMIHZLIMIT;
+  }
+  for (iOrbit = 0; iOrbit < 3; iOrbit++) {
+    if (options[iaOrbit[iOrbit]].iLine[iFile] > -1) {
+      VerifyOrbitExit(options[iOpt].cName, options[iaOrbit[iOrbit]].cName,
+                      files.Infile[iFile].cIn, files.Infile[iFile].cIn,
+                      options[iOpt].iLine[iFile],
+                      options[iaOrbit[iOrbit]].iLine[iFile],
+                      control->Io.iVerbose);
+    }
+  }
+
+  if (!body[0].bStellar || body[0].iStellarModel != STELLAR_MODEL_BARAFFE) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr,
+              "ERROR: %s requires %s to use module STELLAR with %s BARAFFE.\n",
+              options[iOpt].cName, body[0].cName,
+              options[OPT_STELLARMODEL].cName);
+    }
+    LineExit(files.Infile[iFile].cIn, options[iOpt].iLine[iFile]);
+  }
+
+  if (options[OPT_HZAGE].iLine[iFile] > -1) {
+    dAge = body[iBody].dHZAge;
+  } else {
+    dAge = body[0].dAge;
+  }
+  dLuminosity  = fdLuminosityFunctionBaraffe(dAge, body[0].dMass);
+  dTemperature = fdTemperatureFunctionBaraffe(dAge, body[0].dMass);
+  if (isnan(dLuminosity) || isnan(dTemperature)) {
+    if (control->Io.iVerbose >= VERBERR) {
+      fprintf(stderr, "ERROR: The Baraffe tracks of %s do not reach age %e yr.\n",
+              body[0].cName, dAge / YEARSEC);
+    }
+    LineExit(files.Infile[iFile].cIn, options[iOpt].iLine[iFile]);
+  }
+
+  if (iOpt == OPT_SEMIHZFLUX) {
+    // Instellation is in units of Earth's, LSUN at 1 AU
+    body[iBody].dSemi =
+          sqrt(dLuminosity / (LSUN * body[iBody].dSemiHZFlux)) * AUM;
+  } else {
+    fvHabitableZoneKopparapu2013Limits(dLuminosity, dTemperature, daHZLimit);
+    body[iBody].dSemi = daHZLimit[body[iBody].iSemiHZLimit];
+  }
+
+  if (control->Io.iVerbose >= VERBINPUT) {
+    fprintf(stderr, "INFO: %s sets %s of %s to %e AU.\n", options[iOpt].cName,
+            options[OPT_ORBSEMI].cName, body[iBody].cName,
+            body[iBody].dSemi / AUM);
+  }
+}
+
 void VerifyOrbit(BODY *body, CONTROL *control, FILES files, OPTIONS *options,
                  int iBody) {
   int iFile    = iBody + 1, iVerbose;
@@ -179,6 +254,13 @@ void VerifyOrbit(BODY *body, CONTROL *control, FILES files, OPTIONS *options,
 
   iVerbose = control->Io.iVerbose;
 
+  /* Placing the orbit in the HZ counts as setting Semi */
+  if (options[OPT_SEMIHZFLUX].iLine[iFile] > -1 ||
+      options[OPT_SEMIHZLIMIT].iLine[iFile] > -1) {
+    VerifySemiHZ(body, control, files, options, iBody);
+    dSemi = body[iBody].dSemi;
+  }
+
   /* !!!!! ------ Semi IS ALWAYS CORRECT AND IN BODY[iBody] ------- !!!!!! */
 
   if (options[OPT_ORBSEMI].iLine[iFile] > -1 &&
@@ -248,7 +330,7 @@ void VerifyOrbit(BODY *body, CONTROL *control, FILES files, OPTIONS *options,
     fprintf(stderr, "ERROR: Must set one of %s, %s or %s.\n",
             options[OPT_ORBSEMI].cName, options[OPT_ORBMEANMOTION].cName,
             options[OPT_ORBPER].cName);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   /* If Semi set, was anything else? */
@@ -412,9 +494,11 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
     control->Evolve.iDir = 1;
   }
 
-  /* Check for file existence */
+  /* Check for file existence. Rows kept in memory never touch the files,
+     and a resumed run continues the files of the run it resumes. */
   for (iFile = 0; iFile < files->iNumInputs - 1; iFile++) {
-    if (bFileExists(files->Outfile[iFile].cOut)) {
+    if (control->Io.iOutputFormat != OUTPUTMEMORY && files->cRestart == NULL &&
+        bFileExists(files->Outfile[iFile].cOut)) {
       if (!control->Io.bOverwrite) {
         OverwriteExit(options[OPT_OVERWRITE].cName, files->Outfile[iFile].cOut);
       }
@@ -425,6 +509,25 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
     }
   }
 
+  /* Snapshots */
+  if (control->Io.dCheckpointTime > 0 && files->cCheckpoint == NULL) {
+    fvFormattedString(&files->cCheckpoint, "%s.checkpoint", system->cName);
+    if (control->Io.iVerbose >= VERBINPUT) {
+      fprintf(stderr, "INFO: %s not set, defaulting to %s.\n",
+              options[OPT_CHECKPOINTFILE].cName, files->cCheckpoint);
+    }
+  }
+  if (files->cRestart != NULL) {
+    CheckFileExists(files->cRestart);
+  }
+  if (control->Io.bProfile && !control->Io.bLog &&
+      control->Io.iVerbose >= VERBINPUT) {
+    fprintf(stderr,
+            "WARNING: %s set, but %s is not, so the profile will not be "
+            "written.\n",
+            options[OPT_PROFILE].cName, options[OPT_LOG].cName);
+  }
+
   /* Was DoBackward or DoForward NOT set? */
   if (!control->Evolve.bDoBackward && !control->Evolve.bDoForward) {
     for (iFile = 0; iFile < files->iNumInputs; iFile++) {
@@ -476,6 +579,10 @@ void VerifyIntegration(BODY *body, CONTROL *control, FILES *files,
     *fnOneStep = &EulerStep;
   } else if (control->Evolve.iOneStep == RUNGEKUTTA) {
     *fnOneStep = &RungeKutta4Step;
+  } else if (control->Evolve.iOneStep == DORMANDPRINCE) {
+    *fnOneStep = &DormandPrinceStep;
+  } else if (control->Evolve.iOneStep == ROSENBROCK) {
+    *fnOneStep = &RosenbrockStep;
   } else {
     /* Assign Default */
     fvFormattedString(&cTmp, options[OPT_INTEGRATIONMETHOD].cDefault);
@@ -546,7 +653,7 @@ void VerifyMassRad(BODY *body, CONTROL *control, OPTIONS *options, char cFile[],
               options[OPT_MASS].cName, options[OPT_RADIUS].cName,
               options[OPT_DENSITY].cName);
     }
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   /* Were all set? */
@@ -558,7 +665,7 @@ void VerifyMassRad(BODY *body, CONTROL *control, OPTIONS *options, char cFile[],
                      options[OPT_DENSITY].cName, options[OPT_MASS].iLine[iFile],
                      options[OPT_RADIUS].iLine[iFile],
                      options[OPT_DENSITY].iLine[iFile], cFile, iVerbose);
-    exit(EXIT_INPUT);
+    VplanetExit(EXIT_INPUT);
   }
 
   /* Was mass set? */
@@ -1167,7 +1274,7 @@ void VerifyOptions(BODY *body, CONTROL *control, FILES *files, MODULE *module,
     }
 
     /* Must allocate memory in control struct for all perturbing bodies */
-    if (control->Evolve.iOneStep == RUNGEKUTTA) {
+    if (control->Evolve.iOneStep != EULER) {
       InitializeUpdateBodyPerts(control, update, iBody);
       InitializeUpdateTmpBody(body, control, module, update, iBody);
     }
@@ -13,6 +13,7 @@ void VerifyTripleExit(char[], char[], char[], int, int, int, char[], int);
 void VerifyOptions(BODY *, CONTROL *, FILES *, MODULE *, OPTIONS *, OUTPUT *,
                    SYSTEM *, UPDATE *, fnIntegrate *, fnUpdateVariable ****);
 void VerifyDynEllip(BODY *, CONTROL *, OPTIONS *, char[], int, int);
+void VerifySemiHZ(BODY *, CONTROL *, FILES, OPTIONS *, int);
 int fbFloatComparison(double, double);
 void fnNullDerivatives(BODY *, EVOLVE *, MODULE *, UPDATE *,
                        fnUpdateVariable ***);
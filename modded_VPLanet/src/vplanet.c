@@ -21,6 +21,125 @@ const double dTINY = 1. / DBL_MAX; // This is the smallest possibled double
                                    // value according to <float.h>
 /* Do not change these values */
 
+THREADLOCAL INMEMORY *InMemory = NULL;
+
+/*!
+Read, verify and evolve the system described by sPrimaryFile. The options and
+outputs must already be initialized; runs only change the parts that
+InitializeFilesOptions and ReadOutputOrder reset, so the same tables can be
+reused by the next run. control->Io.iVerbose and bOverwrite hold any
+command-line overrides, or -1.
+ */
+void RunVplanet(CONTROL *control, FILES *files, OPTIONS *options,
+                OUTPUT *output, fnReadOption fnRead[], fnWriteOutput fnWrite[],
+                char *sPrimaryFile) {
+  int iBody;
+  UPDATE *update;
+  BODY *body;
+  MODULE module;
+  SYSTEM system;
+  fnUpdateVariable ***fnUpdate;
+  fnIntegrate fnOneStep;
+
+  control->sGitVersion=NULL;
+#ifdef GITVERSION
+  fvFormattedString(&control->sGitVersion, GITVERSION);
+#else
+  fvFormattedString(&control->sGitVersion, "Unknown");
+#endif
+
+  system.cName=NULL;
+
+  /* Set to IntegrationMethod to 0, so default can be
+     assigned if necessary */
+  control->Evolve.iOneStep = 0;
+
+  /* Read input files */
+  ReadOptions(&body, control, files, &module, options, output, &system,
+              &update, fnRead, sPrimaryFile);
+
+  if (control->Io.iVerbose >= VERBINPUT) {
+    printf("Input files read.\n");
+  }
+
+  /* An in-memory run keeps its rows and writes no files, except for a log
+     where the caller asked for one */
+  if (InMemory != NULL) {
+    control->Io.iOutputFormat = OUTPUTMEMORY;
+    if (InMemory->sLogFile != NULL) {
+      fvFormattedString(&files->cLog, "%s", InMemory->sLogFile);
+    }
+  }
+
+  /* Check that user options are mutually compatible */
+  VerifyOptions(body, control, files, &module, options, output, &system,
+                update, &fnOneStep, &fnUpdate);
+
+  if (control->Io.iVerbose >= VERBINPUT) {
+    printf("Input files verified.\n");
+  }
+
+  control->Evolve.dTime      = 0;
+  control->Evolve.bFirstStep = 1;
+  InitializeProfile(control, update);
+
+  if (control->Io.bLog) {
+    WriteLog(body, control, files, &module, options, output, &system, update,
+             fnUpdate, fnWrite, 0);
+    if (control->Io.iVerbose >= VERBPROG &&
+        (InMemory == NULL || InMemory->sLogFile != NULL)) {
+      printf("Log file written.\n");
+    }
+  }
+
+  /* Perform evolution */
+
+  if (control->Evolve.bDoForward || control->Evolve.bDoBackward) {
+    Evolve(body, control, files, &module, output, &system, update, fnUpdate,
+           fnWrite, fnOneStep);
+    FinishProfile(control);
+    FinishCheckpoint(control, files);
+    CloseOutput(control, files);
+    FinishReduce(control, files);
+    WriteReduce(control, files, &system, body);
+    if (InMemory == NULL) {
+      for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+        FreeReduce(&files->Outfile[iBody]);
+      }
+    }
+
+    /* If evolution performed, log final system parameters */
+    if (control->Io.bLog) {
+      WriteLog(body, control, files, &module, options, output, &system,
+               update, fnUpdate, fnWrite, 1);
+      if (control->Io.iVerbose >= VERBPROG &&
+          (InMemory == NULL || InMemory->sLogFile != NULL)) {
+        printf("Log file updated.\n");
+      }
+    }
+  }
+
+  FreeProfile(control, update);
+  FreeStateVector(control);
+  FreeBaraffeTrack(body, control->Evolve.iNumBodies);
+  FreeFilesOptions(files, options);
+
+  /* Hand the rows of an in-memory run back to the caller */
+  if (InMemory != NULL) {
+    InMemory->iNumBodies = control->Evolve.iNumBodies;
+    InMemory->Outfile    = files->Outfile;
+    InMemory->saBodyName = malloc(control->Evolve.iNumBodies * sizeof(char *));
+    for (iBody = 0; iBody < control->Evolve.iNumBodies; iBody++) {
+      InMemory->saBodyName[iBody] = NULL;
+      fvFormattedString(&InMemory->saBodyName[iBody], "%s", body[iBody].cName);
+    }
+  }
+
+  if (control->Io.iVerbose >= VERBPROG) {
+    printf("Simulation completed.\n");
+  }
+}
+
 /*!
 Actual implementation of the main function; called from in `int main()` below.
 We need this wrapper so we can call `main_impl` from Python.
@@ -54,25 +173,10 @@ int main_impl(int argc, char *argv[]) {
   OPTIONS *options;
   OUTPUT *output;
   CONTROL control;
-  UPDATE *update;
-  BODY *body;
-  MODULE module;
   FILES files;
-  SYSTEM system;
   char *sPrimaryFile = NULL;
   fnReadOption fnRead[MODULEOPTEND]; // XXX Pointers?
   fnWriteOutput fnWrite[MODULEOUTEND];
-  fnUpdateVariable ***fnUpdate;
-  fnIntegrate fnOneStep;
-
-  control.sGitVersion=NULL;
-#ifdef GITVERSION
-  fvFormattedString(&control.sGitVersion, GITVERSION);
-#else
-  fvFormattedString(&control.sGitVersion, "Unknown");
-#endif
-
-  system.cName=NULL;
 
   /** Must initialize all options and outputs for all modules
      independent of what is selected. This allows a complete
@@ -86,10 +190,6 @@ int main_impl(int argc, char *argv[]) {
   output = malloc(MODULEOUTEND * sizeof(OUTPUT));
   InitializeOutput(&files, output, fnWrite);
 
-  /* Set to IntegrationMethod to 0, so default can be
-     assigned if necessary */
-  control.Evolve.iOneStep = 0;
-
   /* Copy executable file name to the files struct. */
   files.cExe=NULL;
   fvFormattedString(&files.cExe, argv[0]);
@@ -99,7 +199,7 @@ int main_impl(int argc, char *argv[]) {
             "Usage: %s [-v, -verbose] [-q, -quiet] [-h, -help] [-H, -Help] "
             "<file>\n",
             argv[0]);
-    exit(EXIT_EXE);
+    VplanetExit(EXIT_EXE);
   }
 
   iVerbose              = -1;
@@ -132,7 +232,7 @@ int main_impl(int argc, char *argv[]) {
 
   if (iQuiet != -1 && iVerbose != -1) {
     fprintf(stderr, "ERROR: -v and -q cannot be set simultaneously.\n");
-    exit(EXIT_EXE);
+    VplanetExit(EXIT_EXE);
   }
 
   /* Now identify input file, usually vpl.in */
@@ -144,60 +244,18 @@ int main_impl(int argc, char *argv[]) {
 
   CheckFileExists(sPrimaryFile);
 
-  /* Read input files */
-  ReadOptions(&body, &control, &files, &module, options, output, &system,
-              &update, fnRead, sPrimaryFile);
-
-  if (control.Io.iVerbose >= VERBINPUT) {
-    printf("Input files read.\n");
-  }
-
-  /* Check that user options are mutually compatible */
-  VerifyOptions(body, &control, &files, &module, options, output, &system,
-                update, &fnOneStep, &fnUpdate);
-
-  if (control.Io.iVerbose >= VERBINPUT) {
-    printf("Input files verified.\n");
-  }
-
-  control.Evolve.dTime      = 0;
-  control.Evolve.bFirstStep = 1;
-
-  if (control.Io.bLog) {
-    WriteLog(body, &control, &files, &module, options, output, &system, update,
-             fnUpdate, fnWrite, 0);
-    if (control.Io.iVerbose >= VERBPROG) {
-      printf("Log file written.\n");
-    }
-  }
-
-  /* Perform evolution */
-
-  if (control.Evolve.bDoForward || control.Evolve.bDoBackward) {
-    Evolve(body, &control, &files, &module, output, &system, update, fnUpdate,
-           fnWrite, fnOneStep);
-
-    /* If evolution performed, log final system parameters */
-    if (control.Io.bLog) {
-      WriteLog(body, &control, &files, &module, options, output, &system,
-               update, fnUpdate, fnWrite, 1);
-      if (control.Io.iVerbose >= VERBPROG) {
-        printf("Log file updated.\n");
-      }
-    }
-  }
+  RunVplanet(&control, &files, options, output, fnRead, fnWrite, sPrimaryFile);
 
   // gettimeofday(&end, NULL);
+  // printf("Total time: %.4e [sec]\n",
+  // difftime(end.tv_usec,start.tv_usec)/1e6);
 
-  if (control.Io.iVerbose >= VERBPROG) {
-    printf("Simulation completed.\n");
-    // printf("Total time: %.4e [sec]\n",
-    // difftime(end.tv_usec,start.tv_usec)/1e6);
-  }
-  exit(0);
+  /* Return rather than exit so that the Python interface can call main_impl
+     repeatedly from the same interpreter. */
+  return 0;
 }
 
 
 int main(int argc, char *argv[]) {
-  main_impl(argc, argv);
+  return main_impl(argc, argv);
 }
@@ -15,6 +15,8 @@
 #include <ctype.h>
 #include <float.h>
 #include <math.h>
+#include <setjmp.h>
+#include <signal.h>
 #include <stdio.h>
 #include <stdlib.h>
 #include <stdarg.h>
@@ -29,13 +31,35 @@
 // Windows-specific
 #ifdef VPLANET_ON_WINDOWS
 #define unlink _unlink
+#define THREADLOCAL __declspec(thread)
+#define NORETURN __declspec(noreturn)
 #else
 #include <unistd.h>
+#define THREADLOCAL _Thread_local
+#define NORETURN _Noreturn
 #endif
 #ifndef M_PI
 #define M_PI 3.14159265358979323846
 #endif
 
+/* In the Python extension, every allocation and open file is recorded in
+   the in-memory run that made it, so that the run can release them all when
+   it ends, even if VplanetExit jumped out of it. See RUNMEMORY. */
+#ifdef VPLANET_PYTHON_INTERFACE
+void *RunMalloc(size_t);
+void *RunCalloc(size_t, size_t);
+void *RunRealloc(void *, size_t);
+void RunFree(void *);
+FILE *RunFopen(const char *, const char *);
+int RunFclose(FILE *);
+#define malloc(iSize) RunMalloc(iSize)
+#define calloc(iNum, iSize) RunCalloc(iNum, iSize)
+#define realloc(pMem, iSize) RunRealloc(pMem, iSize)
+#define free(pMem) RunFree(pMem)
+#define fopen(cFile, cMode) RunFopen(cFile, cMode)
+#define fclose(fp) RunFclose(fp)
+#endif
+
 /*! Top-level declarations */
 
 /* Implemented Moduules
@@ -170,11 +194,16 @@ typedef struct EVOLVE EVOLVE;
 typedef struct FILES FILES;
 typedef struct HALT HALT;
 typedef struct INFILE INFILE;
+typedef struct INMEMORY INMEMORY;
+typedef struct INPUTINDEX INPUTINDEX;
 typedef struct IO IO;
 typedef struct MODULE MODULE;
 typedef struct OPTIONS OPTIONS;
 typedef struct OUTFILE OUTFILE;
 typedef struct OUTPUT OUTPUT;
+typedef struct PROFILE PROFILE;
+typedef struct RUNBLOCK RUNBLOCK;
+typedef struct RUNMEMORY RUNMEMORY;
 typedef struct SYSTEM SYSTEM;
 typedef struct UNITS UNITS;
 typedef struct UPDATE UPDATE;
@@ -217,6 +246,9 @@ struct BODY {
   double dMeanMotion; /**< Body's Mean Motion */
   double dOrbPeriod;  /**< Body's Orbital Period */
   double dEccSq;      /**< Eccentricity squared */
+  double dSemiHZFlux; /**< Instellation at which to place the orbit */
+  int iSemiHZLimit;   /**< HZ limit at which to place the orbit */
+  double dHZAge;      /**< Stellar age at which the orbit is placed */
 
   /* ATMESC Parameters */
   int bAtmEsc;        /**< Apply Module ATMESC? */
@@ -253,6 +285,9 @@ struct BODY {
   double dRGDuration;    /**< Duration of runaway greenhouse phase */
   double dKTide;         /**< Tidal enhancement factor for mass loss */
   double dMinKTide;      /**< Minimum allowed value for KTide */
+  char *cFileMagMomTrack; /**< File with the tabulated magnetic moment */
+  double *daMagMomTrack;  /**< Rows of Age and MagMom from cFileMagMomTrack */
+  int iMagMomTrackRows;   /**< Number of rows in daMagMomTrack */
   double dAtmEscXi;      /**< Ratio of Roche radius to XUV radius */
   double dMDotWater;     /**< Water mass loss rate */
   double dFHRef;         /**< Reference hydrogen escape value */
@@ -426,6 +461,7 @@ struct BODY {
 
   /* RADHEAT Parameters: H = Const*exp[-Time/HalfLife] */
   int bRadheat;          /**< Apply Module RADHEAT? */
+  int bExplicitRadheat;  /**< Radiogenic species explicit functions of age? */
   double d26AlConstMan;  /**< Body's Mantle 26Al Decay Constant */
   double d26AlMassMan;   /**< Body's Mantle Mass of 26Al */
   double d26AlNumMan;    /**< Body's Mantle Number of 26Al Atoms */
@@ -624,6 +660,14 @@ struct BODY {
   double dLuminosityAmplitude;
   double dLuminosityFrequency;
   double dLuminosityPhase;
+  double *daBaraffeTrack;   /**< Baraffe grid collapsed onto dBaraffeMass */
+  double dBaraffeMass;      /**< Mass at which daBaraffeTrack was built */
+  double dBaraffeAge;       /**< Age of the values in daBaraffeValue */
+  double daBaraffeValue[4]; /**< T, L, R and RG at dBaraffeAge */
+  int iBaraffeAge;          /**< Age cell of the last Baraffe lookup */
+  char *cFileStellarTrack;  /**< File with the tabulated stellar evolution */
+  double *daStellarTrack;   /**< Rows of STELLAR_TRACK_NCOL track values */
+  int iStellarTrackRows;    /**< Number of rows in daStellarTrack */
 
   // Added by Nathaniel Tanglin 11/16/25
   // Used for magnetic shielding near line 1733 of atmesc.c
@@ -1650,6 +1694,13 @@ struct UPDATE {
   double *pdDsemiDtEqSt;
 };
 
+/* Events whose crossing times are recorded during the integration */
+#define EVENT_SURFACEDESICCATED 0
+#define EVENT_ENVELOPEGONE 1
+#define EVENT_INNERCORENUCLEATED 2
+#define EVENT_DYNAMOSHUTDOWN 3
+#define NUMEVENTS 4
+
 struct HALT {
   int iNumHalts;        /**< Total Number of Halts */
   int bMerge;           /**< Halt for Merge? */
@@ -1716,6 +1767,12 @@ struct HALT {
                                system) */
   int bHaltAllPlanetsDesicc; /**< Halt if all planets desiccated (for
                                 multiplanet system) */
+
+  /* EVENTS */
+  int bEvent[NUMEVENTS];         /**< Record the time of this event? */
+  double dEventTime[NUMEVENTS];  /**< Time the event occurred, -1 if not yet */
+  double dEventValue[NUMEVENTS]; /**< Event function at the last check */
+  int bHaltEvents; /**< Halt once all recorded events have occurred? */
 };
 
 /* Units. These can be different for different bodies. If set
@@ -1750,6 +1807,7 @@ struct EVOLVE {
   double dStopTime; /**< Integration Stop Time */
   double dTimeStep; /**< Integration Time step */
   int bVarDt;       /**< Use Variable Timestep? */
+  int bDenseOutput; /**< Interpolate output between steps? */
   int iTotalSteps;  /**< Total Number of Steps */
   int iStepsSinceLastOutput;
   double dMinValue;  /**< Minimum Value for Eccentricity and Obliquity to be
@@ -1767,6 +1825,52 @@ struct EVOLVE {
                         the equation number.  */
   double ****daDerivProc; /**< Derivatives over a timestep */
 
+  /* RK4 keeps all primary variables in one contiguous state vector */
+  int iNumStateVars;        /**< Number of primary variables of all bodies */
+  int iNumStateEqns;        /**< Number of equations of all bodies */
+  double *daState;          /**< Primary variables at the start of a step */
+  double **pdStateVar;      /**< Home of each primary variable in body */
+  double **pdStateTmpVar;   /**< Home of each primary variable in tmpBody */
+  int *bStateValue;         /**< Is the derivative the variable's new value? */
+  int iNumStages;           /**< Number of stages of the integration method */
+  double *daStateDeriv;     /**< Derivatives of each stage, stage-major */
+  double *daStateDerivProc; /**< Derivatives of each process, stage-major */
+
+  /* Error control of adaptive methods */
+  double dRelTol;     /**< Relative error tolerance per step */
+  double dScaleTol;   /**< Error tolerance per step, as a fraction of the
+                         largest magnitude of each variable so far */
+  double dNextDt;     /**< Timestep proposed by the error control */
+  int *bStateControl; /**< Does the variable take part in error control? */
+  double *daStateScale; /**< Largest magnitude of each variable so far */
+  int bStateEndValid;   /**< Can the last stage start the next step? */
+  double *daStateEnd;   /**< State at which the last stage was evaluated */
+  double (**fnStateEnd)(BODY *, SYSTEM *,
+                        int *); /**< Equations of the last stage */
+  int iNumRejectedSteps;        /**< Number of rejected steps */
+  double *daStateErr;           /**< Error estimate of the last step */
+
+  /* Rosenbrock */
+  double **daJacobian;  /**< Finite-difference Jacobian of the derivatives */
+  double **daRosenW;    /**< Iteration matrix I - gamma*dt*Jacobian */
+  double **daRosenLU;   /**< LU decomposition of daRosenW */
+  double *daRosenRowScale; /**< Row scale factors of the LU decomposition */
+  int *iaRosenSwap;     /**< Row swaps of the LU decomposition */
+  double *daRosenK;     /**< Stage increments, stage-major */
+  double *daTimeDeriv;  /**< Explicit time derivative of the derivatives */
+
+  /* Dense output */
+  double dDenseTime0;     /**< Time at the start of the last step */
+  double dDenseTime1;     /**< Time of the bodies saved at the end */
+  double dDenseStep;      /**< Length of the step */
+  int bDenseSaved;        /**< Has the end of the step been saved? */
+  double *daDenseState0;  /**< Primary variables at the start of the step */
+  double *daDenseDeriv0;  /**< Their derivatives at the start of the step */
+  double *daDenseState1;  /**< Primary variables at the end of the step */
+  double *daDenseDeriv1;  /**< Their derivatives at the end of the step */
+  double *daDenseProc;    /**< Derivatives of each process at the end */
+  BODY *denseBody;        /**< Bodies at the end of the step */
+
   // Module-specific parameters
   int *iNumModules; /**< Number of Modules per Primary Variable */
 
@@ -1799,8 +1903,16 @@ struct IO {
                    4=units; 5=all */
   double dOutputTime; /**< Integration Output Interval */
   double dNextOutput; /**< Time of next output */
+  double dNextReduce; /**< Time of next @ reducer, or dHUGE */
+  double dCheckpointTime; /**< Interval between snapshots, 0 for none */
+  double dNextCheckpoint; /**< Time of next snapshot, or dHUGE */
+  int bTermHandlerSet; /**< Does the run catch SIGTERM? */
+  void (*fnPrevTermHandler)(int); /**< SIGTERM handler before the run */
+  double *daCheckpointCarried; /**< Module properties before the last update
+                                  of the auxiliary properties */
 
   int bLog; /**< Write Log File? */
+  int bProfile; /**< Count and time the work of the integration? */
 
   /* Output Notation */
   int iDigits; /**< Number of Digits After Decimal */
@@ -1808,6 +1920,8 @@ struct IO {
                   Notation */
 
   int bOverwrite; /**< Allow files to be overwritten? */
+  int iOutputFormat; /**< Format of output: OUTPUTTEXT, OUTPUTBINARY or
+                        OUTPUTMEMORY */
 
   /* The following record whether an error message that should only be reported
      once has been printed. */
@@ -1823,6 +1937,32 @@ struct IO {
   int *baEnterHZMessage; /**< Has the Entering the HZ message been printed? */
 };
 
+/* Sections of the integration timed by PROFILE */
+#define PROFILEPROPSAUX 0
+#define PROFILEFORCE 1
+#define PROFILEHALT 2
+#define PROFILEOUTPUT 3
+#define PROFILENUMSECTIONS 4
+
+/* Timesteps are counted by decade of seconds, from 10^PROFILEMINDECADE */
+#define PROFILEMINDECADE -10
+#define PROFILENUMDECADES 41
+
+/* PROFILE counts and times the work of a run with bProfile set. The first
+   indices of the equation arrays are those of UPDATE: body, primary variable
+   and equation. Times are wall-clock seconds. */
+
+struct PROFILE {
+  long long ***laNumDerivs; /**< Evaluations of each equation */
+  double ***daDerivTime;    /**< Time spent evaluating each equation */
+  long long **laNumLimits;  /**< Times each variable set the timescale */
+  long long laNumSection[PROFILENUMSECTIONS]; /**< Calls of each section */
+  double daSectionTime[PROFILENUMSECTIONS];   /**< Time spent in each section */
+  long long laNumSteps[PROFILENUMDECADES]; /**< Steps in each decade of dt */
+  double dEvolveStart; /**< Clock when the integration started */
+  double dEvolveTime;  /**< Duration of the integration */
+};
+
 /* The CONTROL struct contains all the parameters that
  * control program flow. */
 /* CONTROL contains all parameters that control program flow, including I/O,
@@ -1844,6 +1984,7 @@ struct CONTROL {
   EVOLVE Evolve;
   HALT *Halt;
   IO Io;
+  PROFILE Profile;
   UNITS *Units;
 
   char *sGitVersion;
@@ -1924,6 +2065,22 @@ struct INFILE {
   /* Array of Vapor pressure file */
 };
 
+/* An input file read into memory once, with a hash table from the first word
+   of every uncommented line to that line, so that options can be looked up
+   without rereading the file. */
+
+struct INPUTINDEX {
+  char *cFile;       /**< File Name */
+  int iNumLines;     /**< Number of Lines */
+  char **saLine;     /**< Lines, as read by fgets */
+  int *iaNextValid;  /**< Next line at or after each that is not blank,
+                          a comment or starts with $ */
+  int iNumSlots;     /**< Size of the hash table, a power of 2 */
+  char **saKey;      /**< First word of the line in each slot, or NULL */
+  int *iaKeyLine;    /**< First line starting with the key */
+  int *iaKeyDupLine; /**< Second line starting with the key, or -1 */
+};
+
 /* The OUTFILE struct contains all the information
  * regarding the output files. */
 
@@ -1935,8 +2092,83 @@ struct OUTFILE {
   int bNeg[MODULEOUTEND];            /**< Use Negative Option Units? */
   int iNumGrid;                      /**< Number of grid outputs */
   char *caGrid[MODULEOUTEND]; /**< Gridded output name */
+  FILE *fp; /**< Open handle for output (NULL until first write) */
+
+  /* Output plan, resolved from caCol and caGrid by InitializeOutputPlan */
+  int iNumPlan;      /**< Number of outputs written in each row */
+  int *iaPlanOut;    /**< Output index of each planned output */
+  char **saPlanUnit; /**< Unit string of each planned output */
+  int iNumRowCols;   /**< Number of columns in each row */
+  double *daRow;     /**< Row buffer */
+  int *iaGridOut;    /**< Output index of each gridded output, -1 if none */
+
+  /* Rows kept in memory when iOutputFormat is OUTPUTMEMORY */
+  int iNumRows;      /**< Number of rows kept */
+  int iMaxRows;      /**< Number of rows allocated */
+  double *daRows;    /**< Rows, iNumRowCols doubles each */
+  char **saColName;  /**< Name of each column */
+  char **saColUnit;  /**< Unit of each column, from the first row */
+
+  /* Reducers, which condense one output into one number per run */
+  int iNumReduce;          /**< Number of reducers */
+  char **saReduceName;     /**< Name of each reducer, e.g. MagMom:argmin */
+  char **saReduceUnit;     /**< Unit of each result */
+  int *iaReduceOut;        /**< Output index of each reducer */
+  int *iaReduceOp;         /**< Operation of each reducer, REDUCE_* */
+  int *baReduceNeg;        /**< Use the output's negative units? */
+  int *baReduceDone;       /**< Is the result final? */
+  double *daReduceTime;    /**< Time of an @ reducer */
+  double *daReduceInitial; /**< Value at the start of the integration */
+  double *daReduceLast;    /**< Value at the end of the latest step */
+  double *daReduceExtreme; /**< Extreme value so far, for argmin/argmax */
+  double *daReduceResult;  /**< Result, in the output or time units */
 };
 
+/* What an in-memory run has allocated and opened and not yet released.
+   Each allocation starts with a RUNBLOCK, which links it to the others. */
+
+struct RUNBLOCK {
+  RUNBLOCK *pPrev;    /**< Previous allocation of the run */
+  RUNBLOCK *pNext;    /**< Next allocation of the run */
+  RUNMEMORY *memory;  /**< Run that owns the allocation, or NULL */
+  long double dAlign; /**< Aligns the allocation that follows */
+};
+
+struct RUNMEMORY {
+  RUNBLOCK *pFirst; /**< Latest allocation still in use */
+  FILE **fpaOpen;   /**< Files still open */
+  int iNumOpen;     /**< Number of files still open */
+  int iMaxOpen;     /**< Room in fpaOpen */
+};
+
+/* A run started in-process with its input files held in memory. Fatal
+   errors jump back to jbExit instead of exiting, and the forward/backward
+   rows stay in each OUTFILE, which is handed back when the run finishes.
+   Everything the run allocated is released by FreeRunMemory. */
+
+struct INMEMORY {
+  int iNumFiles;      /**< Number of input files held in memory */
+  char **saFileName;  /**< Name of each input file */
+  char **saFileText;  /**< Contents of each input file */
+  jmp_buf jbExit;     /**< Where VplanetExit returns to */
+  int iExitStatus;    /**< Status passed to VplanetExit */
+  int iNumBodies;     /**< Number of bodies, set when the run finishes */
+  char **saBodyName;  /**< Name of each body */
+  OUTFILE *Outfile;   /**< Output rows of each body */
+  char *sLogFile;     /**< Where to write the log, or NULL for no log */
+
+  /* A streamed run hands each row to fnStream instead of keeping it. The
+     arguments are pStream, the body's index and name, and its OUTFILE, whose
+     daRow holds the row. Returning 0 stops the run. */
+  int (*fnStream)(void *, int, char *, OUTFILE *);
+  void *pStream; /**< Passed to fnStream */
+
+  RUNMEMORY Memory; /**< Allocations and files of the run */
+};
+
+/* The in-memory run on this thread, or NULL for a command-line run */
+extern THREADLOCAL INMEMORY *InMemory;
+
 
 /* The FILES struct contains all the information
  * regarding every file. */
@@ -1945,6 +2177,8 @@ struct FILES {
   char *cExe;        /**< Name of Executable */
   OUTFILE *Outfile;       /**< Output File Name for Forward Integration */
   char *cLog; /**< Log File Name (+4 to allow for ".log" suffix) */
+  char *cCheckpoint; /**< Snapshot File Name, or NULL for none */
+  char *cRestart;    /**< Snapshot to resume from, or NULL */
   INFILE *Infile;
   int iNumInputs; /**< Number of Input Files */
 };
@@ -2381,6 +2615,7 @@ typedef void (*fnIntegrate)(BODY *, CONTROL *, SYSTEM *, UPDATE *,
 
 /* Top-level files */
 #include "body.h"
+#include "checkpoint.h"
 #include "control.h"
 #include "evolve.h"
 #include "halt.h"
@@ -0,0 +1,95 @@
+import os
+
+import astropy.units as u
+import numpy as np
+import pytest
+import vplanet
+from benchmark import Benchmark, benchmark
+from vplanet import vplanet_core as core
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+# Writing snapshots leaves the run as it was in DenseOutput
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.sun.RotPer": {"value": 2.558991e06, "unit": u.sec},
+        "log.final.earth.TMan": {"value": 2260.137634},
+        "log.final.earth.TCore": {"value": 4997.105909, "unit": u.K},
+        "log.final.earth.RIC": {"value": 1.263341e06},
+        "log.final.earth.OxygenMass": {"value": 4.595047e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_Checkpoint(Benchmark):
+    pass
+
+
+def resumed_config():
+    # The same inputs, resumed in memory from the snapshot of the run above
+    config = {}
+    for name in ("vpl.in", "sun.in", "earth.in"):
+        with open(os.path.join(PATH, name)) as f:
+            config[name] = f.read()
+    config["vpl.in"] = config["vpl.in"].replace("iVerbose                  5", "")
+    config["vpl.in"] = config["vpl.in"].replace(
+        "dCheckpointTime           2e9", "sRestartFile sol.checkpoint"
+    )
+    return config
+
+
+def test_CheckpointFile(vplanet_output):
+    # The last snapshot, at the first step end after 4 Gyr, replaced the first
+    with open(os.path.join(PATH, "sol.checkpoint"), "rb") as f:
+        assert f.read(8) == b"VPLCKPT2"
+    assert not os.path.exists(os.path.join(PATH, "sol.checkpoint.tmp"))
+
+
+def test_Resume(vplanet_output, monkeypatch):
+    monkeypatch.chdir(PATH)
+    config = resumed_config()
+    output = core.simulate(config)
+    config["vpl.in"] = config["vpl.in"].replace("sRestartFile sol.checkpoint", "")
+    full = core.simulate(config)
+
+    # Rows continue where the snapshot left off, exactly as if the run had
+    # not been stopped
+    for body in ("sun", "earth"):
+        rows = output[body]["rows"]
+        assert rows[0, 0] == 4.01e9
+        assert np.array_equal(rows, full[body]["rows"][-len(rows) :])
+
+
+def test_Fork(vplanet_output, monkeypatch):
+    # Variants branch from the one snapshot, each with its own stop time
+    monkeypatch.chdir(PATH)
+    base = resumed_config()
+    base["vpl.in"] = dict(
+        line.split(None, 1) for line in base["vpl.in"].splitlines() if line.strip()
+    )
+    short, long = (
+        core.simulate(dict(base, **{"vpl.in": dict(base["vpl.in"], dStopTime=stop)}))[
+            "earth"
+        ]["rows"]
+        for stop in (4.2e9, 4.5e9)
+    )
+    assert short[0, 0] == long[0, 0] == 4.01e9
+    assert short[-1, 0] == 4.2e9
+    assert long[-1, 0] == 4.5e9
+    # Both take the same steps until the short one cuts its last step at its
+    # stop time; the rows within that step are interpolated differently. The
+    # last row of a run is written before the auxiliary properties catch up
+    # with its last step.
+    assert np.array_equal(short[:-3], long[: len(short) - 3])
+    assert np.allclose(short[-3:-1], long[len(short) - 3 : len(short) - 1], rtol=1e-4)
+    assert np.allclose(short[-1], long[len(short) - 1], rtol=5e-3)
+
+
+def test_RestartMismatch(vplanet_output, monkeypatch):
+    # A snapshot only resumes the system that wrote it
+    monkeypatch.chdir(PATH)
+    config = resumed_config()
+    config["earth.in"] = config["earth.in"].replace("sName earth", "sName mars")
+    with pytest.raises(vplanet.VPLANETError):
+        core.simulate(config)
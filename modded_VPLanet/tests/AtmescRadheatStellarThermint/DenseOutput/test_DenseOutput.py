@@ -0,0 +1,78 @@
+import os
+
+import astropy.units as u
+import numpy as np
+from benchmark import Benchmark, benchmark
+
+from vplanet import vplanet_core as core
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.sun.RotPer": {"value": 2.558991e06, "unit": u.sec},
+        "log.final.earth.TMan": {"value": 2260.137634},
+        "log.final.earth.TCore": {"value": 4997.105909, "unit": u.K},
+        "log.final.earth.RIC": {"value": 1.263341e06},
+        "log.final.earth.OxygenMass": {"value": 4.595047e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_DenseOutput(Benchmark):
+    pass
+
+
+def simulate(earth="", **options):
+    # The run above in memory, with the primary variables as output, the
+    # options of vpl.in replaced and earth's added to
+    config = {}
+    for name in ("vpl.in", "sun.in", "earth.in"):
+        with open(os.path.join(PATH, name)) as f:
+            config[name] = f.read()
+    lines = config["vpl.in"].split("\n")
+    lines = [line for line in lines if line.split()[:1] not in [["iVerbose"]]]
+    options["iVerbose"] = 0
+    config["vpl.in"] = "\n".join(
+        line for line in lines if line.split()[:1] not in [[k] for k in options]
+    )
+    config["vpl.in"] += "".join("\n%s %s" % item for item in options.items())
+    config["sun.in"] = config["sun.in"].split("saOutputOrder")[0]
+    config["sun.in"] += "saOutputOrder Time -RotPer -Luminosity\n"
+    config["earth.in"] = config["earth.in"].replace("bHaltSurfaceDesiccated 0", "")
+    config["earth.in"] = config["earth.in"].split("# Output options")[0]
+    config["earth.in"] += "saOutputOrder Time TMan TCore -SurfWaterMass\n"
+    config["earth.in"] += earth
+    output = core.simulate(config)
+    return {body: output[body]["rows"] for body in ("sun", "earth")}
+
+
+def test_DenseMatchesSteps():
+    # Interpolated rows agree with a run whose steps end on every output, to
+    # the accuracy of the integration. The luminosity is set from the age, so
+    # it is recomputed at each output rather than interpolated.
+    dense = simulate()
+    steps = simulate(bDenseOutput=0)
+    for body in ("sun", "earth"):
+        assert np.array_equal(dense[body][:, 0], steps[body][:, 0])
+        assert np.allclose(dense[body], steps[body], rtol=1e-3, atol=1e-10)
+    assert np.allclose(dense["sun"][:, 2], steps["sun"][:, 2], rtol=1e-12)
+
+
+def test_DenseCadence():
+    # Interpolating never changes the integration: the rows at the times a
+    # coarser cadence shares, and the final state, are bit for bit the same
+    dense = simulate()
+    coarse = simulate(dOutputTime=1e8)
+    for body in ("sun", "earth"):
+        assert np.array_equal(dense[body][::10], coarse[body])
+
+
+def test_DenseHalt():
+    # The last row of a halted run is the end of the step that halted, after
+    # the rows interpolated within it
+    earth = simulate(earth="bHaltSurfaceDesiccated 1\n")["earth"]
+    assert np.all(np.diff(earth[:, 0]) > 0)
+    assert earth[-2, 3] > 0
+    assert earth[-1, 3] == 0
@@ -0,0 +1,17 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.sun.RotPer": {"value": 2.559040e06, "unit": u.sec},
+        "log.final.earth.TMan": {"value": 2260.112018},
+        "log.final.earth.TCore": {"value": 4997.053250, "unit": u.K},
+        "log.final.earth.RIC": {"value": 1.264102e06},
+        "log.final.earth.OxygenMass": {"value": 4.595047e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_DormandPrince(Benchmark):
+    pass
@@ -0,0 +1,29 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.initial.earth.DesiccatedTime": {"value": -1.000000, "unit": u.sec},
+        "log.initial.earth.EnvelopeGoneTime": {"value": -1.000000, "unit": u.sec},
+        "log.initial.earth.InnerCoreTime": {"value": -1.000000, "unit": u.sec},
+        "log.initial.earth.DynamoShutdownTime": {"value": -1.000000, "unit": u.sec},
+        "log.final.system.Time": {"value": 1.232941e17, "unit": u.sec, "rtol": 1e-4},
+        "log.final.earth.DesiccatedTime": {
+            "value": 2.237384e15,
+            "unit": u.sec,
+            "rtol": 1e-4,
+        },
+        "log.final.earth.EnvelopeGoneTime": {"value": -1.000000, "unit": u.sec},
+        "log.final.earth.InnerCoreTime": {
+            "value": 1.232932e17,
+            "unit": u.sec,
+            "rtol": 1e-4,
+        },
+        "log.final.earth.DynamoShutdownTime": {"value": -1.000000, "unit": u.sec},
+        "log.final.earth.RIC": {"value": 1.415406e04, "rtol": 1e-2},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_EventTimes(Benchmark):
+    pass
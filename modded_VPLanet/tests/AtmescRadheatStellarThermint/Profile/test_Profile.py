@@ -0,0 +1,50 @@
+import astropy.units as u
+import numpy as np
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.earth.OxygenMass": {"value": 4.595047e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_Profile(Benchmark):
+    pass
+
+
+def test_Profile(vplanet_output):
+    profile = vplanet_output.profile
+    assert profile is vplanet_output.log.profile
+
+    # Every accepted step lands in one decade of the timestep histogram
+    assert profile.Steps == 814
+    assert profile.RejectedSteps == 206
+    assert profile.TimeSteps.Steps.sum() == profile.Steps
+    assert np.all(np.diff(profile.TimeSteps.Decade) > 0)
+
+    assert list(profile.Sections.Section) == [
+        "PropertiesAuxiliary",
+        "ForceBehavior",
+        "CheckHalt",
+        "WriteOutput",
+    ]
+    assert profile.Sections.Calls[1] == profile.Steps
+    assert profile.Sections.Calls[2] == profile.Steps
+
+    # One equation per primary variable, each called once per derivative
+    equations = profile.Equations
+    assert len(equations) == 25
+    assert np.all(equations.Calls == equations.Calls[0])
+    assert "earth" in equations.Body and "sun" in equations.Body
+    assert list(profile.Variables.Variable) == list(equations.Variable)
+
+    # The module totals add up their equations
+    for row in profile.Modules:
+        mask = (equations.Body == row.Body) & (equations.Module == row.Module)
+        assert row.Calls == equations.Calls[mask].sum()
+
+    # Some variable set the length of each variable step
+    assert profile.Variables.Limits.sum() >= 1
+    assert profile.Variables.Limits.sum() <= profile.Steps + profile.RejectedSteps
@@ -0,0 +1,65 @@
+import os
+
+import astropy.units as u
+import numpy as np
+from benchmark import Benchmark, benchmark
+
+from vplanet import vplanet_core as core
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.earth.OxygenMass": {"value": 4.595047e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_Reduce(Benchmark):
+    pass
+
+
+def test_ReduceFile(vplanet_output):
+    # One line of name, value and unit per reducer; earth writes no forward file
+    with open(os.path.join(PATH, "sol.reduce")) as f:
+        reduce = {line.split()[0]: line.split()[1:] for line in f}
+    assert not os.path.exists(os.path.join(PATH, "sol.earth.forward"))
+    assert list(reduce) == [
+        "earth.TMan@1e9",
+        "earth.-MagMom:min",
+        "earth.MagMom:argmin",
+        "earth.SurfWaterMass:firstzero",
+        "earth.-SurfWaterMass:loss",
+        "earth.OxygenMass:final",
+        "earth.-TCore:max",
+    ]
+    assert np.isclose(float(reduce["earth.TMan@1e9"][0]), 2414.958279)
+    assert reduce["earth.-MagMom:min"] == ["0.908788", "EMAGMOM"]
+    assert reduce["earth.MagMom:argmin"] == ["3.930000e+09", "year"]
+    assert reduce["earth.SurfWaterMass:firstzero"] == ["7.122561e+07", "year"]
+    assert reduce["earth.-SurfWaterMass:loss"] == ["1.000000", "TO"]
+    assert reduce["earth.-TCore:max"] == ["6000.000000", "K"]
+
+
+def test_ReduceMatchesOutput():
+    # The same run in memory, with the time series kept to check against
+    config = {}
+    for name in ("vpl.in", "sun.in", "earth.in"):
+        with open(os.path.join(PATH, name)) as f:
+            config[name] = f.read()
+    config["vpl.in"] = config["vpl.in"].replace("iVerbose                  5", "")
+    config["earth.in"] += "\nsaOutputOrder Time TMan -SurfWaterMass MagMom\n"
+    earth = core.simulate(config)["earth"]
+    time, tman, water, magmom = earth["rows"].T
+    reduce = earth["reduce"]
+
+    # Interpolated within a step exactly as the dense output is
+    assert reduce["TMan@1e9"] == tman[time == 1e9][0]
+    assert reduce["-SurfWaterMass:loss"] == water[0] - water[-1]
+    assert time[water > 0][-1] < reduce["SurfWaterMass:firstzero"]
+    assert reduce["SurfWaterMass:firstzero"] < time[water == 0][0]
+
+    # Extremes include the interpolated output times, not just the step ends
+    assert reduce["MagMom:argmin"] == time[np.argmin(magmom)]
+    assert earth["reduce_units"]["MagMom:argmin"] == "year"
@@ -0,0 +1,17 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.sun.RotPer": {"value": 2.558913e06, "unit": u.sec},
+        "log.final.earth.TMan": {"value": 2259.217813},
+        "log.final.earth.TCore": {"value": 4995.891182, "unit": u.K},
+        "log.final.earth.RIC": {"value": 1.280803e06},
+        "log.final.earth.OxygenMass": {"value": 4.595148e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_Rosenbrock(Benchmark):
+    pass
@@ -0,0 +1,50 @@
+import os
+
+import astropy.units as u
+import numpy as np
+from benchmark import Benchmark, benchmark
+
+from vplanet import vplanet_core as core
+
+PATH = os.path.dirname(os.path.abspath(__file__))
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.sun.RotPer": {"value": 2.558988e06, "unit": u.sec},
+        "log.final.sun.Luminosity": {"value": 3.904525e26, "unit": u.W},
+        "log.final.earth.TMan": {"value": 2260.682517},
+        "log.final.earth.TCore": {"value": 4997.906580, "unit": u.K},
+        "log.final.earth.RIC": {"value": 1.251700e06},
+        "log.final.earth.OxygenMass": {"value": 4.594128e20, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+    }
+)
+class Test_StellarTrack(Benchmark):
+    pass
+
+
+def test_TrackEnd(monkeypatch):
+    # Runs past the last row of sun.track, at an age of 4.55 Gyr
+    monkeypatch.chdir(PATH)
+    config = {}
+    for name in ("vpl.in", "sun.in", "earth.in"):
+        with open(name) as f:
+            config[name] = f.read()
+    config["vpl.in"] = config["vpl.in"].replace("iVerbose                  5", "")
+    config["vpl.in"] = config["vpl.in"].replace(
+        "dStopTime                 4.5e9", "dStopTime 5e9"
+    )
+
+    # Halts at the end of the first step past the track
+    sun = core.simulate(config)["sun"]["rows"]
+    assert 4.55e9 < sun[-1, 1] < 4.6e9
+
+    # Unless told not to, when the star keeps the last row
+    config["sun.in"] = config["sun.in"].replace(
+        "bHaltEndBaraffeGrid 1", "bHaltEndBaraffeGrid 0"
+    )
+    sun = core.simulate(config)["sun"]["rows"]
+    assert sun[-1, 0] == 5e9
+    assert np.all(sun[sun[:, 1] >= 4.55e9, 2] == sun[-1, 2])
@@ -0,0 +1,14 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.final.system.Time": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.earth.EnvelopeMass": {"value": 0.000000, "unit": u.kg},
+        "log.final.earth.SurfWaterMass": {"value": 0.000000, "unit": u.kg},
+        "log.final.earth.OxygenMass": {"value": 4.593888e20, "unit": u.kg},
+    }
+)
+class Test_Replay(Benchmark):
+    pass
@@ -0,0 +1,18 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.initial.star.HZLimRunaway": {"value": 1.771185e10, "unit": u.m},
+        "log.initial.b.SemiMajorAxis": {"value": 1.771185e10, "unit": u.m},
+        "log.initial.e.SemiMajorAxis": {"value": 8.450210e09, "unit": u.m},
+        "log.final.system.Age": {"value": 3.471336e15, "unit": u.sec},
+        "log.final.e.Instellation": {
+            "value": 820.562281,
+            "unit": u.kg / u.sec**3,
+        },
+    }
+)
+class Test_SemiHZ(Benchmark):
+    pass
@@ -0,0 +1,22 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "log.initial.earth.D40KNumManDt": {"value": -1.694597e26, "unit": 1 / u.sec},
+        "log.initial.earth.RadPowerMan": {"value": 74.591573, "unit": u.TW},
+        "log.initial.earth.RadPowerTotal": {"value": 142.484111, "unit": u.TW},
+        "log.final.system.Age": {"value": 1.420092e17, "unit": u.sec},
+        "log.final.earth.D40KNumManDt": {"value": -1.425474e25, "unit": 1 / u.sec},
+        "log.final.earth.D232ThNumManDt": {"value": -7.630887e23, "unit": 1 / u.sec},
+        "log.final.earth.D238UNumManDt": {"value": -7.013429e23, "unit": 1 / u.sec},
+        "log.final.earth.D235UNumManDt": {"value": -3.671211e22, "unit": 1 / u.sec},
+        "log.final.earth.RadPowerMan": {"value": 14.306031, "unit": u.TW},
+        "log.final.earth.RadPowerCore": {"value": 3.030301, "unit": u.TW},
+        "log.final.earth.RadPowerCrust": {"value": 6.926660, "unit": u.TW},
+        "log.final.earth.RadPowerTotal": {"value": 24.262992, "unit": u.TW},
+    }
+)
+class Test_ExplicitDecay(Benchmark):
+    pass
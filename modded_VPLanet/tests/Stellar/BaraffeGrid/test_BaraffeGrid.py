@@ -0,0 +1,35 @@
+import astropy.units as u
+import numpy as np
+
+from vplanet.stellar import (
+    BARAFFE_ERR_OUTOFBOUNDS_HI,
+    BARAFFE_ERR_OUTOFBOUNDS_LO,
+    baraffe,
+)
+
+
+def test_BaraffeGrid():
+    # Same stars as StellarEvol, which logs the grid at 2 Myr
+    mass = np.array([0.1, 1.0])
+    age = 2e6
+    L, error = baraffe(mass, age, "luminosity")
+    assert np.all(error == 0)
+    assert np.allclose(L.to_value(u.LSUN), [0.055557, 1.184636], rtol=1e-5)
+    R, _ = baraffe(mass, age, "radius")
+    assert np.allclose(R.to_value(u.Rearth), [97.114438, 209.259428], rtol=1e-6)
+    T, _ = baraffe(mass * u.Msun, age * u.yr, "temperature")
+    assert np.allclose(T.to_value(u.K), [2971.232396, 4349.796199], rtol=1e-8)
+    RG, _ = baraffe(mass, age, "radgyra")
+    assert np.allclose(RG, [0.448345, 0.451302], rtol=1e-5)
+
+    # Mass and age broadcast to a table; off-grid points are NaN
+    L, error = baraffe([[0.05], [0.5], [2.0]], [1e7, 1e9], "luminosity", order=1)
+    assert L.shape == error.shape == (3, 2)
+    assert np.all(error[0] == BARAFFE_ERR_OUTOFBOUNDS_LO)
+    assert np.all(error[1] == 0)
+    assert np.all(error[2] == BARAFFE_ERR_OUTOFBOUNDS_HI)
+    assert np.all(np.isnan(L[error < 0]))
+
+
+if __name__ == "__main__":
+    test_BaraffeGrid()
@@ -0,0 +1,33 @@
+import numpy as np
+from vplanet import vplanet_core as core
+
+from inmemory import stellar_config
+
+
+def test_BaraffeTrack():
+    # The first output comes from fdBaraffe, called when the star is verified.
+    # RungeKutta4 then sets the stellar properties to their values at the start
+    # of the step, which come from the track cached at the star's mass. Both
+    # lookups are at the same mass and age, so they must agree exactly.
+    base = stellar_config(
+        sIntegrationMethod="RungeKutta4",
+        bVarDt=False,
+        dTimeStep=1.0,
+        dStopTime=1.0,
+        dOutputTime=1.0,
+        bDoLog=False,
+    )
+    output = ["Time", "-Luminosity", "-Radius", "Temperature", "RadGyra"]
+    masses = [0.1, 0.25, 0.6, 1.0, 1.2]
+    ages = [1.5e6, 2e6, 1e7, 5.5e7, 1e8, 1e9, 4.56e9]
+
+    for mass in masses:
+        for age in ages:
+            star = dict(base["a.in"], dMass=mass, dAge=age, saOutputOrder=output)
+            rows = core.simulate(dict(base, **{"a.in": star}))["a"]["rows"]
+            assert np.all(np.isfinite(rows))
+            assert np.array_equal(rows[0, 1:], rows[1, 1:])
+
+
+if __name__ == "__main__":
+    test_BaraffeTrack()
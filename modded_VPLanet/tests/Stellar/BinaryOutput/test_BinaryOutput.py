@@ -0,0 +1,21 @@
+import astropy.units as u
+from benchmark import Benchmark, benchmark
+
+
+@benchmark(
+    {
+        "a.Time": {"value": 1.000000e08, "unit": u.yr, "index": -1},
+        "a.RotPer": {"value": 0.299249, "unit": u.day, "index": -1, "rtol": 1e-4},
+        "a.Luminosity": {"value": 0.002445, "unit": u.LSUN, "index": -1, "rtol": 1e-3},
+        "a.Radius": {"value": 20.109478, "unit": u.Rearth, "index": -1, "rtol": 1e-4},
+        "a.Temperature": {"value": 2992.332065, "unit": u.K, "index": -1, "rtol": 1e-4},
+        "b.Time": {"value": 1.000000e07, "unit": u.yr, "index": 1},
+        "b.RotPer": {"value": 3.075484, "unit": u.day, "index": -1, "rtol": 1e-4},
+        "b.Luminosity": {"value": 0.689087, "unit": u.LSUN, "index": -1, "rtol": 1e-4},
+        "b.Radius": {"value": 98.456415, "unit": u.Rearth, "index": -1, "rtol": 1e-4},
+        "b.Temperature": {"value": 5539.188787, "unit": u.K, "index": -1, "rtol": 1e-4},
+        "log.final.a.Luminosity": {"value": 0.002445, "unit": u.LSUN, "rtol": 1e-4},
+    }
+)
+class Test_BinaryOutput(Benchmark):
+    pass
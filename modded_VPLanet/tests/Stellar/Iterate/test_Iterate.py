@@ -0,0 +1,68 @@
+import threading
+
+import numpy as np
+import pytest
+from inmemory import stellar_config
+
+import vplanet
+from vplanet import vplanet_core as core
+
+
+def test_Iterate():
+    output = core.simulate(stellar_config())
+
+    # One row per item, in the order they are written
+    items = list(vplanet.iterate(stellar_config()))
+    assert [item["body"] for item in items] == ["a", "b"] * 11
+    for item in items:
+        assert item["columns"] == output[item["body"]]["columns"]
+        assert item["units"] == output[item["body"]]["units"]
+    for body in ("a", "b"):
+        rows = np.vstack([item["rows"] for item in items if item["body"] == body])
+        assert np.array_equal(rows, output[body]["rows"])
+
+    # Blocks of rows, with the remainder last
+    items = list(vplanet.iterate(stellar_config(), block=4))
+    assert [len(item["rows"]) for item in items] == [4, 4, 4, 4, 3, 3]
+    rows = np.vstack([item["rows"] for item in items if item["body"] == "b"])
+    assert np.array_equal(rows, output["b"]["rows"])
+
+
+def test_Close():
+    # Closing the generator stops a long run early and ends its thread
+    threads = threading.active_count()
+    items = vplanet.iterate(stellar_config(dStopTime=1e10, dOutputTime=1e6), buffer=2)
+    for i, item in zip(range(5), items):
+        pass
+    items.close()
+    assert item["rows"][0, 0] == 2e6
+    assert threading.active_count() == threads
+
+    # A falsy return from the callback stops the run too
+    blocks = []
+    core.stream(
+        stellar_config(dStopTime=1e10), lambda item: blocks.append(item) or False, 1
+    )
+    assert len(blocks) == 1
+
+
+def test_Errors():
+    # The error of the run is raised by the generator
+    with pytest.raises(vplanet.VPLANETError):
+        list(vplanet.iterate(stellar_config(dBogus=1)))
+
+    # So is one raised by the consumer's callback
+    def callback(item):
+        raise KeyError(item["body"])
+
+    with pytest.raises(KeyError):
+        core.stream(stellar_config(), callback, 1)
+
+    with pytest.raises(ValueError):
+        vplanet.iterate(stellar_config(), block=0)
+
+
+if __name__ == "__main__":
+    test_Iterate()
+    test_Close()
+    test_Errors()
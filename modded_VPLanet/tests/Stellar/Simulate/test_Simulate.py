@@ -0,0 +1,94 @@
+import ctypes
+import os
+import threading
+
+import numpy as np
+import pytest
+import vplanet
+from inmemory import resident_kb, stellar_config
+from vplanet import vplanet_core as core
+from vplanet.log import get_log
+
+
+def test_Simulate():
+    output = core.simulate(stellar_config())
+    assert list(output) == ["a", "b"]
+    a = output["a"]
+    assert a["columns"] == ["Time", "RotPer", "Luminosity", "Temperature"]
+    assert a["units"] == ["year", "days", "LSUN", "K"]
+    assert a["rows"].shape == (11, 4)
+    assert np.allclose(a["rows"][:, 0], np.arange(11) * 1e7)
+    assert np.allclose(
+        a["rows"][-1, 1:], [0.2992494, 2.444683e-3, 2992.332065], rtol=1e-6
+    )
+
+    # Fatal input errors raise instead of exiting the interpreter
+    with pytest.raises(vplanet.VPLANETError):
+        core.simulate(stellar_config(dBogus=1))
+
+    # So does an adaptive step that cannot meet its tolerances
+    with pytest.raises(vplanet.VPLANETError) as error:
+        core.simulate(
+            stellar_config(
+                sIntegrationMethod="DormandPrince", dRelTol=1e-300, dScaleTol=1e-300
+            )
+        )
+    assert error.value.args[1] == 5
+
+    # Runs share no state, so concurrent runs agree with a serial one
+    rows = [None] * 4
+
+    def simulate(i):
+        rows[i] = core.simulate(stellar_config())["b"]["rows"]
+
+    threads = [threading.Thread(target=simulate, args=(i,)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(np.array_equal(r, output["b"]["rows"]) for r in rows)
+
+
+@pytest.mark.skipif(
+    not os.path.exists("/proc/self/statm"), reason="Needs /proc to measure memory"
+)
+def test_SimulateMemory():
+    # Runs release everything they allocate, whether or not they finish
+    good = stellar_config(dStopTime=1e5, dOutputTime=1e4)
+    bad = stellar_config(dBogus=1)
+
+    def simulate(runs):
+        for _ in range(runs):
+            core.simulate(good)
+            with pytest.raises(vplanet.VPLANETError):
+                core.simulate(bad)
+
+    simulate(10)
+    before = resident_kb()
+    simulate(50)
+    assert resident_kb() - before < 2048
+
+
+def test_SimulateLog(tmp_path):
+    # A run writes its log only where it is asked to
+    output = core.simulate(stellar_config(), str(tmp_path / "star.log"))
+    log = get_log(str(tmp_path), sysname="star", units=False)
+    assert np.isclose(log.final.b.Temperature, output["b"]["rows"][-1, 3], rtol=1e-6)
+
+    core.simulate(stellar_config(bDoLog=False), str(tmp_path / "nolog.log"))
+    assert not (tmp_path / "nolog.log").exists()
+
+
+def test_SimulateVerbose(capfd):
+    # An in-memory run reports its progress but writes no log file, so it does
+    # not claim to
+    core.simulate(stellar_config(iVerbose=5, dStopTime=1e6, dOutputTime=1e5))
+    ctypes.CDLL(None).fflush(None)
+    out = capfd.readouterr().out
+    assert "Simulation completed." in out
+    assert "Log file" not in out
+
+
+if __name__ == "__main__":
+    test_Simulate()
+    test_SimulateMemory()
@@ -0,0 +1,35 @@
+import numpy as np
+from inmemory import stellar_config
+
+from vplanet import vplanet_core as core
+
+
+def rotation(**options):
+    # Rotation period of the 0.1 solar mass star and the number of steps taken
+    config = stellar_config(**options)
+    config["a.in"]["saOutputOrder"] = ["Time", "-RotPer", "DeltaTime"]
+    rows = core.simulate(config)["a"]["rows"]
+    steps = np.sum(np.diff(rows[:, 0]) / rows[1:, 2])
+    return rows[1:, 1], steps
+
+
+def test_StiffBraking():
+    # Magnetic braking spins the low-mass star down on a timescale much
+    # shorter than its evolution, which limits the steps of explicit methods
+    reference, _ = rotation(sIntegrationMethod="RungeKutta", dEta=1e-3)
+
+    def error(rotper):
+        return np.max(np.abs(rotper / reference - 1))
+
+    # For the same accuracy or better, Rosenbrock takes far fewer steps
+    for rk4_eta, rel_tol in [(0.03, 1e-6), (0.01, 1e-8)]:
+        rk4, rk4_steps = rotation(sIntegrationMethod="RungeKutta", dEta=rk4_eta)
+        rosenbrock, rosenbrock_steps = rotation(
+            sIntegrationMethod="Rosenbrock", dRelTol=rel_tol
+        )
+        assert error(rosenbrock) < error(rk4)
+        assert rosenbrock_steps < rk4_steps / 5
+
+
+if __name__ == "__main__":
+    test_StiffBraking()
@@ -26,6 +26,8 @@ def vplanet_output(request):
             + glob.glob(f"{path}/*.forward")
             + glob.glob(f"{path}/*.backward")
             + glob.glob(f"{path}/*.Climate")
+            + glob.glob(f"{path}/*.reduce")
+            + glob.glob(f"{path}/*.checkpoint")
         ):
             os.remove(file)
         for directory in glob.glob(f"{path}/SeasonalClimateFiles"):
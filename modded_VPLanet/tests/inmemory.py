@@ -0,0 +1,47 @@
+"""Helpers for the tests of the in-memory vplanet_core API."""
+
+import os
+
+
+def stellar_config(**system):
+    """
+    The two stars of Stellar/StellarEvol as option dicts rather than files.
+
+    Keyword arguments add or replace options of the primary file. Returns a
+    dict of input file names and option dicts, with ``vpl.in`` first.
+
+    """
+    primary = {
+        "sSystemName": "star",
+        "iVerbose": 0,
+        "saBodyFiles": ["a.in", "b.in"],
+        "sUnitMass": "solar",
+        "sUnitLength": "aU",
+        "sUnitTime": "YEARS",
+        "sUnitAngle": "d",
+        "bDoLog": True,
+        "bDoForward": True,
+        "bVarDt": True,
+        "dEta": 0.01,
+        "dStopTime": 1e8,
+        "dOutputTime": 1e7,
+    }
+    primary.update(system)
+    star = {
+        "saModules": "stellar",
+        "dAge": 2e6,
+        "sStellarModel": "baraffe",
+        "sMagBrakingModel": "reiners",
+        "saOutputOrder": ["Time", "-RotPer", "-Luminosity", "Temperature"],
+    }
+    return {
+        "vpl.in": primary,
+        "a.in": dict(star, sName="a", dMass=0.1),
+        "b.in": dict(star, sName="b", dMass=1.0),
+    }
+
+
+def resident_kb():
+    """Resident memory of this process in kB, read from /proc."""
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
@@ -8,8 +8,11 @@ __version__ = version().decode("utf-8")
 # Grab the help info
 
 
+# Batch evaluation of the stellar grids
+from . import stellar
+
 # Import the rest of the user-facing stuff
-from .log import Log, LogBody, LogStage
+from .log import Log, LogBody, LogProfile, LogStage
 
 # Import the logger
 from .logger import logger
@@ -17,4 +20,4 @@ from .output import Body, Output, get_output
 from .quantity import VPLANETQuantity as Quantity
 
 # Import the main interface
-from .wrapper import VPLANETError, help, run
+from .wrapper import VPLANETError, help, iterate, run
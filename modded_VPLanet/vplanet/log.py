@@ -147,6 +147,7 @@ class Log(object):
         self._initial._name = "Initial"
         self._final = LogStage()
         self._final._name = "Final"
+        self._profile = None
         self._body_names = []
         self.path = ""
 
@@ -178,6 +179,15 @@ class Log(object):
         """
         return self._final
 
+    @property
+    def profile(self):
+        """
+        The counters of a run with ``bProfile`` set, an instance of
+        :py:class:`LogProfile`, or None if the run was not profiled.
+
+        """
+        return self._profile
+
     def __repr__(self):
         return "<vplanet.Log: %s>" % self.sysname
 
@@ -185,7 +195,7 @@ class Log(object):
     def members(self):
         """A list of all the properties of this object."""
         keys = list(self.__dict__.keys())
-        keys += ["header", "initial", "final"]
+        keys += ["header", "initial", "final", "profile"]
         return [key for key in keys if not key.startswith("_")]
 
 
@@ -227,6 +237,83 @@ class LogBody(object):
         return [key for key in keys if not key.startswith("_")]
 
 
+class LogProfile(object):
+    """A class containing the ``PROFILE`` section of a ``vplanet`` ``.log``
+    output file, written when ``bProfile`` is set.
+
+    The totals, such as ``Steps`` and ``EvolveTime``, are attributes. So are
+    the tables ``Sections``, ``Modules``, ``Variables``, ``Equations`` and
+    ``TimeSteps``, as ``numpy`` record arrays with one field per column. The
+    ``Time`` columns are in seconds.
+
+    """
+
+    def __init__(self):
+        self._name = "Profile"
+
+    def __repr__(self):
+        return "<vplanet.LogProfile>"
+
+    @property
+    def members(self):
+        """A list of all the properties of this object."""
+        keys = list(self.__dict__.keys())
+        return [key for key in keys if not key.startswith("_")]
+
+
+# The type of each numeric column of the profile tables; the rest are names
+PROFILE_COLUMN_TYPES = {
+    "Calls": "i8",
+    "Steps": "i8",
+    "Limits": "i8",
+    "Equation": "i8",
+    "Decade": "i8",
+    "Time": "f8",
+}
+
+
+def get_profile(lines, file, units=True):
+    """
+    Grab the totals and tables of the ``PROFILE`` section of a log file.
+
+    Returns a :py:class:`LogProfile`.
+    """
+    profile = LogProfile()
+
+    def add_table(name, columns, rows):
+        dtype = [
+            (column, PROFILE_COLUMN_TYPES.get(column, "U64")) for column in columns
+        ]
+        table = np.array([tuple(row) for row in rows], dtype=dtype)
+        setattr(profile, name, table.view(np.recarray))
+
+    table = None
+    for i, line in lines:
+        name_and_unit, _, value = line.partition(":")
+        words = value.split()
+        if value and words and all(word.isidentifier() for word in words):
+            # A table header, naming the table and its columns
+            if table is not None:
+                add_table(*table)
+            table = (name_and_unit, words, [])
+        elif value and table is None:
+            unit = get_param_unit(name_and_unit, file, i)
+            name = get_param_name(name_and_unit, file, i)
+            value = get_param_value(value, unit, file, i, units=units)
+            setattr(profile, name, value)
+        elif table is not None and len(line.split()) == len(table[1]):
+            table[2].append(line.split())
+        else:
+            raise ValueError(
+                "Error processing line {} of {}: ".format(i, file)
+                + "Cannot understand profile entry."
+            )
+    if table is not None:
+        add_table(*table)
+
+    return profile
+
+
 def get_log(path=".", sysname=None, ext="log", units=True):
     """ """
     # Just in case!
@@ -273,6 +360,7 @@ def get_log(path=".", sysname=None, ext="log", units=True):
     header = []
     initial = []
     final = []
+    profile = []
     stage = 0
     for i, line in enumerate(lines):
         line = line.replace("\n", "")
@@ -280,6 +368,9 @@ def get_log(path=".", sysname=None, ext="log", units=True):
             stage = 1
         elif "FINAL SYSTEM PROPERTIES" in line:
             stage = 2
+        elif "---- PROFILE ----" in line:
+            stage = 3
+            continue
         if len(line):
             if stage == 0:
                 if ("Log file" not in line) and ("FORMATTING" not in line):
@@ -290,6 +381,8 @@ def get_log(path=".", sysname=None, ext="log", units=True):
             elif stage == 2:
                 if ("SYSTEM PROPERTIES" not in line) and ("PARAMETERS" not in line):
                     final.append((i + 1, line))
+            else:
+                profile.append((i + 1, line))
 
     # Instantiate a `Log` object
     log = Log()
@@ -376,4 +469,8 @@ def get_log(path=".", sysname=None, ext="log", units=True):
             logbody._name = body
             setattr(log.final, body, logbody)
 
+    # Process the profile
+    if stage == 3:
+        log._profile = get_profile(profile, lf, units=units)
+
     return log
@@ -1,4 +1,5 @@
 # -*- coding: utf-8 -*-
+import functools
 import os
 import re
 import warnings
@@ -64,8 +65,67 @@ class Body(object):
         return [key for key in keys if not key.startswith("_")]
 
 
+# Binary output files (``sOutputFormat binary``) start with this string
+BINARY_MAGIC = b"VPLBIN01"
+
+
+def is_binary(path):
+    """Check whether an output file was written with ``sOutputFormat binary``.
+
+    Args:
+        path (str): Path to a ``.forward`` or ``.backward`` file.
+
+    Returns:
+        True if the file starts with the binary output header.
+    """
+    with open(path, "rb") as f:
+        return f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+
+
+def read_binary(path):
+    """Memory-map a binary ``vplanet`` output file without copying it.
+
+    The header holds the number of columns and the header size, followed
+    by each column's name and unit; the rows after it are packed
+    little-endian float64 values.
+
+    Args:
+        path (str): Path to a file written with ``sOutputFormat binary``.
+
+    Returns:
+        A tuple ``(names, units, data)``, where ``data`` is a read-only
+        array of shape ``(rows, columns)`` backed by ``numpy.memmap``.
+    """
+    with open(path, "rb") as f:
+        header = f.read(len(BINARY_MAGIC) + 8)
+        if header[: len(BINARY_MAGIC)] != BINARY_MAGIC:
+            raise ValueError("{} is not a binary vplanet output file.".format(path))
+        ncols, offset = np.frombuffer(header[len(BINARY_MAGIC) :], dtype="<u4")
+        ncols, offset = int(ncols), int(offset)
+        strings = f.read(offset - len(header)).split(b"\0")[: 2 * ncols]
+
+    names = [s.decode() for s in strings[0::2]]
+    units = [s.decode() for s in strings[1::2]]
+
+    # Ignore a partially written last row, e.g. if the run is still going
+    nrows = (os.path.getsize(path) - offset) // (8 * ncols)
+    if nrows == 0:
+        data = np.empty((0, ncols), dtype="<f8")
+    else:
+        data = np.memmap(
+            path, dtype="<f8", mode="r", offset=offset, shape=(nrows, ncols)
+        )
+
+    return names, units, data
+
+
+@functools.lru_cache(maxsize=None)
 def get_param_descriptions():
-    """ """
+    """Parse the output descriptions from the ``vplanet`` help message.
+
+    The result is cached, so the help message is only generated and parsed
+    once per process.
+    """
 
     # Get the help message
     from .wrapper import help
@@ -112,22 +172,55 @@ def get_param_descriptions():
     return description
 
 
+def parse_text(file):
+    """Parse a text output file into a 2-D float64 array in a single pass.
+
+    Args:
+        file (str or list): Path to the file, or its lines.
+
+    Returns:
+        A ``numpy`` array of shape ``(rows, columns)``.
+    """
+    with warnings.catch_warnings():
+        # Empty files are fine; they just have no rows
+        warnings.simplefilter("ignore", UserWarning)
+        return np.loadtxt(file, dtype=np.float64, ndmin=2)
+
+
 def get_params(outputorder, file, units=True, body=None):
-    """ """
+    """Build the tagged arrays of an output file.
+
+    Args:
+        outputorder (str): Column names and units, e.g. ``Time[year] ...``.
+        file (list or ndarray): The lines of a text output file, or its
+            contents already parsed into a 2-D array.
+        units (bool, optional): Return astropy quantities? Default True.
+        body (str, optional): Name of the body, used to tag the arrays.
+
+    Returns:
+        A list with one array per column. The arrays are views into a single
+        2-D array holding the whole file.
+    """
     # Get parameter descriptions from the vplanet help
     description = get_param_descriptions()
 
     # Get params and units
     params_and_units = re.findall(r"(.*?)\[(.*?)\]", outputorder)
 
+    # Parse the whole file in one pass; every column below is a view into
+    # this 2-D array
+    data = file
+    if not isinstance(data, np.ndarray):
+        data = parse_text(data)
+    if data.size == 0:
+        data = np.empty((0, len(params_and_units)))
+
     # Populate the params
     params = []
     for j, param in enumerate(params_and_units):
 
         # Grab the array in the fwfile/bwfile
-        array = []
-        for line in file:
-            array.append(float(line.split()[j]))
+        array = data[:, j]
 
         # Get the name and units
         name = param[0].replace(" ", "")
@@ -158,7 +251,7 @@ def get_params(outputorder, file, units=True, body=None):
                     unit = u.Unit("")
 
             # Make it into an astropy quantity with units
-            array = Quantity(np.array(array), unit=unit)
+            array = Quantity(np.asarray(array), unit=unit, copy=False)
             physical_type = unit.physical_type
 
         else:
@@ -166,7 +259,7 @@ def get_params(outputorder, file, units=True, body=None):
             # Keep it as a numpy array with tags. We'll
             # still keep track of the unit, but it's only
             # a passive tag!
-            array = NumpyQuantity(np.array(array))
+            array = NumpyQuantity(np.asarray(array))
             array.unit = unit_str
             physical_type = None
 
@@ -184,6 +277,30 @@ def get_params(outputorder, file, units=True, body=None):
     return params
 
 
+def read_file(path, file, outputorder):
+    """Read a ``.forward`` or ``.backward`` file in either output format.
+
+    Args:
+        path (str): Directory containing the file.
+        file (str): File name, or an empty string if there is no file.
+        outputorder (str): The output order recorded in the log file.
+
+    Returns:
+        A tuple ``(outputorder, contents)``. Binary files replace the output
+        order with the one in their header. ``contents`` is a 2-D array of
+        the file, or None if the file does not exist.
+    """
+    if file == "" or not os.path.exists(os.path.join(path, file)):
+        return outputorder, None
+    if is_binary(os.path.join(path, file)):
+        names, unit_strs, data = read_binary(os.path.join(path, file))
+        outputorder = "".join(
+            "{}[{}] ".format(name, unit_str) for name, unit_str in zip(names, unit_strs)
+        )
+        return outputorder, data
+    return outputorder, parse_text(os.path.join(path, file))
+
+
 def get_arrays(log, units=True):
     """ """
     # Initialize
@@ -191,6 +308,7 @@ def get_arrays(log, units=True):
 
     # Get basic system info
     output.log = log
+    output.profile = log.profile
     output.sysname = log.sysname
     output.path = log.path
 
@@ -216,41 +334,31 @@ def get_arrays(log, units=True):
         if not os.path.exists(os.path.join(output.path, body.climfile)):
             body.climfile = ""
 
-        # Grab the forward arrays. Note that they may not exist for this body
-        try:
-            with open(os.path.join(output.path, body.fwfile), "r") as f:
-                fwfile = f.readlines()
-        except IOError:
-            fwfile = [""]
-
-        # Grab the backward arrays. Note that they may not exist for this body
-        try:
-            with open(os.path.join(output.path, body.bwfile), "r") as f:
-                bwfile = f.readlines()
-        except IOError:
-            bwfile = [""]
+        # Grab the forward and backward arrays. Note that they may not exist
+        # for this body
+        outputorder = getattr(log.initial, body._name).OutputOrder
+        fworder, fwfile = read_file(output.path, body.fwfile, outputorder)
+        bworder, bwfile = read_file(output.path, body.bwfile, outputorder)
 
         # TODO: Add support for *both* fwfile and bwfile at the same time?
-        if fwfile != [""] and bwfile != [""]:
+        if fwfile is not None and bwfile is not None:
             logger.error(
                 "Both a fwfile and a bwfile were detected. "
                 + "Currently, vplanet can only handle one at a time. "
                 + "Continuing, but ignoring the bwfile..."
             )
 
-        # Now grab the output order and the params
-        outputorder = getattr(log.initial, body._name).OutputOrder
-        if fwfile != [""]:
-            body._params = get_params(outputorder, fwfile, units=units, body=body._name)
-        elif bwfile != [""]:
-            body._params = get_params(outputorder, bwfile, units=units, body=body._name)
+        # Now grab the params
+        if fwfile is not None:
+            body._params = get_params(fworder, fwfile, units=units, body=body._name)
+        elif bwfile is not None:
+            body._params = get_params(bworder, bwfile, units=units, body=body._name)
 
         # Climate file
         if body.climfile != "":
             # Grab the climate arrays...
             try:
-                with open(os.path.join(output.path, body.climfile), "r") as f:
-                    climfile = f.readlines()
+                climfile = parse_text(os.path.join(output.path, body.climfile))
             except IOError:
                 raise Exception("Unable to open %s." % body.climfile)
 
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+import astropy.units as u
+import numpy as np
+
+from . import vplanet_core as core
+
+# Quantities on the Baraffe grid, with their codes in stellar.h
+_BARAFFE_QUANTITIES = {
+    "temperature": (1, u.K),
+    "luminosity": (2, u.W),
+    "radius": (3, u.m),
+    "radgyra": (4, u.Unit("")),
+}
+
+# Error codes set by fdBaraffeInterpolate
+BARAFFE_ERR_NONE = 0
+BARAFFE_ERR_LINEAR = 1
+BARAFFE_ERR_OUTOFBOUNDS_LO = -2
+BARAFFE_ERR_OUTOFBOUNDS_HI = -3
+BARAFFE_ERR_ISNAN = -4
+BARAFFE_ERR_BADORDER = -7
+
+
+def baraffe(mass, age, quantity, order=3):
+    """
+    Interpolate the Baraffe et al. (2015) stellar evolution grid.
+
+    This evaluates the same interpolation as the ``STELLAR`` module with
+    ``sStellarModel baraffe``, for every pair of ``mass`` and ``age`` in a
+    single call to the C extension. The two arrays are broadcast against
+    each other, so e.g. ``mass[:, None]`` and ``age[None, :]`` give a
+    mass x age table.
+
+    Args:
+        mass (float, array or Quantity): Stellar mass, in solar masses
+            unless it carries units.
+        age (float, array or Quantity): Stellar age, in years unless it
+            carries units. Ages below 1 Myr are evaluated at 1 Myr.
+        quantity (str): One of ``temperature``, ``luminosity``, ``radius``
+            or ``radgyra``.
+        order (int, optional): Interpolation order, 1 (bilinear) or 3
+            (bicubic). Bicubic interpolation falls back to bilinear next to
+            the edges of the grid. Default 3.
+
+    Returns:
+        A tuple ``(value, error)`` of arrays with the broadcast shape.
+        ``value`` is an ``astropy`` quantity in SI units, and NaN wherever
+        ``error`` is negative. ``error`` holds the codes of
+        ``fdBaraffeInterpolate``: ``BARAFFE_ERR_NONE``,
+        ``BARAFFE_ERR_LINEAR`` where bicubic fell back to bilinear, and
+        ``BARAFFE_ERR_OUTOFBOUNDS_LO``, ``BARAFFE_ERR_OUTOFBOUNDS_HI`` or
+        ``BARAFFE_ERR_ISNAN`` where the point is off the grid.
+    """
+    try:
+        iParam, unit = _BARAFFE_QUANTITIES[quantity.lower()]
+    except KeyError:
+        raise ValueError(
+            "Unknown quantity `{}`. Must be one of {}.".format(
+                quantity, ", ".join(_BARAFFE_QUANTITIES)
+            )
+        )
+    if order not in (1, 3):
+        raise ValueError("Interpolation order must be 1 or 3.")
+
+    if isinstance(mass, u.Quantity):
+        mass = mass.to_value(u.Msun)
+    if isinstance(age, u.Quantity):
+        age = age.to_value(u.yr)
+    mass, age = np.broadcast_arrays(
+        np.asarray(mass, dtype=np.float64), np.asarray(age, dtype=np.float64)
+    )
+
+    # The grid ages are in Gyr
+    shape = mass.shape
+    mass = np.ascontiguousarray(mass.ravel())
+    age = np.ascontiguousarray(age.ravel()) * 1e-9
+    value = np.empty(mass.shape, dtype=np.float64)
+    error = np.empty(mass.shape, dtype=np.intc)
+    core.baraffe(mass, age, iParam, order, value, error)
+
+    value[error < 0] = np.nan
+    return value.reshape(shape) * unit, error.reshape(shape)
@@ -1,8 +1,13 @@
 # -*- coding: utf-8 -*-
+import functools
 import subprocess
 
-_help = subprocess.check_output(["vplanet", "-h"]).decode("utf-8")
-_help_verbose = subprocess.check_output(["vplanet", "-H"]).decode("utf-8")
+
+@functools.lru_cache(maxsize=None)
+def _get_help(verbose=False):
+    """Run ``vplanet -h`` (or ``-H``) at most once per process."""
+    flag = "-H" if verbose else "-h"
+    return subprocess.check_output(["vplanet", flag]).decode("utf-8")
 
 
 class VPLANETHelp:
@@ -12,10 +17,7 @@ class VPLANETHelp:
     """
 
     def __init__(self, verbose=False):
-        if verbose:
-            self._help = _help_verbose
-        else:
-            self._help = _help
+        self._help = _get_help(verbose)
 
     def __repr__(self):
         return self._help
@@ -1,20 +1,17 @@
 # -*- coding: utf-8 -*-
 import os
+import queue
 import re
 import subprocess
 import sys
+import threading
 
 from . import vplanet_core as core
 from .output import get_output
 
-
-class VPLANETError(RuntimeError):
-    """
-    Catch-all runtime error class for VPLANET.
-
-    """
-
-    pass
+# Catch-all runtime error class for VPLANET. It is defined by the C extension
+# so that ``core.simulate`` can raise it.
+VPLANETError = core.VPLANETError
 
 
 def _entry_point():
@@ -99,6 +96,85 @@ def run(
     return output
 
 
+def iterate(infile="vpl.in", block=1, buffer=16):
+    """
+    Run `vplanet` in the background and yield its output rows as they are
+    written.
+
+    Args:
+        infile (str or dict, optional): The path to the primary input file, or
+            a dict of input file names and contents as for
+            ``vplanet_core.simulate``. Files that are not given are read from
+            disk relative to the current directory, as a ``vplanet infile``
+            run from there would. Default ``vpl.in``.
+        block (int, optional): The number of rows of a body gathered into each
+            item. Default 1.
+        buffer (int, optional): The number of items held for the consumer;
+            once they are all waiting, the run pauses until one is taken.
+            Default 16.
+
+    Yields:
+        A dict with the ``body`` name, its output ``columns`` and ``units``,
+        and ``rows``, a 2-D float64 ``numpy`` array of ``block`` rows. The
+        last item of each body may hold fewer rows. No files are written.
+
+    Raises:
+        ``vplanet.VPLANETError``: If the run stops with an error. The rows
+            written before the error are yielded first.
+
+    Closing the generator, e.g. by breaking out of a loop over it, stops the
+    run when it next hands on a block.
+
+    """
+    if block < 1:
+        raise ValueError("Blocks must hold at least one row.")
+    if isinstance(infile, dict):
+        config = infile
+    else:
+        with open(infile, "r") as f:
+            config = {infile: f.read()}
+    return _iterate(config, block, buffer)
+
+
+def _iterate(config, block, buffer):
+    items = queue.Queue(buffer)
+    stop = threading.Event()
+    done = object()
+    error = []
+
+    # Called by the run with each block; returning False stops the run
+    def put(item):
+        if not stop.is_set():
+            items.put(item)
+        return not stop.is_set()
+
+    def simulate():
+        try:
+            core.stream(config, put, block)
+        except BaseException as e:
+            error.append(e)
+        finally:
+            items.put(done)
+
+    thread = threading.Thread(target=simulate, daemon=True)
+    thread.start()
+    item = None
+    try:
+        while True:
+            item = items.get()
+            if item is done:
+                break
+            yield item
+    finally:
+        # Take what the run still puts, so it sees the stop at its next block
+        stop.set()
+        while item is not done:
+            item = items.get()
+        thread.join()
+    if error:
+        raise error[0]
+
+
 def help(verbose=False):
     from .vplanet_help import VPLANETHelp
 
@@ -5,7 +5,8 @@ import numpy as np
 import pandas as pd
 import math
 import planet
-from planet import Planet
+from planet import Planet, PlanetBatch
+from sweep_archive import SweepArchive, is_archive
 import scipy.interpolate as sci
 
 # Unused.
@@ -18,6 +19,18 @@ def read_vplanet(filepath, output_options=None, usecols=None):
     if usecols == None:
         usecols = output_options
 
+    # Files written with 'sOutputFormat binary' name their own columns and are memory-mapped rather than parsed.
+    from vplanet.output import is_binary, read_binary
+
+    if is_binary(filepath):
+        (names, units, data) = read_binary(filepath)
+        frame = pd.DataFrame(data, columns=names, copy=False)
+
+        if usecols == None:
+            return frame
+
+        return frame[[column for column in frame.columns if column in usecols]]
+
     if output_options == None:
         path_list = filepath.split(os.sep)
 
@@ -38,14 +51,32 @@ def read_vplanet(filepath, output_options=None, usecols=None):
 
     return pd.read_csv(filepath, sep = ' ', names = output_options, index_col = False, usecols=usecols)
 
-def solar_planet(planet_dynamics, stellar_dynamics, semi_major_axis):
+def read_sweep_run(directory, run_name, file_name, usecols=None):
+    # Reads the forward file of one run of a sweep, from the sweep archive if directory is one (see sweep_archive.py).
+    if is_archive(directory):
+        return SweepArchive(directory).frame(file_name.split('.')[-2], run_name, usecols)
+
+    return read_vplanet(os.path.join(directory, run_name, file_name), usecols=usecols)
+
+def sweep_runs(directory, file_name, usecols=None):
+    # Yields (run_name, dynamics) for every run of a sweep directory or sweep archive.
+    if is_archive(directory):
+        archive = SweepArchive(directory)
+
+        for run_name in archive.runs:
+            yield (run_name, archive.frame(file_name.split('.')[-2], run_name, usecols))
+    else:
+        for run_name in os.listdir(directory):
+            yield (run_name, read_vplanet(os.path.join(directory, run_name, file_name), usecols=usecols))
+
+def solar_planet(planet_dynamics, stellar_dynamics, semi_major_axis, planet_class=Planet):
     #semi_major_axis = 1.49598 * 1e11 # In meters.
     solar_mean_surface_B = 1e-4 # In Tesla. From https://nssdc.gsfc.nasa.gov/planetary/factsheet/sunfact.html.
     solar_radius = 6.957e8 # Volumetric mean radius in meters. From https://nssdc.gsfc.nasa.gov/planetary/factsheet/sunfact.html
 
-    return Planet(solar_mean_surface_B, solar_radius, semi_major_axis, planet_dynamics, stellar_dynamics)
+    return planet_class(solar_mean_surface_B, solar_radius, semi_major_axis, planet_dynamics, stellar_dynamics)
 
-def M_dwarf_planet(planet_dynamics, stellar_dynamics, semi_major_axis):
+def M_dwarf_planet(planet_dynamics, stellar_dynamics, semi_major_axis, planet_class=Planet):
     #semi_major_axis = 2.89308763e9 # In meters.
     
     #7.08658848e9 # In meters. # 1.49598 * 1e11 # In meters.
@@ -53,7 +84,7 @@ def M_dwarf_planet(planet_dynamics, stellar_dynamics, semi_major_axis):
     R_EARTH = 6.371 * 1e6 # In SI base units.
     M_dwarf_radius = 12.3 * R_EARTH # 6.957e8 # Volumetric mean radius in meters. From https://nssdc.gsfc.nasa.gov/planetary/factsheet/sunfact.html
 
-    return Planet(stellar_mean_surface_B=M_dwarf_mean_surface_B, stellar_radius=M_dwarf_radius, planet_star_distance=semi_major_axis, planet_dynamics=planet_dynamics, stellar_dynamics=stellar_dynamics)
+    return planet_class(stellar_mean_surface_B=M_dwarf_mean_surface_B, stellar_radius=M_dwarf_radius, planet_star_distance=semi_major_axis, planet_dynamics=planet_dynamics, stellar_dynamics=stellar_dynamics)
 
 def solar_metric(planet_dynamics, stellar_dynamics, semi_major_axis):
     return solar_planet(planet_dynamics, stellar_dynamics, semi_major_axis).integrate()
@@ -61,6 +92,14 @@ def solar_metric(planet_dynamics, stellar_dynamics, semi_major_axis):
 def M_dwarf_metric(planet_dynamics, stellar_dynamics, semi_major_axis):
     return M_dwarf_planet(planet_dynamics, stellar_dynamics, semi_major_axis).integrate()
 
+# Same as the metrics above for a whole sweep at once: the dynamics hold runs x time arrays, e.g. from
+# planet.stack_runs, and the result has one row of cumulative mass loss per run.
+def solar_metric_batch(planet_dynamics, stellar_dynamics, semi_major_axis):
+    return solar_planet(planet_dynamics, stellar_dynamics, semi_major_axis, PlanetBatch).integrate()
+
+def M_dwarf_metric_batch(planet_dynamics, stellar_dynamics, semi_major_axis):
+    return M_dwarf_planet(planet_dynamics, stellar_dynamics, semi_major_axis, PlanetBatch).integrate()
+
 semi_major_axis = 1.49598 * 1e11 # In meters.
 solar_mean_surface_B = 1/1e4 # In Tesla. From https://nssdc.gsfc.nasa.gov/planetary/factsheet/sunfact.html.
 solar_radius = 6.957e8 # Volumetric mean radius in meters. From https://nssdc.gsfc.nasa.gov/planetary/factsheet/sunfact.html
@@ -100,19 +139,24 @@ DESSIC_TIME = 4
 PERCENT = 8
 
 def build_contour_VPLanet(save_name = '', directory = 'Parameter_Sweep', planet_file_name = 'planet.in', mode = ATM):
+    # directory is either the run directories of a sweep or its archive, from which only the needed columns are read.
     print('Plotting parameter sweep data from directory {}'.format(directory))
 
     x = np.zeros((30, 30))
     y = np.zeros((30, 30))
     z = np.zeros((30, 30))
 
-    files = os.listdir(directory)
-
     unit_label = str()
 
-    for (i, subdirectory) in enumerate(files):
-        vpl_file = os.path.join(directory, subdirectory)
+    # Simple bitwise mapping to choose the mass type.
+    mass_type = {
+        WATER: 'SurfWaterMass',
+        ATM: 'EnvelopeMass'
+    }[(mode & WATER) | (mode & ATM)]
+
+    columns = ['Time', '40KNumCore', '232ThNumMan', mass_type]
 
+    for (i, (subdirectory, planet_dynamics)) in enumerate(sweep_runs(directory, planet_file_name, usecols=columns)):
         terms = subdirectory.split('_')
 
         row = int(terms[1].replace('K', ''))
@@ -121,17 +165,9 @@ def build_contour_VPLanet(save_name = '', directory = 'Parameter_Sweep', planet_
         if i % 50 == 0:
             print('> Fetching data for runs {}-{}...'.format(i+1, i+50))
 
-        planet_dynamics = read_vplanet(os.path.join(vpl_file, planet_file_name))
-
         initial_40K = planet_dynamics['40KNumCore'].iloc[0] / planet.EARTH_40K_CORE
         initial_232Th = planet_dynamics['232ThNumMan'].iloc[0] / planet.EARTH_232TH_MANTLE
 
-        # Simple bitwise mapping to choose the mass type.
-        mass_type = {
-            WATER: 'SurfWaterMass',
-            ATM: 'EnvelopeMass'
-        }[(mode & WATER) | (mode & ATM)]
-        
         mass = planet_dynamics[mass_type]
 
         metric = 0.0
@@ -97,77 +97,81 @@ class Parameter_Sweep:
 
             return output
     
-    def generate_input_files(self, directory_path = 'Parameter_Sweep'):
-        directory_name = directory_path.split(os.sep)[-1]
-        parent_directory = directory_path.removesuffix(directory_name)
+    def num_runs(self):
+        return self._num_combinations(0, self.ranges)
 
-        # Creates the directory in which the input files will be placed.
-        if directory_name not in os.listdir(parent_directory):
-            os.mkdir(directory_path)
+    def run_name(self, row):
+        # The file name for the subdirectory for this specific parameter combination.
+        parameter_file_identifier = ''
 
-        for row in range(self._num_combinations(0, self.ranges)):
-            injections = {}
-            
-            # The file name for the subdirectory for this specific parameter combination.
-            parameter_file_identifier = ''
+        for column in range(len(self.ranges)):
+            (k, abundance) = self._matrix_component(row, column, self.ranges, return_k = True)
 
-            for column in range(len(self.ranges)):
-                (k, abundance) = self._matrix_component(row, column, self.ranges, return_k = True)
-                
-                parameter_file_identifier += '_{parameter_name}{n}'.format(parameter_name = self.names[column], n = k)
+            parameter_file_identifier += '_{parameter_name}{n}'.format(parameter_name = self.names[column], n = k)
 
-                path = self.input_file_paths[column]
-                contents = open(path).read()
+        return '{trial}{parameter_file_identifier}'.format(trial = self.trial_name, parameter_file_identifier=parameter_file_identifier)
 
-                if path not in injections:
-                    injections[path] = ''
+    def parameters(self, row):
+        return {self.names[column]: self._matrix_component(row, column, self.ranges) for column in range(len(self.ranges))}
 
-                injections[path] += '# Varied parameter {n}\n'.format(n=column+1)
+    def _run_input_files(self, row):
+        injections = {}
 
-                for option in self.input_options[column]:
-                    #new_string = '{option} -{abundance}\n'.format(option=option, abundance=abundance)
-                    #if contents.find(option) != -1:
+        for column in range(len(self.ranges)):
+            abundance = self._matrix_component(row, column, self.ranges)
 
-                    unit_character = ''
+            path = self.input_file_paths[column]
 
-                    if option[0] == '-':
-                        option = option.removeprefix('-')
-                        unit_character = '-'
+            if path not in injections:
+                injections[path] = ''
 
-                    injections[path] += '{option} {abundance}\n'.format(option=option, abundance=unit_character+str(abundance))
-                    #else:
-                        #contents.replace(option, '')
+            injections[path] += '# Varied parameter {n}\n'.format(n=column+1)
 
-                injections[path] += '\n'
+            for option in self.input_options[column]:
+                unit_character = ''
 
-            # Subdirectory for the specific run. This is where the modified input files go.
-            run_name = '{trial}{parameter_file_identifier}'.format(trial = self.trial_name, parameter_file_identifier=parameter_file_identifier)
-            run_directory = os.path.join(directory_path, run_name)
+                if option[0] == '-':
+                    option = option.removeprefix('-')
+                    unit_character = '-'
 
-            # Makes the new directory.
-            if run_name not in os.listdir(directory_path):
-                os.mkdir(run_directory)
+                injections[path] += '{option} {abundance}\n'.format(option=option, abundance=unit_character+str(abundance))
 
-            for (file_path, injection) in injections.items():
-                file_name = file_path.split(os.sep)[-1]
+            injections[path] += '\n'
 
-                body_file_path = os.path.join(run_directory, file_name)
+        run_name = self.run_name(row)
 
-                with open(body_file_path, 'w', encoding = 'utf-8') as input_file:
-                    contents = self._inject_input_file(file_path, injection)
+        # Maps each input file name to the contents it has for this run.
+        input_files = {}
 
-                    input_file.write(contents)
+        for (file_path, injection) in injections.items():
+            input_files[file_path.split(os.sep)[-1]] = self._inject_input_file(file_path, injection)
+
+        for file_path in self.unvaried_input_files:
+            with open(file_path, 'r') as input_file:
+                input_files[file_path.split(os.sep)[-1]] = input_file.read()
 
-            for file_path in self.unvaried_input_files:
-                contents = ''
+        return (run_name, input_files)
 
-                with open(file_path, 'r') as input_file:
-                    contents = input_file.read()
+    def generate_input_files(self, directory_path = 'Parameter_Sweep'):
+        directory_name = directory_path.split(os.sep)[-1]
+        parent_directory = directory_path.removesuffix(directory_name)
+
+        # Creates the directory in which the input files will be placed.
+        if directory_name not in os.listdir(parent_directory):
+            os.mkdir(directory_path)
 
-                file_name = file_path.split(os.sep)[-1]
-                body_file_path = os.path.join(run_directory, file_name)
+        for row in range(self.num_runs()):
+            (run_name, input_files) = self._run_input_files(row)
+
+            # Subdirectory for the specific run. This is where the modified input files go.
+            run_directory = os.path.join(directory_path, run_name)
+
+            # Makes the new directory.
+            if run_name not in os.listdir(directory_path):
+                os.mkdir(run_directory)
 
-                with open(body_file_path, 'w') as input_file:
+            for (file_name, contents) in input_files.items():
+                with open(os.path.join(run_directory, file_name), 'w', encoding = 'utf-8') as input_file:
                     input_file.write(contents)
 
         vspace_file_path = os.path.join(directory_path, os.pardir, 'vspace.in')
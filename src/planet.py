@@ -13,9 +13,37 @@ EARTH_235U_MANTLE = 9.89663e+40
 EARTH_40K_MANTLE = 9.72110e+42
 EARTH_40K_CORE = 9.10261e+42
 
+SECONDS_PER_YEAR = 3.1536e7
+
+def cumulative_mass_loss(dm_dt, time):
+    # Mass lost up to each time sample, with the rate at the end of each step held over the step.
+    # Works along the last axis, so dm_dt may hold one run per row; time is in years.
+    dm_dt = np.asarray(dm_dt, dtype=float)
+    dt = np.diff(np.asarray(time, dtype=float)[..., :dm_dt.shape[-1]], axis=-1) * SECONDS_PER_YEAR # Convert to seconds.
+
+    # Summed in place, which keeps the order of additions of a running total.
+    mass_loss = np.empty(dm_dt.shape)
+    mass_loss[..., 0] = 0.0
+    np.multiply(dm_dt[..., 1:], dt, out=mass_loss[..., 1:])
+    np.cumsum(mass_loss, axis=-1, out=mass_loss)
+
+    return mass_loss
+
+def stack_runs(runs, column):
+    # Stacks one column of several runs into a runs x time array, padding shorter runs with NaN.
+    columns = [np.asarray(run[column], dtype=float) for run in runs]
+    stacked = np.full((len(columns), max(len(values) for values in columns)), np.nan)
+
+    for (row, values) in enumerate(columns):
+        stacked[row, :len(values)] = values
+
+    return stacked
+
 class Planet:
     G = 6.674 * 1e-11 # SI base units.
     EPSILON_0 = 8.82 * 1e-12 # C^2 kg^-1 m^-3 s^2 (SI base units)
+    SOLAR_LUMINOSITY = 3.828 * 1e26 # Watts (SI base units).
+    EARTH_MAGNETIC_MOMENT = 7.94 * 1e22 # A m^2 (SI base units). From https://modern-physics.org/earths-dipole-moment/
 
     def __init__(self,
                  stellar_mean_surface_B,
@@ -29,23 +57,22 @@ class Planet:
         self.planet_dynamics = planet_dynamics
         self.stellar_dynamics = stellar_dynamics
 
-        SOLAR_LUMINOSITY = 3.828 * 1e26 # Watts (SI base units).
-        XUV_flux = (stellar_dynamics['LXUVStellar'] * SOLAR_LUMINOSITY) / (4*np.pi*(planet_star_distance**2)) # SI base units.
-        EARTH_MAGNETIC_MOMENT = 7.94 * 1e22 # A m^2 (SI base units). From https://modern-physics.org/earths-dipole-moment/
-        self.planet_dipole_strength = planet_dynamics['MagMom'] * EARTH_MAGNETIC_MOMENT # SI base units.
+        # The dynamics are read as arrays, so they may hold one run or, as in PlanetBatch, one run per row.
+        XUV_luminosity = np.asarray(stellar_dynamics['LXUVStellar'], dtype=float)
+        XUV_flux = (XUV_luminosity * self.SOLAR_LUMINOSITY) / (4*np.pi*(planet_star_distance**2)) # SI base units.
+        self.planet_dipole_strength = np.asarray(planet_dynamics['MagMom'], dtype=float) * self.EARTH_MAGNETIC_MOMENT # SI base units.
 
-        self.LIMITING_INDEX = len(XUV_flux)
+        self.LIMITING_INDEX = XUV_flux.shape[-1]
 
         self.eta = eta
         self.planet_radius = planet_radius
         self.planet_mass = planet_mass
-        self.planet_mean_surface_B = (4*np.pi*self.EPSILON_0*3*self.planet_dipole_strength[:self.LIMITING_INDEX]) / (2.0*planet_radius**3) # Tesla (SI base units).
+        self.planet_mean_surface_B = (4*np.pi*self.EPSILON_0*3*self.planet_dipole_strength[..., :self.LIMITING_INDEX]) / (2.0*planet_radius**3) # Tesla (SI base units).
         self.stellar_mean_surface_B = stellar_mean_surface_B
         self.stellar_radius = stellar_radius
         self.planet_star_distance = planet_star_distance
-        self.time = stellar_dynamics['Time'][:self.LIMITING_INDEX]
+        self.time = np.asarray(stellar_dynamics['Time'], dtype=float)[..., :self.LIMITING_INDEX]
         self.XUV_flux = XUV_flux
-        self.eta = eta
 
     def dm_dt_energy_limited(self):
         return (self.eta*np.pi*(self.planet_radius**3)*self.XUV_flux) / (self.G*self.planet_mass)
@@ -70,16 +97,7 @@ class Planet:
     def integrate(self, magnetic = True):
         dm_dt = self.dm_dt_magnetic() if magnetic else self.dm_dt_energy_limited()
 
-        max_time_index = len(dm_dt)
-        mass_loss = np.zeros(max_time_index)
-
-        for time_index in range(1, max_time_index):
-            dt = (self.time[time_index] - self.time[time_index-1]) * 3.1536e7/1 # Convert to seconds.
-            dm = dm_dt[time_index] * dt
-
-            mass_loss[time_index] = mass_loss[time_index-1] + dm
-        
-        return mass_loss
+        return cumulative_mass_loss(dm_dt, self.time)
 
     def output(self):
         df = pd.DataFrame()
@@ -104,7 +122,7 @@ class Planet:
         fig.set_size_inches(14.5, 3.75)
         fig.subplots_adjust(wspace=0.225)
 
-        MAX_TIME = self.time.iloc[-1]
+        MAX_TIME = self.time[-1]
 
         axes[0].plot(self.time, self.planet_mean_surface_B[:len(self.time)], alpha = 0.7)
         axes[0].set_xlim(0.0, MAX_TIME)
@@ -144,3 +162,30 @@ class Planet:
         initial_ThU = self.planet_dynamics['232ThNumMan'].iloc[0] / EARTH_232TH_MANTLE
 
         fig.suptitle('Thermal Intererior Evolution of Earth-Like Planet (Initial K = {_40K} [Primordial Earth]; Initial Th, U = {_ThU} [Primordial Earth])'.format(_40K=round(initial_K, 2), _ThU=round(initial_ThU, 2)), fontsize = 15)
+
+class PlanetBatch(Planet):
+    # Evaluates Planet for a whole sweep at once. planet_dynamics['MagMom'] and stellar_dynamics['LXUVStellar']
+    # are runs x time arrays (see stack_runs) and stellar_dynamics['Time'] is either one shared time axis or
+    # runs x time. planet_star_distance is a scalar, one value per run, or runs x time. Samples past the end
+    # of a shorter run are NaN and stay NaN.
+
+    def __init__(self,
+                 stellar_mean_surface_B,
+                 stellar_radius,
+                 planet_star_distance,
+                 planet_dynamics,
+                 stellar_dynamics,
+                 **kwargs):
+        planet_star_distance = np.asarray(planet_star_distance, dtype=float)
+
+        # One distance per run applies to every sample of the run.
+        if planet_star_distance.ndim == 1:
+            planet_star_distance = planet_star_distance[:, np.newaxis]
+
+        super().__init__(stellar_mean_surface_B, stellar_radius, planet_star_distance, planet_dynamics, stellar_dynamics, **kwargs)
+
+    def output(self):
+        raise Exception('PlanetBatch holds many runs; use Planet to write the output of one run.')
+
+    def plot_thermal_evolution(self):
+        raise Exception('PlanetBatch holds many runs; use Planet to plot the thermal evolution of one run.')
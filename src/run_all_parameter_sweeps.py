@@ -1,6 +1,6 @@
 import nbformat
 
-# Note: add modified multiplanet binary into project directory and modify the PATH variable.
+# Note: the sweeps run in-process through the modified vplanet Python package (see sweep_engine.py).
 
 # Runs the Jupyter notebook with all the parameter sweep scripts.
 nb = nbformat.read('run_parameter_sweeps.ipynb', as_version=nbformat.NO_CONVERT)
@@ -0,0 +1,324 @@
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+from parameter_sweep import Parameter_Sweep
+from sweep_engine import _read_final_log, _read_results
+
+# A sweep archive is a directory holding every run of a parameter sweep in a few files:
+#
+#   index.json            Parameter names, ranges and run names, and the columns, final values and reducers of
+#                         every body.
+#   values.npy            Runs x parameters array of the swept values, in the order of Parameter_Sweep rows.
+#   <body>.offsets.npy    Runs x 2 array of (start, length) of each run in the column files of the body.
+#   <body>.<column>.f8    Little-endian float64 samples of one output column, all runs back to back.
+#   <body>.final.npy      Runs x properties array of the final log values of the body.
+#   <body>.reduce.npy     Runs x reducers array of the saReduce results of the body.
+#
+# Column files are memory-mapped, so reading a column of a few runs only touches those samples. An archive may
+# be written into the sweep directory itself, next to the run directories; lib.read_sweep_run and
+# lib.build_contour_VPLanet then read from the archive instead of the forward files.
+
+INDEX_FILE_NAME = 'index.json'
+
+class _ArchiveWriter:
+    # Appends the runs of a sweep to a new archive in whatever order they finish.
+
+    def __init__(self, archive_path, sweep):
+        os.makedirs(archive_path, exist_ok=True)
+
+        self.archive_path = archive_path
+        self.sweep = sweep
+        self.num_runs = sweep.num_runs()
+
+        self.bodies = {}
+        self.column_files = {}
+        self.offsets = {}
+        self.finals = {}
+        self.reduces = {}
+        self.reduce_units = {}
+
+    def add(self, row, results, finals):
+        # Takes the results of a run as SweepEngine.run yields them and its final log values.
+        for (body_name, body) in results.items():
+            columns = {column: values for (column, values) in body.items() if column not in ('reduce', 'reduce_units')}
+
+            if body_name not in self.bodies:
+                self.bodies[body_name] = list(columns)
+                self.offsets[body_name] = np.zeros((self.num_runs, 2), dtype=np.int64)
+
+                for column in columns:
+                    self.column_files[(body_name, column)] = open(os.path.join(self.archive_path, '{body}.{column}.f8'.format(body=body_name, column=column)), 'wb')
+
+            if list(columns) != self.bodies[body_name]:
+                raise Exception('Run {row} has different {body} output columns than the runs before it.'.format(row=row, body=body_name))
+
+            length = len(columns[self.bodies[body_name][0]]) if len(columns) > 0 else 0
+            start = self.column_files[(body_name, self.bodies[body_name][0])].tell() // 8 if len(columns) > 0 else 0
+
+            for (column, values) in columns.items():
+                self.column_files[(body_name, column)].write(np.ascontiguousarray(values, dtype='<f8').tobytes())
+
+            self.offsets[body_name][row] = (start, length)
+
+            body_reduces = self.reduces.setdefault(body_name, {})
+
+            for (name, value) in body.get('reduce', {}).items():
+                if name not in body_reduces:
+                    body_reduces[name] = np.full(self.num_runs, np.nan)
+                    self.reduce_units.setdefault(body_name, {})[name] = body['reduce_units'][name]
+
+                body_reduces[name][row] = value
+
+        for (body_name, properties) in finals.items():
+            body_finals = self.finals.setdefault(body_name, {})
+
+            for (name, value) in properties.items():
+                if name not in body_finals:
+                    body_finals[name] = np.full(self.num_runs, np.nan)
+
+                body_finals[name][row] = value
+
+    def close(self):
+        for column_file in self.column_files.values():
+            column_file.close()
+
+    def finish(self):
+        for (body_name, offsets) in self.offsets.items():
+            np.save(os.path.join(self.archive_path, body_name + '.offsets.npy'), offsets)
+
+        for (body_name, body_finals) in self.finals.items():
+            if len(body_finals) == 0:
+                continue
+
+            np.save(os.path.join(self.archive_path, body_name + '.final.npy'), np.stack(list(body_finals.values()), axis=1))
+
+        for (body_name, body_reduces) in self.reduces.items():
+            if len(body_reduces) == 0:
+                continue
+
+            np.save(os.path.join(self.archive_path, body_name + '.reduce.npy'), np.stack(list(body_reduces.values()), axis=1))
+
+        rows = range(self.num_runs)
+        values = np.array([[float(self.sweep.parameters(row)[name]) for name in self.sweep.names] for row in rows]).reshape(self.num_runs, len(self.sweep.names))
+        np.save(os.path.join(self.archive_path, 'values.npy'), values)
+
+        index = {
+            'parameters': self.sweep.names,
+            'ranges': [[float(value) for value in values_range] for values_range in self.sweep.ranges],
+            'runs': [self.sweep.run_name(row) for row in rows],
+            'bodies': {}
+        }
+
+        for (body_name, columns) in self.bodies.items():
+            reduce_units = self.reduce_units.get(body_name, {})
+
+            index['bodies'][body_name] = {
+                'columns': columns,
+                'final': list(self.finals.get(body_name, {})),
+                'reduce': list(reduce_units),
+                'reduce_units': list(reduce_units.values())
+            }
+
+        # Bodies that only have log output, e.g. when no run wrote a forward file for them.
+        for (body_name, body_finals) in self.finals.items():
+            if body_name not in index['bodies']:
+                index['bodies'][body_name] = {'columns': [], 'final': list(body_finals), 'reduce': [], 'reduce_units': []}
+
+        # Written last, so a sweep that fails halfway does not leave something that looks like an archive.
+        with open(os.path.join(self.archive_path, INDEX_FILE_NAME), 'w', encoding = 'utf-8') as index_file:
+            json.dump(index, index_file, indent=1)
+
+def _read_input_files(run_directory):
+    # Maps the name of each input file of a run directory to its contents.
+    input_files = {}
+
+    for file_name in os.listdir(run_directory):
+        if file_name.endswith('.in'):
+            with open(os.path.join(run_directory, file_name), 'r') as input_file:
+                input_files[file_name] = input_file.read()
+
+    return input_files
+
+def _primary_file(input_files):
+    for (file_name, contents) in input_files.items():
+        if contents.find('saBodyFiles') != -1:
+            return file_name
+
+    raise Exception('None of the input files contains saBodyFiles.')
+
+def archive_directory(archive_path, directory_path, sweep):
+    # Builds an archive from the run directories of a finished sweep, e.g. one run by multiplanet or by
+    # SweepEngine.run(directory_path). sweep holds the keyword arguments the sweep was created with. Runs
+    # without a directory are stored with no samples.
+    if isinstance(sweep, dict):
+        sweep = Parameter_Sweep(**sweep)
+
+    writer = _ArchiveWriter(archive_path, sweep)
+
+    try:
+        for row in range(sweep.num_runs()):
+            run_directory = os.path.join(directory_path, sweep.run_name(row))
+
+            if not os.path.isdir(run_directory):
+                continue
+
+            input_files = _read_input_files(run_directory)
+            primary_file = _primary_file(input_files)
+
+            writer.add(row, _read_results(run_directory, input_files, primary_file), _read_final_log(run_directory, input_files, primary_file))
+    finally:
+        writer.close()
+
+    writer.finish()
+
+    return SweepArchive(archive_path)
+
+def archive_sweep(archive_path, engine):
+    # Runs a SweepEngine and writes every grid point to an archive as soon as it finishes, removing its run
+    # directory afterwards. Failed runs are stored with no samples.
+    rows = {engine.run_name(row): row for row in range(engine.num_runs())}
+
+    writer = _ArchiveWriter(archive_path, engine)
+
+    try:
+        with tempfile.TemporaryDirectory() as directory_path:
+            for (run_name, parameters, results) in engine.run(directory_path):
+                run_directory = os.path.join(directory_path, run_name)
+
+                if not isinstance(results, Exception):
+                    input_files = _read_input_files(run_directory)
+
+                    writer.add(rows[run_name], results, _read_final_log(run_directory, input_files, engine.primary_file))
+
+                shutil.rmtree(run_directory, ignore_errors=True)
+    finally:
+        writer.close()
+
+    writer.finish()
+
+    return SweepArchive(archive_path)
+
+def is_archive(path):
+    return os.path.isfile(os.path.join(path, INDEX_FILE_NAME))
+
+class SweepArchive:
+    # Read-only view of an archive. Runs are addressed by row (the Parameter_Sweep row) or by run name, and
+    # nothing is read from disk until a column or final value is asked for.
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+
+        with open(os.path.join(archive_path, INDEX_FILE_NAME), 'r') as index_file:
+            index = json.load(index_file)
+
+        self.parameters = index['parameters']
+        self.ranges = [np.array(values_range) for values_range in index['ranges']]
+        self.runs = index['runs']
+        self.bodies = index['bodies']
+
+        # Runs are stored in row order, so the grid of any per-run array is a C-order reshape.
+        self.shape = tuple(len(values_range) for values_range in self.ranges)
+
+        self._rows = {run_name: row for (row, run_name) in enumerate(self.runs)}
+        self._values = None
+        self._offsets = {}
+        self._columns = {}
+        self._finals = {}
+        self._reduces = {}
+
+    def __len__(self):
+        return len(self.runs)
+
+    @property
+    def values(self):
+        # Runs x parameters array of the swept values.
+        if self._values is None:
+            self._values = np.load(os.path.join(self.archive_path, 'values.npy'))
+
+        return self._values
+
+    def row(self, run):
+        return self._rows[run] if isinstance(run, str) else int(run)
+
+    def grid_index(self, run):
+        # Index of each parameter in its range, e.g. (i, j) of run_K{i}_ThU{j}.
+        return np.unravel_index(self.row(run), self.shape)
+
+    def grid(self, per_run):
+        # Reshapes a per-run array onto the parameter grid, one axis per swept parameter.
+        return np.asarray(per_run).reshape(self.shape + np.shape(per_run)[1:])
+
+    def columns(self, body_name):
+        return self.bodies[body_name]['columns']
+
+    def _column(self, body_name, column):
+        if (body_name, column) not in self._columns:
+            if column not in self.columns(body_name):
+                raise KeyError('{body} has no output column {column}.'.format(body=body_name, column=column))
+
+            column_path = os.path.join(self.archive_path, '{body}.{column}.f8'.format(body=body_name, column=column))
+
+            if os.path.getsize(column_path) == 0:
+                self._columns[(body_name, column)] = np.empty(0, dtype='<f8')
+            else:
+                self._columns[(body_name, column)] = np.memmap(column_path, dtype='<f8', mode='r')
+
+        return self._columns[(body_name, column)]
+
+    def _run_offsets(self, body_name):
+        if body_name not in self._offsets:
+            self._offsets[body_name] = np.load(os.path.join(self.archive_path, body_name + '.offsets.npy'))
+
+        return self._offsets[body_name]
+
+    def series(self, body_name, column, run):
+        # One output column of one run, as a read-only view into the column file.
+        (start, length) = self._run_offsets(body_name)[self.row(run)]
+
+        return self._column(body_name, column)[start:start + length]
+
+    def frame(self, body_name, run, columns=None):
+        # The forward file of one run as a DataFrame, as read_vplanet returns it, reading only the given columns.
+        if columns is None:
+            columns = self.columns(body_name)
+
+        return pd.DataFrame({column: self.series(body_name, column, run) for column in columns})
+
+    def stack(self, body_name, column, runs=None):
+        # One output column of several runs (all by default) as a runs x time array, padded with NaN. The
+        # result can be handed to planet.PlanetBatch.
+        rows = range(len(self)) if runs is None else [self.row(run) for run in runs]
+        offsets = self._run_offsets(body_name)[rows]
+        data = self._column(body_name, column)
+
+        stacked = np.full((len(offsets), offsets[:, 1].max(initial=0)), np.nan)
+
+        for (i, (start, length)) in enumerate(offsets):
+            stacked[i, :length] = data[start:start + length]
+
+        return stacked
+
+    def final(self, body_name, name):
+        # One final log value of a body for every run, NaN for runs without a log file.
+        if body_name not in self._finals:
+            self._finals[body_name] = np.load(os.path.join(self.archive_path, body_name + '.final.npy'))
+
+        return self._finals[body_name][:, self.bodies[body_name]['final'].index(name)]
+
+    def reduce(self, body_name, name):
+        # One saReduce result of a body, e.g. 'MagMom:argmin', for every run, NaN for runs without one. Its unit
+        # is reduce_unit(body_name, name).
+        if body_name not in self._reduces:
+            self._reduces[body_name] = np.load(os.path.join(self.archive_path, body_name + '.reduce.npy'))
+
+        return self._reduces[body_name][:, self.bodies[body_name]['reduce'].index(name)]
+
+    def reduce_unit(self, body_name, name):
+        body = self.bodies[body_name]
+
+        return body['reduce_units'][body['reduce'].index(name)]
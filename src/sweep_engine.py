@@ -0,0 +1,401 @@
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+from parameter_sweep import Parameter_Sweep
+
+# Needs Python 3.9 or later, like parameter_sweep.py. Recycling workers with max_tasks_per_child needs 3.11.
+
+def _option_values(contents, option):
+    # Returns the words following an option in an input file, joining lines continued with '$'.
+    values = None
+
+    for line in contents.split('\n'):
+        words = line.split('#')[0].split()
+
+        if values is None:
+            if len(words) == 0 or words[0] != option:
+                continue
+
+            words = words[1:]
+            values = []
+
+        continued = len(words) > 0 and words[-1].endswith('$')
+
+        if continued:
+            words[-1] = words[-1].removesuffix('$')
+
+        values += [word for word in words if word != '']
+
+        if not continued:
+            break
+
+    return values
+
+def _canonical_input(contents):
+    # Drops comments, blank lines and repeated spaces, which do not change what vplanet computes.
+    lines = [' '.join(line.split('#')[0].split()) for line in contents.split('\n')]
+
+    return '\n'.join(line for line in lines if line != '')
+
+# Options naming data files that vplanet reads besides the input files.
+REFERENCED_FILE_OPTIONS = ('sFileStellarTrack', 'sFileMagMomTrack')
+
+def _file_digest(path):
+    # SHA-256 of the contents of a file, read in blocks.
+    digest = hashlib.sha256()
+
+    with open(path, 'rb') as data_file:
+        for block in iter(lambda: data_file.read(1 << 20), b''):
+            digest.update(block)
+
+    return digest.hexdigest()
+
+def _build_id():
+    # Identifies the vplanet build by the contents of its extension module, since the version string does not
+    # change when the C code is rebuilt.
+    from vplanet import vplanet_core
+
+    return _file_digest(vplanet_core.__file__)
+
+def _cache_key(input_files, build_id):
+    # Content hash of a run: every input file, by name, the data files they reference and the vplanet build
+    # that runs them. Referenced files that are not input files are read relative to the working directory,
+    # as vplanet reads them; a missing one is hashed by name only.
+    key = hashlib.sha256(build_id.encode('utf-8'))
+
+    for file_name in sorted(input_files):
+        key.update(b'\0' + file_name.encode('utf-8') + b'\0' + _canonical_input(input_files[file_name]).encode('utf-8'))
+
+    for file_name in sorted(input_files):
+        for option in REFERENCED_FILE_OPTIONS:
+            for referenced_name in _option_values(input_files[file_name], option) or []:
+                key.update(b'\0' + option.encode('utf-8') + b'\0' + referenced_name.encode('utf-8'))
+
+                if referenced_name not in input_files and os.path.isfile(referenced_name):
+                    key.update(b'\0' + _file_digest(referenced_name).encode('utf-8'))
+
+    return key.hexdigest()
+
+def _write_forward_files(directory, system_name, output):
+    # Writes the rows of each body of a vplanet_core.simulate output as a forward file, at full precision.
+    for (body_name, body) in output.items():
+        if body['rows'].shape[1] == 0:
+            continue
+
+        forward_path = os.path.join(directory, '{system}.{body}.forward'.format(system=system_name, body=body_name))
+        np.savetxt(forward_path, body['rows'], fmt='%.17g')
+
+def _write_reduce_file(directory, system_name, output):
+    # Writes the reducers of every body of a vplanet_core.simulate output as the reduce file a command-line run
+    # writes, one line of name, value and unit each, at full precision.
+    lines = []
+
+    for (body_name, body) in output.items():
+        for (name, value) in body['reduce'].items():
+            unit = body['reduce_units'][name]
+            lines.append('{body}.{name} {value:.17g} {unit}\n'.format(body=body_name, name=name, value=value, unit=unit))
+
+    if len(lines) == 0:
+        return
+
+    with open(os.path.join(directory, system_name + '.reduce'), 'w', encoding = 'utf-8') as reduce_file:
+        reduce_file.writelines(lines)
+
+def _results(output):
+    # The results of a vplanet_core.simulate output: for each body, a dictionary of output arrays keyed by output
+    # name and, if it has reducers, 'reduce' and 'reduce_units' dictionaries of their results and units. Bodies
+    # with neither are left out.
+    results = {}
+
+    for (body_name, body) in output.items():
+        if body['rows'].shape[1] == 0 and len(body['reduce']) == 0:
+            continue
+
+        results[body_name] = dict(zip(body['columns'], body['rows'].T))
+
+        if len(body['reduce']) > 0:
+            results[body_name]['reduce'] = body['reduce']
+            results[body_name]['reduce_units'] = body['reduce_units']
+
+    return results
+
+def _store_outputs(system_name, output, log_path, staging_directory, cache_entry):
+    # Writes the forward files, reducers and log of a finished run into the cache. The entry is assembled in a
+    # staging directory and renamed into place, so an interrupted run never leaves an entry that looks complete.
+    _write_forward_files(staging_directory, system_name, output)
+    _write_reduce_file(staging_directory, system_name, output)
+
+    # The log is written by the run itself, into the staging directory unless it has a run directory.
+    if os.path.dirname(log_path) != staging_directory and os.path.exists(log_path):
+        shutil.copy2(log_path, staging_directory)
+
+    try:
+        os.rename(staging_directory, cache_entry)
+    except OSError:
+        # Another worker stored the same run first.
+        shutil.rmtree(staging_directory)
+
+def _load_outputs(cache_entry, input_files, run_directory):
+    # Recreates a cached run in run_directory, as if it had just been run there.
+    os.makedirs(run_directory, exist_ok=True)
+
+    for (file_name, contents) in input_files.items():
+        with open(os.path.join(run_directory, file_name), 'w', encoding = 'utf-8') as input_file:
+            input_file.write(contents)
+
+    for file_name in os.listdir(cache_entry):
+        shutil.copy2(os.path.join(cache_entry, file_name), run_directory)
+
+def _run_vplanet(input_files, primary_file, run_directory=None, cache_entry=None):
+    # Runs one grid point inside a worker process with vplanet_core.simulate, which keeps the output in memory
+    # and raises a VPLANETError instead of exiting when the run stops early. Returns a dictionary of output
+    # arrays and reducers for each body, as _results gives them, or the VPLANETError of a failed run. If
+    # run_directory is given, the input files, the log, the reduce file and the forward file of each body are
+    # written there; if cache_entry is given, the log, reduce file and forward files of a finished run are also
+    # stored there.
+    from vplanet import vplanet_core
+
+    system_name = _option_values(input_files[primary_file], 'sSystemName')[0]
+
+    # simulate takes the primary file first, made quiet as the -q of the command line would. Files that are not
+    # in the config, e.g. stellar tracks, are read relative to the working directory.
+    primary_lines = [line for line in input_files[primary_file].split('\n') if _option_values(line, 'iVerbose') is None]
+    config = {primary_file: '\n'.join(primary_lines + ['iVerbose 0', ''])}
+    config.update((file_name, contents) for (file_name, contents) in input_files.items() if file_name != primary_file)
+
+    log_path = None
+    staging_directory = None
+
+    if cache_entry is not None:
+        staging_directory = tempfile.mkdtemp(dir=os.path.dirname(cache_entry), prefix='.staging-')
+        log_path = os.path.join(staging_directory, system_name + '.log')
+
+    if run_directory is not None:
+        os.makedirs(run_directory, exist_ok=True)
+        log_path = os.path.join(run_directory, system_name + '.log')
+
+    try:
+        output = vplanet_core.simulate(config, log_path)
+    except vplanet_core.VPLANETError as error:
+        output = error
+
+    if run_directory is not None:
+        for (file_name, contents) in input_files.items():
+            with open(os.path.join(run_directory, file_name), 'w', encoding = 'utf-8') as input_file:
+                input_file.write(contents)
+
+    if isinstance(output, Exception):
+        if staging_directory is not None:
+            shutil.rmtree(staging_directory)
+
+        return output
+
+    if run_directory is not None:
+        _write_forward_files(run_directory, system_name, output)
+        _write_reduce_file(run_directory, system_name, output)
+
+    if cache_entry is not None:
+        _store_outputs(system_name, output, log_path, staging_directory, cache_entry)
+
+    return _results(output)
+
+def _read_forward_files(run_directory, input_files, primary_file):
+    # Reads the forward file of every body of a finished run into a dictionary of arrays keyed by output name.
+    from vplanet.output import is_binary, read_binary
+
+    system_name = _option_values(input_files[primary_file], 'sSystemName')[0]
+    results = {}
+
+    for body_file_name in _option_values(input_files[primary_file], 'saBodyFiles'):
+        contents = input_files[body_file_name]
+        body_name = _option_values(contents, 'sName')[0]
+        output_options = [option.removeprefix('-') for option in _option_values(contents, 'saOutputOrder') or []]
+
+        forward_path = os.path.join(run_directory, '{system}.{body}.forward'.format(system=system_name, body=body_name))
+
+        if not os.path.exists(forward_path):
+            continue
+
+        if is_binary(forward_path):
+            (output_options, units, data) = read_binary(forward_path)
+        else:
+            data = np.loadtxt(forward_path, ndmin=2)
+
+        results[body_name] = {option: data[:, column] for (column, option) in enumerate(output_options)}
+
+    return results
+
+def _read_reduce_file(run_directory, input_files, primary_file):
+    # Reads the reduce file of a finished run into a dictionary of reducer results and one of their units for
+    # every body with reducers.
+    system_name = _option_values(input_files[primary_file], 'sSystemName')[0]
+    body_file_names = _option_values(input_files[primary_file], 'saBodyFiles')
+    body_names = [_option_values(input_files[body_file_name], 'sName')[0] for body_file_name in body_file_names]
+    results = {}
+
+    reduce_path = os.path.join(run_directory, system_name + '.reduce')
+
+    if not os.path.exists(reduce_path):
+        return results
+
+    with open(reduce_path, 'r') as reduce_file:
+        for line in reduce_file:
+            words = line.split()
+
+            if len(words) == 0:
+                continue
+
+            # Reducer names may hold dots, e.g. EnvelopeMass@6.0253e9, so the body is matched by name.
+            body_name = next(body_name for body_name in body_names if words[0].startswith(body_name + '.'))
+            name = words[0][len(body_name) + 1:]
+
+            (reduce, reduce_units) = results.setdefault(body_name, ({}, {}))
+            reduce[name] = float(words[1])
+            reduce_units[name] = words[2] if len(words) > 2 else ''
+
+    return results
+
+def _read_results(run_directory, input_files, primary_file):
+    # Reads the forward files and reduce file of a finished run into results as _results gives them.
+    results = _read_forward_files(run_directory, input_files, primary_file)
+
+    for (body_name, (reduce, reduce_units)) in _read_reduce_file(run_directory, input_files, primary_file).items():
+        results.setdefault(body_name, {})
+        results[body_name]['reduce'] = reduce
+        results[body_name]['reduce_units'] = reduce_units
+
+    return results
+
+def _read_final_log(run_directory, input_files, primary_file):
+    # Reads the numeric final-state properties of every body from the log file of a finished run.
+    from vplanet.log import get_log
+    from vplanet.logger import logger
+
+    system_name = _option_values(input_files[primary_file], 'sSystemName')[0]
+
+    if not os.path.exists(os.path.join(run_directory, system_name + '.log')):
+        return {}
+
+    # The units are not kept, so complaints about ones astropy does not know would only repeat for every run.
+    disabled = logger.disabled
+    logger.disabled = True
+
+    try:
+        log = get_log(run_directory, sysname=system_name, units=False)
+    finally:
+        logger.disabled = disabled
+
+    results = {}
+
+    for body_name in log._body_names:
+        body = getattr(log.final, body_name)
+        results[body_name] = {}
+
+        for name in body.members:
+            value = getattr(body, name)
+
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                results[body_name][name] = float(value)
+
+    return results
+
+class SweepEngine(Parameter_Sweep):
+    # Runs a parameter sweep in-process instead of writing a vspace.in file for multiplanet.
+    # Takes the same keyword arguments as Parameter_Sweep; every grid point is handed to a
+    # pool of worker processes that call vplanet_core.simulate directly.
+
+    def __init__(self, max_workers=None, max_tasks_per_child=None, cache_directory=None, **kwargs):
+        super().__init__(**kwargs)
+
+        # Finished runs are kept here under a hash of their input files, the data files they reference and the
+        # vplanet build, so rerunning a crashed, resumed or extended sweep only runs the grid points that are not
+        # in the cache yet.
+        self.cache_directory = cache_directory
+
+        # Defaults to one worker per core.
+        self.max_workers = max_workers
+
+        # Very long sweeps can recycle workers after this many runs, which returns memory fragmented by earlier
+        # runs to the system. Workers are then started with 'spawn', which needs an importable __main__.
+        if max_tasks_per_child is not None and sys.version_info < (3, 11):
+            raise Exception('max_tasks_per_child needs Python 3.11 or later.')
+
+        self.max_tasks_per_child = max_tasks_per_child
+
+        self.primary_file = None
+
+        for path in self.input_file_paths + self.unvaried_input_files:
+            with open(path, 'r') as input_file:
+                if input_file.read().find('saBodyFiles') != -1:
+                    self.primary_file = path.split(os.sep)[-1]
+
+        if self.primary_file is None:
+            raise Exception('None of the input files contains saBodyFiles.')
+
+    def run(self, directory_path=None):
+        # Yields (run_name, parameters, results) for each grid point as soon as it finishes, where results maps
+        # each body name to a dictionary of output arrays, with 'reduce' and 'reduce_units' dictionaries for a
+        # body with saReduce. A run that fails does not stop the sweep: its results are the exception instead, a
+        # VPLANETError if vplanet stopped early or a BrokenProcessPool if its worker died, and it is not cached.
+        # If directory_path is given, the input files, log, reduce file and forward files of every run are kept
+        # in the same layout as generate_input_files; otherwise the results are only kept in memory. Grid points
+        # found in the cache are yielded right away, without running vplanet.
+        if directory_path is not None:
+            os.makedirs(directory_path, exist_ok=True)
+
+        build_id = None
+
+        if self.cache_directory is not None:
+            os.makedirs(self.cache_directory, exist_ok=True)
+            build_id = _build_id()
+
+        if self.max_tasks_per_child is None:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers, max_tasks_per_child=self.max_tasks_per_child)
+
+        try:
+            futures = {}
+
+            for row in range(self.num_runs()):
+                (run_name, input_files) = self._run_input_files(row)
+
+                run_directory = None
+                cache_entry = None
+
+                if directory_path is not None:
+                    run_directory = os.path.join(directory_path, run_name)
+
+                if self.cache_directory is not None:
+                    cache_entry = os.path.join(self.cache_directory, _cache_key(input_files, build_id))
+
+                    if os.path.isdir(cache_entry):
+                        if run_directory is not None:
+                            _load_outputs(cache_entry, input_files, run_directory)
+
+                        yield (run_name, self.parameters(row), _read_results(cache_entry, input_files, self.primary_file))
+                        continue
+
+                future = executor.submit(_run_vplanet, input_files, self.primary_file, run_directory, cache_entry)
+                futures[future] = (run_name, row)
+
+            for future in as_completed(futures):
+                (run_name, row) = futures[future]
+
+                try:
+                    results = future.result()
+                except BrokenProcessPool as error:
+                    # A worker that crashes takes the pool with it, so every run still pending ends up here.
+                    results = error
+
+                yield (run_name, self.parameters(row), results)
+        finally:
+            # Drops the remaining grid points if the caller stops iterating early.
+            executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,45 @@
+import os
+import shutil
+
+import numpy as np
+import pytest
+
+TRACK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'modded_VPLanet', 'tests', 'AtmescStellar', 'Replay', 'sun.track')
+
+PRIMARY_FILE = '''sSystemName sol
+iVerbose 0
+bDoLog 1
+saBodyFiles sun.in
+sUnitMass kg
+sUnitLength AU
+sUnitTime YEARS
+sUnitAngle d
+bDoForward 1
+bVarDt 1
+dEta 0.1
+dStopTime 1e8
+dOutputTime 1e7
+'''
+
+STAR_FILE = '''sName sun
+saModules stellar
+dMass 2e30
+dAge 5e7
+sStellarModel track
+sFileStellarTrack sun.track
+sMagBrakingModel matt
+saOutputOrder Time -Luminosity -Radius
+'''
+
+@pytest.fixture
+def sweep(tmp_path, monkeypatch):
+    # A two-point sweep of a star that follows sun.track, run from a directory holding its input files.
+    (tmp_path / 'vpl.in').write_text(PRIMARY_FILE)
+    (tmp_path / 'sun.in').write_text(STAR_FILE)
+    shutil.copy(TRACK_PATH, tmp_path / 'sun.track')
+    monkeypatch.chdir(tmp_path)
+
+    return {
+        'paths': [str(tmp_path / 'sun.in'), str(tmp_path / 'vpl.in')],
+        'sun.in': {'input_options': [['dSatXUVFrac']], 'names': ['XUV'], 'ranges': [np.array([1e-3, 2e-3])]},
+    }
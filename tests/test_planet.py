@@ -0,0 +1,92 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+from planet import Planet, PlanetBatch, cumulative_mass_loss, stack_runs
+
+STELLAR_MEAN_SURFACE_B = 1.35 * 1e-4
+STELLAR_RADIUS = 6.957e8
+AU = 1.496e11
+
+def loop_mass_loss(dm_dt, time):
+    # The per-run loop Planet.integrate used before cumulative_mass_loss.
+    max_time_index = len(dm_dt)
+    mass_loss = np.zeros(max_time_index)
+
+    for time_index in range(1, max_time_index):
+        dt = (time[time_index] - time[time_index-1]) * 3.1536e7/1
+        dm = dm_dt[time_index] * dt
+        mass_loss[time_index] = mass_loss[time_index-1] + dm
+
+    return mass_loss
+
+def make_runs():
+    # Runs of different lengths with uneven time steps, some of them with a magnetic moment that switches off.
+    rng = np.random.default_rng(7)
+    runs = []
+
+    for length in (40, 25, 33):
+        time = np.concatenate(([0.0], np.cumsum(rng.uniform(1e6, 5e7, length - 1))))
+        magnetic_moment = rng.uniform(0.0, 2.0, length)
+        magnetic_moment[length // 2:length // 2 + 3] = 0.0
+
+        runs.append((pd.DataFrame({'MagMom': magnetic_moment}), pd.DataFrame({'Time': time, 'LXUVStellar': rng.uniform(1e-6, 1e-3, length)})))
+
+    return runs
+
+def test_PlanetLoop():
+    for (planet_dynamics, stellar_dynamics) in make_runs():
+        planet = Planet(STELLAR_MEAN_SURFACE_B, STELLAR_RADIUS, AU, planet_dynamics, stellar_dynamics)
+
+        for (magnetic, dm_dt) in ((True, planet.dm_dt_magnetic()), (False, planet.dm_dt_energy_limited())):
+            expected = loop_mass_loss(dm_dt, stellar_dynamics['Time'])
+            assert np.array_equal(planet.integrate(magnetic), expected)
+            assert np.array_equal(cumulative_mass_loss(dm_dt, stellar_dynamics['Time']), expected)
+
+def test_PlanetBatch():
+    runs = make_runs()
+    distances = AU * np.array([0.5, 1.0, 2.0])
+
+    planet_dynamics = {'MagMom': stack_runs([planet_dynamics for (planet_dynamics, stellar_dynamics) in runs], 'MagMom')}
+    stellar_dynamics = {column: stack_runs([stellar_dynamics for (planet_dynamics, stellar_dynamics) in runs], column) for column in ('Time', 'LXUVStellar')}
+    batch = PlanetBatch(STELLAR_MEAN_SURFACE_B, STELLAR_RADIUS, distances, planet_dynamics, stellar_dynamics)
+
+    for magnetic in (True, False):
+        mass_loss = batch.integrate(magnetic)
+        assert mass_loss.shape == (len(runs), max(len(stellar_dynamics) for (planet_dynamics, stellar_dynamics) in runs))
+
+        # Each row is bitwise what the old loop gives for its run alone, and NaN past the end of the run.
+        for (row, (run_planet_dynamics, run_stellar_dynamics)) in enumerate(runs):
+            planet = Planet(STELLAR_MEAN_SURFACE_B, STELLAR_RADIUS, distances[row], run_planet_dynamics, run_stellar_dynamics)
+            dm_dt = planet.dm_dt_magnetic() if magnetic else planet.dm_dt_energy_limited()
+            length = len(run_stellar_dynamics)
+
+            assert np.array_equal(mass_loss[row, :length], loop_mass_loss(dm_dt, run_stellar_dynamics['Time']))
+            assert np.all(np.isnan(mass_loss[row, length:]))
+
+def test_PlanetBatchSharedTime():
+    # Runs that share one time axis, as from a sweep of the same length, may pass it once.
+    (planet_dynamics, stellar_dynamics) = make_runs()[0]
+    scales = np.array([[1.0], [0.5], [3.0]])
+
+    batch = PlanetBatch(STELLAR_MEAN_SURFACE_B, STELLAR_RADIUS, AU, {'MagMom': scales * planet_dynamics['MagMom'].values}, {'Time': stellar_dynamics['Time'].values, 'LXUVStellar': scales * stellar_dynamics['LXUVStellar'].values})
+    mass_loss = batch.integrate()
+
+    for (row, scale) in enumerate(scales[:, 0]):
+        planet = Planet(STELLAR_MEAN_SURFACE_B, STELLAR_RADIUS, AU, {'MagMom': scale * planet_dynamics['MagMom'].values}, {'Time': stellar_dynamics['Time'].values, 'LXUVStellar': scale * stellar_dynamics['LXUVStellar'].values})
+        assert np.array_equal(mass_loss[row], loop_mass_loss(planet.dm_dt_magnetic(), stellar_dynamics['Time']))
+
+def test_PlanetBatchSingleRunMethods():
+    (planet_dynamics, stellar_dynamics) = make_runs()[0]
+    batch = PlanetBatch(STELLAR_MEAN_SURFACE_B, STELLAR_RADIUS, [AU], {'MagMom': [planet_dynamics['MagMom'].values]}, {'Time': stellar_dynamics['Time'].values, 'LXUVStellar': [stellar_dynamics['LXUVStellar'].values]})
+
+    with pytest.raises(Exception, match='use Planet'):
+        batch.output()
+
+    with pytest.raises(Exception, match='use Planet'):
+        batch.plot_thermal_evolution()
@@ -0,0 +1,71 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip('vplanet')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+from sweep_archive import SweepArchive, archive_directory, archive_sweep
+from sweep_engine import SweepEngine
+
+def test_ArchiveRoundTrip(sweep):
+    engine = SweepEngine(max_workers=1, **sweep)
+    results = {run_name: results for (run_name, parameters, results) in engine.run('runs')}
+
+    # An archive built while the engine runs and one built from the run directories afterwards hold the same runs.
+    archives = [archive_sweep('archive', SweepEngine(max_workers=1, **sweep)), archive_directory('directory_archive', 'runs', sweep)]
+
+    for archive in archives:
+        archive = SweepArchive(archive.archive_path)
+
+        assert archive.parameters == ['XUV']
+        assert len(archive) == 2
+        assert np.array_equal(archive.values[:, 0], [1e-3, 2e-3])
+        assert archive.columns('sun') == ['Time', 'Luminosity', 'Radius']
+
+        for run_name in results:
+            for column in archive.columns('sun'):
+                assert np.array_equal(archive.series('sun', column, run_name), results[run_name]['sun'][column])
+
+        stacked = archive.stack('sun', 'Luminosity')
+        assert stacked.shape == (2, len(results[archive.runs[0]]['sun']['Luminosity']))
+        assert np.array_equal(stacked[1], results[archive.runs[1]]['sun']['Luminosity'])
+
+        # Final values come from the log, which rounds them.
+        assert np.array_equal(archive.final('sun', 'Mass'), [2e30, 2e30])
+        assert np.allclose(archive.final('sun', 'Luminosity'), stacked[:, -1], rtol=1e-4)
+
+def test_ArchiveReduce(sweep):
+    # A star with reducers and no output order, so its runs keep no time series.
+    with open('sun.in') as star_file:
+        contents = star_file.read().replace('saOutputOrder Time -Luminosity -Radius', 'saReduce -Luminosity@5e7 -Luminosity:final Radius:max')
+
+    with open('sun.in', 'w') as star_file:
+        star_file.write(contents)
+
+    engine = SweepEngine(max_workers=1, cache_directory='cache', **sweep)
+    results = {run_name: results for (run_name, parameters, results) in engine.run('runs')}
+    cached = {run_name: results for (run_name, parameters, results) in engine.run('cached_runs')}
+
+    for run_name in results:
+        assert sorted(results[run_name]['sun']) == ['reduce', 'reduce_units']
+        assert list(results[run_name]['sun']['reduce']) == ['-Luminosity@5e7', '-Luminosity:final', 'Radius:max']
+        assert results[run_name]['sun']['reduce_units']['-Luminosity@5e7'] == 'LSUN'
+
+        # Reducers are written at full precision, so a cached run returns the same values.
+        assert cached[run_name]['sun'] == results[run_name]['sun']
+        assert sorted(os.listdir(os.path.join('runs', run_name))) == ['sol.log', 'sol.reduce', 'sun.in', 'vpl.in']
+
+    archives = [archive_sweep('archive', engine), archive_directory('directory_archive', 'runs', sweep)]
+
+    for archive in archives:
+        archive = SweepArchive(archive.archive_path)
+        assert archive.columns('sun') == []
+        assert archive.reduce_unit('sun', 'Radius:max') == 'au'
+
+        for (row, run_name) in enumerate(archive.runs):
+            for (name, value) in results[run_name]['sun']['reduce'].items():
+                assert archive.reduce('sun', name)[row] == value
@@ -0,0 +1,82 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip('vplanet')
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, 'src'))
+
+import sweep_engine
+from sweep_engine import SweepEngine
+
+def run_sweep(sweep):
+    engine = SweepEngine(max_workers=1, cache_directory='cache', **sweep)
+
+    return {run_name: results for (run_name, parameters, results) in engine.run()}
+
+def cache_entries():
+    return sorted(name for name in os.listdir('cache') if not name.startswith('.'))
+
+def test_CacheHit(sweep):
+    results = run_sweep(sweep)
+    entries = cache_entries()
+    assert len(entries) == 2
+    assert all(os.path.exists(os.path.join('cache', entry, 'sol.log')) for entry in entries)
+
+    # A second sweep reads the cache instead of running vplanet, so it sees changes made to an entry.
+    for entry in entries:
+        forward_path = os.path.join('cache', entry, 'sol.sun.forward')
+        np.savetxt(forward_path, 2 * np.loadtxt(forward_path))
+
+    cached = run_sweep(sweep)
+    assert cache_entries() == entries
+
+    for run_name in results:
+        assert np.array_equal(cached[run_name]['sun']['Luminosity'], 2 * results[run_name]['sun']['Luminosity'])
+
+def test_CacheInvalidation(sweep, monkeypatch):
+    results = run_sweep(sweep)
+    entries = cache_entries()
+
+    # Comments and spacing of the input files do not change the key.
+    with open('sun.in', 'a') as star_file:
+        star_file.write('\n# A comment\n')
+
+    run_sweep(sweep)
+    assert cache_entries() == entries
+
+    # A different build does.
+    build_id = sweep_engine._build_id()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(sweep_engine, '_build_id', lambda: build_id + '-rebuilt')
+        run_sweep(sweep)
+
+    assert len(cache_entries()) == 4
+
+    # So does a change to the stellar track, which is not an input file.
+    track = np.loadtxt('sun.track')
+    track[:, 1:3] *= 1.5
+    np.savetxt('sun.track', track)
+
+    rerun = run_sweep(sweep)
+    assert len(cache_entries()) == 6
+
+    for run_name in results:
+        assert not np.array_equal(rerun[run_name]['sun']['Luminosity'], results[run_name]['sun']['Luminosity'])
+
+def test_CacheLog(sweep):
+    # The log of a run is cached with its forward files, so a run directory recreated from the cache has one too.
+    engine = SweepEngine(max_workers=1, cache_directory='cache', **sweep)
+    run_names = [run_name for (run_name, parameters, results) in engine.run('runs')]
+
+    for entry in cache_entries():
+        assert sorted(os.listdir(os.path.join('cache', entry))) == ['sol.log', 'sol.sun.forward']
+
+    list(engine.run('cached_runs'))
+
+    for run_name in run_names:
+        with open(os.path.join('runs', run_name, 'sol.log')) as log_file, open(os.path.join('cached_runs', run_name, 'sol.log')) as cached_log_file:
+            assert log_file.read() == cached_log_file.read()